@@ -0,0 +1,246 @@
+"""gimdict merge benchmarks.
+
+Two questions, two sections:
+
+1. **Merge throughput** — folding 8 counter shards into one: a Python
+   ``dict.get`` loop vs object and typed gimdicts (``|`` chains and
+   ``merge_all``), plus typed ``|`` with per-key strategies on 10% of keys
+   (stored inline with the values by the ``FlatMap`` backend).
+2. **Memory per entry** — ``sys.getsizeof`` of a dict, an object gimdict and
+   a typed gimdict (native values + key interner; key and value objects are
+   not counted for any of them) across sizes.
+3. **Worker scaling** — ``merge_reduce`` of 64 worker shards on 1..8
+   threads, from plain dicts and from typed shards sharing one key space.
+   Speedups are bounded by ``os.cpu_count()``, which is printed and saved.
+4. **Sketch strategies** — mean/variance, count, top-5 and a 10-bucket
+   histogram per key: a Python aggregation layer (Welford, ``heapq``,
+   ``bisect``) vs ``gimdict.merge_all(..., strategy=...)``, both for raw
+   observation shards and for combining 8 partial aggregates.
+
+Run:  python benchmarks/gimdict_merge.py [--no-save]
+
+Each run appends its raw measurements + environment metadata to
+``results/gimdict_merge.jsonl`` (see ``_results.py``), so performance can be
+followed across commits; ``--no-save`` measures without recording.
+"""
+
+import bisect
+import heapq
+import os
+import random
+import sys
+import time
+from functools import reduce
+
+from tabulate import tabulate
+
+from pygim.utils import gimdict
+from _results import save, wants_save
+
+REPS = 5
+SHARDS = 8
+SHARD_KEYS = 100_000
+KEY_SPACE = 150_000
+
+
+def best(fn, *args):
+    """Best-of-REPS wall time in seconds (min is the least noisy estimator)."""
+    times = []
+    for _ in range(REPS):
+        t0 = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+# ── Workloads ────────────────────────────────────────────────────────────────
+
+def make_shards():
+    rng = random.Random(48)
+    keys = [f"word-{i}" for i in range(KEY_SPACE)]
+    return [{key: rng.randint(1, 100) for key in rng.sample(keys, SHARD_KEYS)} for _ in range(SHARDS)]
+
+
+def dict_loop(shards):
+    out = {}
+    for shard in shards:
+        for key, value in shard.items():
+            out[key] = out.get(key, 0) + value
+    return out
+
+
+# ── 1. merge throughput ──────────────────────────────────────────────────────
+
+def bench_throughput(shards):
+    expected = dict_loop(shards)
+    objects = [gimdict(shard) for shard in shards]
+    typed = [gimdict(shard, dtype="int64") for shard in shards]
+    base = gimdict.merge_all(shards)
+    shared = [gimdict.merge_all([base, shard]) for shard in shards]  # one key space
+
+    left, right = gimdict.merge_all(shards[:4]), gimdict.merge_all([base, *shards[4:]])
+    for key in list(expected)[::10]:
+        left.set_strategy(key, "max")
+
+    workloads = {
+        "dict.get loop": lambda: dict_loop(shards),
+        "object gimdict |": lambda: reduce(lambda a, b: a | b, objects),
+        "typed gimdict |": lambda: reduce(lambda a, b: a | b, typed),
+        "merge_all(dicts)": lambda: gimdict.merge_all(shards),
+        "merge_all(typed, shared keys)": lambda: gimdict.merge_all(shared),
+        "typed |, 10% per-key strategies": lambda: left | right,
+    }
+    assert gimdict.merge_all(shards).to_dict() == expected
+    assert reduce(lambda a, b: a | b, typed).to_dict() == expected
+
+    entries = SHARDS * SHARD_KEYS
+    rows = [{"workload": label, "seconds": best(fn)} for label, fn in workloads.items()]
+    baseline = rows[0]["seconds"]
+    table = [[r["workload"], f"{r['seconds'] * 1e3:8.1f}", f"{entries / r['seconds'] / 1e6:6.1f}",
+              f"{baseline / r['seconds']:5.1f}x"] for r in rows]
+    print(f"\n== Merge throughput: {SHARDS} shards x {SHARD_KEYS:,} keys (best of {REPS}) ==")
+    print(tabulate(table, headers=["workload", "ms", "M entries/s", "vs dict loop"], tablefmt="github"))
+    return rows
+
+
+# ── 2. memory per entry ──────────────────────────────────────────────────────
+
+def bench_memory():
+    rows = []
+    for size in (1_000, 10_000, 100_000, 1_000_000):
+        plain = {f"k{i}": i for i in range(size)}
+        row = {"entries": size,
+               "dict_bytes": sys.getsizeof(plain),
+               "object_bytes": sys.getsizeof(gimdict(plain)),
+               "typed_bytes": sys.getsizeof(gimdict.merge_all([plain]))}
+        rows.append(row)
+
+    table = [[f"{r['entries']:,}"] + [f"{r[k] / r['entries']:6.1f}"
+                                       for k in ("dict_bytes", "object_bytes", "typed_bytes")]
+             for r in rows]
+    print("\n== Memory per entry (bytes, sys.getsizeof; key/value objects excluded) ==")
+    print(tabulate(table, headers=["entries", "dict", "object gimdict", "typed gimdict"], tablefmt="github"))
+    return rows
+
+
+# ── 3. worker scaling ────────────────────────────────────────────────────────
+
+def bench_scaling():
+    rng = random.Random(49)
+    keys = [f"word-{i}" for i in range(KEY_SPACE)]
+    shards = [{key: rng.randint(1, 100) for key in rng.sample(keys, SHARD_KEYS // 4)} for _ in range(64)]
+    base = gimdict.merge_all(shards)
+    shared = [gimdict.merge_all([base, shard]) for shard in shards]
+    expected = gimdict.merge_all(shards).to_dict()
+
+    rows = []
+    for label, sources in (("dicts", shards), ("typed, shared keys", shared)):
+        for workers in (1, 2, 4, 8):
+            if label == "dicts":
+                assert gimdict.merge_reduce(sources, workers=workers).to_dict() == expected
+            rows.append({"shards": label, "workers": workers,
+                         "seconds": best(lambda: gimdict.merge_reduce(sources, workers=workers))})
+
+    table = [[r["shards"], r["workers"], f"{r['seconds'] * 1e3:8.1f}",
+              f"{rows[(i // 4) * 4]['seconds'] / r['seconds']:5.2f}x"] for i, r in enumerate(rows)]
+    print(f"\n== merge_reduce scaling: 64 shards x {SHARD_KEYS // 4:,} keys, "
+          f"{os.cpu_count()} CPUs (best of {REPS}) ==")
+    print(tabulate(table, headers=["shards", "workers", "ms", "vs 1 worker"], tablefmt="github"))
+    return {"cpus": os.cpu_count(), "rows": rows}
+
+
+# ── 4. sketch strategies ─────────────────────────────────────────────────────
+
+EDGES = [float(edge) for edge in range(2, 20, 2)]
+SKETCHES = {
+    "mean": "mean",
+    "count": "count",
+    "top_k(5)": ("top_k", 5),
+    "histogram(10)": ("histogram", EDGES),
+}
+
+
+def python_observe(kind, shards):
+    """The Python layer being replaced: one state per key, updated per value."""
+    state = {}
+    for shard in shards:
+        for key, x in shard.items():
+            if kind == "mean":
+                s = state.setdefault(key, [0, 0.0, 0.0])
+                s[0] += 1
+                delta = x - s[1]
+                s[1] += delta / s[0]
+                s[2] += delta * (x - s[1])
+            elif kind == "count":
+                state[key] = state.get(key, 0) + 1
+            elif kind == "top_k(5)":
+                heap = state.setdefault(key, [])
+                if len(heap) < 5:
+                    heapq.heappush(heap, x)
+                elif x > heap[0]:
+                    heapq.heapreplace(heap, x)
+            else:
+                state.setdefault(key, [0] * (len(EDGES) + 1))[bisect.bisect_right(EDGES, x)] += 1
+    return state
+
+
+def python_combine(kind, partials):
+    out = {}
+    for partial in partials:
+        for key, s in partial.items():
+            if key not in out:
+                out[key] = list(s) if isinstance(s, list) else s
+            elif kind == "mean":
+                a = out[key]
+                n = a[0] + s[0]
+                delta = s[1] - a[1]
+                a[1] += delta * s[0] / n
+                a[2] += s[2] + delta * delta * a[0] * s[0] / n
+                a[0] = n
+            elif kind == "count":
+                out[key] += s
+            elif kind == "top_k(5)":
+                out[key] = heapq.nlargest(5, out[key] + s)
+            else:
+                out[key] = [x + y for x, y in zip(out[key], s)]
+    return out
+
+
+def bench_sketches():
+    rng = random.Random(50)
+    keys = [f"metric-{i}" for i in range(20_000)]
+    shards = [{key: rng.gauss(10, 3) for key in keys} for _ in range(64)]
+    groups = [shards[i::8] for i in range(8)]
+
+    rows = []
+    for kind, spec in SKETCHES.items():
+        py_partials = [python_observe(kind, group) for group in groups]
+        partials = [gimdict.merge_all(group, dtype="float64", strategy=spec) for group in groups]
+        rows.append({
+            "sketch": kind,
+            "python_observe": best(lambda: python_observe(kind, shards)),
+            "gimdict_observe": best(lambda: gimdict.merge_all(shards, dtype="float64", strategy=spec)),
+            "python_combine": best(lambda: python_combine(kind, py_partials)),
+            "gimdict_combine": best(lambda: gimdict.merge_all(partials)),
+        })
+
+    table = [[r["sketch"]] + [f"{r[k] * 1e3:8.1f}" for k in ("python_observe", "gimdict_observe")]
+             + [f"{r['python_observe'] / r['gimdict_observe']:5.1f}x"]
+             + [f"{r[k] * 1e3:8.1f}" for k in ("python_combine", "gimdict_combine")]
+             + [f"{r['python_combine'] / r['gimdict_combine']:5.1f}x"] for r in rows]
+    print(f"\n== Sketch strategies: 64 shards x {len(keys):,} keys; combine = 8 partial aggregates "
+          f"(best of {REPS}) ==")
+    print(tabulate(table, headers=["sketch", "observe: python ms", "gimdict ms", "speedup",
+                                   "combine: python ms", "gimdict ms", "speedup"], tablefmt="github"))
+    return rows
+
+
+if __name__ == "__main__":
+    sections = {
+        "throughput": bench_throughput(make_shards()),
+        "memory": bench_memory(),
+        "scaling": bench_scaling(),
+        "sketches": bench_sketches(),
+    }
+    if wants_save():
+        print(f"\nRun recorded -> {save('gimdict_merge', sections, reps=REPS)}")
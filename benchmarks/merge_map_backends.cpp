@@ -0,0 +1,114 @@
+// DynamicMergeMap backend benchmark: merge throughput and memory per entry.
+//
+// Compares the `Map` backends of mapping::DynamicMergeMap on the same merge
+// stream (8 shards of random counter updates):
+//
+//   unordered_map  node per key; per-key strategies in a second unordered_map
+//   FlatMap        open addressing; key, value and strategy tag in one slot
+//   DenseIdMap     slot = key (dense ids only); strategy tag in the slot
+//
+// each without and with per-key strategies on 10% of the keys, for dense ids
+// (0..n) and sparse ids (spread over 10x the range). Memory is the bytes
+// held by the backend after the merge (slot arrays; for unordered_map every
+// allocation plus 16 bytes of allocator overhead), divided by the entries.
+//
+// Header-only, no Python needed:
+//   g++ -std=c++20 -O3 benchmarks/merge_map_backends.cpp -o /tmp/merge_map_backends
+//   /tmp/merge_map_backends
+
+#include "../src/_pygim_fast/mapping/dense_id_map.h"
+#include "../src/_pygim_fast/mapping/dynamic_merge_map.h"
+#include "../src/_pygim_fast/mapping/flat_map.h"
+
+#include <algorithm>
+#include <chrono>
+#include <cstdint>
+#include <cstdio>
+#include <memory>
+#include <random>
+#include <unordered_map>
+#include <vector>
+
+namespace {
+
+using namespace pygim::mapping;
+
+constexpr int kReps = 5;
+constexpr std::size_t kShards = 8;
+
+std::size_t g_allocated = 0;
+
+template <typename T>
+struct CountingAllocator {
+    using value_type = T;
+    CountingAllocator() = default;
+    template <typename U>
+    CountingAllocator(const CountingAllocator<U>&) {}
+    T* allocate(std::size_t n) {
+        g_allocated += n * sizeof(T) + 16;
+        return std::allocator<T>().allocate(n);
+    }
+    void deallocate(T* p, std::size_t n) {
+        g_allocated -= n * sizeof(T) + 16;
+        std::allocator<T>().deallocate(p, n);
+    }
+    bool operator==(const CountingAllocator&) const { return true; }
+};
+
+using Key = std::uint32_t;
+using Value = std::int64_t;
+template <typename T>
+using Node = std::unordered_map<Key, T, std::hash<Key>, std::equal_to<Key>, CountingAllocator<std::pair<const Key, T>>>;
+
+using NodeMerge = DynamicMergeMap<Key, Value, Node<Value>, Node<MergeStrategy>>;
+using FlatMerge = DynamicMergeMap<Key, Value, FlatMap<Key, Value>>;
+using DenseMerge = DynamicMergeMap<Key, Value, DenseIdMap<Key, Value>>;
+
+template <typename Merge>
+void run(const char* name, const std::vector<std::vector<Key>>& shards, const std::vector<Key>& keys,
+         bool strategies) {
+    double best = 1e300;
+    std::size_t bytes = 0;
+    std::size_t entries = 0;
+    for (int rep = 0; rep < kReps; ++rep) {
+        g_allocated = 0;
+        Merge merge;
+        if (strategies) {
+            for (std::size_t i = 0; i < keys.size(); i += 10) merge.set_merge_strategy(keys[i], MergeStrategy::Max);
+        }
+        const auto start = std::chrono::steady_clock::now();
+        for (const auto& shard : shards) {
+            for (const Key key : shard) merge.merge_in(key, 1);
+        }
+        best = std::min(best, std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count());
+        entries = merge.size();
+        if constexpr (Merge::inline_strategies) bytes = merge.data().memory_usage();
+        else bytes = g_allocated;
+    }
+    const double merges = static_cast<double>(shards.size() * shards.front().size());
+    std::printf("| %-13s | %-3s | %9.1f | %8.1f |\n", name, strategies ? "yes" : "no", merges / best / 1e6,
+                static_cast<double>(bytes) / static_cast<double>(entries));
+}
+
+}  // namespace
+
+int main() {
+    std::mt19937 rng(48);
+    for (const std::size_t n : {std::size_t{1'000}, std::size_t{200'000}}) {
+        for (const std::size_t spread : {std::size_t{1}, std::size_t{10}}) {
+            std::vector<Key> keys(n);
+            for (std::size_t i = 0; i < n; ++i) keys[i] = static_cast<Key>(i * spread);
+            std::vector<std::vector<Key>> shards(kShards);
+            for (auto& shard : shards) {
+                for (std::size_t i = 0; i < n; ++i) shard.push_back(keys[rng() % n]);
+            }
+            std::printf("\n%zu keys, %s ids (best of %d)\n", n, spread == 1 ? "dense" : "sparse", kReps);
+            std::printf("| backend       | strategies | M merges/s | bytes/entry |\n|---|---|---|---|\n");
+            for (const bool strategies : {false, true}) {
+                run<NodeMerge>("unordered_map", shards, keys, strategies);
+                run<FlatMerge>("FlatMap", shards, keys, strategies);
+                run<DenseMerge>("DenseIdMap", shards, keys, strategies);
+            }
+        }
+    }
+}
@@ -11,10 +11,16 @@ This example demonstrates:
 - Broadcasting attribute reads, property reads, and method calls
 - Forwarding positional and keyword arguments
 - Broadcasting over arbitrary iterables, including built-in types
+- Parallel fan-out of blocking method calls with ``workers=``
+- Columnar attribute harvest into typed buffers with ``gather()``
+- Single-pass streaming over generators with ``lazy=True`` / ``chunk=N``
 - The dunder guard rail that keeps proxy behaviour unambiguous
 """
 
-from pygim.each import each
+import itertools
+import time
+
+from pygim.each import each, gather
 
 
 class Sensor:
@@ -56,7 +62,56 @@ assert each(sensors).scaled(factor=10) == [100, 200, 300]
 assert each(("a", "bb", "ccc")).upper() == ["A", "BB", "CCC"]
 
 # ----------------------------------------------------------------------------
-# 3. Guard rail: dunder access is refused
+# 3. Parallel fan-out
+# ----------------------------------------------------------------------------
+# For element methods that block (network calls, sleeps, file I/O), pass
+# workers=N: the calls run on N native threads, so the broadcast takes
+# roughly the slowest call rather than the sum. Results keep input order;
+# workers=0 picks a ThreadPoolExecutor-style default. If any call fails,
+# every call still runs and one BroadcastError carries all the failures.
+class Endpoint:
+    def __init__(self, name):
+        self.name = name
+
+    def ping(self):
+        time.sleep(0.05)  # stands in for network latency
+        return f"{self.name}: ok"
+
+
+endpoints = [Endpoint(f"node{i}") for i in range(8)]
+start = time.perf_counter()
+assert each(endpoints, workers=8).ping() == [f"node{i}: ok" for i in range(8)]
+assert time.perf_counter() - start < 8 * 0.05  # overlapped, not summed
+
+# ----------------------------------------------------------------------------
+# 4. Columnar gather
+# ----------------------------------------------------------------------------
+# When the values are headed for numeric code, gather() skips the list of
+# Python objects: it reads several attributes in one pass straight into typed
+# array.array columns. They export the buffer protocol, so numpy.asarray(col)
+# or pyarrow.py_buffer(col) wraps them without copying.
+# Several names give a tuple of columns: xs, ys = gather(points, "x", "y").
+values = gather((s for s in sensors), "value", dtype="int64")  # even a generator
+assert values.tolist() == [10, 20, 30] and values.typecode == "q"
+assert sum(gather(sensors, "value")) == 60.0  # float64 by default
+
+# ----------------------------------------------------------------------------
+# 5. Streaming over generators
+# ----------------------------------------------------------------------------
+# The default broadcast may traverse its input twice and returns a full list.
+# With lazy=True it makes one pass: the first element decides attribute vs
+# method, and the result is an iterator that pulls the source as you consume
+# it -- so even an endless stream broadcasts in constant memory. chunk=N
+# yields lists of up to N results (and combines with workers= per chunk).
+readings = (Sensor(f"s{i}", i) for i in itertools.count())  # never ends
+first_three = itertools.islice(each(readings, lazy=True).scaled(10), 3)
+assert list(first_three) == [0, 10, 20]
+
+batches = each((Sensor("b", v) for v in range(5)), lazy=True, chunk=2).value
+assert list(batches) == [[0, 1], [2, 3], [4]]
+
+# ----------------------------------------------------------------------------
+# 6. Guard rail: dunder access is refused
 # ----------------------------------------------------------------------------
 # Forwarding dunders (__len__, __iter__, ...) would make it impossible to
 # tell whether you mean the *proxy's* protocol or a broadcast over the
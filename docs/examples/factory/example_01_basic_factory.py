@@ -62,6 +62,11 @@ for shape_name, argument in [("circle", 1), ("square", 2)]:
     product = factory.create(shape_name, argument)
     assert product  # no if/elif over shape names anywhere
 
+# create_many() builds a batch with one call and one creator lookup; each
+# mapping is passed as keyword arguments.
+circles = factory.create_many("circle", [{"radius": r} for r in range(1, 4)])
+assert [c.radius for c in circles] == [1, 2, 3]
+
 # Asking for an unknown name fails loudly.
 try:
     factory.create("triangle")
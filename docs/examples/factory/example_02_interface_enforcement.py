@@ -15,8 +15,11 @@ This example demonstrates:
 - Constructing a Factory bound to an interface
 - Creators that satisfy and violate the interface
 - Where and how violations surface
+- ``validate="first"|"always"|"never"`` and the per-type verdict cache
 """
 
+from typing import Protocol, runtime_checkable
+
 from pygim.factory import Factory
 
 
@@ -69,4 +72,34 @@ else:
 # The failure is per-creation: the factory itself stays fully usable.
 assert isinstance(factory.create("disk"), Storage)
 
+
+# ----------------------------------------------------------------------------
+# 3. How often products are checked
+# ----------------------------------------------------------------------------
+# By default (validate="first") the verdict is remembered per concrete
+# product type, so structural protocol checks run once per class rather than
+# once per product. Modifying the class or the interface invalidates it.
+@runtime_checkable
+class Closeable(Protocol):
+    def close(self): ...
+
+
+class Handle:
+    def close(self):
+        pass
+
+
+handles = Factory(Closeable)
+handles.register("handle", Handle)
+for _ in range(3):
+    handles.create("handle")
+info = handles.validation_cache_info()
+assert (info["misses"], info["hits"]) == (1, 2)
+
+# "always" checks every product (use it when the verdict depends on the
+# instance, e.g. protocol data members set in __init__); "never" skips it.
+checked_every_time = Factory(Closeable, validate="always")
+assert checked_every_time.validate == "always"
+handles.validate = "never"
+
 print("Factory interface example OK:", type(storage).__name__)
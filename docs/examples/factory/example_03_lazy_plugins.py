@@ -0,0 +1,92 @@
+# type: ignore
+"""Lazy plugins: register now, import on first ``create()``.
+
+``use_module()`` imports a plugin module up front so that it can register
+itself. With many plugins that makes startup pay for every import, including
+the ones a given run never creates. A lazy entry names a ``module:attr``
+target instead; the module is imported the first time the entry is used.
+
+A manifest (``{name: "module:attr"}``) records the targets, so a scan done
+once -- at build time, from installed entry points, or from an eager
+factory -- can be replayed at startup without importing anything.
+
+This example demonstrates:
+- ``register_lazy()`` and ``is_pending()``
+- A plugin that registers itself on import fulfilling its lazy entry
+- ``manifest()`` / ``save_manifest()`` / ``load_manifest()``
+- ``use_entry_points(group)`` for installed packages
+"""
+
+import pathlib
+import sys
+import tempfile
+
+from pygim.factory import Factory
+
+# A plugin package on disk, standing in for an installed distribution.
+plugin_dir = pathlib.Path(tempfile.mkdtemp())
+(plugin_dir / "shape_plugins.py").write_text(
+    "def circle(radius):\n"
+    "    return ('circle', radius)\n"
+    "\n"
+    "def square(side):\n"
+    "    return ('square', side)\n"
+)
+sys.path.insert(0, str(plugin_dir))
+
+# ----------------------------------------------------------------------------
+# 1. Lazy entries
+# ----------------------------------------------------------------------------
+factory = Factory()
+factory.register_lazy("circle", "shape_plugins:circle")
+factory.register_lazy("square", "shape_plugins:square")
+
+assert "shape_plugins" not in sys.modules  # nothing imported yet
+assert factory.is_pending("circle")
+
+assert factory.create("circle", 2) == ("circle", 2)  # imports shape_plugins
+assert "shape_plugins" in sys.modules
+assert not factory.is_pending("circle")
+
+# A bad target is reported at registration; a missing module on first use.
+try:
+    factory.register_lazy("oval", "shape_plugins.oval")
+except ValueError:
+    pass
+else:
+    raise AssertionError("Expected a malformed target to raise")
+
+# ----------------------------------------------------------------------------
+# 2. Manifests
+# ----------------------------------------------------------------------------
+# Eager creators are included when they can be imported back by
+# `module:qualname`; lambdas and __main__ functions are skipped.
+factory.register("dumps", __import__("json").dumps)
+factory.register("anonymous", lambda: None)
+manifest = factory.manifest()
+assert manifest == {
+    "circle": "shape_plugins:circle",
+    "square": "shape_plugins:square",
+    "dumps": "json:dumps",
+}
+
+manifest_path = plugin_dir / "plugins.json"
+factory.save_manifest(manifest_path)
+
+startup = Factory()
+startup.load_manifest(manifest_path)  # a path or a mapping
+assert all(startup.is_pending(name) for name in manifest)
+assert startup.create("square", 4) == ("square", 4)
+
+# ----------------------------------------------------------------------------
+# 3. Entry points
+# ----------------------------------------------------------------------------
+# Installed distributions advertise plugins in their metadata, e.g.
+#
+#   [project.entry-points."myapp.shapes"]
+#   circle = "shape_plugins:circle"
+#
+# and use_entry_points() registers each one lazily.
+assert Factory().use_entry_points("pygim.example.no_such_group") == []
+
+print("Lazy plugins example OK:", sorted(startup.registered_callables()))
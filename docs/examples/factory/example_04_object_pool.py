@@ -0,0 +1,82 @@
+# type: ignore
+"""Reusing expensive products with a pooled factory entry.
+
+Some products -- parsers with compiled tables, large buffers, bound
+connections -- cost far more to build than to reset. Registering them with
+``pool=N`` lets callers borrow an instance with ``with factory.acquire(...)``
+and hand it back afterwards instead of building a new one per task.
+
+This example demonstrates:
+- ``pool=``, ``reset=`` and ``idle_timeout=`` on ``register()``
+- Borrowing with ``acquire()`` and the reuse it gives
+- Failed work dropping the instance instead of returning it
+- ``pool_stats()`` and ``evict_idle()``
+"""
+
+import re
+import time
+
+from pygim.factory import Factory
+
+
+class Parser:
+    def __init__(self, dialect="default"):
+        self.dialect = dialect
+        self.rules = [re.compile(rf"\b{word}\b") for word in ("select", "from", "where")]
+        self.buffer = bytearray(64 * 1024)
+        self.parsed = 0
+
+    def feed(self, text):
+        self.parsed += sum(len(rule.findall(text)) for rule in self.rules)
+
+    def reset(self):
+        self.parsed = 0
+
+
+factory = Factory(Parser)
+factory.register("parser", Parser, pool=4, reset=Parser.reset, idle_timeout=60.0)
+
+# ----------------------------------------------------------------------------
+# 1. Borrow and return
+# ----------------------------------------------------------------------------
+# kwargs are only used when a new instance has to be created.
+with factory.acquire("parser", dialect="ansi") as parser:
+    parser.feed("select a from t where b")
+    assert parser.parsed == 3
+
+with factory.acquire("parser") as again:
+    assert again is parser  # the same instance, already reset
+    assert again.parsed == 0 and again.dialect == "ansi"
+
+stats = factory.pool_stats("parser")
+assert (stats["hits"], stats["misses"], stats["idle"]) == (1, 1, 1)
+
+# ----------------------------------------------------------------------------
+# 2. Failed work is not returned to the pool
+# ----------------------------------------------------------------------------
+try:
+    with factory.acquire("parser") as broken:
+        raise ValueError("half-parsed input")
+except ValueError:
+    pass
+assert factory.pool_stats("parser")["idle"] == 0  # `broken` was dropped
+
+# ----------------------------------------------------------------------------
+# 3. Bounded and evicting
+# ----------------------------------------------------------------------------
+# At most `pool` idle instances are kept; extra returns are dropped.
+leases = [factory.acquire("parser") for _ in range(6)]
+for lease in leases:
+    lease.__enter__()
+for lease in leases:
+    lease.__exit__(None, None, None)
+stats = factory.pool_stats("parser")
+assert stats["idle"] == 4 and stats["in_use"] == 0
+
+factory.register("scratch", Parser, pool=2, idle_timeout=0.01)
+with factory.acquire("scratch"):
+    pass
+time.sleep(0.02)
+assert factory.evict_idle() == 1  # otherwise evicted on the next acquire/return
+
+print("Object pool example OK:", factory.pool_stats("parser"))
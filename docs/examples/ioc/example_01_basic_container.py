@@ -15,8 +15,11 @@ This example demonstrates:
 - Provider decorators for cross-cutting concerns
 - Runtime interface/protocol validation on resolve
 - Introspection: ``len``, ``in``, ``registered_keys``, ``describe``, ``repr``
+- Building singletons ahead of traffic with ``warm_up()``
 """
 
+import time
+
 from pygim.ioc import Container
 
 # A container can reserve space upfront to avoid rehashing while you
@@ -161,4 +164,35 @@ assert descriptor.provider is CachedRepository
 assert descriptor.lifecycle == "singleton"
 assert descriptor.name == "cached"
 
+# ----------------------------------------------------------------------------
+# 8. Warming up singletons before traffic
+# ----------------------------------------------------------------------------
+# Singletons are built on first resolve, so the first request would pay for
+# all of them. warm_up() builds them up front on a thread pool: independent
+# singletons overlap, dependent ones wait for what they need. It returns the
+# construction time per key, in seconds.
+
+class Settings:
+    pass
+
+
+class Templates:
+    pass
+
+
+def load(kind):
+    def provider():
+        time.sleep(0.05)  # stand-in for file or network I/O
+        return kind()
+    return provider
+
+
+startup = Container()
+startup.register(Settings, load(Settings), lifecycle="singleton")
+startup.register(Templates, load(Templates), lifecycle="singleton")
+
+timings = startup.warm_up(workers=2)   # keys=[...] limits it to some roots
+assert set(timings) == {(Settings, None), (Templates, None)}
+assert startup.warm_up() == {}         # already built: nothing to do
+
 print("IoC basic container example OK:", container)
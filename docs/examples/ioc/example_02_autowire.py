@@ -16,9 +16,11 @@ This example demonstrates:
 - Autowiring across several layers of an object graph
 - Falling back to default values when no provider matches a typed parameter
 - The class-provider restriction and other guard rails
+- Precompiling resolution plans with ``compile()``
+- The process-wide constructor signature cache
 """
 
-from pygim.ioc import Container
+from pygim.ioc import Container, signature_cache_info
 
 container = Container()
 
@@ -127,4 +129,43 @@ except RuntimeError as error:
 else:
     raise AssertionError("Expected unresolvable dependency to fail resolution")
 
+
+# ----------------------------------------------------------------------------
+# 4. Compile once wiring is complete
+# ----------------------------------------------------------------------------
+# Dynamic autowiring re-plans every resolve (registrations may still change).
+# Once the application has registered everything, compile() freezes the
+# container and flattens each key into a construction plan: constructors are
+# introspected once, cycles and missing providers are reported right here,
+# and resolve() then runs the plan straight through.
+app = Container()
+app.register(Repository, MemoryRepository, lifecycle="singleton")
+app.register(Service, Service, autowire=True)
+app.register(Controller, Controller, autowire=True)
+app.compile()
+
+compiled_controller = app.resolve(Controller)
+assert compiled_controller.service.repository is app.resolve(Repository)
+
+try:
+    app.register(Database, Database)
+except RuntimeError as error:
+    assert "frozen" in str(error)
+else:
+    raise AssertionError("Expected registration after compile() to fail")
+
+# ----------------------------------------------------------------------------
+# 5. Constructor signatures are parsed once per process
+# ----------------------------------------------------------------------------
+# Introspecting a constructor (inspect.signature + typing.get_type_hints) is
+# the slow part of autowiring. The parsed result is cached per class for the
+# whole process, so a fresh container -- one per test or per tenant -- reuses
+# it. Replacing a class's __init__ invalidates its entry.
+before = signature_cache_info()
+tenant = Container()
+tenant.register(Repository, MemoryRepository)
+tenant.register(Service, Service, autowire=True)
+tenant.resolve(Service)
+assert signature_cache_info()["hits"] == before["hits"] + 1   # no re-parse
+
 print("IoC autowire example OK:", controller.service.repository.label)
@@ -0,0 +1,104 @@
+# type: ignore
+"""Per-request services with the ``scoped`` lifecycle.
+
+Transient and singleton cover "always new" and "one per process", but many
+services live exactly as long as one unit of work: a database session per
+HTTP request, a unit-of-work per task. Registering them as ``scoped`` makes
+the container build them once per ``container.scope()`` and close them when
+the scope ends -- newest first, so a service is closed before the
+dependencies it was built from.
+
+The active scope is held in a ``ContextVar``: asyncio tasks started inside
+an ``async with container.scope():`` block share it, while concurrent
+requests each get their own.
+
+This example demonstrates:
+- One instance per scope, shared by everything resolved inside it
+- Reverse-order disposal via ``close()`` / ``aclose()``
+- The error for resolving a scoped key outside any scope
+- Async scopes isolating concurrent requests
+"""
+
+import asyncio
+
+from pygim.ioc import Container
+
+events = []
+
+
+class Session:
+    """Something that must be closed: a connection, a transaction, ..."""
+
+    def __init__(self):
+        events.append("open session")
+
+    def close(self):
+        events.append("close session")
+
+
+class UnitOfWork:
+    def __init__(self, session: Session):
+        self.session = session
+        events.append("open unit of work")
+
+    def close(self):
+        events.append("close unit of work")
+
+
+container = Container()
+container.register(Session, Session, lifecycle="scoped")
+container.register(UnitOfWork, UnitOfWork, lifecycle="scoped", autowire=True)
+
+# ----------------------------------------------------------------------------
+# 1. One instance per scope, closed in reverse creation order
+# ----------------------------------------------------------------------------
+with container.scope() as scope:
+    uow = container.resolve(UnitOfWork)
+    assert container.resolve(UnitOfWork) is uow        # cached for the scope
+    assert container.resolve(Session) is uow.session   # shared with the graph
+    assert len(scope) == 2
+
+assert events == [
+    "open session",
+    "open unit of work",
+    "close unit of work",   # newest first ...
+    "close session",        # ... then what it was built from
+]
+
+with container.scope():
+    assert container.resolve(UnitOfWork) is not uow    # a fresh scope, fresh instances
+
+# ----------------------------------------------------------------------------
+# 2. Scoped keys need an active scope
+# ----------------------------------------------------------------------------
+try:
+    container.resolve(Session)
+except RuntimeError as error:
+    assert "No active scope" in str(error)
+else:
+    raise AssertionError("scoped resolve outside a scope must fail")
+
+# ----------------------------------------------------------------------------
+# 3. asyncio: one scope per request, inherited by the request's tasks
+# ----------------------------------------------------------------------------
+
+
+async def handle_request():
+    async with container.scope():
+        session = container.resolve(Session)
+
+        async def background_step():
+            return container.resolve(Session)  # runs in a child task
+
+        assert await asyncio.create_task(background_step()) is session
+        return session
+
+
+async def serve():
+    return await asyncio.gather(handle_request(), handle_request())
+
+
+first, second = asyncio.run(serve())
+assert first is not second  # concurrent requests never share a session
+
+print("Scoped lifecycle example OK")
@@ -0,0 +1,85 @@
+# type: ignore
+"""Async providers with ``await container.aresolve(key)``.
+
+Connection pools and HTTP clients are usually created by coroutines, and most
+of them do not depend on each other. ``aresolve`` awaits coroutine providers
+and resolves the injected dependencies of a registration *concurrently*, so
+wiring a service with many async dependencies takes as long as its slowest
+chain, not the sum of all of them.
+
+This example demonstrates:
+- Coroutine providers awaited by the container
+- Independent dependencies started together (``asyncio.gather``)
+- An async singleton built once, however many tasks ask for it
+"""
+
+import asyncio
+import time
+
+from pygim.ioc import Container
+
+connects = []
+
+
+class Database:
+    pass
+
+
+class Search:
+    pass
+
+
+class Mailer:
+    pass
+
+
+async def connect(kind):
+    connects.append(kind.__name__)
+    await asyncio.sleep(0.05)  # stand-in for a network handshake
+    return kind()
+
+
+class Application:
+    def __init__(self, db: Database, search: Search, mailer: Mailer):
+        self.db, self.search, self.mailer = db, search, mailer
+
+
+container = Container()
+container.register(Database, lambda: connect(Database), lifecycle="singleton")
+container.register(Search, lambda: connect(Search), lifecycle="singleton")
+container.register(Mailer, lambda: connect(Mailer))
+container.register(Application, Application, autowire=True)
+
+# ----------------------------------------------------------------------------
+# 1. Three 50 ms handshakes, started together
+# ----------------------------------------------------------------------------
+
+
+async def startup():
+    started = time.perf_counter()
+    app = await container.aresolve(Application)
+    return app, time.perf_counter() - started
+
+
+app, elapsed = asyncio.run(startup())
+assert isinstance(app.db, Database) and isinstance(app.mailer, Mailer)
+assert elapsed < 0.15  # ~0.05 s: one round of handshakes, not three
+
+# ----------------------------------------------------------------------------
+# 2. Async singletons are built once, even under concurrent awaiters
+# ----------------------------------------------------------------------------
+connects.clear()
+fresh = Container()
+fresh.register(Database, lambda: connect(Database), lifecycle="singleton")
+
+
+async def many_awaiters():
+    return await asyncio.gather(*(fresh.aresolve(Database) for _ in range(20)))
+
+
+databases = asyncio.run(many_awaiters())
+assert connects == ["Database"]                  # a single handshake
+assert all(db is databases[0] for db in databases)
+assert fresh.resolve(Database) is databases[0]   # sync resolve sees it too
+
+print(f"Async providers example OK ({elapsed * 1000:.0f} ms startup)")
@@ -0,0 +1,95 @@
+# type: ignore
+"""Finding slow wiring with resolution profiling.
+
+When ``resolve()`` is slow, the question is *which* part of the object graph
+is slow: a provider doing I/O, a decorator, or the first-time introspection
+of an autowired constructor. With ``container.profiling = True`` every
+top-level resolve records its tree of resolutions, timed per key and split
+into phases (dependencies, provider, decorators, validation).
+
+This example demonstrates:
+- The per-resolve tree from ``profile_report()`` and totals from ``profile_stats()``
+- Cached instances (``constructed: False``) versus real constructions
+- ``flame_graph()`` folded stacks for flamegraph.pl / speedscope
+- ``dependency_graph()`` as JSON or Graphviz DOT
+"""
+
+import json
+import time
+
+from pygim.ioc import Container
+
+
+class Config:
+    pass
+
+
+class Database:
+    def __init__(self, config: Config):
+        time.sleep(0.02)  # stand-in for opening a connection
+
+
+class Cache:
+    def __init__(self, config: Config):
+        pass
+
+
+class Service:
+    def __init__(self, db: Database, cache: Cache):
+        self.db, self.cache = db, cache
+
+
+container = Container()
+container.register(Config, Config, lifecycle="singleton")
+container.register(Database, Database, autowire=True)
+container.register(Cache, Cache, autowire=True)
+container.register(Service, Service, autowire=True)
+
+# ----------------------------------------------------------------------------
+# 1. One tree per top-level resolve
+# ----------------------------------------------------------------------------
+container.profiling = True
+container.resolve(Service)
+container.profiling = False
+
+
+def show(node, depth=0):
+    interface, _ = node["key"]
+    state = "built" if node["constructed"] else "cached"
+    print(f"{'  ' * depth}{interface.__name__:<10} {node['seconds'] * 1000:7.2f} ms  {state}")
+    for child in node["children"]:
+        show(child, depth + 1)
+
+
+(tree,) = container.profile_report()
+show(tree)
+slowest = max(tree["children"], key=lambda child: child["seconds"])
+assert slowest["key"][0] is Database
+assert slowest["phases"]["provider"] >= 0.02  # the time is in its constructor
+
+stats = container.profile_stats()
+assert stats["constructed"] == 4 and stats["cached"] == 1  # Config: built once, then shared
+
+# ----------------------------------------------------------------------------
+# 2. Flame graph: `Service;Database <self µs>` lines
+# ----------------------------------------------------------------------------
+folded = container.flame_graph()
+print(folded, end="")
+assert any(line.startswith("Service;Database ") for line in folded.splitlines())
+# Save with: open("ioc.folded", "w").write(folded); flamegraph.pl ioc.folded > ioc.svg
+
+container.clear_profile()
+assert container.profile_report() == []
+
+# ----------------------------------------------------------------------------
+# 3. The registrations as a graph
+# ----------------------------------------------------------------------------
+graph = json.loads(container.dependency_graph())
+names = {node["id"]: node["key"] for node in graph["nodes"]}
+edges = {(names[edge["source"]], names[edge["target"]]) for edge in graph["edges"]}
+assert ("Service", "Database") in edges and ("Cache", "Config") in edges
+
+dot = container.dependency_graph(format="dot")  # render with `dot -Tsvg`
+assert dot.startswith("digraph pygim_ioc")
+
+print("Profiling example OK")
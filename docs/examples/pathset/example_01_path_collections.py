@@ -12,14 +12,16 @@ This example demonstrates:
 - Removing paths with ``-=`` (by string or by another PathSet)
 - Independent copies with ``clone()``
 - Bulk-reading file contents with ``read_all_files()``
-- Glob-style matching with ``match_pattern``
+- Glob-style matching with ``match_pattern`` and a compiled ``Matcher``
+- Bulk copy / move / delete with ``copy_to()``, ``move_to()``, ``unlink()``
+- Parallel size aggregation with ``disk_usage()``
 """
 
 import shutil
 import tempfile
 from pathlib import Path
 
-from pygim.pathset import PathSet, match_pattern
+from pygim.pathset import Matcher, PathSet, match_pattern
 
 # A scratch directory with a few real files keeps the example self-contained.
 workdir = Path(tempfile.mkdtemp(prefix="pygim_pathset_example_"))
@@ -86,6 +88,41 @@ try:
     assert not match_pattern("*.txt", "logo.png")
     assert match_pattern("read??.txt", "readme.txt")
 
+    # When the same pattern is applied to many names, compile it once and
+    # filter the whole batch in a single call. match_many() returns a
+    # list[bool] mask in input order.
+    txt = Matcher("*.txt")
+    names = ["readme.txt", "logo.png", "notes.txt"]
+    assert txt.match_many(names) == [True, False, True]
+    assert [n for n, hit in zip(names, txt.match_many(names)) if hit] == ["readme.txt", "notes.txt"]
+
+    # ------------------------------------------------------------------------
+    # 5. Bulk file operations
+    # ------------------------------------------------------------------------
+    # copy_to / move_to / unlink run natively on a bounded thread pool with
+    # the GIL released. A bad path never aborts the batch: failures are
+    # collected per item in result.errors, and result.paths holds what was
+    # actually written (or removed).
+    texts_only = PathSet([workdir / "readme.txt", workdir / "notes.txt"])
+    staged = texts_only.copy_to(workdir / "staging", workers=2)
+    assert staged.ok and staged.succeeded == 2
+    assert (workdir / "staging" / "readme.txt").read_text() == "hello"
+
+    # Copying again without overwrite=True reports each clash instead of raising.
+    clash = texts_only.copy_to(workdir / "staging")
+    assert clash.failed == 2 and clash.errors[0][0] == workdir / "notes.txt"
+
+    # disk_usage() walks every path in parallel and sums regular-file sizes
+    # natively, returning {group: (bytes, files)} -- one entry per group,
+    # never one Python object per file. Group by "parent" (default),
+    # "entry", "total", or depth=N levels below each path (du --max-depth=N).
+    everything = PathSet(list(workdir.iterdir()))
+    assert everything.disk_usage("total") == {workdir: (28, 5)}  # 3 originals + 2 staged
+    per_child = PathSet([workdir]).disk_usage(depth=1)
+    assert per_child[workdir / "staging"] == (10, 2) and per_child[workdir] == (18, 3)
+
+    assert staged.paths.unlink().succeeded == 2
+
     print("PathSet example OK:", sorted(p.name for p in files))
 finally:
     shutil.rmtree(workdir)
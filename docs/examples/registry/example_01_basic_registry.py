@@ -124,4 +124,47 @@ except Exception:
 else:
     raise AssertionError("Expected identity policy to reject a string id")
 
+# ----------------------------------------------------------------------------
+# 7. Freezing a read-mostly registry
+# ----------------------------------------------------------------------------
+# Under the qualname policy every lookup by object builds its
+# "module.qualname" string. Once registration is done, freeze() builds a
+# perfect-hash index over the keys and caches each looked-up object's slot,
+# so repeat lookups skip the string work altogether.
+class Handler:
+    pass
+
+
+reg.register(Handler, "handler")
+reg.freeze()
+assert reg[Handler] == "handler"  # first lookup: builds the key, caches the slot
+assert reg[Handler] == "handler"  # then: one pointer-keyed probe
+
+try:
+    reg.register("too.late", None)
+except RuntimeError:
+    pass  # frozen registries refuse registration ...
+else:
+    raise AssertionError("Expected a frozen registry to reject registration")
+
+reg.unfreeze()  # ... until unfrozen explicitly
+reg.register("too.late", None)
+
+# ----------------------------------------------------------------------------
+# 8. Bulk registration and lookup
+# ----------------------------------------------------------------------------
+# update() and get_many() move a whole batch through one call: plugin
+# loading registers thousands of entries, batch jobs look up a handler per
+# row. update() checks the batch before storing anything.
+reg.update({f"codec.{n}": n for n in ("utf8", "latin1", "ascii")})
+rows = ["codec.utf8", "codec.ascii", "codec.utf8"]
+assert reg.get_many(rows) == ["utf8", "ascii", "utf8"]
+
+try:
+    reg.update([("codec.utf16", "utf16"), ("codec.utf8", "again")])
+except RuntimeError:
+    assert "codec.utf16" not in reg  # all or nothing
+else:
+    raise AssertionError("Expected a duplicate in the batch to raise")
+
 print("Basic registry example OK:", reg, id_reg)
@@ -20,6 +20,8 @@ This example demonstrates:
 - Decorator-form registration with and without override
 - Manually triggering post hooks
 - Capacity pre-reservation for bulk registration
+- Hooks filtered to one key or an id prefix, and batched ``post_many``
+- Native event counters that never call into Python
 """
 
 from pygim.registry import Registry, KeyPolicyKind
@@ -104,4 +106,34 @@ keys = [key[0] for key in reg.registered_keys()]
 assert "task.process" in keys and "task.square" in keys
 assert reg.find_id("task.process") is reg["task.process"]
 
+# ----------------------------------------------------------------------------
+# 5. Subscribing to a subset of keys
+# ----------------------------------------------------------------------------
+# A hook that cares about a few keys should not cost a Python call on every
+# other lookup. `key=` / `prefix=` filters are checked in C++ first.
+audited = []
+reg.on_pre(lambda key, value: audited.append(key[0]), prefix="task.")
+reg.on_post(lambda key, obj: audited.append(("done", obj)), key="task.square")
+
+reg.register("util.noop", lambda: None)
+reg["util.noop"]           # no Python call for the filtered hooks
+reg["task.square"]
+
+# post_many() announces a whole batch in one call.
+reg.post_many([("task.square", "batch-1"), ("util.noop", "batch-1")])
+assert audited == ["task.square", ("done", "batch-1")]
+
+# ----------------------------------------------------------------------------
+# 6. Native counters
+# ----------------------------------------------------------------------------
+# enable_stats() counts events per key in C++; timing=True adds the time
+# spent in the subscribed Python hooks, to see what instrumentation costs.
+reg.enable_stats(timing=True)
+for _ in range(3):
+    reg["task.process"]
+stats = reg.stats()
+assert stats["per_key"][("task.process", "")]["pre"] == 3
+assert stats["callback_seconds"]["pre"] > 0
+reg.disable_stats()
+
 print("Hooks registry example OK:", reg, {k: len(v) for k, v in events.items()})
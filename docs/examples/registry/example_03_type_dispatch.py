@@ -0,0 +1,69 @@
+# type: ignore
+"""A type -> handler table with ``registry.dispatch()``.
+
+Registries are a natural home for per-type handlers: serializers, renderers,
+validators. Exact lookups only find the class that was registered, though,
+so subclasses used to need a Python loop over ``type(obj).__mro__`` with a
+lookup per base. ``dispatch()`` does that walk in C++, the way
+``functools.singledispatch`` does, and remembers the answer per concrete
+type until the next registration.
+
+This example demonstrates:
+- Dispatching on an instance or a type to the most specific registered base
+- ``object`` as the catch-all fallback
+- Registration (or override) immediately changing later dispatches
+"""
+
+import datetime
+import decimal
+
+from pygim.registry import Registry
+
+serializers = Registry()
+
+
+@serializers.register(object)
+def serialize_any(value):
+    return repr(value)
+
+
+@serializers.register(datetime.date)
+def serialize_date(value):
+    return value.isoformat()
+
+
+@serializers.register(decimal.Decimal)
+def serialize_decimal(value):
+    return str(value)
+
+
+def serialize(value):
+    return serializers.dispatch(value)(value)
+
+
+# ----------------------------------------------------------------------------
+# 1. The most specific registered base wins
+# ----------------------------------------------------------------------------
+# datetime.datetime is a subclass of datetime.date: no registration needed.
+stamp = datetime.datetime(2024, 5, 1, 12, 30)
+assert serialize(stamp) == "2024-05-01T12:30:00"
+assert serialize(decimal.Decimal("1.50")) == "1.50"
+assert serialize(3) == "3"  # falls back to `object`
+
+# Types work as well as instances.
+assert serializers.dispatch(datetime.datetime) is serialize_date
+
+# ----------------------------------------------------------------------------
+# 2. New registrations take effect immediately
+# ----------------------------------------------------------------------------
+
+
+@serializers.register(datetime.datetime)
+def serialize_datetime(value):
+    return value.strftime("%Y-%m-%d %H:%M")
+
+
+assert serialize(stamp) == "2024-05-01 12:30"
+assert serialize(datetime.date(2024, 5, 1)) == "2024-05-01"  # dates unaffected
+
+print("Type dispatch example OK")
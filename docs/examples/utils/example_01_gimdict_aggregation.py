@@ -0,0 +1,110 @@
+# type: ignore
+"""Aggregating counters from many shards with ``gimdict``.
+
+A ``gimdict`` is a mapping whose ``merge`` / ``|`` combine values per key
+with a strategy (sum, max, min, replace). By default it holds arbitrary
+Python objects. With ``dtype="int64"`` or ``dtype="float64"`` it stores the
+values natively instead, with keys interned into dense ids, and
+``gimdict.merge_all(shards)`` merges any number of shards in one call: each
+shard is read once, then merged in C++ with the GIL released.
+
+This example demonstrates:
+- Object gimdicts and their per-type / per-key strategies
+- Typed gimdicts (``dtype=``) and the values they accept
+- ``merge_all`` over plain dicts and over typed gimdicts
+- ``merge_reduce``: the same merge spread over worker threads
+- Sketch strategies: count, mean/variance, top-k and histograms per key
+"""
+
+from pygim.utils import gimdict
+
+# ----------------------------------------------------------------------------
+# 1. Object mode: strategies chosen by value type or per key
+# ----------------------------------------------------------------------------
+left = gimdict({"hits": 3, "owner": "alice"})
+right = gimdict({"hits": 4, "owner": "bob"})
+both = left | right
+assert both["hits"] == 7  # numbers sum by default
+assert both["owner"] == "bob"  # everything else is replaced
+
+# ----------------------------------------------------------------------------
+# 2. Typed mode: native int64 / float64 values
+# ----------------------------------------------------------------------------
+#                            ┌─ dtype: store values natively; they must
+#                            │  convert to the type (TypeError otherwise)
+#                            ▼
+counts = gimdict({"a": 1}, dtype="int64")
+counts.merge_in("a", 2)
+counts.merge_in("b", 5)
+assert counts.to_dict() == {"a": 3, "b": 5}
+try:
+    counts["c"] = "many"
+except TypeError:
+    pass
+else:
+    raise AssertionError("Expected a non-integer value to raise")
+
+latency = gimdict(dtype="float64", float=max)  # per-type strategies still apply
+latency.merge_in("db", 0.25)
+latency.merge_in("db", 0.5)
+assert latency["db"] == 0.5
+
+# ----------------------------------------------------------------------------
+# 3. merge_all: N shards in one pass
+# ----------------------------------------------------------------------------
+# E.g. word counts returned by worker processes as plain dicts.
+shards = [
+    {"the": 120, "cat": 3},
+    {"the": 98, "dog": 7},
+    {"cat": 1, "dog": 2},
+]
+totals = gimdict.merge_all(shards)  # dtype inferred from the first value
+assert totals.dtype == "int64"
+assert totals.to_dict() == {"the": 218, "cat": 4, "dog": 9}
+
+# Typed gimdicts merge without re-reading their keys when they share a key
+# space, e.g. earlier merge_all results combined again.
+daily = [gimdict.merge_all(shards), gimdict.merge_all(shards[:1])]
+weekly = gimdict.merge_all(daily)
+assert weekly["the"] == 338
+
+peaks = gimdict.merge_all(shards, strategy="max")
+assert peaks.to_dict() == {"the": 120, "cat": 3, "dog": 7}
+
+# ----------------------------------------------------------------------------
+# 4. merge_reduce: the same merge on several threads
+# ----------------------------------------------------------------------------
+#                                            ┌─ threads (0 = one per core); each
+#                                            │  folds a run of shards, then the
+#                                            ▼  partial results merge pairwise
+many = [{f"w{(i * 7 + j) % 100}": 1 for j in range(10)} for i in range(64)]
+parallel = gimdict.merge_reduce(many, workers=4)
+assert parallel.to_dict() == gimdict.merge_all(many).to_dict()
+
+# ----------------------------------------------------------------------------
+# 5. Sketch strategies: summaries instead of a single number
+# ----------------------------------------------------------------------------
+# Each worker summarises its request latencies; the summaries then merge.
+def worker_metrics(latencies):
+    metrics = gimdict(dtype="float64")
+    metrics.set_strategy("latency", "mean")                   # count/mean/variance
+    metrics.set_strategy("requests", "count")
+    metrics.set_strategy("slowest", ("top_k", 2))             # the 2 largest
+    metrics.set_strategy("buckets", ("histogram", [0.1, 1]))  # <0.1, <1, rest
+    for seconds in latencies:
+        for key in ("latency", "requests", "slowest", "buckets"):
+            metrics.merge_in(key, seconds)  # one observation each
+    return metrics
+
+
+overall = worker_metrics([0.05, 0.2]) | worker_metrics([0.5, 1.5, 0.08])
+assert overall["requests"] == 5
+assert round(overall["latency"]["mean"], 3) == 0.466
+assert overall["slowest"] == [1.5, 0.5]
+assert overall["buckets"] == [2, 2, 1]
+
+# Or as the default strategy: every value merged in feeds its key's mean.
+means = gimdict.merge_all([{"db": 0.2}, {"db": 0.4}], dtype="float64", strategy="mean")
+assert round(means["db"]["mean"], 3) == 0.3
+
+print("gimdict aggregation example OK:", totals.to_dict())
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Python-side orchestration for ``pygim.ioc.Container.aresolve``.
+
+Registry lookups, lifecycle caching, decorators and interface validation stay
+native (``wiring/ioc``): the container hands this module a *plan* per key and
+takes the provider's result back to *complete* it. What must be Python lives
+here: awaiting coroutine providers, gathering independent dependencies, and
+sharing one in-flight build of a singleton (or scoped instance) between every
+task that awaits it.
+"""
+
+import asyncio
+import inspect
+
+__all__ = ["AsyncState", "aresolve"]
+
+
+class AsyncState:
+    """Per-container bookkeeping for in-flight async builds.
+
+    ``builds`` maps a build id (loop, key, scope) to the future every awaiter
+    shares. ``blocked_on`` records which builds each build is waiting for, so
+    a cycle split across concurrent tasks raises instead of hanging.
+    """
+
+    __slots__ = ("plan", "complete", "builds", "blocked_on")
+
+    def __init__(self, plan, complete):
+        self.plan = plan
+        self.complete = complete
+        self.builds = {}
+        self.blocked_on = {}
+
+    def reaches(self, start, target):
+        """Whether build *start* (transitively) waits for build *target*."""
+        pending, seen = [start], set()
+        while pending:
+            build = pending.pop()
+            if build == target:
+                return True
+            if build not in seen:
+                seen.add(build)
+                pending.extend(self.blocked_on.get(build, ()))
+        return False
+
+
+def _label(key):
+    interface, name = key
+    label = getattr(interface, "__qualname__", None) or repr(interface)
+    return label if name is None else f"{label}, name='{name}'"
+
+
+def _cycle_error(chain):
+    return RuntimeError("Circular dependency detected: " + " -> ".join(map(_label, chain)))
+
+
+async def aresolve(container, state, key, path=(), owner=None):
+    """Resolve *key*; *path* is the chain of keys being built above it and
+    *owner* the innermost shared build that is waiting for the result."""
+    plan = state.plan(key)
+    if plan[0]:
+        return plan[1]
+    _, key, provider, injections, lifecycle, scope = plan
+    if key in path:
+        raise _cycle_error((*path[path.index(key):], key))
+    path = (*path, key)
+    if lifecycle == "transient":
+        return await _build(container, state, key, provider, injections, path, owner)
+
+    build_id = (asyncio.get_running_loop(), key, scope)
+    future = state.builds.get(build_id)
+    if future is None:
+        future = asyncio.ensure_future(
+            _build(container, state, key, provider, injections, path, build_id))
+        state.builds[build_id] = future
+
+        def _done(_):
+            state.builds.pop(build_id, None)
+            state.blocked_on.pop(build_id, None)
+
+        future.add_done_callback(_done)
+    elif owner is not None and state.reaches(build_id, owner):
+        # The build we would wait for is itself waiting for us (another
+        # task started it); the rest of the cycle is on that task's path.
+        raise _cycle_error(path)
+
+    if owner is None:
+        return await asyncio.shield(future)
+    waits = state.blocked_on.setdefault(owner, set())
+    waits.add(build_id)
+    try:
+        return await asyncio.shield(future)
+    finally:
+        waits.discard(build_id)
+
+
+async def _build(container, state, key, provider, injections, path, owner):
+    values = await asyncio.gather(
+        *(aresolve(container, state, dependency, path, owner) for _, dependency in injections))
+    instance = provider(**{name: value for (name, _), value in zip(injections, values)})
+    if inspect.isawaitable(instance):
+        instance = await instance
+    return state.complete(key, instance)
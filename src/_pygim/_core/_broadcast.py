@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Python-side helpers for parallel ``each`` broadcasts.
+
+The fan-out itself is native (``each/adapter.h``); only the pieces that must
+be Python live here: the coroutine that gathers async element calls and the
+construction of the aggregated error.
+"""
+
+import asyncio
+
+from ._exceptions import BroadcastError
+
+__all__ = ["broadcast_error", "gather"]
+
+
+def broadcast_error(errors, total):
+    """Return the exception to raise for *errors* out of *total* calls.
+
+    Control-flow exceptions that are not ``Exception`` subclasses
+    (``KeyboardInterrupt``, ``asyncio.CancelledError``, ...) are returned
+    as-is instead of being buried inside a group.
+    """
+    for error in errors:
+        if not isinstance(error, Exception):
+            return error
+    return BroadcastError(f"{len(errors)} of {total} broadcast calls failed", list(errors))
+
+
+async def gather(awaitables):
+    """Await every element call concurrently; results keep input order."""
+    results = await asyncio.gather(*awaitables, return_exceptions=True)
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if errors:
+        raise broadcast_error(errors, len(results))
+    return results
@@ -3,6 +3,8 @@
 This module contains all exceptions found and used in pygim.
 """
 
+import sys
+
 from ._error_msgs import type_error_msg
 from dataclasses import dataclass
 from . import _typing as t
@@ -17,6 +19,8 @@ __all__ = [
     "ShaSumTargetNotFoundError",
     "DispatchError",
     "UnrecognizedTypeError",
+    "BroadcastError",
+    "WarmUpError",
 ]
 
 
@@ -80,3 +84,37 @@ class UnrecognizedTypeError(DispatchError):
 
     def __init__(self, given_type, expected_types):
         super().__init__(type_error_msg(given_type, expected_types))
+
+
+if sys.version_info >= (3, 11):
+
+    class BroadcastError(ExceptionGroup):  # noqa: F821 - builtin since 3.11
+        """Raised when element calls of a parallel ``each`` broadcast fail.
+
+        Every failure is kept in ``exceptions`` (input order), so ``except*``
+        can pick out the interesting ones.
+        """
+
+    class WarmUpError(ExceptionGroup):  # noqa: F821 - builtin since 3.11
+        """Raised when singletons fail to build in ``Container.warm_up()``.
+
+        Singletons depending on a failed one are skipped, not attempted.
+        """
+
+else:  # pragma: no cover - Python < 3.11 has no ExceptionGroup
+
+    class BroadcastError(GimError):
+        """Raised when element calls of a parallel ``each`` broadcast fail."""
+
+        def __init__(self, msg, exceptions):
+            super().__init__(msg)
+            self.message = msg
+            self.exceptions = tuple(exceptions)
+
+    class WarmUpError(GimError):
+        """Raised when singletons fail to build in ``Container.warm_up()``."""
+
+        def __init__(self, msg, exceptions):
+            super().__init__(msg)
+            self.message = msg
+            self.exceptions = tuple(exceptions)
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Python-side helpers for ``pygim.ioc`` scopes.
+
+Instance caching and teardown order are native (``wiring/ioc``); only the
+disposal protocol lives here: calling ``close()`` / awaiting ``aclose()`` on
+every instance a scope created, newest first.
+"""
+
+import inspect
+
+__all__ = ["adispose", "dispose", "resolved"]
+
+
+def _raise_collected(errors):
+    if not errors:
+        return
+    first = errors[0]
+    if hasattr(first, "add_note"):  # Python 3.11+
+        for other in errors[1:]:
+            first.add_note(f"also failed while closing the scope: {other!r}")
+    raise first
+
+
+def dispose(instances):
+    """Call ``close()`` on each instance that has one, in the given order.
+
+    Every instance is attempted; the first failure is raised afterwards with
+    the others attached as notes (where the interpreter supports them).
+    """
+    errors = []
+    for instance in instances:
+        close = getattr(instance, "close", None)
+        if close is None:
+            continue
+        try:
+            close()
+        except Exception as error:
+            errors.append(error)
+    _raise_collected(errors)
+
+
+async def adispose(instances):
+    """Async counterpart of :func:`dispose`.
+
+    Prefers ``aclose()``; a ``close()`` returning an awaitable is awaited.
+    """
+    errors = []
+    for instance in instances:
+        close = getattr(instance, "aclose", None) or getattr(instance, "close", None)
+        if close is None:
+            continue
+        try:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as error:
+            errors.append(error)
+    _raise_collected(errors)
+
+
+async def resolved(value):
+    """Awaitable that returns *value* (``__aenter__`` has nothing to wait for)."""
+    return value
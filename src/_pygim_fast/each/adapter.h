@@ -21,15 +21,40 @@
 //         · no memory leaks (entry vanishes when the instance dies),
 //         · never calling the wrong object even if CPython re‑uses an
 //           `id()` value.
+// • `workers` (default 1) selects the fan-out of method broadcasts: 1 calls
+//   elements in order on the calling thread; N > 1 (or 0 = auto) runs the
+//   calls on a bounded pool of native threads that take turns on the GIL, so
+//   element methods that block in I/O overlap. Results keep input order and
+//   failures are aggregated into one `BroadcastError`. Async element methods
+//   are gathered with asyncio instead (the call returns an awaitable). With
+//   workers=1 nothing is awaited: the call returns the list of coroutines,
+//   ready for `asyncio.gather(*...)`.
+// • `lazy=True` makes broadcasts single-pass: the *first* element decides
+//   attribute vs method, and the result is a `Stream` iterator that pulls
+//   the source one element (or `chunk=N` elements) per step. Generators and
+//   unbounded streams work in O(chunk) memory.
 //
-// The implementation relies only on the public pybind11 C++ API and core
-// Python types, so it is ABI‑stable across CPython versions.
+// • Name resolution is cached per element *type* for the duration of one
+//   broadcast: the MRO is walked once per distinct type, and a plain method
+//   on a type whose instances have no `__dict__` (builtins, `__slots__`) is
+//   called unbound. Everything else makes one attribute lookup (or one
+//   vectorcall method call) per element, never a hasattr probe first.
+//
+// The implementation relies only on the public pybind11 C++ API and the
+// public CPython C API (vectorcall, type flags), no private interpreter
+// internals.
 // ---------------------------------------------------------------------------
 #pragma once
 
-#include <optional>
+#include <algorithm>
+#include <atomic>
+#include <cstdint>
+#include <limits>
 #include <string>
 #include <memory>
+#include <thread>
+#include <type_traits>
+#include <utility>
 #include <vector>
 
 #include <pybind11/pybind11.h>
@@ -38,8 +63,9 @@
 
 namespace py = pybind11;
 
-// Forward declaration so `Each` can return it.
+// Forward declarations so `Each` and `Proxy` can return them.
 class Proxy;
+class Stream;
 
 // ---------------------------------------------------------------------------
 //                               Proxy helper
@@ -47,8 +73,9 @@ class Proxy;
 class Proxy : public std::enable_shared_from_this<Proxy> {
 public:
     //! Construct a proxy bound to a given Python iterable.
-    explicit Proxy(const py::object &iterable)
-        : m_iterable(iterable), m_funcName(std::nullopt) {}
+    explicit Proxy(const py::object &iterable, std::size_t workers = 1, bool lazy = false,
+                   std::size_t chunk = 0)
+        : m_iterable(iterable), m_workers(workers), m_lazy(lazy), m_chunk(chunk) {}
 
     // ---------------------------------------------------------------------
     // Python special methods exposed via pybind11
@@ -65,46 +92,68 @@ public:
      *     invoke `__call__`.
      *   • Otherwise we build a `py::list` with the attribute from every
      *     element and return it.
+     *
+     * Each element costs a single attribute lookup; a type whose instances
+     * cannot shadow a plain method enters method mode without any.
      */
     py::object getattr(const std::string &name) {
+        m_slots.clear();
+        const py::str key(name);
+        if (m_lazy) {
+            return stream_getattr(key);
+        }
+        // A one-shot iterator would lose the elements probed here before
+        // call() traverses it again; the eager result is O(n) anyway.
+        if (PyIter_Check(m_iterable.ptr())) {
+            m_iterable = py::list(m_iterable);
+        }
         std::vector<py::object> collected;
 
         for (const py::handle &item : m_iterable) {
-            if (!py::hasattr(item, name.c_str())) {
-                std::ostringstream msg;
-                msg << '\'' << py::str(py::type::of(item)).cast<std::string>()
-                    << "' object has no attribute '" << name << '\'';
-                throw py::attribute_error(msg.str());
+            if (!slot_for(m_slots, item, key).direct) {
+                py::object value = attribute_of(item, key);
+                if (!PyCallable_Check(value.ptr())) {
+                    collected.emplace_back(std::move(value));   // data attribute
+                    continue;
+                }
             }
-
-            py::object attr = item.attr(name.c_str());
-            if (py::isinstance<py::function>(attr) ||
-                py::isinstance<py::cpp_function>(attr) ||
-                PyCallable_Check(attr.ptr())) {
-
-                m_funcName = name;                         // enter "method" mode
-                return py::cast(shared_from_this());
-            }
-            collected.emplace_back(std::move(attr));      // data attribute
+            m_funcName = key;                              // enter "method" mode
+            return py::cast(shared_from_this());
         }
 
+        m_slots.clear();
         return collected.empty() ? py::none() : py::cast(collected);
     }
 
     /** __call__(*args, **kwargs) – broadcast previously cached method */
-    py::list call(py::args args, py::kwargs kwargs) {
+    py::object call(py::args args, py::kwargs kwargs) {
         if (!m_funcName) {
             throw py::type_error("Proxy object is not in callable mode (missing attribute access)");
         }
 
+        // Clear cached function name (and type slots) to avoid accidental reuse.
+        const py::str name = std::move(m_funcName);
+        m_funcName = py::object();
+        std::vector<TypeSlot> slots = std::move(m_slots);
+        m_slots.clear();
+
+        if (m_lazy) {
+            return stream_call(name, std::move(slots), std::move(args), std::move(kwargs));
+        }
+
+        CallFrame frame(args, kwargs);
+        if (m_workers != 1) {
+            std::vector<py::object> items;
+            for (const py::handle &item : m_iterable) {
+                items.push_back(py::reinterpret_borrow<py::object>(item));
+            }
+            return call_parallel(std::move(items), name, slots, frame);
+        }
+
         py::list results;
         for (const py::handle &item : m_iterable) {
-            py::object method = item.attr(m_funcName.value().c_str());
-            results.append(method(*args, **kwargs));
+            results.append(invoke(item, name, slot_for(slots, item, name), frame));
         }
-
-        // Clear cached function name to avoid accidental reuse.
-        m_funcName.reset();
         return results;
     }
 
@@ -113,10 +162,371 @@ public:
     }
 
 private:
+    friend class Stream;
+
+    //! How one element type resolves the broadcast name, computed once per
+    //! distinct type and shared by every element of that type.
+    struct TypeSlot {
+        py::object type;      //!< Strong ref: keeps the pointer key valid
+        py::object descr;     //!< Attribute found on the type's MRO, if any
+        bool direct = false;  //!< Plain method no instance can shadow: call descr(item, ...)
+    };
+
+    //! Call arguments laid out once for vectorcall; slot 0 takes the element.
+    struct CallFrame {
+        CallFrame(const py::args &args, const py::kwargs &kwargs) : nargs(args.size() + 1) {
+            argv.reserve(nargs + kwargs.size());
+            argv.push_back(nullptr);
+            for (const py::handle &arg : args) {
+                argv.push_back(arg.ptr());
+            }
+            if (!kwargs.empty()) {
+                py::tuple names(kwargs.size());
+                std::size_t k = 0;
+                for (const auto &[key, value] : kwargs) {
+                    names[k++] = key;
+                    argv.push_back(value.ptr());
+                }
+                kwnames = std::move(names);
+            }
+        }
+
+        std::vector<PyObject *> argv;  //!< Borrowed: args/kwargs outlive the broadcast
+        py::object kwnames;            //!< Keyword names tuple, or null
+        std::size_t nargs;             //!< Positional count including the element
+    };
+
+    //! Find (or resolve and append) the slot for the type of `item`.
+    //! Broadcasts are nearly always homogeneous, so a linear scan wins.
+    static const TypeSlot &slot_for(std::vector<TypeSlot> &slots, const py::handle &item,
+                                    const py::str &name) {
+        PyTypeObject *tp = Py_TYPE(item.ptr());
+        for (const TypeSlot &slot : slots) {
+            if (reinterpret_cast<PyTypeObject *>(slot.type.ptr()) == tp) {
+                return slot;
+            }
+        }
+
+        TypeSlot slot{py::reinterpret_borrow<py::object>(reinterpret_cast<PyObject *>(tp))};
+        for (const py::handle &base : slot.type.attr("__mro__")) {
+            py::object dict = base.attr("__dict__");
+            if (dict.contains(name)) {
+                slot.descr = dict[name];
+                break;
+            }
+        }
+        // Custom __getattribute__/__getattr__ must see every lookup, and an
+        // instance __dict__ may shadow a method, so both take the slow path.
+        slot.direct = slot.descr
+                   && tp->tp_getattro == PyObject_GenericGetAttr
+                   && PyType_HasFeature(Py_TYPE(slot.descr.ptr()), Py_TPFLAGS_METHOD_DESCRIPTOR)
+                   && !has_instance_dict(tp);
+        slots.push_back(std::move(slot));
+        return slots.back();
+    }
+
+    //! `item.<name>`, with the broadcast's own message when it is missing.
+    static py::object attribute_of(const py::handle &item, const py::str &name) {
+        PyObject *attr = PyObject_GetAttr(item.ptr(), name.ptr());
+        if (attr == nullptr) {
+            if (!PyErr_ExceptionMatches(PyExc_AttributeError)) {
+                throw py::error_already_set();
+            }
+            PyErr_Clear();
+            std::ostringstream msg;
+            msg << '\'' << py::str(py::type::of(item)).cast<std::string>()
+                << "' object has no attribute '" << name.cast<std::string>() << '\'';
+            throw py::attribute_error(msg.str());
+        }
+        return py::reinterpret_steal<py::object>(attr);
+    }
+
+    //! Next element of a Python iterator, or a null object when exhausted.
+    static py::object next_of(const py::handle &iterator) {
+        PyObject *item = PyIter_Next(iterator.ptr());
+        if (item == nullptr && PyErr_Occurred()) {
+            throw py::error_already_set();
+        }
+        return py::reinterpret_steal<py::object>(item);
+    }
+
+    // Lazy mode (defined after Stream): only the first element is probed.
+    py::object stream_getattr(const py::str &name);
+    py::object stream_call(const py::str &name, std::vector<TypeSlot> slots, py::args args,
+                           py::kwargs kwargs);
+
+    static bool has_instance_dict(PyTypeObject *tp) {
+#ifdef Py_TPFLAGS_MANAGED_DICT
+        if (PyType_HasFeature(tp, Py_TPFLAGS_MANAGED_DICT)) {
+            return true;
+        }
+#endif
+        return tp->tp_dictoffset != 0;
+    }
+
+    //! One call per element: the unbound descriptor when the slot allows it,
+    //! otherwise CPython's method call, which skips the bound-method object.
+    static py::object invoke(const py::handle &item, const py::str &name, const TypeSlot &slot,
+                             CallFrame &frame) {
+        frame.argv[0] = item.ptr();
+        PyObject *result = slot.direct
+            ? PyObject_Vectorcall(slot.descr.ptr(), frame.argv.data(), frame.nargs, frame.kwnames.ptr())
+            : PyObject_VectorcallMethod(name.ptr(), frame.argv.data(), frame.nargs, frame.kwnames.ptr());
+        if (result == nullptr) {
+            throw py::error_already_set();
+        }
+        return py::reinterpret_steal<py::object>(result);
+    }
+
+    /** Fan the cached method out over a thread pool (or asyncio.gather).
+     *
+     * Each native worker holds the GIL while it runs Python and gives it up
+     * whenever the element call blocks (socket reads, sleeps, C extensions
+     * releasing the GIL), which is exactly when another worker can proceed.
+     * The calling thread is worker 0 and joins the others with the GIL
+     * released. No call is abandoned on failure: every element runs, and all
+     * errors are raised together afterwards.
+     */
+    py::object call_parallel(std::vector<py::object> items, const py::str &name,
+                             std::vector<TypeSlot> &slots, const CallFrame &frame) {
+        std::vector<std::size_t> item_slots;
+        if (items.empty()) {
+            return py::list();
+        }
+        // Resolved up front: workers only read the slots, never grow them.
+        // Indices, not pointers: each new type may reallocate `slots`.
+        item_slots.reserve(items.size());
+        for (const py::object &item : items) {
+            item_slots.push_back(static_cast<std::size_t>(&slot_for(slots, item, name) - slots.data()));
+        }
+
+        if (is_coroutine_function(py::getattr(items.front(), name))) {
+            py::list awaitables;
+            CallFrame local = frame;
+            for (std::size_t i = 0; i < items.size(); ++i) {
+                awaitables.append(invoke(items[i], name, slots[item_slots[i]], local));
+            }
+            return py::module_::import("_pygim._core._broadcast").attr("gather")(awaitables);
+        }
+
+        const std::size_t n = items.size();
+        std::vector<py::object> results(n);
+        std::vector<py::object> errors(n);
+        std::atomic<std::size_t> next{0};
+
+        auto work = [&]() {
+            CallFrame local = frame;  // slot 0 differs per worker
+            for (std::size_t i; (i = next.fetch_add(1, std::memory_order_relaxed)) < n;) {
+                try {
+                    results[i] = invoke(items[i], name, slots[item_slots[i]], local);
+                } catch (py::error_already_set &e) {
+                    errors[i] = e.value();
+                } catch (const std::exception &e) {
+                    errors[i] = py::module_::import("builtins").attr("RuntimeError")(e.what());
+                }
+            }
+        };
+
+        {
+            std::vector<std::jthread> pool;
+            // Joined without the GIL (also on unwinding): workers need it to finish.
+            struct JoinReleased {
+                std::vector<std::jthread> &pool;
+                ~JoinReleased() {
+                    py::gil_scoped_release release;
+                    pool.clear();
+                }
+            } join{pool};
+
+            const std::size_t threads = resolve_workers(n);
+            pool.reserve(threads - 1);
+            for (std::size_t t = 1; t < threads; ++t) {
+                pool.emplace_back([&work]() {
+                    py::gil_scoped_acquire gil;
+                    work();
+                });
+            }
+            work();
+        }
+
+        py::list failed;
+        py::list out(n);
+        for (std::size_t i = 0; i < n; ++i) {
+            if (errors[i]) {
+                failed.append(errors[i]);
+            } else {
+                out[i] = std::move(results[i]);
+            }
+        }
+        if (!failed.empty()) {
+            py::object error = py::module_::import("_pygim._core._broadcast")
+                                   .attr("broadcast_error")(failed, n);
+            PyErr_SetObject(reinterpret_cast<PyObject *>(Py_TYPE(error.ptr())), error.ptr());
+            throw py::error_already_set();
+        }
+        return out;
+    }
+
+    //! Thread count for `n` calls: `workers`, or for 0 the stdlib
+    //! ThreadPoolExecutor default (cpu + 4, capped at 32); never more than n.
+    std::size_t resolve_workers(std::size_t n) const {
+        std::size_t threads = m_workers;
+        if (threads == 0) {
+            threads = std::min<std::size_t>(32, std::max(1u, std::thread::hardware_concurrency()) + 4);
+        }
+        return std::min(threads, n);
+    }
+
     py::object m_iterable;                     //!< Bound Python iterable
-    std::optional<std::string> m_funcName;    //!< Last looked‑up callable attr
+    py::object m_funcName;                     //!< Last looked‑up callable attr (str), or null
+    std::vector<TypeSlot> m_slots;             //!< Type slots resolved for m_funcName
+    std::size_t m_workers;                     //!< 1 = sequential, 0 = auto, N = pool size
+    bool m_lazy;                               //!< Single pass; results come from a Stream
+    std::size_t m_chunk;                       //!< Lazy mode: 0 = one result per step, N = lists of N
+    py::object m_pending;                      //!< Lazy callable mode: iterator awaiting call()
+    py::object m_head;                         //!< ...and the element consumed to probe it
+};
+
+// ---------------------------------------------------------------------------
+//                           Stream (lazy broadcasts)
+// ---------------------------------------------------------------------------
+/** Iterator returned by lazy broadcasts (`each(stream, lazy=True)`).
+ *
+ * The source is pulled one element (or one chunk) per `__next__`, so memory
+ * stays O(chunk) and generators work. The first element decided the mode
+ * when the attribute was accessed: its value is yielded first in attribute
+ * mode; in call mode it is the first element called. With `chunk=N` every
+ * step yields a list of up to N results, and `workers` fans each chunk out
+ * like an eager parallel broadcast (async methods: one awaitable per chunk,
+ * and coroutines as they are without workers).
+ */
+class Stream {
+public:
+    enum class Mode { Empty, Attribute, Call };
+
+    //! Attribute mode (head is the first element's value) or empty stream.
+    Stream(std::shared_ptr<Proxy> proxy, Mode mode, py::str name, py::object iterator,
+           py::object head)
+        : m_proxy(std::move(proxy)), m_mode(mode), m_name(std::move(name)),
+          m_iterator(std::move(iterator)), m_head(std::move(head)),
+          m_frame(m_args, m_kwargs) {}
+
+    //! Call mode: head is the first element, still to be called.
+    Stream(std::shared_ptr<Proxy> proxy, py::str name, py::object iterator, py::object head,
+           std::vector<Proxy::TypeSlot> slots, py::args args, py::kwargs kwargs)
+        : m_proxy(std::move(proxy)), m_mode(Mode::Call), m_name(std::move(name)),
+          m_iterator(std::move(iterator)), m_head(std::move(head)), m_slots(std::move(slots)),
+          m_args(std::move(args)), m_kwargs(std::move(kwargs)), m_frame(m_args, m_kwargs) {}
+
+    py::object next() {
+        const std::size_t chunk = m_proxy->m_chunk;
+        if (chunk == 0) {
+            py::object item = pull();
+            if (!item) {
+                throw py::stop_iteration();
+            }
+            return produce(item);
+        }
+
+        std::vector<py::object> items;
+        items.reserve(chunk);
+        for (py::object item; items.size() < chunk && (item = pull());) {
+            items.push_back(std::move(item));
+        }
+        if (items.empty()) {
+            throw py::stop_iteration();
+        }
+        if (m_mode == Mode::Call && m_proxy->m_workers != 1) {
+            return m_proxy->call_parallel(std::move(items), m_name, m_slots, m_frame);
+        }
+        py::list results;
+        for (const py::object &item : items) {
+            results.append(produce(item));
+        }
+        return results;
+    }
+
+    //! An empty stream cannot tell attribute from method: allow both.
+    py::object call(const py::args &, const py::kwargs &) const {
+        if (m_mode != Mode::Empty) {
+            throw py::type_error("Stream object is not callable");
+        }
+        return py::cast(*this);
+    }
+
+    std::string representation() const {
+        static constexpr const char *modes[] = {"empty", "attribute", "call"};
+        return "<Each-stream " + std::string(modes[static_cast<int>(m_mode)]) + " '" +
+               m_name.cast<std::string>() + "'>";
+    }
+
+private:
+    //! The probed first element (or value), then the rest of the source.
+    py::object pull() {
+        if (m_head) {
+            return std::exchange(m_head, py::object());
+        }
+        if (!m_iterator) {
+            return py::object();
+        }
+        py::object item = Proxy::next_of(m_iterator);
+        if (!item) {
+            m_iterator = py::object();  // drop the exhausted source early
+        }
+        return item;
+    }
+
+    py::object produce(const py::object &item) {
+        if (m_mode == Mode::Attribute) {
+            // The head was pulled first and is already the attribute value.
+            if (!std::exchange(m_head_pulled, true)) {
+                return item;
+            }
+            return Proxy::attribute_of(item, m_name);
+        }
+        return Proxy::invoke(item, m_name, Proxy::slot_for(m_slots, item, m_name), m_frame);
+    }
+
+    std::shared_ptr<Proxy> m_proxy;           //!< Options (workers, chunk) and helpers
+    Mode m_mode;
+    py::str m_name;
+    py::object m_iterator;                    //!< Python iterator over the source
+    py::object m_head;                        //!< First element (call) or its value (attribute)
+    bool m_head_pulled = false;
+    std::vector<Proxy::TypeSlot> m_slots;     //!< Type cache, grown as new types stream by
+    py::args m_args;
+    py::kwargs m_kwargs;
+    Proxy::CallFrame m_frame;                 //!< Borrows from m_args / m_kwargs
 };
 
+inline py::object Proxy::stream_getattr(const py::str &name) {
+    py::object iterator = py::iter(m_iterable);
+    py::object head = next_of(iterator);
+    if (!head) {
+        return py::cast(Stream(shared_from_this(), Stream::Mode::Empty, name, py::object(),
+                               py::object()));
+    }
+    if (!slot_for(m_slots, head, name).direct) {
+        py::object value = attribute_of(head, name);
+        if (!PyCallable_Check(value.ptr())) {
+            m_slots.clear();
+            return py::cast(Stream(shared_from_this(), Stream::Mode::Attribute, name,
+                                   std::move(iterator), std::move(value)));
+        }
+    }
+    m_funcName = name;                                 // enter "method" mode
+    m_pending = std::move(iterator);
+    m_head = std::move(head);
+    return py::cast(shared_from_this());
+}
+
+inline py::object Proxy::stream_call(const py::str &name, std::vector<TypeSlot> slots,
+                                     py::args args, py::kwargs kwargs) {
+    return py::cast(Stream(shared_from_this(), name, std::exchange(m_pending, py::object()),
+                           std::exchange(m_head, py::object()), std::move(slots),
+                           std::move(args), std::move(kwargs)));
+}
+
 // ---------------------------------------------------------------------------
 //                             Each helper / descriptor
 // ---------------------------------------------------------------------------
@@ -126,9 +536,18 @@ public:
      * Factory‑mode constructor (iterable provided) **or** descriptor‑mode
      * default constructor (iterable = None).
      */
-    explicit Each(const py::object &iterable = py::none())
+    explicit Each(const py::object &iterable = py::none(), std::size_t workers = 1,
+                  bool lazy = false, std::size_t chunk = 0)
         : m_iterable(iterable), m_weakDict(py::module_::import("weakref")
-                                              .attr("WeakKeyDictionary")()) {}
+                                              .attr("WeakKeyDictionary")()),
+          m_workers(workers), m_lazy(lazy), m_chunk(chunk) {
+        if (chunk != 0 && !lazy) {
+            throw py::value_error("`chunk` requires lazy=True");
+        }
+        if (lazy && chunk == 0 && workers != 1) {
+            throw py::value_error("lazy broadcasts run in parallel per chunk; pass chunk=N with workers");
+        }
+    }
 
     // --------------------------- factory mode --------------------------- //
 
@@ -142,7 +561,7 @@ public:
             throw py::attribute_error("Cannot access dunder attributes with `each`");
 
         // Allocate the proxy on the heap so its lifetime is managed by Python.
-        auto proxy_sp = std::make_shared<Proxy>(m_iterable);
+        auto proxy_sp = std::make_shared<Proxy>(m_iterable, m_workers, m_lazy, m_chunk);
         return proxy_sp->getattr(name);    // returns the proxy or list
     }
 
@@ -173,8 +592,9 @@ public:
         if (!py::isinstance<py::iterable>(instance)) {
             throw py::type_error("`each` can only be used on iterable instances");
         }
-        if (is_generator(instance)) {
-            // NOTE: We deliberately reject **generator objects** here.
+        if (!m_lazy && is_generator(instance)) {
+            // NOTE: We deliberately reject **generator objects** here
+            // (unless lazy=True, which never traverses twice).
             //
             // Generators are *single-pass* iterators: once you consume a value,
             // it is gone forever and the generator's internal state has advanced.
@@ -212,7 +632,7 @@ public:
         //  • Safety: if CPython reuses an address, the old entry is already
         //    gone, so we create a fresh Proxy bound to the new object.
         // ----------------------------------------------------------------------------------
-        auto proxy_sp = std::make_shared<Proxy>(instance);
+        auto proxy_sp = std::make_shared<Proxy>(instance, m_workers, m_lazy, m_chunk);
         py::object proxy_obj = py::cast(proxy_sp);
         m_weakDict.attr("__setitem__")(instance, proxy_obj);
         return proxy_obj;
@@ -225,4 +645,130 @@ private:
     py::object m_iterable;     //!< Iterable for factory mode; None in descriptor mode
     py::object m_weakDict;    //!< Python weakref.WeakKeyDictionary
     std::string m_name;        //!< Name of the attribute on the owner class (debug)
+    std::size_t m_workers;     //!< Fan-out passed to every proxy (see Proxy)
+    bool m_lazy;               //!< Proxies stream results (see Stream)
+    std::size_t m_chunk;       //!< Lazy results per step: 0 = single, N = lists
 };
+
+// ---------------------------------------------------------------------------
+//                         Columnar gather (each.gather)
+// ---------------------------------------------------------------------------
+// `gather(iterable, "x", "y", dtype=...)` harvests data attributes in a single
+// pass straight into native columns, one per name, and hands each column to
+// Python as a typed `array.array`. That object exports the buffer protocol,
+// so `numpy.asarray(col)` and `pyarrow.py_buffer(col)` wrap it without a
+// copy, while pygim itself needs neither library. Works on generators, since
+// nothing is traversed twice.
+namespace each_detail {
+
+//! Element types a column can hold, with their `array` typecode.
+enum class Column : char {
+    Float64 = 'd',
+    Float32 = 'f',
+    Int64   = 'q',
+    Int32   = 'i',
+    Bool    = 'B',
+};
+
+inline Column parse_dtype(const py::handle &dtype) {
+    auto builtins = py::module_::import("builtins");
+    if (dtype.is(builtins.attr("float"))) return Column::Float64;
+    if (dtype.is(builtins.attr("int")))   return Column::Int64;
+    if (dtype.is(builtins.attr("bool")))  return Column::Bool;
+
+    // Strings, and numpy/pyarrow dtype objects through their str() form.
+    const auto name = py::str(dtype).cast<std::string>();
+    if (name == "float64") return Column::Float64;
+    if (name == "float32") return Column::Float32;
+    if (name == "int64")   return Column::Int64;
+    if (name == "int32")   return Column::Int32;
+    if (name == "bool")    return Column::Bool;
+    throw py::value_error("unsupported dtype " + py::repr(dtype).cast<std::string>() +
+                          "; expected float64, float32, int64, int32 or bool");
+}
+
+//! Convert one attribute value; Python raises (TypeError/OverflowError) on mismatch.
+template <class T>
+T convert(PyObject *value) {
+    if constexpr (std::is_floating_point_v<T>) {
+        const double v = PyFloat_AsDouble(value);
+        if (v == -1.0 && PyErr_Occurred()) throw py::error_already_set();
+        return static_cast<T>(v);
+    } else if constexpr (std::is_same_v<T, std::uint8_t>) {
+        const int v = PyObject_IsTrue(value);
+        if (v < 0) throw py::error_already_set();
+        return static_cast<T>(v);
+    } else {
+        const long long v = PyLong_AsLongLong(value);
+        if (v == -1 && PyErr_Occurred()) throw py::error_already_set();
+        if (v < std::numeric_limits<T>::min() || v > std::numeric_limits<T>::max()) {
+            PyErr_SetString(PyExc_OverflowError, "Python int too large to convert to int32");
+            throw py::error_already_set();
+        }
+        return static_cast<T>(v);
+    }
+}
+
+template <class T>
+py::object gather_typed(const py::iterable &iterable, const std::vector<py::str> &names,
+                        Column column) {
+    std::vector<std::vector<T>> columns(names.size());
+    const auto hint = PyObject_LengthHint(iterable.ptr(), 0);
+    if (hint < 0) throw py::error_already_set();
+    for (auto &col : columns) {
+        col.reserve(static_cast<std::size_t>(hint));
+    }
+
+    for (const py::handle &item : iterable) {
+        for (std::size_t c = 0; c < names.size(); ++c) {
+            PyObject *value = PyObject_GetAttr(item.ptr(), names[c].ptr());
+            if (value == nullptr) throw py::error_already_set();
+            const auto owned = py::reinterpret_steal<py::object>(value);
+            columns[c].push_back(convert<T>(value));
+        }
+    }
+
+    // One memcpy per column into the array's own storage.
+    auto array = py::module_::import("array").attr("array");
+    const char typecode[2] = {static_cast<char>(column), '\0'};
+    py::tuple out(names.size());
+    for (std::size_t c = 0; c < names.size(); ++c) {
+        py::object arr = array(typecode);
+        arr.attr("frombytes")(py::memoryview::from_memory(
+            columns[c].data(), static_cast<py::ssize_t>(columns[c].size() * sizeof(T))));
+        out[c] = std::move(arr);
+    }
+    return names.size() == 1 ? py::object(out[0]) : py::object(std::move(out));
+}
+
+}  // namespace each_detail
+
+/** gather(iterable, *names, dtype="float64") – columnar attribute harvest.
+ *
+ * Returns one `array.array` for a single name, or a tuple of them in name
+ * order (as `operator.attrgetter` does). A missing attribute or a value that
+ * does not convert to `dtype` raises the underlying Python error.
+ */
+inline py::object gather(const py::iterable &iterable, const py::args &names,
+                         const py::object &dtype) {
+    if (names.empty()) {
+        throw py::type_error("gather() requires at least one attribute name");
+    }
+    std::vector<py::str> keys;
+    for (const py::handle &name : names) {
+        if (!py::isinstance<py::str>(name)) {
+            throw py::type_error("attribute names must be str");
+        }
+        keys.push_back(py::reinterpret_borrow<py::str>(name));
+    }
+
+    using each_detail::Column;
+    switch (const Column column = each_detail::parse_dtype(dtype)) {
+        case Column::Float64: return each_detail::gather_typed<double>(iterable, keys, column);
+        case Column::Float32: return each_detail::gather_typed<float>(iterable, keys, column);
+        case Column::Int64:   return each_detail::gather_typed<std::int64_t>(iterable, keys, column);
+        case Column::Int32:   return each_detail::gather_typed<std::int32_t>(iterable, keys, column);
+        case Column::Bool:    return each_detail::gather_typed<std::uint8_t>(iterable, keys, column);
+    }
+    std::unreachable();
+}
@@ -21,14 +21,49 @@ Python code sees it only when doing `obj.each.attr` or `obj.each.method()`.
         .def("__getattr__", &Proxy::getattr)
         .def("__call__", &Proxy::call);
 
+    // ---------------------- Bind Stream --------------------- //
+    py::class_<Stream>(m, "_Stream", R"doc(
+Iterator returned by lazy broadcasts (`each(stream, lazy=True)`): yields one
+result per element, or lists of up to `chunk` results, pulling the source
+as it goes.
+)doc")
+        .def("__iter__", [](py::object self) { return self; })
+        .def("__next__", &Stream::next)
+        .def("__call__", &Stream::call)
+        .def("__repr__", &Stream::representation);
+
     // ---------------------- Bind Each ----------------------- //
     py::class_<Each>(m, "each", R"doc(
 `each` can be used either as a *descriptor* (declare `each = each()` inside
 an iterable class) or as a *factory* (`each(iterable)`).
+
+`workers` sets the fan-out of method broadcasts: 1 (default) calls elements
+in order; N > 1 runs the calls on N native threads (0 = cpu + 4, max 32),
+keeping result order and raising one `BroadcastError` for all failures.
+Async methods are gathered instead, and the call returns an awaitable;
+with `workers=1` the call returns the coroutines unawaited, as a list.
+
+`lazy=True` traverses the iterable once, so generators and endless streams
+work: the first element decides attribute vs method, and the broadcast
+returns an iterator of results (lists of up to `chunk` results when
+`chunk=N`; with `workers`, each chunk runs in parallel).
 )doc")
-        .def(py::init<py::object>(), py::arg("iterable") = py::none())
+        .def(py::init<py::object, std::size_t, bool, std::size_t>(),
+             py::arg("iterable") = py::none(), py::kw_only(), py::arg("workers") = 1,
+             py::arg("lazy") = false, py::arg("chunk") = 0)
         .def("__repr__", &Each::representation)
         .def("__getattr__", &Each::getattr)
         .def("__set_name__", &Each::set_name)
         .def("__get__", &Each::get);
+
+    m.def("gather", &gather, py::arg("iterable"), py::arg("dtype") = "float64", R"doc(
+Gather data attributes from every element in one pass into typed columns.
+
+`gather(points, "x", "y", dtype="float64")` returns one `array.array` per
+name (a single array for one name, else a tuple in name order). Values are
+converted natively, with no intermediate list; the arrays export the buffer
+protocol, so `numpy.asarray(col)` / `pyarrow.py_buffer(col)` wrap them
+without copying. `dtype`: float64, float32, int64, int32 or bool (also the
+builtins float/int/bool or a numpy dtype). Generators are accepted.
+)doc");
 }
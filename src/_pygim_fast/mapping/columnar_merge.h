@@ -0,0 +1,49 @@
+#pragma once
+
+#include <algorithm>
+#include <cstddef>
+#include <vector>
+
+#include "dynamic_merge_map.h"
+
+namespace pygim::mapping {
+
+// One shard flattened into parallel key/value arrays, so merging it needs no
+// access to the objects it was read from (e.g. with the GIL released).
+template <typename Key, typename T>
+struct MergeColumn {
+    std::vector<Key> keys;
+    std::vector<T> values;
+
+    void reserve(std::size_t capacity) {
+        keys.reserve(capacity);
+        values.reserve(capacity);
+    }
+
+    void push_back(const Key& key, const T& value) {
+        keys.push_back(key);
+        values.push_back(value);
+    }
+
+    std::size_t size() const noexcept {
+        return keys.size();
+    }
+};
+
+// Merge columns into `into`, in column order, with its merge strategies.
+template <typename Key, typename T, typename Map, typename StrategyMap>
+void merge_columns(DynamicMergeMap<Key, T, Map, StrategyMap>& into,
+                   const std::vector<MergeColumn<Key, T>>& columns) {
+    std::size_t largest = 0;
+    for (const auto& column : columns) {
+        largest = std::max(largest, column.size());
+    }
+    into.reserve(std::max(into.size(), largest));
+    for (const auto& column : columns) {
+        for (std::size_t i = 0; i < column.size(); ++i) {
+            into.merge_in(column.keys[i], column.values[i]);
+        }
+    }
+}
+
+} // namespace pygim::mapping
@@ -0,0 +1,189 @@
+#pragma once
+
+#include <cstddef>
+#include <cstdint>
+#include <iterator>
+#include <limits>
+#include <stdexcept>
+#include <type_traits>
+#include <utility>
+#include <vector>
+
+namespace pygim::mapping {
+
+/*
+ * DenseIdMap is a map for small dense integer keys (e.g. interned ids): the
+ * value for key `k` lives in slot `k` of a vector, so lookups and merges are
+ * an index instead of a hash probe. Like FlatMap, each slot carries a
+ * one-byte tag next to its value (DynamicMergeMap keeps per-key strategies
+ * there), and it offers the same interface, so either can be passed as
+ * DynamicMergeMap's `Map` parameter. Iteration visits keys in ascending
+ * order.
+ *
+ * Memory is proportional to the largest key, not the number of entries.
+ */
+template <typename Key, typename T>
+class DenseIdMap {
+    static_assert(std::is_unsigned_v<Key>, "DenseIdMap keys are dense unsigned ids");
+
+public:
+    using key_type = Key;
+    using mapped_type = T;
+    using tag_type = std::uint8_t;
+
+    static constexpr Key empty_key = std::numeric_limits<Key>::max();
+    static constexpr tag_type no_tag = std::numeric_limits<tag_type>::max();
+
+    // Result of upsert(): `inserted` is true when the key had no value, in
+    // which case `value` is value-initialized and now counts towards size().
+    struct Upsert {
+        T& value;
+        bool inserted;
+        tag_type tag;
+    };
+
+private:
+    // `key` is empty_key while the slot holds no value; its tag may be set.
+    struct Slot {
+        Key key{empty_key};
+        tag_type tag{no_tag};
+        T value{};
+    };
+
+public:
+    class const_iterator {
+    public:
+        using iterator_category = std::forward_iterator_tag;
+        using value_type = std::pair<const Key&, const T&>;
+        using difference_type = std::ptrdiff_t;
+        using reference = value_type;
+
+        const_iterator() = default;
+        const_iterator(const Slot* current, const Slot* last) : m_current(current), m_last(last) {
+            skip_empty();
+        }
+
+        reference operator*() const { return {m_current->key, m_current->value}; }
+
+        const_iterator& operator++() {
+            ++m_current;
+            skip_empty();
+            return *this;
+        }
+
+        const_iterator operator++(int) {
+            auto previous = *this;
+            ++*this;
+            return previous;
+        }
+
+        friend bool operator==(const const_iterator& lhs, const const_iterator& rhs) {
+            return lhs.m_current == rhs.m_current;
+        }
+
+    private:
+        void skip_empty() {
+            while (m_current != m_last && m_current->key == empty_key) {
+                ++m_current;
+            }
+        }
+
+        const Slot* m_current{nullptr};
+        const Slot* m_last{nullptr};
+    };
+
+    const_iterator begin() const { return {m_slots.data(), m_slots.data() + m_slots.size()}; }
+    const_iterator end() const {
+        const auto* last = m_slots.data() + m_slots.size();
+        return {last, last};
+    }
+
+    std::size_t size() const noexcept { return m_size; }
+    bool empty() const noexcept { return m_size == 0; }
+
+    bool contains(const Key& key) const noexcept {
+        return key < m_slots.size() && m_slots[key].key != empty_key;
+    }
+
+    // Pointer to the key's value, or nullptr.
+    const T* find(const Key& key) const noexcept {
+        return contains(key) ? &m_slots[key].value : nullptr;
+    }
+
+    T* find(const Key& key) noexcept {
+        return contains(key) ? &m_slots[key].value : nullptr;
+    }
+
+    const T& at(const Key& key) const {
+        if (!contains(key)) {
+            throw std::out_of_range("DenseIdMap::at: key not found");
+        }
+        return m_slots[key].value;
+    }
+
+    T& operator[](const Key& key) {
+        return upsert(key).value;
+    }
+
+    Upsert upsert(const Key& key) {
+        auto& slot = slot_for(key);
+        const bool inserted = slot.key == empty_key;
+        if (inserted) {
+            slot.key = key;
+            slot.value = T{};
+            ++m_size;
+        }
+        return Upsert{slot.value, inserted, slot.tag};
+    }
+
+    // Removes the value; the key's tag, if any, is kept.
+    std::size_t erase(const Key& key) {
+        if (!contains(key)) {
+            return 0;
+        }
+        auto& slot = m_slots[key];
+        slot.key = empty_key;
+        slot.value = T{};
+        --m_size;
+        return 1;
+    }
+
+    tag_type tag(const Key& key) const noexcept {
+        return key < m_slots.size() ? m_slots[key].tag : no_tag;
+    }
+
+    void set_tag(const Key& key, tag_type tag) {
+        slot_for(key).tag = tag;
+    }
+
+    // `capacity` is the expected largest key + 1.
+    void reserve(std::size_t capacity) {
+        m_slots.reserve(capacity);
+    }
+
+    void clear() {
+        m_slots.clear();
+        m_size = 0;
+    }
+
+    // Bytes held by the slot array.
+    std::size_t memory_usage() const noexcept {
+        return m_slots.capacity() * sizeof(Slot);
+    }
+
+private:
+    Slot& slot_for(const Key& key) {
+        if (key == empty_key) {
+            throw std::out_of_range("DenseIdMap key out of range");
+        }
+        if (key >= m_slots.size()) {
+            m_slots.resize(static_cast<std::size_t>(key) + 1);
+        }
+        return m_slots[key];
+    }
+
+    std::vector<Slot> m_slots{};
+    std::size_t m_size{0};
+};
+
+} // namespace pygim::mapping
@@ -8,11 +8,31 @@
 
 namespace pygim::mapping {
 
+// Sum/Max/Min/Replace combine two values of the same type. Count, Mean,
+// TopK and Histogram are sketch strategies: they summarise a stream of
+// numbers into a MergeSketch (merge_sketch.h), so they apply to maps of
+// sketches, not of numbers.
 enum class MergeStrategy {
     Sum,
     Max,
     Min,
     Replace,
+    Count,
+    Mean,
+    TopK,
+    Histogram,
+};
+
+constexpr bool is_sketch_strategy(MergeStrategy strategy) noexcept {
+    return strategy >= MergeStrategy::Count;
+}
+
+// A value summarising a stream of numbers (e.g. MergeSketch): add() folds in
+// one number and merge() combines two summaries, e.g. from two shards.
+template <typename T>
+concept SketchValue = requires(T& value, const T& other, double x) {
+    value.add(x);
+    value.merge(other);
 };
 
 template <typename T, typename = void>
@@ -25,6 +45,22 @@ struct MergeDefaultStrategy<T, std::enable_if_t<std::is_arithmetic_v<T>>> {
     static constexpr MergeStrategy value = MergeStrategy::Sum;
 };
 
+// A sketch carries its own kind, so every strategy but Replace merges two
+// sketches; Sum stands for "merge" here.
+template <SketchValue T>
+struct MergeDefaultStrategy<T, void> {
+    static constexpr MergeStrategy value = MergeStrategy::Sum;
+};
+
+// A `Map` backend with a per-key tag (e.g. FlatMap) stores each key's
+// strategy inline with its value instead of in `StrategyMap`.
+template <typename Map>
+concept TaggedMergeBackend = requires(Map& map, const typename Map::key_type& key) {
+    Map::no_tag;
+    map.upsert(key);
+    map.set_tag(key, Map::no_tag);
+};
+
 template <typename Key,
           typename T,
           typename Map = std::unordered_map<Key, T>,
@@ -35,6 +71,8 @@ public:
     using mapped_type = T;
     using map_type = Map;
 
+    static constexpr bool inline_strategies = TaggedMergeBackend<Map>;
+
     explicit DynamicMergeMap(
         MergeStrategy default_strategy = MergeDefaultStrategy<T>::value)
         : m_default_strategy(default_strategy) {}
@@ -42,7 +80,8 @@ public:
     explicit DynamicMergeMap(const Map& values,
                              MergeStrategy default_strategy = MergeDefaultStrategy<T>::value)
         : m_values(values),
-          m_default_strategy(default_strategy) {}
+          m_default_strategy(default_strategy),
+          m_has_key_strategies(inline_strategies) {}  // the map may carry tags
 
     void set_default_strategy(MergeStrategy strategy) noexcept {
         m_default_strategy = strategy;
@@ -52,8 +91,18 @@ public:
         return m_default_strategy;
     }
 
+    // False until some key got a strategy of its own.
+    bool has_key_strategies() const noexcept {
+        return m_has_key_strategies;
+    }
+
     void set_merge_strategy(const Key& key, MergeStrategy strategy) {
-        m_strategies[key] = strategy;
+        m_has_key_strategies = true;
+        if constexpr (inline_strategies) {
+            m_values.set_tag(key, static_cast<typename Map::tag_type>(strategy));
+        } else {
+            m_strategies[key] = strategy;
+        }
     }
 
     void set(const Key& key, const T& value) {
@@ -61,7 +110,20 @@ public:
     }
 
     bool contains(const Key& key) const {
-        return m_values.find(key) != m_values.end();
+        if constexpr (inline_strategies) return m_values.contains(key);
+        else return m_values.find(key) != m_values.end();
+    }
+
+    bool erase(const Key& key) {
+        return m_values.erase(key) > 0;
+    }
+
+    std::size_t size() const noexcept {
+        return m_values.size();
+    }
+
+    void reserve(std::size_t capacity) {
+        m_values.reserve(capacity);
     }
 
     const T& at(const Key& key) const {
@@ -69,32 +131,100 @@ public:
     }
 
     T value_or(const Key& key, const T& fallback) const {
-        const auto it = m_values.find(key);
-        if (it == m_values.end()) return fallback;
-        return it->second;
+        if constexpr (inline_strategies) {
+            const T* value = m_values.find(key);
+            return value ? *value : fallback;
+        } else {
+            const auto it = m_values.find(key);
+            if (it == m_values.end()) return fallback;
+            return it->second;
+        }
     }
 
     const Map& data() const noexcept {
         return m_values;
     }
 
-    const StrategyMap& strategies() const noexcept {
+    const StrategyMap& strategies() const noexcept
+        requires (!inline_strategies) {
         return m_strategies;
     }
 
     void clear() {
         m_values.clear();
         m_strategies.clear();
+        m_has_key_strategies = false;
+    }
+
+    // The strategy merge_in(key, rhs) applies: the key's own, else the default.
+    MergeStrategy merge_strategy(const Key& key) const {
+        if (!m_has_key_strategies) return m_default_strategy;
+        if constexpr (inline_strategies) {
+            const auto tag = m_values.tag(key);
+            return tag == Map::no_tag ? m_default_strategy : static_cast<MergeStrategy>(tag);
+        } else {
+            return strategy_for(key);
+        }
     }
 
     void merge_in(const Key& key, const T& rhs) {
-        const auto strategy = strategy_for(key);
-        auto it = m_values.find(key);
-        if (it == m_values.end()) {
-            m_values[key] = rhs;
-            return;
+        if constexpr (inline_strategies) {
+            // One probe finds the value and the key's strategy together.
+            auto [value, inserted, tag] = m_values.upsert(key);
+            if (inserted) {
+                value = rhs;
+            } else {
+                apply(tag == Map::no_tag ? m_default_strategy : static_cast<MergeStrategy>(tag), value, rhs);
+            }
+        } else {
+            merge_in(key, rhs, strategy_for(key));
+        }
+    }
+
+    // Merge with `strategy` instead of the key's own (e.g. another map's).
+    void merge_in(const Key& key, const T& rhs, MergeStrategy strategy) {
+        if constexpr (inline_strategies) {
+            auto [value, inserted, tag] = m_values.upsert(key);
+            if (inserted) value = rhs;
+            else apply(strategy, value, rhs);
+        } else {
+            auto it = m_values.find(key);
+            if (it == m_values.end()) {
+                m_values[key] = rhs;
+                return;
+            }
+            apply(strategy, it->second, rhs);
+        }
+    }
+
+    // Fold one number into the key's sketch in place, without building a
+    // one-number sketch to merge; a new key starts as a copy of `empty`.
+    // When add() throws, the map is left as it was.
+    void observe(const Key& key, double x, const T& empty)
+        requires SketchValue<T> {
+        if constexpr (inline_strategies) {
+            auto [value, inserted, tag] = m_values.upsert(key);
+            if (!inserted) {
+                value.add(x);
+                return;
+            }
+            try {
+                value = empty;
+                value.add(x);
+            } catch (...) {
+                m_values.erase(key);
+                throw;
+            }
+        } else {
+            auto it = m_values.find(key);
+            if (it != m_values.end()) {
+                it->second.add(x);
+                return;
+            }
+            T value = empty;
+            value.add(x);
+            m_values.emplace(key, std::move(value));
         }
-        it->second = apply(strategy, it->second, rhs);
     }
 
     void merge_with(const DynamicMergeMap& other) {
@@ -116,31 +246,62 @@ public:
 
 private:
     MergeStrategy strategy_for(const Key& key) const {
+        if (m_strategies.empty()) return m_default_strategy;
         const auto it = m_strategies.find(key);
         return (it == m_strategies.end()) ? m_default_strategy : it->second;
     }
 
-    static T apply(MergeStrategy strategy, const T& lhs, const T& rhs) {
+    // lhs = lhs (strategy) rhs, in place: a sketch merge must not copy.
+    static void apply(MergeStrategy strategy, T& lhs, const T& rhs) {
+        if constexpr (SketchValue<T>) {
+            if (strategy == MergeStrategy::Replace) lhs = rhs;
+            else lhs.merge(rhs);
+            return;
+        }
         switch (strategy) {
             case MergeStrategy::Replace:
-                return rhs;
+                lhs = rhs;
+                return;
             case MergeStrategy::Sum:
-                if constexpr (std::is_arithmetic_v<T>) return lhs + rhs;
-                return rhs;
+                if constexpr (std::is_integral_v<T> && !std::is_same_v<T, bool>) lhs = checked_sum(lhs, rhs);
+                else if constexpr (std::is_arithmetic_v<T>) lhs = lhs + rhs;
+                else lhs = rhs;
+                return;
             case MergeStrategy::Max:
-                if constexpr (std::is_arithmetic_v<T>) return std::max(lhs, rhs);
-                return rhs;
+                if constexpr (std::is_arithmetic_v<T>) lhs = std::max(lhs, rhs);
+                else lhs = rhs;
+                return;
             case MergeStrategy::Min:
-                if constexpr (std::is_arithmetic_v<T>) return std::min(lhs, rhs);
-                return rhs;
+                if constexpr (std::is_arithmetic_v<T>) lhs = std::min(lhs, rhs);
+                else lhs = rhs;
+                return;
+            case MergeStrategy::Count:
+            case MergeStrategy::Mean:
+            case MergeStrategy::TopK:
+            case MergeStrategy::Histogram:
+                throw std::invalid_argument("sketch merge strategies need sketch values (MergeSketch)");
         }
         throw std::runtime_error("unsupported merge strategy");
     }
 
+    // Integer sums must not wrap silently: counters are the main use.
+    static T checked_sum(T lhs, T rhs) {
+        using limits = std::numeric_limits<T>;
+        bool overflow = rhs > 0 && lhs > limits::max() - rhs;
+        if constexpr (std::is_signed_v<T>) {
+            overflow = overflow || (rhs < 0 && lhs < limits::min() - rhs);
+        }
+        if (overflow) {
+            throw std::overflow_error("merge sum overflows the value type");
+        }
+        return static_cast<T>(lhs + rhs);
+    }
+
 private:
     Map m_values{};
     StrategyMap m_strategies{};
     MergeStrategy m_default_strategy;
+    bool m_has_key_strategies{false};
 };
 
 } // namespace pygim::mapping
@@ -0,0 +1,305 @@
+#pragma once
+
+#include <algorithm>
+#include <atomic>
+#include <bit>
+#include <cstddef>
+#include <cstdint>
+#include <functional>
+#include <iterator>
+#include <limits>
+#include <stdexcept>
+#include <utility>
+#include <vector>
+
+namespace pygim::mapping {
+
+/*
+ * FlatMap is an open-addressing hash map with flat storage, built as a
+ * `Map` backend for DynamicMergeMap.
+ *
+ * Each slot holds the key, the value and a one-byte tag contiguously, in a
+ * power-of-two array probed linearly: no allocation per key, one cache line
+ * per lookup, and the tag rides in the slot's padding, so a caller keeping
+ * e.g. a per-key merge strategy there reads it with the same probe that
+ * finds the value.
+ *
+ * A key can hold a tag without a value (set before the first value, or kept
+ * after erase()); such slots are skipped by iteration and not counted by
+ * size(). Iteration order is slot order, i.e. unspecified, and differs
+ * between maps holding the same keys: each map hashes with its own seed, as
+ * copying one map into another in slot order would otherwise insert keys in
+ * home-slot order and, while the target is smaller, pile them into long
+ * probe runs (quadratic merges).
+ *
+ * Usage example:
+ *   FlatMap<std::size_t, double> seconds;
+ *   seconds[3] += 0.25;
+ *   auto [value, inserted, tag] = seconds.upsert(3);  // one probe
+ */
+template <typename Key,
+          typename T,
+          typename Hash = std::hash<Key>,
+          typename KeyEqual = std::equal_to<Key>>
+class FlatMap {
+    enum class State : std::uint8_t { Empty, Deleted, Tagged, Full };
+
+public:
+    using key_type = Key;
+    using mapped_type = T;
+    using tag_type = std::uint8_t;
+
+    static constexpr tag_type no_tag = std::numeric_limits<tag_type>::max();
+
+    // Result of upsert(): `inserted` is true when the key had no value, in
+    // which case `value` is value-initialized and now counts towards size().
+    struct Upsert {
+        T& value;
+        bool inserted;
+        tag_type tag;
+    };
+
+private:
+    struct Slot {
+        Key key{};
+        State state{State::Empty};
+        tag_type tag{no_tag};
+        T value{};
+    };
+
+public:
+    class const_iterator {
+    public:
+        using iterator_category = std::forward_iterator_tag;
+        using value_type = std::pair<const Key&, const T&>;
+        using difference_type = std::ptrdiff_t;
+        using reference = value_type;
+
+        const_iterator() = default;
+        const_iterator(const Slot* current, const Slot* last) : m_current(current), m_last(last) {
+            skip_empty();
+        }
+
+        reference operator*() const { return {m_current->key, m_current->value}; }
+
+        const_iterator& operator++() {
+            ++m_current;
+            skip_empty();
+            return *this;
+        }
+
+        const_iterator operator++(int) {
+            auto previous = *this;
+            ++*this;
+            return previous;
+        }
+
+        friend bool operator==(const const_iterator& lhs, const const_iterator& rhs) {
+            return lhs.m_current == rhs.m_current;
+        }
+
+    private:
+        void skip_empty() {
+            while (m_current != m_last && m_current->state != State::Full) {
+                ++m_current;
+            }
+        }
+
+        const Slot* m_current{nullptr};
+        const Slot* m_last{nullptr};
+    };
+
+    FlatMap() = default;
+
+    const_iterator begin() const { return {m_slots.data(), m_slots.data() + m_slots.size()}; }
+    const_iterator end() const {
+        const auto* last = m_slots.data() + m_slots.size();
+        return {last, last};
+    }
+
+    std::size_t size() const noexcept { return m_size; }
+    bool empty() const noexcept { return m_size == 0; }
+
+    bool contains(const Key& key) const {
+        return find(key) != nullptr;
+    }
+
+    // Pointer to the key's value, or nullptr.
+    const T* find(const Key& key) const {
+        const auto* slot = find_slot(key);
+        return (slot && slot->state == State::Full) ? &slot->value : nullptr;
+    }
+
+    T* find(const Key& key) {
+        return const_cast<T*>(std::as_const(*this).find(key));
+    }
+
+    const T& at(const Key& key) const {
+        if (const auto* value = find(key)) {
+            return *value;
+        }
+        throw std::out_of_range("FlatMap::at: key not found");
+    }
+
+    T& operator[](const Key& key) {
+        return upsert(key).value;
+    }
+
+    Upsert upsert(const Key& key) {
+        auto& slot = slot_for(key);
+        const bool inserted = slot.state != State::Full;
+        if (inserted) {
+            slot.value = T{};
+            slot.state = State::Full;
+            ++m_size;
+        }
+        return Upsert{slot.value, inserted, slot.tag};
+    }
+
+    // Removes the value; the key's tag, if any, is kept.
+    std::size_t erase(const Key& key) {
+        auto* slot = const_cast<Slot*>(find_slot(key));
+        if (!slot || slot->state != State::Full) {
+            return 0;
+        }
+        slot->value = T{};
+        --m_size;
+        if (slot->tag == no_tag) {
+            slot->state = State::Deleted;
+            --m_live;
+        } else {
+            slot->state = State::Tagged;
+        }
+        return 1;
+    }
+
+    tag_type tag(const Key& key) const {
+        const auto* slot = find_slot(key);
+        return slot ? slot->tag : no_tag;
+    }
+
+    void set_tag(const Key& key, tag_type tag) {
+        auto& slot = slot_for(key);
+        if (slot.state != State::Full) {
+            slot.state = State::Tagged;
+        }
+        slot.tag = tag;
+    }
+
+    // `capacity` is the expected number of keys.
+    void reserve(std::size_t capacity) {
+        if (capacity_for(capacity) > m_slots.size()) {
+            rehash(capacity_for(capacity));
+        }
+    }
+
+    void clear() {
+        m_slots.clear();
+        m_size = 0;
+        m_live = 0;
+        m_used = 0;
+    }
+
+    // Bytes held by the slot array.
+    std::size_t memory_usage() const noexcept {
+        return m_slots.capacity() * sizeof(Slot);
+    }
+
+private:
+    static constexpr std::size_t min_capacity = 8;
+
+    // At most 3/4 of the slots are in use, counting deleted ones.
+    static std::size_t capacity_for(std::size_t keys) {
+        return std::bit_ceil(std::max(min_capacity, keys + keys / 3 + 1));
+    }
+
+    // An odd multiplier per map: splitmix64 of a counter, so maps get
+    // unrelated slot orders without a clock or a random device.
+    static std::uint64_t next_seed() noexcept {
+        static std::atomic<std::uint64_t> counter{0};
+        auto z = (counter.fetch_add(1, std::memory_order_relaxed) + 1) * 0x9E3779B97F4A7C15ull;
+        z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9ull;
+        z = (z ^ (z >> 27)) * 0x94D049BB133111EBull;
+        return (z ^ (z >> 31)) | 1;
+    }
+
+    // Multiplicative hashing spreads identity hashes (small integers) over
+    // the whole word; the high bits pick the home slot.
+    std::size_t home(const Key& key) const {
+        const auto hash = static_cast<std::uint64_t>(Hash{}(key)) * m_seed;
+        return static_cast<std::size_t>(hash >> m_shift);
+    }
+
+    const Slot* find_slot(const Key& key) const {
+        if (m_slots.empty()) {
+            return nullptr;
+        }
+        const auto mask = m_slots.size() - 1;
+        for (auto position = home(key);; position = (position + 1) & mask) {
+            const auto& slot = m_slots[position];
+            if (slot.state == State::Empty) {
+                return nullptr;
+            }
+            if (slot.state != State::Deleted && KeyEqual{}(slot.key, key)) {
+                return &slot;
+            }
+        }
+    }
+
+    // The key's slot. A new key gets an Empty or Deleted one holding the
+    // key, which the caller must make Tagged or Full.
+    Slot& slot_for(const Key& key) {
+        if (capacity_for(m_used + 1) > m_slots.size()) {
+            rehash(capacity_for(m_live + 1));
+        }
+        const auto mask = m_slots.size() - 1;
+        Slot* reuse = nullptr;
+        auto position = home(key);
+        for (;; position = (position + 1) & mask) {
+            auto& slot = m_slots[position];
+            if (slot.state == State::Empty) {
+                break;
+            }
+            if (slot.state == State::Deleted) {
+                if (!reuse) reuse = &slot;
+            } else if (KeyEqual{}(slot.key, key)) {
+                return slot;
+            }
+        }
+        auto& slot = reuse ? *reuse : m_slots[position];
+        if (!reuse) {
+            ++m_used;
+        }
+        ++m_live;
+        slot.key = key;
+        return slot;
+    }
+
+    // Re-insert live slots into `capacity` slots, dropping deleted ones.
+    void rehash(std::size_t capacity) {
+        std::vector<Slot> previous(capacity);
+        previous.swap(m_slots);
+        m_shift = 64 - std::countr_zero(capacity);
+        m_used = m_live;
+        const auto mask = capacity - 1;
+        for (auto& slot : previous) {
+            if (slot.state == State::Empty || slot.state == State::Deleted) {
+                continue;
+            }
+            auto position = home(slot.key);
+            while (m_slots[position].state != State::Empty) {
+                position = (position + 1) & mask;
+            }
+            m_slots[position] = std::move(slot);
+        }
+    }
+
+    std::vector<Slot> m_slots{};
+    std::size_t m_size{0};  //!< Full slots
+    std::size_t m_live{0};  //!< Full and Tagged slots
+    std::size_t m_used{0};  //!< slots that are not Empty
+    int m_shift{64};
+    std::uint64_t m_seed{next_seed()};  //!< hash multiplier; kept by copies, as it placed their slots
+};
+
+} // namespace pygim::mapping
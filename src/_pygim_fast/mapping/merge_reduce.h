@@ -0,0 +1,141 @@
+#pragma once
+
+#include <algorithm>
+#include <atomic>
+#include <cstddef>
+#include <exception>
+#include <mutex>
+#include <thread>
+#include <variant>
+#include <vector>
+
+#include "columnar_merge.h"
+#include "dynamic_merge_map.h"
+
+namespace pygim::mapping {
+
+// Call fn(key, value) for every entry of a shard.
+template <typename Key, typename T, typename Map, typename StrategyMap, typename Fn>
+void for_each_entry(const DynamicMergeMap<Key, T, Map, StrategyMap>& shard, Fn&& fn) {
+    for (const auto& [key, value] : shard.data()) {
+        fn(key, value);
+    }
+}
+
+template <typename Key, typename T, typename Fn>
+void for_each_entry(const MergeColumn<Key, T>& shard, Fn&& fn) {
+    for (std::size_t i = 0; i < shard.size(); ++i) {
+        fn(shard.keys[i], shard.values[i]);
+    }
+}
+
+template <typename Shard, typename Fn>
+void for_each_entry(const Shard* shard, Fn&& fn) {
+    for_each_entry(*shard, fn);
+}
+
+template <typename... Shards, typename Fn>
+void for_each_entry(const std::variant<Shards...>& shard, Fn&& fn) {
+    std::visit([&](const auto& alternative) { for_each_entry(alternative, fn); }, shard);
+}
+
+namespace detail {
+
+// fn(i) for every i in [0, count) on up to `threads` threads, the caller's
+// included. The first exception stops handing out work and is rethrown once
+// every thread has finished.
+template <typename Fn>
+void parallel_for(std::size_t count, std::size_t threads, Fn&& fn) {
+    std::atomic<std::size_t> next{0};
+    std::exception_ptr error;
+    std::mutex error_mutex;
+    auto run = [&] {
+        for (std::size_t i; (i = next.fetch_add(1, std::memory_order_relaxed)) < count;) {
+            try {
+                fn(i);
+            } catch (...) {
+                std::lock_guard lock(error_mutex);
+                if (!error) error = std::current_exception();
+                next.store(count, std::memory_order_relaxed);
+            }
+        }
+    };
+    {
+        std::vector<std::jthread> pool;
+        threads = std::min(threads, count);
+        for (std::size_t t = 1; t < threads; ++t) pool.emplace_back(run);
+        run();
+    }
+    if (error) {
+        std::rethrow_exception(error);
+    }
+}
+
+} // namespace detail
+
+/*
+ * Fold `shards` (DynamicMergeMaps or MergeColumns, by value, pointer or in a
+ * std::variant) into `into`, in order, on up to `workers` threads (0 = one
+ * per hardware thread).
+ *
+ * The shards are split into one contiguous run per worker and each run is
+ * folded into a private partial, the first starting from a copy of `into`;
+ * the partials are then combined pairwise, left to right, in log2(workers)
+ * rounds. Every merge uses the strategies of `into` (per key, else its
+ * default), and sum/max/min/replace are associative, so the result is what
+ * merging the shards one by one gives. (A checked integer sum can overflow
+ * in one grouping and not another only when values of both signs are
+ * summed.) If a merge throws, `into` is left unchanged. Safe to call without
+ * the GIL.
+ *
+ * Usage example:
+ *   DynamicMergeMap<std::string, std::int64_t> totals;
+ *   merge_reduce(totals, worker_counts, 8);
+ */
+template <typename Key, typename T, typename Map, typename StrategyMap, typename Shard>
+void merge_reduce(DynamicMergeMap<Key, T, Map, StrategyMap>& into,
+                  const std::vector<Shard>& shards,
+                  unsigned workers = 0) {
+    using Merge = DynamicMergeMap<Key, T, Map, StrategyMap>;
+
+    std::size_t n = workers ? workers : std::max(1u, std::thread::hardware_concurrency());
+    n = std::min(n, shards.size());
+    if (n == 0) {
+        return;
+    }
+
+    std::vector<Merge> partials(n, Merge(into.default_strategy()));
+    partials[0] = into;
+    const Merge& strategies = into;
+
+    detail::parallel_for(n, n, [&](std::size_t w) {
+        auto& partial = partials[w];
+        const auto first = shards.size() * w / n;
+        const auto last = shards.size() * (w + 1) / n;
+        for (auto s = first; s < last; ++s) {
+            if (w == 0) {
+                // A copy of `into`: its own strategies are the ones to use.
+                for_each_entry(shards[s], [&](const Key& key, const T& value) { partial.merge_in(key, value); });
+            } else {
+                for_each_entry(shards[s], [&](const Key& key, const T& value) {
+                    partial.merge_in(key, value, strategies.merge_strategy(key));
+                });
+            }
+        }
+    });
+
+    for (std::size_t step = 1; step < n; step *= 2) {
+        const auto pairs = (n + step - 1) / (2 * step);
+        detail::parallel_for(pairs, n, [&](std::size_t p) {
+            auto& left = partials[2 * step * p];
+            auto& right = partials[2 * step * p + step];
+            for_each_entry(right, [&](const Key& key, const T& value) {
+                left.merge_in(key, value, strategies.merge_strategy(key));
+            });
+            right = Merge{};  // release memory as the rounds proceed
+        });
+    }
+    into = std::move(partials[0]);
+}
+
+} // namespace pygim::mapping
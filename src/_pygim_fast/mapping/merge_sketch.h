@@ -0,0 +1,249 @@
+#pragma once
+
+#include <algorithm>
+#include <cmath>
+#include <cstddef>
+#include <cstdint>
+#include <functional>
+#include <limits>
+#include <memory>
+#include <stdexcept>
+#include <utility>
+#include <variant>
+#include <vector>
+
+#include "dynamic_merge_map.h"
+
+namespace pygim::mapping {
+
+namespace detail {
+
+struct SketchCount {
+    std::uint64_t n{0};
+};
+
+struct SketchMoments {
+    std::uint64_t n{0};
+    double mean{0.0};
+    double m2{0.0};  //!< sum of squared deviations from the mean
+};
+
+struct SketchTopK {
+    std::vector<double> heap;  //!< min-heap: the smallest kept value on top
+    std::uint32_t k{1};
+};
+
+struct SketchHistogram {
+    std::shared_ptr<const std::vector<double>> edges;
+    std::vector<std::uint64_t> counts;
+};
+
+} // namespace detail
+
+/*
+ * MergeSketch is a mergeable summary of a stream of numbers, the value type
+ * behind DynamicMergeMap's sketch strategies:
+ *
+ *   Count      number of observations                     8 bytes
+ *   Mean       count, mean and variance (Welford)         24 bytes
+ *   TopK       the k largest observations                 k doubles
+ *   Histogram  counts per fixed bucket                    one count per bucket
+ *
+ * add() folds in one observation in place and merge() combines two sketches
+ * of the same kind and parameters (e.g. one per shard), so summarising the
+ * shards one by one and merging the results gives the same sketch as
+ * summarising all the observations (up to float rounding for Mean). NaN
+ * observations are rejected, so no sketch ever holds one. Top-k
+ * values are kept in a min-heap; histogram bucket edges are shared by all
+ * the sketches copied from one prototype.
+ *
+ * Usage example:
+ *   DynamicMergeMap<std::string, MergeSketch> latency;
+ *   latency.observe("db", 0.25, MergeSketch::make_mean());
+ *   latency.at("db").variance();
+ */
+class MergeSketch {
+public:
+    // An empty Count sketch.
+    MergeSketch() = default;
+
+    static MergeSketch make_count() { return MergeSketch(Count{}); }
+
+    static MergeSketch make_mean() { return MergeSketch(Moments{}); }
+
+    static MergeSketch make_top_k(std::size_t k) {
+        if (k == 0 || k > std::numeric_limits<std::uint32_t>::max()) {
+            throw std::invalid_argument("top_k needs 1 <= k < 2**32");
+        }
+        return MergeSketch(TopK{{}, static_cast<std::uint32_t>(k)});
+    }
+
+    // Buckets (-inf, e0), [e0, e1), ..., [en, inf) for strictly ascending edges.
+    static MergeSketch make_histogram(std::vector<double> edges) {
+        if (edges.empty()) {
+            throw std::invalid_argument("histogram needs at least one bucket edge");
+        }
+        for (std::size_t i = 0; i < edges.size(); ++i) {
+            if (std::isnan(edges[i]) || (i > 0 && !(edges[i - 1] < edges[i]))) {
+                throw std::invalid_argument("histogram bucket edges must be strictly ascending");
+            }
+        }
+        const auto buckets = edges.size() + 1;
+        return MergeSketch(Histogram{std::make_shared<const std::vector<double>>(std::move(edges)),
+                                     std::vector<std::uint64_t>(buckets)});
+    }
+
+    MergeStrategy strategy() const noexcept {
+        return static_cast<MergeStrategy>(static_cast<std::size_t>(MergeStrategy::Count) + m_state.index());
+    }
+
+    // A sketch of the same kind and parameters with nothing observed.
+    MergeSketch cleared() const {
+        return std::visit([](const auto& state) {
+            using State = std::decay_t<decltype(state)>;
+            if constexpr (std::is_same_v<State, TopK>) {
+                return MergeSketch(TopK{{}, state.k});
+            } else if constexpr (std::is_same_v<State, Histogram>) {
+                return MergeSketch(Histogram{state.edges, std::vector<std::uint64_t>(state.counts.size())});
+            } else {
+                return MergeSketch(State{});
+            }
+        }, m_state);
+    }
+
+    // Throws std::invalid_argument for NaN (it has no place in the top-k or
+    // histogram order and would stick to a mean); the sketch is left unchanged.
+    void add(double x) {
+        if (std::isnan(x)) {
+            throw std::invalid_argument("sketch observations must not be NaN");
+        }
+        std::visit([x](auto& state) {
+            using State = std::decay_t<decltype(state)>;
+            if constexpr (std::is_same_v<State, Count>) {
+                ++state.n;
+            } else if constexpr (std::is_same_v<State, Moments>) {
+                ++state.n;
+                const double delta = x - state.mean;
+                state.mean += delta / static_cast<double>(state.n);
+                state.m2 += delta * (x - state.mean);
+            } else if constexpr (std::is_same_v<State, TopK>) {
+                push_top(state, x);
+            } else {
+                const auto& edges = *state.edges;
+                ++state.counts[static_cast<std::size_t>(std::upper_bound(edges.begin(), edges.end(), x) - edges.begin())];
+            }
+        }, m_state);
+    }
+
+    // Same kind and parameters (top-k's k, histogram edges): merge() accepts it.
+    bool mergeable_with(const MergeSketch& other) const noexcept {
+        if (m_state.index() != other.m_state.index()) return false;
+        if (const auto* top = std::get_if<TopK>(&m_state)) return top->k == std::get<TopK>(other.m_state).k;
+        if (const auto* histogram = std::get_if<Histogram>(&m_state)) {
+            const auto& rhs = std::get<Histogram>(other.m_state);
+            return histogram->edges == rhs.edges || *histogram->edges == *rhs.edges;
+        }
+        return true;
+    }
+
+    // Throws std::invalid_argument when the kinds or parameters differ.
+    void merge(const MergeSketch& other) {
+        if (m_state.index() != other.m_state.index()) {
+            throw std::invalid_argument("cannot merge sketches of different kinds");
+        }
+        std::visit([&](auto& state) {
+            using State = std::decay_t<decltype(state)>;
+            const auto& rhs = std::get<State>(other.m_state);
+            if constexpr (std::is_same_v<State, Count>) {
+                state.n += rhs.n;
+            } else if constexpr (std::is_same_v<State, Moments>) {
+                // Chan et al.: combine two (count, mean, M2) triples.
+                if (rhs.n == 0) return;
+                const auto n = state.n + rhs.n;
+                const double delta = rhs.mean - state.mean;
+                const double share = static_cast<double>(rhs.n) / static_cast<double>(n);
+                state.mean += delta * share;
+                state.m2 += rhs.m2 + delta * delta * static_cast<double>(state.n) * share;
+                state.n = n;
+            } else if constexpr (std::is_same_v<State, TopK>) {
+                if (state.k != rhs.k) {
+                    throw std::invalid_argument("cannot merge top_k sketches with different k");
+                }
+                for (const double x : rhs.heap) push_top(state, x);
+            } else {
+                if (state.edges != rhs.edges && *state.edges != *rhs.edges) {
+                    throw std::invalid_argument("cannot merge histograms with different bucket edges");
+                }
+                for (std::size_t i = 0; i < state.counts.size(); ++i) state.counts[i] += rhs.counts[i];
+            }
+        }, m_state);
+    }
+
+    // Observations summarised, for Count and Mean sketches.
+    std::uint64_t count() const {
+        if (const auto* moments = std::get_if<Moments>(&m_state)) return moments->n;
+        return std::get<Count>(m_state).n;
+    }
+
+    // Mean and population variance, for Mean sketches (NaN when empty).
+    double mean() const {
+        const auto& moments = std::get<Moments>(m_state);
+        return moments.n ? moments.mean : std::numeric_limits<double>::quiet_NaN();
+    }
+
+    double variance() const {
+        const auto& moments = std::get<Moments>(m_state);
+        return moments.n ? moments.m2 / static_cast<double>(moments.n) : std::numeric_limits<double>::quiet_NaN();
+    }
+
+    // The k largest observations, largest first, for TopK sketches.
+    std::vector<double> top() const {
+        auto values = std::get<TopK>(m_state).heap;
+        std::sort(values.begin(), values.end(), std::greater<>());
+        return values;
+    }
+
+    std::size_t k() const { return std::get<TopK>(m_state).k; }
+
+    // Bucket edges and len(edges) + 1 counts, for Histogram sketches.
+    const std::vector<double>& edges() const { return *std::get<Histogram>(m_state).edges; }
+
+    const std::vector<std::uint64_t>& bucket_counts() const { return std::get<Histogram>(m_state).counts; }
+
+    // Heap bytes held by this sketch (shared histogram edges not included).
+    std::size_t memory_usage() const noexcept {
+        if (const auto* top = std::get_if<TopK>(&m_state)) return top->heap.capacity() * sizeof(double);
+        if (const auto* histogram = std::get_if<Histogram>(&m_state)) {
+            return histogram->counts.capacity() * sizeof(std::uint64_t);
+        }
+        return 0;
+    }
+
+private:
+    using Count = detail::SketchCount;
+    using Moments = detail::SketchMoments;
+    using TopK = detail::SketchTopK;
+    using Histogram = detail::SketchHistogram;
+
+    // Alternatives in MergeStrategy order, starting at Count.
+    using State = std::variant<Count, Moments, TopK, Histogram>;
+
+    explicit MergeSketch(State state) : m_state(std::move(state)) {}
+
+    static void push_top(TopK& state, double x) {
+        if (state.heap.size() < state.k) {
+            state.heap.push_back(x);
+            std::push_heap(state.heap.begin(), state.heap.end(), std::greater<>());
+        } else if (x > state.heap.front()) {
+            std::pop_heap(state.heap.begin(), state.heap.end(), std::greater<>());
+            state.heap.back() = x;
+            std::push_heap(state.heap.begin(), state.heap.end(), std::greater<>());
+        }
+    }
+
+    State m_state{};
+};
+
+static_assert(SketchValue<MergeSketch>);
+
+} // namespace pygim::mapping
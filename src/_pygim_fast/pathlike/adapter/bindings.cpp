@@ -178,6 +178,20 @@ drops into ``open()``, ``Path()``, etc.
         .def("is_dir", &file::is_dir, "Whether it is a directory.")
         .def("is_symlink", &file::is_symlink, "Whether it is a symbolic link.")
         .def("size", &file::size, "File size in bytes (raises if it does not exist).")
+        .def("disk_usage",
+             [](const file& f, unsigned workers) {
+                 pygim::pathset::Usage usage;
+                 {
+                     py::gil_scoped_release release;
+                     usage = f.disk_usage(workers);
+                 }
+                 return py::make_tuple(usage.bytes, usage.files);
+             },
+             py::kw_only(), py::arg("workers") = 0,
+             "(bytes, files) for this file, or summed over every regular file "
+             "under this directory (parallel walk, GIL released; symlinks not "
+             "followed). For a per-directory breakdown use "
+             "pathset('*').disk_usage().")
         .def("read_bytes", [](const file& f) { return py::bytes(f.read_bytes()); },
              "The raw file bytes, undecoded.")
         .def("read",
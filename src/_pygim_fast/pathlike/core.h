@@ -23,6 +23,8 @@
 #include <utility>
 #include <vector>
 
+#include "../pathset/disk_usage.h"
+
 namespace pygim::pathlike {
 
 namespace fs = std::filesystem;
@@ -244,6 +246,13 @@ public:
     [[nodiscard]] bool is_symlink() const { return fs::is_symlink(m_path); }
     [[nodiscard]] std::uintmax_t size() const { return fs::file_size(m_path); }
 
+    // Total apparent size and regular-file count of this file, or of every
+    // file under this directory (walked in parallel; symlinks not followed).
+    [[nodiscard]] pathset::Usage disk_usage(unsigned workers = 0) const {
+        const auto groups = pathset::disk_usage({m_path}, pathset::GroupBy::Entry, 0, {}, workers);
+        return groups.empty() ? pathset::Usage{} : groups.front().second;
+    }
+
     // -- directory traversal (pathlib parity; results inherit the engine pin)
     // Children of this directory, sorted for determinism.
     [[nodiscard]] std::vector<file> iterdir() const {
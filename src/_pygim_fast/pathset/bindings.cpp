@@ -6,6 +6,8 @@
 #define PYBIND11_HAS_FILESYSTEM_IS_OPTIONAL
 #include <pybind11/stl/filesystem.h>
 
+#include <optional>
+
 #include "core.h"
 #include <iostream>         // std::string
 
@@ -14,6 +16,28 @@
 
 namespace py = pybind11;
 
+namespace {
+
+// group_by="parent"|"entry"|"total" (None: "parent"), or depth=N (which
+// implies depth grouping, so it cannot be combined with group_by).
+pygim::pathset::GroupBy group_by_from_arg(const std::optional<std::string>& group_by,
+                                          const std::optional<std::size_t>& depth) {
+    using pygim::pathset::GroupBy;
+    if (depth) {
+        if (group_by) {
+            throw py::value_error("disk_usage() takes either group_by or depth, not both");
+        }
+        return GroupBy::Depth;
+    }
+    const std::string mode = group_by.value_or("parent");
+    if (mode == "parent") return GroupBy::Parent;
+    if (mode == "entry") return GroupBy::Entry;
+    if (mode == "total") return GroupBy::Total;
+    throw py::value_error("invalid group_by: '" + mode + "' (expected 'parent', 'entry' or 'total')");
+}
+
+}  // namespace
+
 PYBIND11_MODULE(pathset, m)
 {
     m.doc() = "Python Gimmicks Common library."; // optional module docstring
@@ -22,6 +46,73 @@ PYBIND11_MODULE(pathset, m)
     m.def("match_pattern", &match_pattern, py::arg("pattern"), py::arg("string"),
           "Match a string against a glob pattern");
 
+    /* ----------------  Matcher  ----------------- */
+    py::class_<Matcher>(m, "Matcher")
+        .def(py::init<std::string>(), py::arg("pattern"),
+             "Compile a glob pattern once for repeated matching")
+        .def_property_readonly("pattern", &Matcher::pattern)
+        .def("match", [](const Matcher& self, std::string_view name) { return self(name); },
+             py::arg("name"), "Match a single string against the compiled pattern")
+        .def("__call__", [](const Matcher& self, std::string_view name) { return self(name); },
+             py::arg("name"))
+        // One crossing for the whole batch: names are read in place as UTF-8
+        // (no per-item std::string) and the mask is filled from the shared
+        // Py_True/Py_False singletons. Any iterable of str works, including
+        // numpy unicode arrays (their items are str subclasses).
+        .def("match_many", [](const Matcher& self, const py::iterable& names) {
+             std::vector<std::uint8_t> hits;
+             hits.reserve(py::len_hint(names));
+             for (py::handle item : names) {
+                 Py_ssize_t size = 0;
+                 const char* data = PyUnicode_Check(item.ptr())
+                     ? PyUnicode_AsUTF8AndSize(item.ptr(), &size)
+                     : nullptr;
+                 if (!data) {
+                     if (PyErr_Occurred()) throw py::error_already_set();
+                     throw py::type_error("match_many() expects an iterable of str, got "
+                                          + std::string(py::str(py::type::handle_of(item).attr("__name__"))));
+                 }
+                 hits.push_back(self(std::string_view(data, static_cast<std::size_t>(size))));
+             }
+             py::list mask(hits.size());
+             for (std::size_t i = 0; i < hits.size(); ++i) {
+                 mask[i] = py::bool_(hits[i] != 0);
+             }
+             return mask;
+         }, py::arg("names"),
+         "Match every string in *names*; return a list[bool] mask in input order")
+        .def("__repr__", &Matcher::repr);
+
+    /* ----------------  Bulk operation results  ----------------- */
+    py::class_<BulkProgress>(m, "BulkProgress",
+        "Live counters for a running copy_to/move_to/unlink; safe to poll from another thread")
+        .def(py::init<>())
+        .def_property_readonly("total",  [](const BulkProgress& p) { return p.total.load(); })
+        .def_property_readonly("done",   [](const BulkProgress& p) { return p.done.load(); })
+        .def_property_readonly("failed", [](const BulkProgress& p) { return p.failed.load(); })
+        .def_property_readonly("bytes",  [](const BulkProgress& p) { return p.bytes.load(); })
+        .def("__repr__", [](const BulkProgress& p) {
+             return "BulkProgress(" + std::to_string(p.done.load() + p.failed.load())
+                    + "/" + std::to_string(p.total.load()) + ", failed=" + std::to_string(p.failed.load()) + ")";
+         });
+
+    py::class_<BulkResult>(m, "BulkResult")
+        .def_readonly("succeeded", &BulkResult::succeeded)
+        .def_readonly("failed",    &BulkResult::failed)
+        .def_readonly("bytes",     &BulkResult::bytes)
+        .def_property_readonly("ok", [](const BulkResult& r) { return r.failed == 0; })
+        .def_property_readonly("errors", [](const BulkResult& r) {
+             py::list out;
+             for (const auto& e : r.errors) out.append(py::make_tuple(e.path, e.message));
+             return out;
+         }, "list of (path, message) for every item that failed, in set order")
+        .def_property_readonly("paths", [](const BulkResult& r) { return PathSet(r.paths); },
+             "PathSet of destinations written (copy/move) or paths removed (unlink)")
+        .def("__repr__", [](const BulkResult& r) {
+             return "BulkResult(succeeded=" + std::to_string(r.succeeded) + ", failed="
+                    + std::to_string(r.failed) + ", bytes=" + std::to_string(r.bytes) + ")";
+         });
+
     py::class_<PathSet>(m, "PathSet")
         .def(py::init<>())
         .def(py::init<const fs::path&>())
@@ -53,7 +144,48 @@ PYBIND11_MODULE(pathset, m)
         .def(py::self -= py::str())
         .def("__eq__",          &PathSet::operator==)
         .def("clone", &PathSet::clone)
-        .def("read_all_files", &PathSet::read_all_files);
+        .def("read_all_files", &PathSet::read_all_files)
+        .def("disk_usage",
+             [](const PathSet& ps, const std::optional<std::string>& group_by, std::optional<std::size_t> depth,
+                unsigned workers) {
+                 const auto mode = group_by_from_arg(group_by, depth);
+                 std::vector<std::pair<fs::path, pygim::pathset::Usage>> groups;
+                 {
+                     py::gil_scoped_release release;
+                     groups = ps.disk_usage(mode, depth.value_or(0), workers);
+                 }
+                 py::dict out;
+                 for (const auto& [key, usage] : groups) {
+                     out[py::cast(key)] = py::make_tuple(usage.bytes, usage.files);
+                 }
+                 return out;
+             },
+             py::arg("group_by") = py::none(), py::kw_only(), py::arg("depth") = py::none(),
+             py::arg("workers") = 0,
+             "Sum regular-file sizes under every path in parallel: {group: (bytes, files)}. "
+             "group_by is 'parent' (containing directory, the default), 'entry' (each path in "
+             "the set) or 'total'; depth=N instead groups by the ancestor at most N levels below "
+             "each path in the set, like du --max-depth=N (depth=0 matches 'entry'). "
+             "Apparent sizes; symlinks are not followed.")
+        .def("common_root", &PathSet::common_root,
+             "Deepest directory containing every path in the set")
+        // Bulk I/O runs without the GIL: the paths are copied out of the set
+        // first, and `progress` (if given) can be polled from another thread.
+        .def("copy_to", &PathSet::copy_to, py::arg("dest"), py::kw_only(),
+             py::arg("workers") = 0, py::arg("preserve_tree") = true,
+             py::arg("overwrite") = false, py::arg("progress") = nullptr,
+             py::call_guard<py::gil_scoped_release>(),
+             "Copy every regular file into *dest* on a bounded thread pool; per-item errors are collected. "
+             "Paths that would share a destination (one file name with preserve_tree=False) all fail.")
+        .def("move_to", &PathSet::move_to, py::arg("dest"), py::kw_only(),
+             py::arg("workers") = 0, py::arg("preserve_tree") = true,
+             py::arg("overwrite") = false, py::arg("progress") = nullptr,
+             py::call_guard<py::gil_scoped_release>(),
+             "Move every path into *dest* (rename, or copy + remove across devices)")
+        .def("unlink", &PathSet::unlink, py::kw_only(),
+             py::arg("workers") = 0, py::arg("progress") = nullptr,
+             py::call_guard<py::gil_scoped_release>(),
+             "Remove every path (files, symlinks, empty directories)");
 
 
     /* ----------------  Filter  ----------------- */
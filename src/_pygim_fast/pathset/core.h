@@ -1,6 +1,7 @@
 #pragma once
 
 #include <filesystem>
+#include <map>
 #include <set>
 #include <string>
 #include <string_view>
@@ -9,32 +10,45 @@
 #include <sstream>
 #include <mutex>
 #include <execution>
+#include <algorithm>
+#include <atomic>
+#include <cstdint>
+#include <functional>
+#include <system_error>
+#include <thread>
+
+#include "disk_usage.h"
+
+#if defined(__linux__)
+#include <cerrno>
+#include <fcntl.h>
+#include <sys/sendfile.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
 
 namespace fs = std::filesystem;
 
-[[nodiscard]] inline bool match_pattern(std::string_view pattern, std::string_view str) {
-    // Fast-path checks (no allocation needed)
-    if (pattern.empty()) return false;
-    if (pattern == "*") return true;
-    if (pattern == "*.*") return str.find('.') != std::string_view::npos;
-
-    // Pointer-chase algorithm requires null-terminated strings
-    std::string p_str(pattern), s_str(str);
-    const char *p = p_str.c_str();
-    const char *s = s_str.c_str();
-    const char *star = nullptr;
-    const char *ss = nullptr;
-
-    while (*s) {
-        if (*p == '?' || *p == *s) {
+// Glob core shared by match_pattern() and Matcher: `*` matches any run, `?`
+// exactly one character. Index-based, so views need no NUL terminator and
+// nothing is copied per call.
+[[nodiscard]] inline bool match_glob(std::string_view pattern, std::string_view str) noexcept {
+    constexpr auto npos = std::string_view::npos;
+    std::size_t p = 0, s = 0;
+    std::size_t star = npos;
+    std::size_t ss = 0;
+
+    while (s < str.size()) {
+        if (p < pattern.size() && pattern[p] == '*') {
+            // '*' found in pattern, remember this position. Checked first so a
+            // literal '*' in the string cannot consume the wildcard.
+            star = p++;
+            ss = s;
+        } else if (p < pattern.size() && (pattern[p] == '?' || pattern[p] == str[s])) {
             // Characters match or pattern has '?', move to the next character
             ++p;
             ++s;
-        } else if (*p == '*') {
-            // '*' found in pattern, remember this position
-            star = p++;
-            ss = s;
-        } else if (star) {
+        } else if (star != npos) {
             // Last pattern pointer was '*', backtrack
             p = star + 1;
             s = ++ss;
@@ -45,15 +59,103 @@ namespace fs = std::filesystem;
     }
 
     // Consume any remaining '*' in the pattern
-    while (*p == '*') {
+    while (p < pattern.size() && pattern[p] == '*') {
         ++p;
     }
 
     // If we've reached the end of the pattern, it's a match
-    return *p == '\0';
+    return p == pattern.size();
+}
+
+[[nodiscard]] inline bool match_pattern(std::string_view pattern, std::string_view str) noexcept {
+    // Fast-path checks
+    if (pattern.empty()) return false;
+    if (pattern == "*") return true;
+    if (pattern == "*.*") return str.find('.') != std::string_view::npos;
+
+    return match_glob(pattern, str);
 }
 
 
+/*-------------  Compiled pattern  ----------------*/
+// Same semantics as match_pattern(), with the pattern analysed once: the
+// literal prefix (before the first wildcard) and literal suffix (after the
+// last `*`) are checked with plain compares, and the common shapes
+// (`name`, `pre*`, `*.ext`, `pre*.ext`) never enter the backtracking loop.
+class Matcher {
+public:
+    explicit Matcher(std::string pattern) : m_pattern(std::move(pattern)) {
+        const std::string_view p = m_pattern;
+        if (p.empty()) { m_kind = Kind::Never; return; }
+        if (p == "*")   { m_kind = Kind::Any; return; }
+        if (p == "*.*") { m_kind = Kind::AnyDot; return; }
+
+        const auto first_wild = p.find_first_of("*?");
+        if (first_wild == std::string_view::npos) {
+            m_kind = Kind::Literal;
+            m_prefix_len = p.size();
+            return;
+        }
+        m_prefix_len = first_wild;
+
+        const auto last_star = p.rfind('*');
+        if (last_star != std::string_view::npos
+            && p.find('?', last_star) == std::string_view::npos) {
+            m_suffix_len = p.size() - last_star - 1;
+        }
+
+        const bool single_star = p.find('?') == std::string_view::npos
+                                 && p.find('*') == last_star;
+        m_kind = single_star ? Kind::Affix : Kind::General;
+    }
+
+    [[nodiscard]] bool operator()(std::string_view str) const noexcept {
+        const std::string_view p = m_pattern;
+        switch (m_kind) {
+            case Kind::Never:   return false;
+            case Kind::Any:     return true;
+            case Kind::AnyDot:  return str.find('.') != std::string_view::npos;
+            case Kind::Literal: return str == p;
+            case Kind::Affix:
+            case Kind::General:
+                break;
+        }
+
+        if (str.size() < m_prefix_len + m_suffix_len) return false;
+        if (!str.starts_with(p.substr(0, m_prefix_len))) return false;
+        if (!str.ends_with(p.substr(p.size() - m_suffix_len))) return false;
+        if (m_kind == Kind::Affix) return true;
+
+        // Both literal ends matched; only the wildcard middle is left.
+        return match_glob(p.substr(m_prefix_len, p.size() - m_prefix_len - m_suffix_len),
+                          str.substr(m_prefix_len, str.size() - m_prefix_len - m_suffix_len));
+    }
+
+    [[nodiscard]] const std::string& pattern() const noexcept { return m_pattern; }
+
+    [[nodiscard]] std::string repr() const {
+        return "Matcher(\"" + m_pattern + "\")";
+    }
+
+private:
+    enum class Kind : std::uint8_t {
+        Never,    // empty pattern
+        Any,      // "*"
+        AnyDot,   // "*.*": any name containing a dot
+        Literal,  // no wildcards
+        Affix,    // exactly one '*' and no '?': prefix + suffix compare
+        General,  // literal ends, glob over the middle
+    };
+
+    std::string m_pattern;
+    Kind m_kind = Kind::General;
+    // Lengths rather than views: a view into m_pattern would dangle when an
+    // SSO-sized Matcher is copied or moved.
+    std::size_t m_prefix_len = 0;
+    std::size_t m_suffix_len = 0;
+};
+
+
 using entry   = fs::directory_entry;
 
 /*-------------  A "callable" filter  ----------------*/
@@ -83,6 +185,287 @@ inline Filter ext(std::string_view x)
 }
 
 
+/*-------------  Bulk filesystem operations  ----------------*/
+// Live counters for a running bulk operation. The operation itself runs with
+// the GIL released, so another Python thread can poll these while it works.
+struct BulkProgress {
+    std::atomic<std::size_t>   total{0};
+    std::atomic<std::size_t>   done{0};
+    std::atomic<std::size_t>   failed{0};
+    std::atomic<std::uint64_t> bytes{0};
+
+    void reset(std::size_t n) noexcept {
+        total.store(n, std::memory_order_relaxed);
+        done.store(0, std::memory_order_relaxed);
+        failed.store(0, std::memory_order_relaxed);
+        bytes.store(0, std::memory_order_relaxed);
+    }
+};
+
+struct BulkError {
+    fs::path    path;
+    std::string message;
+};
+
+// Outcome of a whole batch. Failures do not stop the batch; they are listed
+// in `errors` in the set's iteration order.
+struct BulkResult {
+    std::size_t            succeeded = 0;
+    std::size_t            failed    = 0;
+    std::uint64_t          bytes     = 0;  // data copied (a same-device rename moves none)
+    std::vector<BulkError> errors;
+    std::vector<fs::path>  paths;          // destinations written, or paths removed
+};
+
+class PathSet;
+
+namespace pathset_detail {
+
+// Bytes moved by one item, or an error. Items never throw: every failure is
+// recorded against its path and the batch carries on.
+struct ItemOutcome {
+    std::uint64_t   bytes = 0;
+    std::error_code ec;
+    std::string     what;    // set instead of ec for non-filesystem exceptions
+    fs::path        target;  // destination written, or the path removed
+
+    [[nodiscard]] bool failed() const noexcept { return ec || !what.empty(); }
+};
+
+inline unsigned resolve_workers(unsigned requested, std::size_t items) noexcept {
+    unsigned n = requested ? requested : std::max(1u, std::thread::hardware_concurrency());
+    return static_cast<unsigned>(std::min<std::size_t>(n, std::max<std::size_t>(items, 1)));
+}
+
+#if defined(__linux__)
+// RAII fd so every early return closes what it opened.
+struct Fd {
+    int fd = -1;
+    explicit Fd(int f) noexcept : fd(f) {}
+    Fd(const Fd&) = delete;
+    Fd& operator=(const Fd&) = delete;
+    ~Fd() { if (fd >= 0) ::close(fd); }
+};
+
+// Kernel-side copy: copy_file_range (same or cross filesystem on >= 5.3),
+// then sendfile, then a plain read/write loop for filesystems that support
+// neither (some FUSE and network mounts).
+inline std::uint64_t copy_fd(int in, int out, std::uint64_t size, std::error_code& ec) noexcept {
+    std::uint64_t copied = 0;
+    bool use_cfr = true, use_sendfile = true;
+    while (copied < size) {
+        const std::size_t chunk = static_cast<std::size_t>(std::min<std::uint64_t>(size - copied, 1u << 30));
+        ssize_t n = -1;
+        if (use_cfr) {
+            n = ::copy_file_range(in, nullptr, out, nullptr, chunk, 0);
+            if (n < 0 && (errno == ENOSYS || errno == EXDEV || errno == EINVAL || errno == EOPNOTSUPP)) {
+                use_cfr = false;
+                continue;
+            }
+        } else if (use_sendfile) {
+            n = ::sendfile(out, in, nullptr, chunk);
+            if (n < 0 && (errno == ENOSYS || errno == EINVAL)) {
+                use_sendfile = false;
+                continue;
+            }
+        } else {
+            char buf[1 << 16];
+            n = ::read(in, buf, std::min(chunk, sizeof(buf)));
+            for (ssize_t w = 0; n > 0 && w < n;) {
+                const ssize_t k = ::write(out, buf + w, static_cast<std::size_t>(n - w));
+                if (k < 0) { if (errno == EINTR) continue; n = -1; break; }
+                w += k;
+            }
+        }
+        if (n < 0) {
+            if (errno == EINTR) continue;
+            ec.assign(errno, std::generic_category());
+            return copied;
+        }
+        if (n == 0) break;  // file shrank underneath us
+        copied += static_cast<std::uint64_t>(n);
+    }
+    return copied;
+}
+
+// rename(2) that fails with EEXIST instead of replacing `dst`. Filesystems
+// without RENAME_NOREPLACE fall back to link + unlink, equally atomic for
+// files; only a directory there is checked first and then renamed.
+inline void rename_noreplace(const fs::path& src, const fs::path& dst, std::error_code& ec) {
+    ec.clear();
+#ifdef RENAME_NOREPLACE
+    if (::renameat2(AT_FDCWD, src.c_str(), AT_FDCWD, dst.c_str(), RENAME_NOREPLACE) == 0) return;
+    if (errno != EINVAL && errno != ENOSYS) { ec.assign(errno, std::generic_category()); return; }
+#endif
+    if (::link(src.c_str(), dst.c_str()) == 0) {
+        if (::unlink(src.c_str()) != 0) ec.assign(errno, std::generic_category());
+        return;
+    }
+    if (errno != EPERM && errno != EOPNOTSUPP) { ec.assign(errno, std::generic_category()); return; }
+    if (fs::exists(fs::symlink_status(dst, ec))) {
+        ec = std::make_error_code(std::errc::file_exists);
+        return;
+    }
+    fs::rename(src, dst, ec);
+}
+#endif
+
+// Bytes in the regular files at or under `path` (symlinks not followed).
+inline std::uint64_t regular_bytes(const fs::path& path, std::error_code& ec) {
+    const auto kind = fs::symlink_status(path, ec);
+    if (ec) return 0;
+    if (fs::is_regular_file(kind)) return static_cast<std::uint64_t>(fs::file_size(path, ec));
+    if (!fs::is_directory(kind)) return 0;
+    std::uint64_t bytes = 0;
+    for (fs::recursive_directory_iterator it(path, ec), end; !ec && it != end; it.increment(ec)) {
+        if (it->is_regular_file(ec) && !it->is_symlink(ec)) bytes += static_cast<std::uint64_t>(it->file_size(ec));
+        if (ec) break;
+    }
+    return bytes;
+}
+
+inline std::uint64_t copy_regular_file(const fs::path& src, const fs::path& dst,
+                                       bool overwrite, std::error_code& ec) {
+    const auto kind = fs::status(src, ec);
+    if (ec) return 0;
+    if (!fs::is_regular_file(kind)) {
+        ec = std::make_error_code(fs::is_directory(kind) ? std::errc::is_a_directory
+                                                       : std::errc::invalid_argument);
+        return 0;
+    }
+    fs::create_directories(dst.parent_path(), ec);
+    if (ec) return 0;
+    if (overwrite && fs::equivalent(src, dst, ec)) {
+        // Truncating the destination would truncate the source.
+        ec = std::make_error_code(std::errc::file_exists);
+        return 0;
+    }
+    ec.clear();
+
+#if defined(__linux__)
+    // Fail fast on an existing destination; the final rename decides.
+    if (!overwrite && fs::exists(fs::symlink_status(dst, ec))) {
+        ec = std::make_error_code(std::errc::file_exists);
+        return 0;
+    }
+    ec.clear();
+    Fd in(::open(src.c_str(), O_RDONLY | O_CLOEXEC));
+    if (in.fd < 0) { ec.assign(errno, std::generic_category()); return 0; }
+    struct stat st{};
+    if (::fstat(in.fd, &st) != 0) { ec.assign(errno, std::generic_category()); return 0; }
+    // Written under a temporary name beside `dst` and renamed into place, so
+    // a failed copy leaves neither a partial file nor a truncated original.
+    std::string tmp = (dst.parent_path() / ".pygim-copy-XXXXXX").string();
+    Fd out(::mkostemp(tmp.data(), O_CLOEXEC));
+    if (out.fd < 0) { ec.assign(errno, std::generic_category()); return 0; }
+    std::uint64_t bytes = 0;
+    if (::fchmod(out.fd, st.st_mode & 07777) != 0) {
+        ec.assign(errno, std::generic_category());
+    } else {
+        bytes = copy_fd(in.fd, out.fd, static_cast<std::uint64_t>(st.st_size), ec);
+    }
+    if (!ec) {
+        if (overwrite) fs::rename(tmp, dst, ec);
+        else rename_noreplace(tmp, dst, ec);
+    }
+    if (ec) {
+        ::unlink(tmp.c_str());
+        return 0;
+    }
+    return bytes;
+#else
+    const auto opts = overwrite ? fs::copy_options::overwrite_existing : fs::copy_options::none;
+    if (!fs::copy_file(src, dst, opts, ec) && !ec) {
+        ec = std::make_error_code(std::errc::file_exists);
+    }
+    return ec ? 0 : static_cast<std::uint64_t>(fs::file_size(dst, ec));
+#endif
+}
+
+// Returns the bytes of the regular files moved (a directory counts its tree).
+inline std::uint64_t move_path(const fs::path& src, const fs::path& dst,
+                               bool overwrite, std::error_code& ec) {
+    fs::create_directories(dst.parent_path(), ec);
+    if (ec) return 0;
+    const auto bytes = regular_bytes(src, ec);
+    if (ec) return 0;
+#if defined(__linux__)
+    if (overwrite) fs::rename(src, dst, ec);
+    else rename_noreplace(src, dst, ec);
+#else
+    if (!overwrite && fs::exists(fs::symlink_status(dst, ec))) {
+        ec = std::make_error_code(std::errc::file_exists);
+        return 0;
+    }
+    ec.clear();
+    fs::rename(src, dst, ec);
+#endif
+    if (!ec) return bytes;
+    if (ec != std::errc::cross_device_link) return 0;
+
+    // Cross-device: copy then remove. Directories are not handled this way.
+    ec.clear();
+    const auto copied = copy_regular_file(src, dst, overwrite, ec);
+    if (!ec) fs::remove(src, ec);
+    return copied;
+}
+
+// Fan the items out over a bounded pool: each worker claims the next index
+// from a shared counter, so uneven file sizes balance themselves out.
+// `op(index, outcome)` returns the bytes it moved and reports through
+// `outcome.ec`.
+template <class Op>
+void run_bulk(const std::vector<fs::path>& items, unsigned workers,
+              BulkProgress& progress, std::vector<ItemOutcome>& outcomes, Op op) {
+    progress.reset(items.size());
+    outcomes.assign(items.size(), {});
+    std::atomic<std::size_t> next{0};
+
+    auto worker = [&]() {
+        for (std::size_t i; (i = next.fetch_add(1, std::memory_order_relaxed)) < items.size();) {
+            auto& out = outcomes[i];
+            try {
+                out.bytes = op(i, out);
+            } catch (const fs::filesystem_error& e) {
+                out.ec = e.code();
+            } catch (const std::exception& e) {
+                out.what = e.what();
+            }
+            if (out.failed()) {
+                progress.failed.fetch_add(1, std::memory_order_relaxed);
+            } else {
+                progress.bytes.fetch_add(out.bytes, std::memory_order_relaxed);
+                progress.done.fetch_add(1, std::memory_order_relaxed);
+            }
+        }
+    };
+
+    const unsigned n = resolve_workers(workers, items.size());
+    std::vector<std::jthread> pool;
+    pool.reserve(n - 1);
+    for (unsigned w = 1; w < n; ++w) pool.emplace_back(worker);
+    worker();  // this thread is worker 0
+}
+
+inline BulkResult collect(const std::vector<fs::path>& items, std::vector<ItemOutcome>& outcomes) {
+    BulkResult result;
+    result.paths.reserve(items.size());
+    for (std::size_t i = 0; i < items.size(); ++i) {
+        auto& out = outcomes[i];
+        if (out.failed()) {
+            ++result.failed;
+            result.errors.push_back({items[i], out.what.empty() ? out.ec.message() : std::move(out.what)});
+        } else {
+            ++result.succeeded;
+            result.bytes += out.bytes;
+            result.paths.push_back(std::move(out.target));
+        }
+    }
+    return result;
+}
+
+}  // namespace pathset_detail
+
 
 class PathSet {
 public:
@@ -189,9 +572,118 @@ public:
         return contents;
     }
 
-    // Other methods as needed
+    // Regular-file sizes under every path, aggregated per group (see
+    // disk_usage.h). Keys are absolute; depth grouping counts levels below
+    // each path (as `du --max-depth` does per argument), and the single
+    // Total group is keyed by common_root().
+    [[nodiscard]] std::vector<std::pair<fs::path, pygim::pathset::Usage>>
+    disk_usage(pygim::pathset::GroupBy group_by, std::size_t depth = 0, unsigned workers = 0) const {
+        std::vector<fs::path> items;
+        items.reserve(m_paths.size());
+        for (const auto& p : m_paths) items.push_back(fs::absolute(p).lexically_normal());
+        const fs::path root = group_by == pygim::pathset::GroupBy::Total ? common_root() : fs::path{};
+        return pygim::pathset::disk_usage(items, group_by, depth, root, workers);
+    }
+
+    /* ---------- Bulk filesystem operations ----------
+       All three run on a bounded pool of `workers` threads (0 = one per
+       hardware thread, never more than the number of paths) and never throw
+       for a single bad path: per-item failures are collected in the result.
+       With `preserve_tree`, destinations keep their layout relative to the
+       deepest directory shared by every path; otherwise they land flat in
+       `dest` by file name. Paths that would share a destination all fail
+       rather than race on it. */
+
+    // The deepest directory containing every path (absolute, normalised).
+    [[nodiscard]] fs::path common_root() const {
+        fs::path root;
+        bool first = true;
+        for (const auto& p : m_paths) {
+            const fs::path parent = fs::absolute(p).lexically_normal().parent_path();
+            if (first) { root = parent; first = false; continue; }
+            fs::path shared;
+            for (auto a = root.begin(), b = parent.begin();
+                 a != root.end() && b != parent.end() && *a == *b; ++a, ++b) {
+                shared /= *a;
+            }
+            root = std::move(shared);
+        }
+        return root;
+    }
+
+    [[nodiscard]] BulkResult copy_to(const fs::path& dest, unsigned workers = 0,
+                                     bool preserve_tree = true, bool overwrite = false,
+                                     BulkProgress* progress = nullptr) const {
+        return transfer(dest, workers, preserve_tree, overwrite, progress,
+                        &pathset_detail::copy_regular_file);
+    }
+
+    [[nodiscard]] BulkResult move_to(const fs::path& dest, unsigned workers = 0,
+                                     bool preserve_tree = true, bool overwrite = false,
+                                     BulkProgress* progress = nullptr) const {
+        return transfer(dest, workers, preserve_tree, overwrite, progress,
+                        &pathset_detail::move_path);
+    }
+
+    // Remove every path (files, symlinks, empty directories).
+    [[nodiscard]] BulkResult unlink(unsigned workers = 0, BulkProgress* progress = nullptr) const {
+        const std::vector<fs::path> items(m_paths.begin(), m_paths.end());
+        BulkProgress local;
+        std::vector<pathset_detail::ItemOutcome> outcomes;
+        pathset_detail::run_bulk(items, workers, progress ? *progress : local, outcomes,
+            [&](std::size_t i, pathset_detail::ItemOutcome& out) -> std::uint64_t {
+                if (!fs::remove(items[i], out.ec) && !out.ec) {
+                    out.ec = std::make_error_code(std::errc::no_such_file_or_directory);
+                }
+                out.target = items[i];
+                return 0;
+            });
+        return pathset_detail::collect(items, outcomes);
+    }
 
 private:
+    template <class Transfer>
+    [[nodiscard]] BulkResult transfer(const fs::path& dest, unsigned workers, bool preserve_tree,
+                                      bool overwrite, BulkProgress* progress, Transfer op) const {
+        const std::vector<fs::path> items(m_paths.begin(), m_paths.end());
+        // Destinations are planned up front on this thread; workers only do I/O.
+        std::vector<fs::path> targets;
+        targets.reserve(items.size());
+        const fs::path root = preserve_tree ? common_root() : fs::path{};
+        for (const auto& p : items) {
+            const fs::path abs = fs::absolute(p).lexically_normal();
+            targets.push_back((dest / (preserve_tree ? abs.lexically_relative(root) : abs.filename())).lexically_normal());
+        }
+        // Items sharing a destination (same file name without `preserve_tree`)
+        // would race on it, so none of them is transferred.
+        std::vector<std::string> clashes(items.size());
+        std::map<fs::path, std::vector<std::size_t>> by_target;
+        for (std::size_t i = 0; i < items.size(); ++i) {
+            by_target[targets[i]].push_back(i);
+        }
+        for (const auto& [target, sharing] : by_target) {
+            if (sharing.size() < 2) continue;
+            for (const auto i : sharing) {
+                const auto other = items[sharing[sharing[0] == i ? 1 : 0]];
+                clashes[i] = "destination " + target.string() + " is also the destination of " + other.string()
+                             + (preserve_tree ? "" : " (use preserve_tree=True)");
+            }
+        }
+
+        BulkProgress local;
+        std::vector<pathset_detail::ItemOutcome> outcomes;
+        pathset_detail::run_bulk(items, workers, progress ? *progress : local, outcomes,
+            [&](std::size_t i, pathset_detail::ItemOutcome& out) -> std::uint64_t {
+                out.target = targets[i];
+                if (!clashes[i].empty()) {
+                    out.what = clashes[i];
+                    return 0;
+                }
+                return op(items[i], targets[i], overwrite, out.ec);
+            });
+        return pathset_detail::collect(items, outcomes);
+    }
+
     std::set<fs::path> m_paths;
 };
 
@@ -0,0 +1,175 @@
+#pragma once
+// pathset/disk_usage.h — parallel `du`: file sizes aggregated per group.
+//
+// pybind-free and shared by PathSet::disk_usage() and pathlike's
+// file::disk_usage(). Each worker walks whole subtrees into its own pair of
+// DynamicMergeMaps (Sum strategy: bytes and file counts per group key); the
+// per-worker maps are merged once at the end, so no lock is taken per file
+// and no Python object exists until the caller converts the final groups.
+
+#include <algorithm>
+#include <atomic>
+#include <cstdint>
+#include <filesystem>
+#include <string>
+#include <system_error>
+#include <thread>
+#include <utility>
+#include <vector>
+
+#include "../mapping/dynamic_merge_map.h"
+
+namespace pygim::pathset {
+
+namespace fs = std::filesystem;
+
+enum class GroupBy {
+    Parent,  // the directory directly containing each file
+    Entry,   // the input path the file was found under (du -s per argument)
+    Depth,   // the ancestor at most `depth` levels below the entry (du --max-depth)
+    Total,   // one group for everything, keyed by the root
+};
+
+struct Usage {
+    std::uint64_t bytes = 0;   // apparent size (st_size), not allocated blocks
+    std::uint64_t files = 0;
+};
+
+namespace detail {
+
+using Counter = mapping::DynamicMergeMap<std::string, std::uint64_t>;
+
+// A unit of work: a file to count, or a directory to walk recursively.
+struct DuTask {
+    fs::path    path;
+    std::size_t entry;       // index into the caller's entries
+    bool        recurse;
+};
+
+struct DuPlan {
+    GroupBy                      group_by;
+    std::size_t                  depth;
+    fs::path                     root;     // for Total
+    const std::vector<fs::path>* entries;  // for Entry and Depth
+};
+
+inline std::string group_key(const DuPlan& plan, const fs::path& file, std::size_t entry) {
+    switch (plan.group_by) {
+        case GroupBy::Parent: return file.parent_path().native();
+        case GroupBy::Entry:  return (*plan.entries)[entry].native();
+        case GroupBy::Total:  return plan.root.native();
+        case GroupBy::Depth:  break;
+    }
+    // A file given as an entry is its own group, as `du` lists it.
+    fs::path key = (*plan.entries)[entry];
+    if (file == key) return key.native();
+    const fs::path rel = file.parent_path().lexically_relative(key);
+    std::size_t level = 0;
+    for (auto it = rel.begin(); it != rel.end() && level < plan.depth; ++it, ++level) {
+        if (it->empty() || *it == ".") break;
+        key /= *it;
+    }
+    return key.native();
+}
+
+struct DuWorker {
+    Counter bytes;
+    Counter files;
+
+    void add(const DuPlan& plan, const fs::path& file, std::size_t entry, std::uint64_t size) {
+        const std::string key = group_key(plan, file, entry);
+        bytes.merge_in(key, size);
+        files.merge_in(key, 1);
+    }
+
+    // Symlinks are not followed and not counted; unreadable entries are
+    // skipped, as `du` does after reporting them.
+    void walk(const DuPlan& plan, const DuTask& task) {
+        std::error_code ec;
+        if (!task.recurse) {
+            const auto size = fs::file_size(task.path, ec);
+            if (!ec) add(plan, task.path, task.entry, size);
+            return;
+        }
+        for (fs::recursive_directory_iterator
+                 it(task.path, fs::directory_options::skip_permission_denied, ec), end;
+             !ec && it != end; it.increment(ec)) {
+            std::error_code fec;
+            if (!it->is_regular_file(fec) || fec || it->is_symlink(fec)) continue;
+            const auto size = it->file_size(fec);
+            if (!fec) add(plan, it->path(), task.entry, size);
+        }
+    }
+};
+
+// Split directory entries one level so workers get more than one task per
+// input path: a single huge tree still fans out across its subdirectories.
+inline std::vector<DuTask> plan_tasks(const std::vector<fs::path>& entries) {
+    std::vector<DuTask> tasks;
+    for (std::size_t i = 0; i < entries.size(); ++i) {
+        std::error_code ec;
+        const auto st = fs::symlink_status(entries[i], ec);
+        if (ec) continue;
+        if (fs::is_regular_file(st)) {
+            tasks.push_back({entries[i], i, false});
+        } else if (fs::is_directory(st)) {
+            for (fs::directory_iterator it(entries[i], ec), end; !ec && it != end; it.increment(ec)) {
+                std::error_code dec;
+                const auto child = it->symlink_status(dec);
+                if (dec) continue;
+                if (fs::is_directory(child)) {
+                    tasks.push_back({it->path(), i, true});
+                } else if (fs::is_regular_file(child)) {
+                    tasks.push_back({it->path(), i, false});
+                }
+            }
+        }
+    }
+    return tasks;
+}
+
+}  // namespace detail
+
+// Aggregate the regular files in/under `entries` into groups, sorted by key.
+// `root` keys GroupBy::Total; GroupBy::Depth counts levels below each entry. `workers` = 0 picks one per hardware thread. Safe to
+// call without the GIL.
+[[nodiscard]] inline std::vector<std::pair<fs::path, Usage>>
+disk_usage(const std::vector<fs::path>& entries, GroupBy group_by, std::size_t depth = 0,
+           const fs::path& root = {}, unsigned workers = 0) {
+    const detail::DuPlan plan{group_by, depth, root.lexically_normal(), &entries};
+    const auto tasks = detail::plan_tasks(entries);
+
+    unsigned n = workers ? workers : std::max(1u, std::thread::hardware_concurrency());
+    n = static_cast<unsigned>(std::min<std::size_t>(n, std::max<std::size_t>(tasks.size(), 1)));
+
+    std::vector<detail::DuWorker> partials(n);
+    std::atomic<std::size_t> next{0};
+    auto run = [&](detail::DuWorker& w) {
+        for (std::size_t i; (i = next.fetch_add(1, std::memory_order_relaxed)) < tasks.size();) {
+            w.walk(plan, tasks[i]);
+        }
+    };
+    {
+        std::vector<std::jthread> pool;
+        pool.reserve(n - 1);
+        for (unsigned w = 1; w < n; ++w) pool.emplace_back(run, std::ref(partials[w]));
+        run(partials[0]);
+    }
+
+    auto& total = partials[0];
+    for (unsigned w = 1; w < n; ++w) {
+        total.bytes.merge_with(partials[w].bytes);
+        total.files.merge_with(partials[w].files);
+    }
+
+    std::vector<std::pair<fs::path, Usage>> out;
+    out.reserve(total.bytes.data().size());
+    for (const auto& [key, bytes] : total.bytes.data()) {
+        out.emplace_back(fs::path(key), Usage{bytes, total.files.at(key)});
+    }
+    std::sort(out.begin(), out.end(),
+              [](const auto& a, const auto& b) { return a.first < b.first; });
+    return out;
+}
+
+}  // namespace pygim::pathset
@@ -3,6 +3,7 @@
 #include "core_utils.h"
 #include <pybind11/pybind11.h>
 #include <pybind11/functional.h>
+#include <pybind11/gil_safe_call_once.h>
 
 namespace py = pybind11;
 
@@ -11,7 +12,19 @@ inline bool is_dunder(const py::str &attr) {
     return is_dunder(s);
 }
 
+// Cached module attributes use gil_safe_call_once_and_store: a plain
+// function-local `static py::object` would be decref'd by the C++ runtime
+// after the interpreter has finalized, aborting the process at exit.
 inline bool is_generator(const py::object &instance) {
-    static py::object generator_type = py::module::import("types").attr("GeneratorType");
-    return py::isinstance(instance, generator_type);
+    PYBIND11_CONSTINIT static py::gil_safe_call_once_and_store<py::object> generator_type;
+    return py::isinstance(instance, generator_type.call_once_and_store_result([] {
+        return py::module_::import("types").attr("GeneratorType");
+    }).get_stored());
+}
+
+inline bool is_coroutine_function(const py::handle &callable) {
+    PYBIND11_CONSTINIT static py::gil_safe_call_once_and_store<py::object> iscoroutinefunction;
+    return iscoroutinefunction.call_once_and_store_result([] {
+        return py::module_::import("inspect").attr("iscoroutinefunction");
+    }).get_stored()(callable).cast<bool>();
 }
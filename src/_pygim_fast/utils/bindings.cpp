@@ -2,24 +2,43 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/functional.h>
 #include <pybind11/stl.h>
+#include <algorithm>
+#include <cmath>
+#include <cstdint>
+#include <limits>
+#include <memory>
 #include <optional>
 #include <string>
+#include <type_traits>
 #include <unordered_map>
+#include <utility>
+#include <variant>
+#include <vector>
 #include "core_utils.h"
 #include "adapter_utils.h"
+#include "../mapping/columnar_merge.h"
+#include "../mapping/dense_id_map.h"
 #include "../mapping/dynamic_merge_map.h"
+#include "../mapping/flat_map.h"
+#include "../mapping/merge_reduce.h"
+#include "../mapping/merge_sketch.h"
 
 namespace py = pybind11;
 
 namespace {
 
 using MergeStrategy = pygim::mapping::MergeStrategy;
+using MergeSketch = pygim::mapping::MergeSketch;
 
 MergeStrategy parse_merge_strategy(const std::string& value) {
       if (value == "sum") return MergeStrategy::Sum;
       if (value == "max") return MergeStrategy::Max;
       if (value == "min") return MergeStrategy::Min;
       if (value == "replace") return MergeStrategy::Replace;
+      if (value == "count") return MergeStrategy::Count;
+      if (value == "mean") return MergeStrategy::Mean;
+      if (value == "top_k") throw py::value_error("the top_k strategy needs a size: pass ('top_k', k)");
+      if (value == "histogram") throw py::value_error("the histogram strategy needs bucket edges: pass ('histogram', edges)");
       throw py::value_error("invalid merge strategy: " + value);
 }
 
@@ -33,6 +52,14 @@ std::string merge_strategy_name(MergeStrategy strategy) {
                   return "min";
             case MergeStrategy::Replace:
                   return "replace";
+            case MergeStrategy::Count:
+                  return "count";
+            case MergeStrategy::Mean:
+                  return "mean";
+            case MergeStrategy::TopK:
+                  return "top_k";
+            case MergeStrategy::Histogram:
+                  return "histogram";
       }
       return "replace";
 }
@@ -47,6 +74,34 @@ MergeStrategy parse_merge_strategy_obj(py::handle obj) {
       throw py::value_error("invalid merge strategy object");
 }
 
+// A parsed merge strategy. Sketch strategies (count, mean, top_k, histogram)
+// also carry the empty sketch a new key starts from, with top_k's k or the
+// histogram's bucket edges.
+struct StrategySpec {
+      MergeStrategy strategy;
+      std::optional<MergeSketch> sketch{};
+};
+
+StrategySpec parse_strategy_spec(py::handle obj) {
+      if (py::isinstance<py::tuple>(obj)) {
+            const auto spec = py::reinterpret_borrow<py::tuple>(obj);
+            const auto name = (spec.size() == 2 && py::isinstance<py::str>(spec[0])) ? spec[0].cast<std::string>() : "";
+            if (name == "top_k") {
+                  const auto k = spec[1].cast<long long>();
+                  if (k < 1) throw py::value_error("top_k needs k >= 1");
+                  return {MergeStrategy::TopK, MergeSketch::make_top_k(static_cast<std::size_t>(k))};
+            }
+            if (name == "histogram") {
+                  return {MergeStrategy::Histogram, MergeSketch::make_histogram(spec[1].cast<std::vector<double>>())};
+            }
+            throw py::value_error("invalid merge strategy tuple: expected ('top_k', k) or ('histogram', edges)");
+      }
+      const auto strategy = parse_merge_strategy_obj(obj);
+      if (strategy == MergeStrategy::Count) return {strategy, MergeSketch::make_count()};
+      if (strategy == MergeStrategy::Mean) return {strategy, MergeSketch::make_mean()};
+      return {strategy};
+}
+
 std::string py_type_name(py::handle obj) {
       return py::str(py::type::of(obj).attr("__name__")).cast<std::string>();
 }
@@ -58,13 +113,261 @@ MergeStrategy default_strategy_for_type(const std::string& type_name) {
       return MergeStrategy::Replace;
 }
 
+// Dense ids for Python keys, so typed values can live in native maps and be
+// merged without touching Python objects. Ids are never reused; gimdicts
+// derived from one another share an interner and so their ids.
+using KeyId = std::uint32_t;
+
+class KeyInterner {
+public:
+      KeyId intern(py::handle key) {
+            const Py_hash_t hash = hash_of(key);
+            std::size_t index = probe(key, hash);
+            if (m_table[index].key != nullptr) {
+                  return m_table[index].id;
+            }
+            if (m_keys.size() >= std::numeric_limits<KeyId>::max()) {
+                  throw std::overflow_error("gimdict key space exhausted");
+            }
+            const auto id = static_cast<KeyId>(m_keys.size());
+            m_keys.push_back(py::reinterpret_borrow<py::object>(key));
+            m_table[index] = Slot{key.ptr(), id, static_cast<std::uint32_t>(hash)};
+            if (4 * m_keys.size() > 3 * m_table.size()) {
+                  rehash(2 * m_table.size());
+            }
+            return id;
+      }
+
+      std::optional<KeyId> find(py::handle key) const {
+            const auto& slot = m_table[probe(key, hash_of(key))];
+            if (slot.key == nullptr) {
+                  return std::nullopt;
+            }
+            return slot.id;
+      }
+
+      const py::object& key(KeyId id) const {
+            return m_keys[id];
+      }
+
+      std::size_t size() const noexcept {
+            return m_keys.size();
+      }
+
+      // Bytes of the native tables; the key objects are not included.
+      std::size_t memory_usage() const noexcept {
+            return m_table.capacity() * sizeof(Slot) + m_keys.capacity() * sizeof(py::object);
+      }
+
+private:
+      // Open addressing with linear probing, at most 3/4 full. Keys compare
+      // like dict keys: same object, or equal hash and `==`. A slot keeps
+      // the low 32 bits of the hash: enough to place it (the table never
+      // outgrows KeyId) and to skip most unequal keys without calling `==`.
+      struct Slot {
+            PyObject* key{nullptr};  // borrowed from m_keys
+            KeyId id{0};
+            std::uint32_t hash{0};
+      };
+
+      static Py_hash_t hash_of(py::handle key) {
+            const Py_hash_t hash = PyObject_Hash(key.ptr());
+            if (hash == -1 && PyErr_Occurred()) {
+                  throw py::error_already_set();
+            }
+            return hash;
+      }
+
+      std::size_t probe(py::handle key, Py_hash_t full_hash) const {
+            const auto hash = static_cast<std::uint32_t>(full_hash);
+            const std::size_t mask = m_table.size() - 1;
+            for (std::size_t index = hash & mask;; index = (index + 1) & mask) {
+                  const Slot& slot = m_table[index];
+                  if (slot.key == nullptr || slot.key == key.ptr()) {
+                        return index;
+                  }
+                  if (slot.hash == hash) {
+                        const int equal = PyObject_RichCompareBool(slot.key, key.ptr(), Py_EQ);
+                        if (equal < 0) {
+                              throw py::error_already_set();
+                        }
+                        if (equal) {
+                              return index;
+                        }
+                  }
+            }
+      }
+
+      void rehash(std::size_t capacity) {
+            std::vector<Slot> table(capacity);
+            const std::size_t mask = capacity - 1;
+            for (const Slot& slot : m_table) {
+                  if (slot.key == nullptr) {
+                        continue;
+                  }
+                  std::size_t index = slot.hash & mask;
+                  while (table[index].key != nullptr) {
+                        index = (index + 1) & mask;
+                  }
+                  table[index] = slot;
+            }
+            m_table.swap(table);
+      }
+
+      std::vector<Slot> m_table = std::vector<Slot>(16);
+      std::vector<py::object> m_keys{};
+};
+
+template <typename T>
+T to_native(py::handle value) {
+      if constexpr (std::is_same_v<T, std::int64_t>) {
+            const long long native = PyLong_AsLongLong(value.ptr());
+            if (native == -1 && PyErr_Occurred()) {
+                  throw py::error_already_set();
+            }
+            return static_cast<T>(native);
+      } else {
+            const double native = PyFloat_AsDouble(value.ptr());
+            if (native == -1.0 && PyErr_Occurred()) {
+                  throw py::error_already_set();
+            }
+            return native;
+      }
+}
+
+template <typename T>
+py::object to_python(T value) {
+      if constexpr (std::is_same_v<T, std::int64_t>) {
+            return py::reinterpret_steal<py::object>(PyLong_FromLongLong(value));
+      } else {
+            return py::reinterpret_steal<py::object>(PyFloat_FromDouble(value));
+      }
+}
+
+using SketchMap = pygim::mapping::DynamicMergeMap<KeyId, MergeSketch, pygim::mapping::FlatMap<KeyId, MergeSketch>>;
+
+// A sketch as Python values: count -> int, mean -> {"count", "mean",
+// "variance"}, top_k -> the k largest values (largest first, in the gimdict's
+// dtype), histogram -> len(edges) + 1 bucket counts.
+template <typename T>
+py::object sketch_to_python(const MergeSketch& sketch) {
+      switch (sketch.strategy()) {
+            case MergeStrategy::Count:
+                  return py::int_(sketch.count());
+            case MergeStrategy::Mean: {
+                  py::dict out;
+                  out["count"] = sketch.count();
+                  out["mean"] = sketch.mean();
+                  out["variance"] = sketch.variance();
+                  return out;
+            }
+            case MergeStrategy::TopK: {
+                  py::list out;
+                  for (const double value : sketch.top()) {
+                        out.append(to_python(static_cast<T>(value)));
+                  }
+                  return out;
+            }
+            case MergeStrategy::Histogram:
+                  return py::cast(sketch.bucket_counts());
+            default:
+                  break;
+      }
+      throw std::logic_error("not a sketch strategy");
+}
+
+// Typed mode storage: values by interned key id. Ids are dense, so the
+// values sit in a DenseIdMap (per-key strategies inline with them) and
+// iterate in interning (first-insertion) order. A key whose strategy is a
+// sketch (mean, top_k, ...) holds a MergeSketch in `sketches` instead, never
+// both; such keys are usually few, hence a FlatMap.
+template <typename T>
+struct TypedValues {
+      using Values = pygim::mapping::DynamicMergeMap<KeyId, T, pygim::mapping::DenseIdMap<KeyId, T>>;
+
+      std::shared_ptr<KeyInterner> keys;
+      Values values{};
+      SketchMap sketches{};
+      pygim::mapping::FlatMap<KeyId, MergeSketch> key_sketches{};  // empty sketch per key with a sketch strategy
+      std::optional<MergeSketch> default_sketch{};
+
+      // False while every value merges as a plain number (the fast path).
+      bool has_sketches() const noexcept {
+            return default_sketch || !key_sketches.empty() || sketches.size() > 0;
+      }
+
+      // The empty sketch the key's values go into, or nullptr for plain values.
+      const MergeSketch* sketch_for(KeyId id) const {
+            if (const auto* empty = key_sketches.find(id)) return empty;
+            if (default_sketch && values.data().tag(id) == Values::map_type::no_tag) return &*default_sketch;
+            return nullptr;
+      }
+
+      bool is_sketch(KeyId id) const {
+            return sketches.contains(id) || sketch_for(id) != nullptr;
+      }
+
+      // One value; for a sketch key, one observation.
+      void merge_value(KeyId id, T value) {
+            const MergeSketch* empty = sketch_for(id);
+            if (empty || sketches.contains(id)) {
+                  sketches.observe(id, static_cast<double>(value), empty ? *empty : MergeSketch{});
+            } else {
+                  values.merge_in(id, value);
+            }
+      }
+
+      // A sketch from another gimdict. A plain value already held for the
+      // key becomes the sketch's first observation.
+      void merge_sketch(KeyId id, const MergeSketch& sketch) {
+            if (!sketches.contains(id)) {
+                  const MergeSketch* empty = sketch_for(id);
+                  to_sketch(id, empty ? *empty : sketch.cleared());
+            }
+            sketches.merge_in(id, sketch);
+      }
+
+      // Start the key's sketch from `empty`, observing its plain value if any.
+      void to_sketch(KeyId id, const MergeSketch& empty) {
+            MergeSketch sketch = empty;
+            if (const T* value = values.data().find(id)) {
+                  sketch.add(static_cast<double>(*value));
+                  values.erase(id);
+            }
+            sketches.set(id, sketch);
+      }
+};
+
+using TypedStore = std::variant<TypedValues<std::int64_t>, TypedValues<double>>;
+
+TypedStore make_typed_store(const std::string& dtype) {
+      if (dtype == "int64") return TypedValues<std::int64_t>{std::make_shared<KeyInterner>()};
+      if (dtype == "float64") return TypedValues<double>{std::make_shared<KeyInterner>()};
+      throw py::value_error("invalid gimdict dtype: " + dtype + " (expected 'int64' or 'float64')");
+}
+
+template <typename T>
+constexpr const char* dtype_name() {
+      return std::is_same_v<T, std::int64_t> ? "int64" : "float64";
+}
+
+template <typename T>
+constexpr const char* python_type_name() {
+      return std::is_same_v<T, std::int64_t> ? "int" : "float";
+}
+
 class PyGimDict {
 public:
-      PyGimDict(py::object initial = py::none(), py::kwargs type_strategies = py::kwargs()) {
+      PyGimDict(py::object initial = py::none(), py::kwargs type_strategies = py::kwargs(),
+                py::object dtype = py::none()) {
+            if (!dtype.is_none()) {
+                  m_typed = make_typed_store(py::str(dtype).cast<std::string>());
+            }
             for (const auto& item : type_strategies) {
                   const auto type_name = py::str(item.first).cast<std::string>();
-                  m_type_strategies[type_name] = parse_merge_strategy_obj(item.second);
+                  m_type_strategies[type_name] = parse_spec(item.second);
             }
+            update_typed_default(m_type_strategies, m_explicit_default);
 
             if (!initial.is_none()) {
                   if (!PyMapping_Check(initial.ptr())) {
@@ -72,31 +375,68 @@ public:
                   }
                   py::dict d(initial);
                   for (const auto& item : d) {
-                        m_values[item.first] = item.second;
+                        setitem(item.first, item.second);
                   }
             }
       }
 
       std::size_t size() const {
+            if (m_typed) {
+                  return std::visit([](const auto& store) { return store.values.size() + store.sketches.size(); }, *m_typed);
+            }
             return py::len(m_values);
       }
 
       bool contains(py::handle key) const {
+            if (m_typed) {
+                  return std::visit([&](const auto& store) {
+                        const auto id = store.keys->find(key);
+                        return id && (store.values.contains(*id) || store.sketches.contains(*id));
+                  }, *m_typed);
+            }
             return m_values.contains(key);
       }
 
       py::object getitem(py::handle key) const {
-            if (!m_values.contains(key)) {
-                  throw py::key_error("key not found");
+            if (auto value = find(key)) {
+                  return *value;
             }
-            return py::reinterpret_borrow<py::object>(m_values[key]);
+            throw py::key_error("key not found");
       }
 
       void setitem(py::handle key, py::handle value) {
+            check_writable();
+            if (m_typed) {
+                  std::visit([&](auto& store) {
+                        using T = typename decltype(store.values)::mapped_type;
+                        const auto id = store.keys->intern(key);
+                        const auto native = to_native<T>(value);
+                        if (!store.is_sketch(id)) {
+                              store.values.set(id, native);
+                              return;
+                        }
+                        // The key's sketch restarts from this one observation.
+                        auto sketch = store.sketches.contains(id) ? store.sketches.at(id).cleared() : *store.sketch_for(id);
+                        sketch.add(static_cast<double>(native));
+                        store.sketches.set(id, sketch);
+                  }, *m_typed);
+                  return;
+            }
             m_values[key] = value;
       }
 
       void delitem(py::handle key) {
+            check_writable();
+            if (m_typed) {
+                  const bool erased = std::visit([&](auto& store) {
+                        const auto id = store.keys->find(key);
+                        return id && (store.values.erase(*id) || store.sketches.erase(*id));
+                  }, *m_typed);
+                  if (!erased) {
+                        throw py::key_error("key not found");
+                  }
+                  return;
+            }
             if (!m_values.contains(key)) {
                   throw py::key_error("key not found");
             }
@@ -104,8 +444,8 @@ public:
       }
 
       py::object get(py::handle key, py::object default_value = py::none()) const {
-            if (m_values.contains(key)) {
-                  return py::reinterpret_borrow<py::object>(m_values[key]);
+            if (auto value = find(key)) {
+                  return *value;
             }
             if (default_value.is_none()) {
                   throw py::key_error("key not found");
@@ -118,11 +458,38 @@ public:
       }
 
       void set_strategy(py::handle key, py::handle strategy) {
-            m_key_strategies[key] = py::str(merge_strategy_name(parse_merge_strategy_obj(strategy)));
+            check_writable();
+            const auto parsed = parse_spec(strategy);
+            if (m_typed) {
+                  std::visit([&](auto& store) {
+                        const auto id = store.keys->intern(key);
+                        if (store.sketches.contains(id)
+                            && !(parsed.sketch && store.sketches.at(id).mergeable_with(*parsed.sketch))) {
+                              throw py::value_error("gimdict key holds a "
+                                                    + merge_strategy_name(store.sketches.at(id).strategy())
+                                                    + " sketch; delete it before changing its strategy");
+                        }
+                        if (parsed.sketch) {
+                              if (store.values.contains(id)) {
+                                    store.to_sketch(id, *parsed.sketch);  // first: it may reject a NaN
+                              }
+                              store.key_sketches[id] = *parsed.sketch;
+                        } else {
+                              store.key_sketches.erase(id);
+                              store.values.set_merge_strategy(id, parsed.strategy);
+                        }
+                  }, *m_typed);
+                  return;
+            }
+            m_key_strategies[key] = py::str(merge_strategy_name(parsed.strategy));
       }
 
       void set_type_strategy(const std::string& type_name, py::handle strategy) {
-            m_type_strategies[type_name] = parse_merge_strategy_obj(strategy);
+            check_writable();
+            auto strategies = m_type_strategies;
+            strategies[type_name] = parse_spec(strategy);
+            update_typed_default(strategies, m_explicit_default);
+            m_type_strategies = std::move(strategies);
       }
 
       std::string type_strategy(const std::string& type_name) const {
@@ -130,20 +497,43 @@ public:
             if (it == m_type_strategies.end()) {
                   return merge_strategy_name(default_strategy_for_type(type_name));
             }
-            return merge_strategy_name(it->second);
+            return merge_strategy_name(it->second.strategy);
       }
 
       void set_default_strategy(py::handle strategy) {
-            m_explicit_default = parse_merge_strategy_obj(strategy);
+            check_writable();
+            auto spec = parse_spec(strategy);
+            update_typed_default(m_type_strategies, spec);
+            m_explicit_default = std::move(spec);
       }
 
       std::string default_strategy() const {
             return m_explicit_default.has_value()
-                  ? merge_strategy_name(*m_explicit_default)
+                  ? merge_strategy_name(m_explicit_default->strategy)
                   : "type-default";
       }
 
+      py::object dtype() const {
+            if (!m_typed) {
+                  return py::none();
+            }
+            return std::visit([](const auto& store) {
+                  using T = typename std::decay_t<decltype(store.values)>::mapped_type;
+                  return py::object(py::str(dtype_name<T>()));
+            }, *m_typed);
+      }
+
       void merge_in(py::handle key, py::handle value) {
+            check_writable();
+            if (m_typed) {
+                  std::visit([&](auto& store) {
+                        using T = typename decltype(store.values)::mapped_type;
+                        const auto id = store.keys->intern(key);
+                        if (store.has_sketches()) store.merge_value(id, to_native<T>(value));
+                        else store.values.merge_in(id, to_native<T>(value));
+                  }, *m_typed);
+                  return;
+            }
             if (!m_values.contains(key)) {
                   m_values[key] = value;
                   return;
@@ -155,27 +545,458 @@ public:
       }
 
       PyGimDict merged(const PyGimDict& other) const {
-            PyGimDict out;
-            out.m_values = py::dict(m_values);
-            out.m_key_strategies = py::dict(m_key_strategies);
-            out.m_type_strategies = m_type_strategies;
-            out.m_explicit_default = m_explicit_default;
-
-            for (const auto& item : other.m_values) {
+            PyGimDict out = copy();
+            if (out.m_typed && other.m_typed) {
+                  std::visit([&](auto& store) {
+                        using Store = std::decay_t<decltype(store)>;
+                        std::vector<MergeColumn<Store>> columns;
+                        std::vector<SketchShard> sketches;
+                        std::vector<ReadLock> locks;
+                        columns.push_back(encode(other, store));
+                        if (auto shard = encode_sketches(other, store, locks)) {
+                              sketches.push_back(std::move(*shard));
+                        }
+                        store.values.reserve(store.keys->size());
+                        py::gil_scoped_release release;
+                        if (store.has_sketches() || !sketches.empty()) {
+                              merge_routed(store, columns, sketches);
+                        } else {
+                              pygim::mapping::merge_columns(store.values, columns);
+                        }
+                  }, *out.m_typed);
+                  return out;
+            }
+            for (const auto& item : other.to_dict()) {
                   out.merge_in(item.first, item.second);
             }
             return out;
       }
 
+      /**
+       * Merge many shards into a new typed gimdict.
+       *
+       * Shards are read into key-id/value columns with the GIL held (the only
+       * per-key Python work: one hash lookup and one number conversion), then
+       * merged natively with the GIL released.
+       */
+      static PyGimDict merge_all(const py::iterable& shards, py::object dtype, py::object strategy) {
+            return merge_shards("merge_all", shards, std::move(dtype), std::move(strategy), 1);
+      }
+
+      /**
+       * merge_all() with the native phase spread over `workers` threads
+       * (0 = one per hardware thread) as a tree reduction.
+       */
+      static PyGimDict merge_reduce(const py::iterable& shards, unsigned workers, py::object dtype, py::object strategy) {
+            return merge_shards("merge_reduce", shards, std::move(dtype), std::move(strategy), workers);
+      }
+
+      static PyGimDict merge_shards(const std::string& caller, const py::iterable& shards, py::object dtype,
+                                    py::object strategy, unsigned workers) {
+            std::vector<py::object> sources;
+            for (py::handle shard : shards) {
+                  if (!py::isinstance<PyGimDict>(shard) && !PyDict_Check(shard.ptr()) && !py::hasattr(shard, "keys")) {
+                        throw py::type_error(caller + "() expects an iterable of mappings");
+                  }
+                  sources.push_back(py::reinterpret_borrow<py::object>(shard));
+            }
+            if (dtype.is_none()) {
+                  dtype = infer_dtype(caller, sources);
+            }
+
+            PyGimDict out(py::none(), py::kwargs(), dtype);
+            if (!strategy.is_none()) {
+                  out.set_default_strategy(strategy);
+            }
+            std::visit([&](auto& store) {
+                  using Store = std::decay_t<decltype(store)>;
+                  // Typed shards of one family share ids: adopting their
+                  // interner lets them skip key lookups entirely.
+                  for (const auto& source : sources) {
+                        if (py::isinstance<PyGimDict>(source)) {
+                              const auto& shard = source.cast<const PyGimDict&>();
+                              if (const auto* typed = shard.m_typed ? std::get_if<Store>(&*shard.m_typed) : nullptr) {
+                                    store.keys = typed->keys;
+                                    break;
+                              }
+                        }
+                  }
+                  adopt_key_strategies(caller, sources, store);
+                  // Shards already in these ids are read in place (and locked
+                  // against writes meanwhile); the rest become columns.
+                  using Shard = std::variant<MergeColumn<Store>, const decltype(Store::values)*>;
+                  std::vector<Shard> columns;
+                  std::vector<SketchShard> sketches;
+                  std::vector<ReadLock> locks;
+                  columns.reserve(sources.size());
+                  for (const auto& source : sources) {
+                        if (!py::isinstance<PyGimDict>(source)) {
+                              columns.emplace_back(encode_mapping(source, store));
+                              continue;
+                        }
+                        const auto& shard = source.cast<const PyGimDict&>();
+                        const auto* typed = shard.m_typed ? std::get_if<Store>(&*shard.m_typed) : nullptr;
+                        if (typed && typed->keys == store.keys) {
+                              locks.emplace_back(shard);
+                              columns.emplace_back(&typed->values);
+                        } else {
+                              columns.emplace_back(encode(shard, store));
+                        }
+                        if (auto part = encode_sketches(shard, store, locks)) {
+                              sketches.push_back(std::move(*part));
+                        }
+                  }
+                  store.values.reserve(store.keys->size());
+                  py::gil_scoped_release release;
+                  if (store.has_sketches() || !sketches.empty()) {
+                        merge_routed(store, columns, sketches);
+                  } else {
+                        pygim::mapping::merge_reduce(store.values, columns, workers);
+                  }
+            }, *out.m_typed);
+            return out;
+      }
+
+      /**
+       * Bytes used by this gimdict, for sys.getsizeof(): the native value
+       * storage plus its key interner (shared with derived gimdicts), or the
+       * backing dict in object mode. Key and value objects are not counted.
+       */
+      std::size_t sizeof_bytes() const {
+            if (m_typed) {
+                  return std::visit([](const auto& store) {
+                        std::size_t bytes = sizeof(PyGimDict) + store.values.data().memory_usage() + store.keys->memory_usage()
+                                            + store.sketches.data().memory_usage() + store.key_sketches.memory_usage();
+                        for (const auto& [id, sketch] : store.sketches.data()) {
+                              bytes += sketch.memory_usage();
+                        }
+                        return bytes;
+                  }, *m_typed);
+            }
+            return sizeof(PyGimDict) + py::module_::import("sys").attr("getsizeof")(m_values).cast<std::size_t>();
+      }
+
       py::dict to_dict() const {
+            if (m_typed) {
+                  return std::visit([](const auto& store) {
+                        using T = typename decltype(store.values)::mapped_type;
+                        // Values iterate by id; interleave the (few) sketches
+                        // by id too, so keys keep first-insertion order.
+                        std::vector<std::pair<KeyId, const MergeSketch*>> sketches;
+                        for (const auto& [id, sketch] : store.sketches.data()) {
+                              sketches.emplace_back(id, &sketch);
+                        }
+                        std::sort(sketches.begin(), sketches.end(),
+                                  [](const auto& lhs, const auto& rhs) { return lhs.first < rhs.first; });
+                        py::dict out;
+                        auto next = sketches.begin();
+                        for (const auto& [id, value] : store.values.data()) {
+                              for (; next != sketches.end() && next->first < id; ++next) {
+                                    out[store.keys->key(next->first)] = sketch_to_python<T>(*next->second);
+                              }
+                              out[store.keys->key(id)] = to_python(value);
+                        }
+                        for (; next != sketches.end(); ++next) {
+                              out[store.keys->key(next->first)] = sketch_to_python<T>(*next->second);
+                        }
+                        return out;
+                  }, *m_typed);
+            }
             return py::dict(m_values);
       }
 
       py::object iter() const {
+            if (m_typed) {
+                  return to_dict().attr("__iter__")();
+            }
             return m_values.attr("__iter__")();
       }
 
 private:
+      template <typename Store>
+      using MergeColumn = pygim::mapping::MergeColumn<KeyId, typename decltype(Store::values)::mapped_type>;
+      using SketchShard = std::variant<pygim::mapping::MergeColumn<KeyId, MergeSketch>, const SketchMap*>;
+
+      // Held (with the GIL) while a merge reads a gimdict's native values
+      // with the GIL released; writes meanwhile raise BufferError, as
+      // resizing an exported bytearray does.
+      class ReadLock {
+      public:
+            explicit ReadLock(const PyGimDict& owner) : m_owner(&owner) { ++owner.m_readers; }
+            ReadLock(ReadLock&& other) noexcept : m_owner(std::exchange(other.m_owner, nullptr)) {}
+            ReadLock(const ReadLock&) = delete;
+            ReadLock& operator=(const ReadLock&) = delete;
+            ReadLock& operator=(ReadLock&&) = delete;
+            ~ReadLock() {
+                  if (m_owner) --m_owner->m_readers;
+            }
+
+      private:
+            const PyGimDict* m_owner;
+      };
+
+
+      PyGimDict copy() const {
+            PyGimDict out;
+            // py::dict(dict) would alias the same dict object, not copy it.
+            out.m_values = m_values.attr("copy")();
+            out.m_key_strategies = m_key_strategies.attr("copy")();
+            out.m_type_strategies = m_type_strategies;
+            out.m_explicit_default = m_explicit_default;
+            out.m_typed = m_typed;  // the interner is shared
+            return out;
+      }
+
+      std::optional<py::object> find(py::handle key) const {
+            if (m_typed) {
+                  return std::visit([&](const auto& store) -> std::optional<py::object> {
+                        using T = typename std::decay_t<decltype(store.values)>::mapped_type;
+                        const auto id = store.keys->find(key);
+                        if (id && store.values.contains(*id)) {
+                              return to_python(store.values.at(*id));
+                        }
+                        if (id && store.sketches.contains(*id)) {
+                              return sketch_to_python<T>(store.sketches.at(*id));
+                        }
+                        return std::nullopt;
+                  }, *m_typed);
+            }
+            if (!m_values.contains(key)) {
+                  return std::nullopt;
+            }
+            return py::reinterpret_borrow<py::object>(m_values[key]);
+      }
+
+      // Sketches are native values, so sketch strategies need typed mode.
+      StrategySpec parse_spec(py::handle strategy) const {
+            auto spec = parse_strategy_spec(strategy);
+            if (spec.sketch && !m_typed) {
+                  throw py::value_error("the " + merge_strategy_name(spec.strategy)
+                                        + " strategy needs a typed gimdict (dtype='int64' or 'float64')");
+            }
+            return spec;
+      }
+
+      /*
+       * Typed values merge natively, so the per-type default applies once.
+       * Keys without a strategy of their own follow the default: switching
+       * it to a sketch turns their plain values into first observations, and
+       * switching away from a sketch they hold is refused (ValueError), with
+       * nothing changed.
+       */
+      void update_typed_default(const std::unordered_map<std::string, StrategySpec>& type_strategies,
+                                const std::optional<StrategySpec>& explicit_default) {
+            if (!m_typed) {
+                  return;
+            }
+            std::visit([&](auto& store) {
+                  using Store = std::decay_t<decltype(store)>;
+                  using T = typename decltype(store.values)::mapped_type;
+                  StrategySpec spec{MergeStrategy::Sum};
+                  if (explicit_default) {
+                        spec = *explicit_default;
+                  } else if (auto it = type_strategies.find(python_type_name<T>()); it != type_strategies.end()) {
+                        spec = it->second;
+                  }
+                  for (const auto& [id, sketch] : store.sketches.data()) {
+                        if (!store.key_sketches.contains(id) && !(spec.sketch && sketch.mergeable_with(*spec.sketch))) {
+                              throw py::value_error("gimdict holds " + merge_strategy_name(sketch.strategy())
+                                                    + " sketches under its default strategy; cannot change it to "
+                                                    + merge_strategy_name(spec.strategy));
+                        }
+                  }
+                  // Plain values following the default; checked before any
+                  // change since a NaN cannot become an observation.
+                  std::vector<KeyId> moved;
+                  if (spec.sketch) {
+                        for (const auto& [id, value] : store.values.data()) {
+                              if (!store.key_sketches.contains(id) && store.values.data().tag(id) == Store::Values::map_type::no_tag) {
+                                    if (std::isnan(static_cast<double>(value))) {
+                                          throw py::value_error("gimdict holds a NaN value under its default strategy; cannot change it to "
+                                                                + merge_strategy_name(spec.strategy));
+                                    }
+                                    moved.push_back(id);
+                              }
+                        }
+                  }
+                  store.default_sketch = spec.sketch;
+                  store.values.set_default_strategy(spec.strategy);
+                  for (const auto id : moved) store.to_sketch(id, *spec.sketch);
+            }, *m_typed);
+      }
+
+      static py::object infer_dtype(const std::string& caller, const std::vector<py::object>& sources) {
+            for (const auto& source : sources) {
+                  if (py::isinstance<PyGimDict>(source)) {
+                        const auto& shard = source.cast<const PyGimDict&>();
+                        if (shard.m_typed) {
+                              return shard.dtype();
+                        }
+                  }
+                  for (const auto& item : py::dict(py::isinstance<PyGimDict>(source)
+                                                   ? py::object(source.cast<const PyGimDict&>().to_dict())
+                                                   : source)) {
+                        if (PyFloat_Check(item.second.ptr())) return py::str("float64");
+                        if (PyLong_Check(item.second.ptr())) return py::str("int64");
+                        throw py::type_error(caller + "() cannot infer a numeric dtype from "
+                                             + py_type_name(item.second) + " values; pass dtype='int64' or 'float64'");
+                  }
+            }
+            return py::str("int64");
+      }
+
+      /*
+       * Per-key strategies set on the shards (set_strategy()) become the
+       * result's, in `store`'s ids, so merge_all() and merge_reduce() merge
+       * a key as `a | b` would. Two shards giving one key different
+       * strategies raise ValueError.
+       */
+      template <typename Store>
+      static void adopt_key_strategies(const std::string& caller, const std::vector<py::object>& sources, Store& store) {
+            std::unordered_map<KeyId, StrategySpec> chosen;
+            auto adopt = [&](KeyId id, StrategySpec spec) {
+                  const auto [it, inserted] = chosen.try_emplace(id, spec);
+                  const auto& seen = it->second;
+                  if (!inserted && (seen.strategy != spec.strategy
+                                    || (seen.sketch && !seen.sketch->mergeable_with(*spec.sketch)))) {
+                        throw py::value_error(caller + "() shards set different strategies for key "
+                                              + py::repr(store.keys->key(id)).template cast<std::string>() + ": "
+                                              + merge_strategy_name(seen.strategy) + " and "
+                                              + merge_strategy_name(spec.strategy));
+                  }
+            };
+            for (const auto& source : sources) {
+                  if (!py::isinstance<PyGimDict>(source)) {
+                        continue;
+                  }
+                  const auto& shard = source.cast<const PyGimDict&>();
+                  if (!shard.m_typed) {
+                        for (const auto& item : shard.m_key_strategies) {
+                              adopt(store.keys->intern(item.first),
+                                    {parse_merge_strategy(py::str(item.second).cast<std::string>())});
+                        }
+                        continue;
+                  }
+                  std::visit([&](const auto& theirs) {
+                        using Tags = typename std::decay_t<decltype(theirs.values)>::map_type;
+                        const bool shared = theirs.keys == store.keys;
+                        auto to_id = [&](KeyId id) { return shared ? id : store.keys->intern(theirs.keys->key(id)); };
+                        for (const auto& [id, sketch] : theirs.key_sketches) {
+                              adopt(to_id(id), {sketch.strategy(), sketch});
+                        }
+                        if (!theirs.values.has_key_strategies()) {
+                              return;
+                        }
+                        // Tags may sit on keys without a value, so walk every id.
+                        const auto ids = static_cast<KeyId>(theirs.keys->size());
+                        for (KeyId id = 0; id < ids; ++id) {
+                              const auto tag = theirs.values.data().tag(id);
+                              if (tag != Tags::no_tag && !theirs.key_sketches.contains(id)) {
+                                    adopt(to_id(id), {static_cast<MergeStrategy>(tag)});
+                              }
+                        }
+                  }, *shard.m_typed);
+            }
+            for (const auto& [id, spec] : chosen) {
+                  if (spec.sketch) {
+                        store.key_sketches[id] = *spec.sketch;
+                  } else {
+                        store.values.set_merge_strategy(id, spec.strategy);
+                  }
+            }
+      }
+
+      // Column of `shard` with ids of `store`'s interner.
+      template <typename Store>
+      static MergeColumn<Store> encode(const PyGimDict& shard, Store& store) {
+            if (shard.m_typed) {
+                  if (const auto* typed = std::get_if<Store>(&*shard.m_typed)) {
+                        MergeColumn<Store> column;
+                        column.reserve(typed->values.size());
+                        const bool shared = typed->keys == store.keys;
+                        for (const auto& [id, value] : typed->values.data()) {
+                              column.push_back(shared ? id : store.keys->intern(typed->keys->key(id)), value);
+                        }
+                        return column;
+                  }
+            }
+            return encode_mapping(shard.plain_values(), store);
+      }
+
+      template <typename Store>
+      static MergeColumn<Store> encode_mapping(const py::object& mapping, Store& store) {
+            using V = typename decltype(store.values)::mapped_type;
+            MergeColumn<Store> column;
+            if (PyDict_CheckExact(mapping.ptr())) {
+                  column.reserve(static_cast<std::size_t>(PyDict_GET_SIZE(mapping.ptr())));
+                  Py_ssize_t pos = 0;
+                  PyObject* key = nullptr;
+                  PyObject* value = nullptr;
+                  while (PyDict_Next(mapping.ptr(), &pos, &key, &value)) {
+                        column.push_back(store.keys->intern(key), to_native<V>(value));
+                  }
+                  return column;
+            }
+            for (py::handle item : mapping.attr("items")()) {
+                  auto pair = py::reinterpret_borrow<py::tuple>(item);
+                  column.push_back(store.keys->intern(pair[0]), to_native<V>(pair[1]));
+            }
+            return column;
+      }
+
+      // The shard's sketches in ids of `store`'s interner; read in place (and
+      // locked against writes) when the shard shares it.
+      template <typename Store>
+      static std::optional<SketchShard> encode_sketches(const PyGimDict& shard, Store& store, std::vector<ReadLock>& locks) {
+            if (!shard.m_typed) {
+                  return std::nullopt;
+            }
+            return std::visit([&](const auto& theirs) -> std::optional<SketchShard> {
+                  if (theirs.sketches.size() == 0) {
+                        return std::nullopt;
+                  }
+                  if (theirs.keys == store.keys) {
+                        locks.emplace_back(shard);
+                        return SketchShard(&theirs.sketches);
+                  }
+                  pygim::mapping::MergeColumn<KeyId, MergeSketch> column;
+                  column.reserve(theirs.sketches.size());
+                  for (const auto& [id, sketch] : theirs.sketches.data()) {
+                        column.push_back(store.keys->intern(theirs.keys->key(id)), sketch);
+                  }
+                  return SketchShard(std::move(column));
+            }, *shard.m_typed);
+      }
+
+      // Merge into a store where some keys hold sketches: each value goes to
+      // its key's sketch or plain value, so this runs on the calling thread.
+      template <typename Store, typename Shard>
+      static void merge_routed(Store& store, const std::vector<Shard>& columns, const std::vector<SketchShard>& sketches) {
+            using T = typename decltype(store.values)::mapped_type;
+            for (const auto& column : columns) {
+                  pygim::mapping::for_each_entry(column, [&](KeyId id, const T& value) { store.merge_value(id, value); });
+            }
+            for (const auto& shard : sketches) {
+                  pygim::mapping::for_each_entry(shard, [&](KeyId id, const MergeSketch& sketch) {
+                        store.merge_sketch(id, sketch);
+                  });
+            }
+      }
+
+      // Plain (non-sketch) values as a dict.
+      py::dict plain_values() const {
+            if (!m_typed) {
+                  return py::dict(m_values);
+            }
+            return std::visit([](const auto& store) {
+                  py::dict out;
+                  for (const auto& [id, value] : store.values.data()) {
+                        out[store.keys->key(id)] = to_python(value);
+                  }
+                  return out;
+            }, *m_typed);
+      }
+
       MergeStrategy strategy_for(py::handle key, py::handle lhs, py::handle rhs) const {
             if (m_key_strategies.contains(key)) {
                   return parse_merge_strategy(py::str(m_key_strategies[key]).cast<std::string>());
@@ -184,17 +1005,17 @@ private:
             const auto rhs_type = py_type_name(rhs);
             const auto rhs_it = m_type_strategies.find(rhs_type);
             if (rhs_it != m_type_strategies.end()) {
-                  return rhs_it->second;
+                  return rhs_it->second.strategy;
             }
 
             const auto lhs_type = py_type_name(lhs);
             const auto lhs_it = m_type_strategies.find(lhs_type);
             if (lhs_it != m_type_strategies.end()) {
-                  return lhs_it->second;
+                  return lhs_it->second.strategy;
             }
 
             if (m_explicit_default.has_value()) {
-                  return *m_explicit_default;
+                  return m_explicit_default->strategy;
             }
             return default_strategy_for_type(rhs_type);
       }
@@ -214,15 +1035,28 @@ private:
                         return py::module_::import("builtins").attr("max")(lhs, rhs);
                   case MergeStrategy::Min:
                         return py::module_::import("builtins").attr("min")(lhs, rhs);
+                  case MergeStrategy::Count:
+                  case MergeStrategy::Mean:
+                  case MergeStrategy::TopK:
+                  case MergeStrategy::Histogram:
+                        break;  // refused in object mode by parse_spec()
             }
             return py::reinterpret_borrow<py::object>(rhs);
       }
 
 private:
+      void check_writable() const {
+            if (m_readers > 0) {
+                  throw py::buffer_error("gimdict cannot be modified while a merge is reading it");
+            }
+      }
+
       py::dict m_values{};
       py::dict m_key_strategies{};
-      std::unordered_map<std::string, MergeStrategy> m_type_strategies{};
-      std::optional<MergeStrategy> m_explicit_default{};
+      std::unordered_map<std::string, StrategySpec> m_type_strategies{};
+      std::optional<StrategySpec> m_explicit_default{};
+      std::optional<TypedStore> m_typed{};
+      mutable std::size_t m_readers{0};
 };
 
 } // namespace
@@ -256,14 +1090,45 @@ PYBIND11_MODULE(utils, m) {
           "Compute a throughput string from quantity+unit over duration+unit.");
 
       auto gimdict_cls = py::class_<PyGimDict>(m, "gimdict", "Dynamic MutableMapping with merge strategies")
-            .def(py::init([](py::object initial, py::kwargs kwargs) {
-                        return PyGimDict(initial, kwargs);
+            .def(py::init([](py::object initial, py::object dtype, py::kwargs kwargs) {
+                        return PyGimDict(initial, kwargs, dtype);
                    }),
-                   py::arg("initial") = py::none())
+                   py::arg("initial") = py::none(),
+                   py::kw_only(),
+                   py::arg("dtype") = py::none())
+        .def_property_readonly("dtype", &PyGimDict::dtype,
+                               "None for object values, or 'int64' / 'float64' for natively stored numbers.")
+        .def_static("merge_all", &PyGimDict::merge_all,
+                    py::arg("shards"),
+                    py::kw_only(),
+                    py::arg("dtype") = py::none(),
+                    py::arg("strategy") = py::none(),
+                    "Merge an iterable of mappings (dicts or gimdicts) into a new typed gimdict.\n\n"
+                    "`dtype` is 'int64' or 'float64' (inferred from the first value when None) and\n"
+                    "`strategy` the default merge strategy (sum when None). Per-key strategies set\n"
+                    "on gimdict shards carry over; shards disagreeing on one raise ValueError.\n"
+                    "Shards are read once with the GIL held and merged natively with it released.")
+        .def_static("merge_reduce", &PyGimDict::merge_reduce,
+                    py::arg("shards"),
+                    py::kw_only(),
+                    py::arg("workers") = 0,
+                    py::arg("dtype") = py::none(),
+                    py::arg("strategy") = py::none(),
+                    "Like merge_all(), but merge natively on `workers` threads (0 = one per\n"
+                    "hardware thread): each thread folds a contiguous run of shards, then the\n"
+                    "partial results are combined pairwise. The result equals merge_all().\n"
+                    "Typed gimdict shards that share the result's keys are read in place; writing\n"
+                    "to one while the merge runs raises BufferError. Keys holding sketches are\n"
+                    "merged on the calling thread.")
         .def("set", &PyGimDict::set, py::arg("key"), py::arg("value"))
         .def("get", &PyGimDict::get, py::arg("key"), py::arg("default") = py::none())
         .def("contains", &PyGimDict::contains, py::arg("key"))
-        .def("set_strategy", &PyGimDict::set_strategy, py::arg("key"), py::arg("strategy"))
+        .def("set_strategy", &PyGimDict::set_strategy, py::arg("key"), py::arg("strategy"),
+             "Set the key's merge strategy: 'sum', 'max', 'min' or 'replace', or (typed mode\n"
+             "only) a sketch that summarises the values merged in: 'count', 'mean' (count,\n"
+             "mean and population variance), ('top_k', k) or ('histogram', edges). Sketches\n"
+             "of the same kind merge across gimdicts, e.g. one per worker. A NaN observation\n"
+             "raises ValueError and leaves the sketch unchanged.")
         .def("set_type_strategy", &PyGimDict::set_type_strategy, py::arg("type_name"), py::arg("strategy"))
         .def("type_strategy", &PyGimDict::type_strategy, py::arg("type_name"))
         .def("default_strategy", &PyGimDict::default_strategy)
@@ -276,6 +1141,7 @@ PYBIND11_MODULE(utils, m) {
         .def("__delitem__", &PyGimDict::delitem)
         .def("__iter__", &PyGimDict::iter)
         .def("__len__", &PyGimDict::size)
+        .def("__sizeof__", &PyGimDict::sizeof_bytes)
         .def("__contains__", &PyGimDict::contains, py::is_operator())
         .def("__or__", &PyGimDict::merged, py::is_operator());
 
@@ -10,6 +10,7 @@
 #include <type_traits>
 
 #include "../mapping/dynamic_merge_map.h"
+#include "../mapping/flat_map.h"
 
 namespace pygim {
 
@@ -44,7 +45,7 @@ template <typename PhaseEnum = void,
 struct TimerSnapshotT {
     static constexpr bool kEnumMode = !std::is_void_v<PhaseEnum>;
     using TimerId = std::conditional_t<kEnumMode, PhaseEnum, std::size_t>;
-    using PhaseMap = mapping::DynamicMergeMap<std::size_t, double>;
+    using PhaseMap = mapping::DynamicMergeMap<std::size_t, double, mapping::FlatMap<std::size_t, double>>;
 
     std::string_view name{};
     double total_seconds{0.0};
@@ -67,7 +68,7 @@ struct TimerSnapshotT {
 
     TimerSnapshotT& merge_with(const TimerSnapshotT& other) {
         total_seconds += other.total_seconds;
-        phase_seconds = phase_seconds | other.phase_seconds;
+        phase_seconds.merge_with(other.phase_seconds);
         const auto count = std::max(sub_timer_count, other.sub_timer_count);
         for (std::size_t i = 0; i < count; ++i) {
             if (phase_names[i].empty()) phase_names[i] = other.phase_names[i];
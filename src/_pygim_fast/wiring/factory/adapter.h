@@ -1,7 +1,11 @@
 #pragma once
 
+#include <chrono>
+#include <memory>
 #include <optional>
+#include <stdexcept>
 #include <string>
+#include <unordered_map>
 #include <vector>
 
 #include <pybind11/pybind11.h>
@@ -14,11 +18,108 @@ namespace pygim {
 
 namespace py = pybind11;
 
+/*
+ * VerdictCache remembers which concrete types passed an interface check.
+ *
+ * An entry is keyed by type object and stamped with the type's version tag,
+ * which CPython changes whenever the class (or one of its bases) is
+ * mutated, so a stale entry never matches. Mutating the interface clears
+ * the whole cache. Types without a valid tag are simply not cached, and
+ * only positive verdicts are kept: a failing product is always re-checked.
+ * A weakref per type drops the entry when the class is collected.
+ */
+class VerdictCache {
+public:
+    struct Info {
+        std::size_t hits{0};
+        std::size_t misses{0};
+        std::size_t size{0};
+    };
+
+    bool check(const py::object& obj, const py::object& interface) {
+        sync_interface(interface);
+        auto* type = Py_TYPE(obj.ptr());
+        if (auto it = m_types.find(type); it != m_types.end()) {
+            if (version_of(type) == it->second.version) {
+                ++m_hits;
+                return true;
+            }
+            m_types.erase(it);
+        }
+
+        ++m_misses;
+        if (!wiring::detail::is_instance_of(obj, interface)) {
+            return false;
+        }
+        // The check itself may touch the interface (ABC/Protocol bookkeeping
+        // on first use); stamp the verdict with the state after it.
+        sync_interface(interface);
+        if (const unsigned int version = version_of(type)) {
+            m_types.emplace(type, Entry{version, watch(type)});
+        }
+        return true;
+    }
+
+    void clear() {
+        m_types.clear();
+        m_hits = m_misses = 0;
+    }
+
+    [[nodiscard]] Info info() const { return Info{m_hits, m_misses, m_types.size()}; }
+
+private:
+    struct Entry {
+        unsigned int version;
+        py::object watcher;
+    };
+
+    // 0 when the type has no valid version tag (then it is not cached).
+    static unsigned int version_of(PyTypeObject* type) {
+#if PY_VERSION_HEX >= 0x030C0000
+        if (!PyUnstable_Type_AssignVersionTag(type)) {
+            return 0;
+        }
+#else
+        if (!PyType_HasFeature(type, Py_TPFLAGS_VALID_VERSION_TAG)) {
+            // A method-cache lookup assigns a tag when one is available.
+            static PyObject* probe = PyUnicode_InternFromString("__pygim_version_probe__");
+            _PyType_Lookup(type, probe);
+            if (!PyType_HasFeature(type, Py_TPFLAGS_VALID_VERSION_TAG)) {
+                return 0;
+            }
+        }
+#endif
+        return type->tp_version_tag;
+    }
+
+    void sync_interface(const py::object& interface) {
+        const unsigned int version = PyType_Check(interface.ptr())
+            ? version_of(reinterpret_cast<PyTypeObject*>(interface.ptr()))
+            : 0;
+        if (version != m_interface_version || version == 0) {
+            m_types.clear();
+            m_interface_version = version;
+        }
+    }
+
+    py::object watch(PyTypeObject* type) {
+        auto handle = py::handle(reinterpret_cast<PyObject*>(type));
+        return py::weakref(handle, py::cpp_function([this, type](py::handle) { m_types.erase(type); }));
+    }
+
+    std::unordered_map<PyTypeObject*, Entry> m_types;
+    unsigned int m_interface_version{0};
+    std::size_t m_hits{0};
+    std::size_t m_misses{0};
+};
+
 /*
  * PyObjectValidator is a Python-bound validator policy.
  *
  * - If interface is empty, validation is effectively disabled.
- * - If interface is set, created objects must satisfy isinstance(obj, interface).
+ * - If interface is set, created objects must satisfy isinstance(obj, interface),
+ *   checked per `mode`; ValidationMode::First caches verdicts per concrete
+ *   type in a VerdictCache.
  *
  * Usage example:
  *   PyObjectValidator v{py::none()};
@@ -26,18 +127,75 @@ namespace py = pybind11;
  */
 struct PyObjectValidator {
     std::optional<py::object> interface;
+    core::ValidationMode mode{core::ValidationMode::First};
+    // Shared so the weakref callbacks stay valid when the validator moves.
+    std::shared_ptr<VerdictCache> cache{std::make_shared<VerdictCache>()};
 
     /**
      * \brief Validate a created Python object against optional interface/protocol.
      * \param[in] obj Produced Python object.
-     * \return `true` when interface is unset or `isinstance(obj, interface)` is true.
+     * \return `true` when interface is unset, mode is Never, or `isinstance(obj, interface)` is true.
      * \note Exists to keep Python protocol checks out of pybind-free core code.
      */
     bool operator()(const py::object& obj) const {
-        if (!interface) {
+        if (!interface || mode == core::ValidationMode::Never) {
             return true;
         }
-        return wiring::detail::is_instance_of(obj, *interface);
+        if (mode == core::ValidationMode::Always) {
+            return wiring::detail::is_instance_of(obj, *interface);
+        }
+        return cache->check(obj, *interface);
+    }
+};
+
+/*
+ * PyTargetLoader is the lazy-entry loader policy: it resolves a
+ * `"package.module:attr"` target (attr may be dotted) by importing the
+ * module and walking the attributes.
+ *
+ * Usage example:
+ *   PyTargetLoader load;
+ *   py::function dumps = load("json:dumps");
+ */
+struct PyTargetLoader {
+    /**
+     * \brief Check that a target has the `module:attr` shape.
+     * \param[in] target Target string.
+     * \throws std::invalid_argument When either side of the colon is empty.
+     * \note Exists so bad manifests fail at registration instead of on first create().
+     */
+    static void check(const std::string& target) {
+        const auto colon = target.find(':');
+        if (colon == std::string::npos || colon == 0 || colon + 1 == target.size()
+            || target.find(':', colon + 1) != std::string::npos) {
+            throw std::invalid_argument("Lazy creator target must look like 'package.module:attr', got '" + target + "'");
+        }
+    }
+
+    /**
+     * \brief Import the target's module and return the named callable.
+     * \param[in] target `module:attr` string.
+     * \return The callable found at `attr`.
+     * \throws pybind11::error_already_set If the import or an attribute lookup fails.
+     * \throws py::type_error If the attribute is not callable.
+     */
+    py::function operator()(const std::string& target) const {
+        check(target);
+        const auto colon = target.find(':');
+        py::object found = py::module_::import(target.substr(0, colon).c_str());
+        std::size_t start = colon + 1;
+        while (true) {
+            const auto dot = target.find('.', start);
+            found = found.attr(target.substr(start, dot - start).c_str());
+            if (dot == std::string::npos) {
+                break;
+            }
+            start = dot + 1;
+        }
+        if (!PyCallable_Check(found.ptr())) {
+            throw py::type_error("Lazy creator target '" + target + "' is not callable");
+        }
+        return py::reinterpret_borrow<py::function>(found);
     }
 };
 
@@ -52,16 +210,19 @@ struct PyObjectValidator {
  *   auto out = f.create("double", py::make_tuple(3), py::dict());
  */
 class Factory {
-    using CoreType = core::FactoryCore<std::string, py::object, py::function, PyObjectValidator>;
+    using CoreType = core::FactoryCore<std::string, py::object, py::function, PyObjectValidator, PyTargetLoader>;
 
 public:
+    using Pooled = CoreType::Pooled;
+
     /**
      * \brief Construct Python-facing factory adapter.
      * \param[in] interface Optional Python type/protocol for output validation.
      * \note Exists to expose runtime Python constraints while delegating logic to `FactoryCore`.
      */
-    Factory(std::optional<py::object> interface = std::nullopt)
-        : m_core(PyObjectValidator{std::move(interface)}) {}
+    Factory(std::optional<py::object> interface = std::nullopt,
+            core::ValidationMode mode = core::ValidationMode::First)
+        : m_core(PyObjectValidator{std::move(interface), mode}) {}
 
     /**
      * \brief Register a Python callable creator.
@@ -77,6 +238,46 @@ public:
         m_core.register_creator(name, std::move(func), override_existing);
     }
 
+    /**
+     * \brief Register a creator whose products are pooled for acquire().
+     * \param[in] name Registry key.
+     * \param[in] func Python callable used as creator.
+     * \param[in] override_existing Same strict semantics as the unpooled overload.
+     * \param[in] pool Most idle products kept; 0 registers an unpooled creator.
+     * \param[in] reset Optional callable run on each returned product before reuse.
+     * \param[in] idle_timeout Optional seconds after which an idle product is evicted.
+     * \throws std::invalid_argument If `reset`/`idle_timeout` are given without a pool,
+     *         `reset` is not callable, or `idle_timeout` is negative.
+     * \note Exists for expensive-to-build, cheap-to-reset products.
+     */
+    void register_creator(const std::string& name, py::function func, bool override_existing,
+                          std::size_t pool, const py::object& reset, const py::object& idle_timeout) {
+        if (pool == 0) {
+            if (!reset.is_none() || !idle_timeout.is_none()) {
+                throw std::invalid_argument("reset and idle_timeout require pool > 0");
+            }
+            register_creator(name, std::move(func), override_existing);
+            return;
+        }
+
+        core::PoolOptions<py::object> options;
+        options.capacity = pool;
+        if (!idle_timeout.is_none()) {
+            const double seconds = idle_timeout.cast<double>();
+            if (seconds < 0.0) {
+                throw std::invalid_argument("idle_timeout must be non-negative");
+            }
+            options.idle_timeout = std::chrono::duration<double>(seconds);
+        }
+        if (!reset.is_none()) {
+            if (!PyCallable_Check(reset.ptr())) {
+                throw std::invalid_argument("reset must be callable");
+            }
+            options.reset = [reset](py::object& product) { reset(product); };
+        }
+        m_core.register_creator(name, std::move(func), override_existing, std::move(options));
+    }
+
     /**
      * \brief Retrieve a registered Python creator by name.
      * \param[in] name Registry key.
@@ -84,7 +285,7 @@ public:
      * \throws std::runtime_error If key is not registered.
      * \note Exists to support direct callable inspection/access from Python API.
      */
-    py::function getitem(const std::string& name) const {
+    py::function getitem(const std::string& name) {
         return m_core.get_creator(name);
     }
 
@@ -97,12 +298,133 @@ public:
      * \throws std::runtime_error If creator is missing or validation fails.
      * \note Exists to isolate `args/kwargs` forwarding mechanics in adapter layer.
      */
-    py::object create(const std::string& name, py::args args, py::kwargs kwargs) const {
+    py::object create(const std::string& name, py::args args, py::kwargs kwargs) {
         return m_core.create(name, [&](py::function& creator) {
             return creator(*args, **kwargs);
         });
     }
 
+    /**
+     * \brief Invoke a creator once per keyword-argument mapping.
+     * \param[in] name Registry key.
+     * \param[in] kwargs_list Iterable of mappings, each forwarded as `**kwargs`.
+     * \return List of created Python objects, in input order.
+     * \throws std::runtime_error If creator is missing or any validation fails.
+     * \throws py::type_error When an item is not a mapping.
+     * \note Exists for batch construction: one crossing and one creator lookup, and
+     *       each call goes straight to `PyObject_Call` without re-packing arguments.
+     */
+    py::list create_many(const std::string& name, const py::iterable& kwargs_list) {
+        std::vector<py::dict> calls;
+        calls.reserve(py::len_hint(kwargs_list));
+        for (py::handle kwargs : kwargs_list) {
+            if (!py::isinstance<py::dict>(kwargs) && !py::hasattr(kwargs, "keys")) {
+                throw py::type_error("create_many() expects an iterable of keyword-argument mappings");
+            }
+            calls.emplace_back(py::isinstance<py::dict>(kwargs)
+                ? py::reinterpret_borrow<py::dict>(kwargs)
+                : py::dict(py::reinterpret_borrow<py::object>(kwargs)));
+        }
+
+        const py::tuple no_args;
+        auto products = m_core.create_many(name, calls.size(), [&](py::function& creator, std::size_t index) {
+            PyObject* product = PyObject_Call(creator.ptr(), no_args.ptr(), calls[index].ptr());
+            if (product == nullptr) {
+                throw py::error_already_set();
+            }
+            return py::reinterpret_steal<py::object>(product);
+        });
+
+        py::list result(products.size());
+        for (std::size_t index = 0; index < products.size(); ++index) {
+            result[index] = std::move(products[index]);
+        }
+        return result;
+    }
+
+    /**
+     * \brief Borrow a product of a pooled creator.
+     * \param[in] name Registry key.
+     * \param[in] kwargs Keyword arguments, used only when a new product is created.
+     * \return The product and the pool it goes back to.
+     * \throws std::runtime_error If the creator is missing or not pooled, or a new product fails validation.
+     * \note Exists for Lease; Python code borrows through `with factory.acquire(...)`.
+     */
+    Pooled acquire(const std::string& name, const py::dict& kwargs) {
+        return m_core.acquire(name, [&](py::function& creator) {
+            return creator(**kwargs);
+        });
+    }
+
+    /**
+     * \brief Pool counters for a pooled creator.
+     * \param[in] name Registry key.
+     * \return Dict of capacity, idle, in_use, hits, misses, evictions and discarded;
+     *         `None` for an unknown or unpooled name.
+     */
+    py::object pool_stats(const std::string& name) const {
+        auto stats = m_core.pool_stats(name);
+        if (!stats) {
+            return py::none();
+        }
+        py::dict result;
+        result["capacity"] = stats->capacity;
+        result["idle"] = stats->idle;
+        result["in_use"] = stats->in_use;
+        result["hits"] = stats->hits;
+        result["misses"] = stats->misses;
+        result["evictions"] = stats->evictions;
+        result["discarded"] = stats->discarded;
+        return result;
+    }
+
+    /**
+     * \brief Current validation mode name.
+     * \return `"first"`, `"always"` or `"never"`.
+     */
+    std::string validate_mode() const {
+        return std::string(core::validation_mode_to_string(m_core.validator().mode));
+    }
+
+    /**
+     * \brief Switch validation mode; cached verdicts are dropped.
+     * \param[in] mode `"first"`, `"always"` or `"never"`.
+     * \throws std::invalid_argument On an unknown mode.
+     */
+    void set_validate_mode(const std::string& mode) {
+        auto& validator = m_core.validator();
+        validator.mode = core::parse_validation_mode(mode);
+        validator.cache->clear();
+    }
+
+    /**
+     * \brief Counters of the per-type verdict cache.
+     * \return Dict of hits, misses and size (cached types).
+     */
+    py::dict validation_cache_info() const {
+        const auto info = m_core.validator().cache->info();
+        py::dict result;
+        result["hits"] = info.hits;
+        result["misses"] = info.misses;
+        result["size"] = info.size;
+        return result;
+    }
+
+    /**
+     * \brief Forget every cached verdict and reset the counters.
+     */
+    void validation_cache_clear() {
+        m_core.validator().cache->clear();
+    }
+
+    /**
+     * \brief Evict idle pooled products older than their pool's idle_timeout.
+     * \return Number of products evicted.
+     */
+    std::size_t evict_idle() {
+        return m_core.evict_idle();
+    }
+
     /**
      * \brief List names of all registered creators.
      * \return Vector of creator names.
@@ -123,8 +445,205 @@ public:
         py::module_::import(module_name.c_str());
     }
 
+    /**
+     * \brief Register a creator by `module:attr` target, imported on first use.
+     * \param[in] name Registry key.
+     * \param[in] target `"package.module:attr"` string.
+     * \param[in] override_existing Same strict semantics as register_creator().
+     * \throws std::invalid_argument If the target is malformed.
+     * \throws std::runtime_error On invalid override state.
+     * \note Exists so plugin sets can be advertised without importing every plugin.
+     */
+    void register_lazy(const std::string& name, const std::string& target, bool override_existing = false) {
+        PyTargetLoader::check(target);
+        m_core.register_target(name, target, override_existing);
+    }
+
+    /**
+     * \brief Register every entry point of a group lazily.
+     * \param[in] group Entry-point group (e.g. `"myapp.plugins"`).
+     * \param[in] override_existing Same strict semantics as register_creator().
+     * \return Registered names, in discovery order.
+     * \note Exists to discover installed plugins from package metadata alone.
+     */
+    std::vector<std::string> use_entry_points(const std::string& group, bool override_existing = false) {
+        auto entry_points = py::module_::import("importlib.metadata").attr("entry_points");
+        std::vector<std::string> names;
+        for (py::handle entry : entry_points(py::arg("group") = group)) {
+            auto name = entry.attr("name").cast<std::string>();
+            register_lazy(name, entry.attr("value").cast<std::string>(), override_existing);
+            names.push_back(std::move(name));
+        }
+        return names;
+    }
+
+    /**
+     * \brief Map each creator name to an importable `module:attr` target.
+     * \return Dict of name to target; creators without an importable
+     *         location (lambdas, nested functions, bound methods of instances,
+     *         `__main__`) are left out.
+     * \note Exists so a scan can be cached and replayed with load_manifest().
+     */
+    py::dict manifest() const {
+        py::dict result;
+        for (const auto& [name, target] : m_core.targets()) {
+            result[py::str(name)] = target;
+        }
+        for (const auto& name : m_core.registered_names()) {
+            if (result.contains(name)) {
+                continue;
+            }
+            if (const auto* creator = m_core.find_creator(name)) {
+                if (auto target = target_of(*creator)) {
+                    result[py::str(name)] = *target;
+                }
+            }
+        }
+        return result;
+    }
+
+    /**
+     * \brief Register lazy entries from a manifest mapping or JSON file.
+     * \param[in] source Mapping of name to target, or a path to a JSON object.
+     * \param[in] override_existing Same strict semantics as register_creator().
+     * \return Registered names.
+     * \throws std::invalid_argument If a target is malformed.
+     */
+    std::vector<std::string> load_manifest(const py::object& source, bool override_existing = false) {
+        py::object mapping = source;
+        if (!py::isinstance<py::dict>(source) && !py::hasattr(source, "keys")) {
+            auto text = py::module_::import("pathlib").attr("Path")(source).attr("read_text")(py::arg("encoding") = "utf-8");
+            mapping = py::module_::import("json").attr("loads")(text);
+        }
+        std::vector<std::string> names;
+        for (py::handle item : mapping.attr("items")()) {
+            auto pair = py::reinterpret_borrow<py::tuple>(item);
+            auto name = pair[0].cast<std::string>();
+            register_lazy(name, pair[1].cast<std::string>(), override_existing);
+            names.push_back(std::move(name));
+        }
+        return names;
+    }
+
+    /**
+     * \brief Write manifest() to a JSON file.
+     * \param[in] path Destination path.
+     */
+    void save_manifest(const py::object& path) const {
+        auto json = py::module_::import("json");
+        py::str text = json.attr("dumps")(manifest(), py::arg("indent") = 2, py::arg("sort_keys") = true);
+        py::module_::import("pathlib").attr("Path")(path).attr("write_text")(
+            text + py::str("\n"), py::arg("encoding") = "utf-8");
+    }
+
+    /**
+     * \brief Whether a name is registered lazily and not imported yet.
+     * \param[in] name Registry key.
+     */
+    bool is_pending(const std::string& name) const {
+        return m_core.pending(name);
+    }
+
 private:
+    // `module:qualname` of a creator, when resolving that target finds the
+    // creator again. The module must already be imported (nothing is imported
+    // here); bound methods of instances, nested functions and objects
+    // re-bound under another name resolve to something else and are left out.
+    static std::optional<std::string> target_of(const py::function& creator) {
+        py::object module = py::getattr(creator, "__module__", py::none());
+        py::object qualname = py::getattr(creator, "__qualname__", py::none());
+        if (!py::isinstance<py::str>(module) || !py::isinstance<py::str>(qualname)) {
+            return std::nullopt;
+        }
+        auto module_name = module.cast<std::string>();
+        auto path = qualname.cast<std::string>();
+        if (module_name == "__main__" || path.find('<') != std::string::npos) {
+            return std::nullopt;
+        }
+        py::dict modules = py::module_::import("sys").attr("modules");
+        if (!modules.contains(module_name)) {
+            return std::nullopt;
+        }
+        py::object found = modules[py::str(module_name)];
+        for (std::size_t start = 0;;) {
+            const auto dot = path.find('.', start);
+            found = py::getattr(found, path.substr(start, dot - start).c_str(), py::none());
+            if (found.is_none() || dot == std::string::npos) {
+                break;
+            }
+            start = dot + 1;
+        }
+        // `==`, not `is`: a classmethod is bound anew on each lookup.
+        if (found.is_none() || !found.equal(creator)) {
+            return std::nullopt;
+        }
+        return module_name + ":" + path;
+    }
+
     CoreType m_core;
 };
 
+/*
+ * Lease is the context manager returned by `Factory.acquire()`.
+ *
+ * The product is borrowed on `__enter__` and returned on `__exit__`: reset
+ * and kept for reuse after a clean exit, dropped when the block raised.
+ * A lease that is never exited gives its product up when collected.
+ *
+ * Usage example (Python):
+ *   with factory.acquire("parser", strict=True) as parser:
+ *       parser.feed(data)
+ */
+class Lease {
+public:
+    Lease(py::object factory, std::string name, py::dict kwargs)
+        : m_factory(std::move(factory)), m_name(std::move(name)), m_kwargs(std::move(kwargs)) {}
+
+    Lease(const Lease&) = delete;
+    Lease& operator=(const Lease&) = delete;
+
+    ~Lease() {
+        if (m_loan) {
+            m_loan->pool->release(std::move(m_loan->product), false);
+        }
+    }
+
+    /**
+     * \brief Borrow the product.
+     * \return The pooled product.
+     * \throws std::runtime_error If this lease is already active.
+     */
+    py::object enter() {
+        if (m_loan) {
+            throw std::runtime_error("Lease for '" + m_name + "' is already active");
+        }
+        m_loan = m_factory.cast<Factory&>().acquire(m_name, m_kwargs);
+        return m_loan->product;
+    }
+
+    /**
+     * \brief Return the product; reuse it only when the block did not raise.
+     * \param[in] exc_type Exception type from `__exit__`, `None` for a clean exit.
+     * \throws Whatever the pool's reset callable raises.
+     */
+    void exit(const py::object& exc_type) {
+        if (!m_loan) {
+            return;
+        }
+        Factory::Pooled loan = std::move(*m_loan);
+        m_loan.reset();
+        loan.pool->release(std::move(loan.product), exc_type.is_none());
+    }
+
+    std::string repr() const {
+        return "Lease(name='" + m_name + "', active=" + (m_loan ? "True" : "False") + ")";
+    }
+
+private:
+    py::object m_factory;  // keeps the factory alive while borrowed
+    std::string m_name;
+    py::dict m_kwargs;
+    std::optional<Factory::Pooled> m_loan;
+};
+
 } // namespace pygim
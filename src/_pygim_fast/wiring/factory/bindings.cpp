@@ -1,3 +1,5 @@
+#include <memory>
+
 #include <pybind11/functional.h>
 #include <pybind11/pybind11.h>
 
@@ -10,25 +12,59 @@ PYBIND11_MODULE(factory, m) {
     m.doc() = "Factory for creating objects using registered callables, with optional interface enforcement.";
 
     py::class_<Factory>(m, "Factory")
-        .def(py::init<>())
-        .def(py::init<py::object>(), py::arg("interface"))
+        .def(py::init([](py::object interface, const std::string& validate) {
+                 std::optional<py::object> checked;
+                 if (!interface.is_none()) {
+                     checked = std::move(interface);
+                 }
+                 return Factory(std::move(checked), core::parse_validation_mode(validate));
+             }),
+             py::arg("interface") = py::none(),
+             py::kw_only(),
+             py::arg("validate") = "first",
+             R"pbdoc(
+                 Factory(interface=None, *, validate="first")
+
+                 With an `interface`, products must satisfy isinstance(product, interface).
+                 `validate` selects how often: "first" checks the first product of each
+                 concrete type and remembers the verdict until that class or the
+                 interface is modified, "always" checks every product (needed when the
+                 verdict depends on the instance, e.g. protocols with data members
+                 set per instance), and "never" skips the check.
+             )pbdoc")
+        .def_property("validate", &Factory::validate_mode, &Factory::set_validate_mode,
+                      "Validation mode: \"first\", \"always\" or \"never\". Setting it clears the verdict cache.")
+        .def("validation_cache_info", &Factory::validation_cache_info,
+             "Counters of the per-type verdict cache used by validate=\"first\": {hits, misses, size}.")
+        .def("validation_cache_clear", &Factory::validation_cache_clear,
+             "Drop every cached verdict and reset the counters.")
         .def("register",
-             [](Factory& self, const std::string& name, py::object func_or_none, bool override_existing) -> py::object {
+             [](Factory& self, const std::string& name, py::object func_or_none, bool override_existing,
+                std::size_t pool, py::object reset, py::object idle_timeout) -> py::object {
                  if (func_or_none.is_none()) {
-                     py::cpp_function deco([&self, name, override_existing](py::function f) {
-                         self.register_creator(name, f, override_existing);
+                     py::cpp_function deco([&self, name, override_existing, pool, reset, idle_timeout](py::function f) {
+                         self.register_creator(name, f, override_existing, pool, reset, idle_timeout);
                          return f;
                      });
                      return py::object(std::move(deco));
                  }
-                 self.register_creator(name, func_or_none.cast<py::function>(), override_existing);
+                 self.register_creator(name, func_or_none.cast<py::function>(), override_existing, pool, reset, idle_timeout);
                  return func_or_none;
              },
              py::arg("name"),
              py::arg("func") = py::none(),
              py::kw_only(),
              py::arg("override") = false,
-             R"pbdoc(Register a creator by name, or use as a decorator. Use 'override=True' to override.)pbdoc")
+             py::arg("pool") = 0,
+             py::arg("reset") = py::none(),
+             py::arg("idle_timeout") = py::none(),
+             R"pbdoc(
+                 Register a creator by name, or use as a decorator. Use 'override=True' to override.
+
+                 With pool=N the products can be borrowed via acquire(): up to N idle
+                 products are kept, `reset(obj)` runs on each one returned, and idle
+                 products older than `idle_timeout` seconds are evicted.
+             )pbdoc")
         .def("create",
              &Factory::create,
              py::arg("name"),
@@ -41,11 +77,80 @@ PYBIND11_MODULE(factory, m) {
                  against the optional interface, and return it. Raises RuntimeError
                  if the interface check fails.
              )pbdoc")
+        .def("create_many",
+             &Factory::create_many,
+             py::arg("name"),
+             py::arg("kwargs_list"),
+             R"pbdoc(
+                 create_many(name, kwargs_list) -> list
+
+                 Call the creator registered under `name` once per mapping in
+                 `kwargs_list` (passed as keyword arguments) and return the products
+                 in order. Every product is checked against the optional interface;
+                 the first failure raises RuntimeError.
+             )pbdoc")
+        .def("acquire",
+             [](py::object self, const std::string& name, py::kwargs kwargs) {
+                 return std::make_unique<Lease>(std::move(self), name, std::move(kwargs));
+             },
+             py::arg("name"),
+             R"pbdoc(
+                 acquire(name, **kwargs) -> Lease
+
+                 Borrow a product of a creator registered with pool=N:
+                 `with factory.acquire(name, **kwargs) as obj:`. An idle product is
+                 reused when available; otherwise the creator is called with
+                 `kwargs` and the new product is checked against the interface.
+                 On exit the product is reset and kept, unless the block raised or
+                 the pool is full, in which case it is dropped. Thread-safe.
+             )pbdoc")
+        .def("pool_stats", &Factory::pool_stats, py::arg("name"),
+             "Return {capacity, idle, in_use, hits, misses, evictions, discarded} for a pooled creator, else None.")
+        .def("evict_idle", &Factory::evict_idle,
+             "Drop idle pooled products older than their idle_timeout; return how many were dropped.")
         .def("__getitem__", &Factory::getitem, py::arg("name"), "Get a callable by name.")
         .def("registered_callables", &Factory::registered_callables,
              "Return a list of all registered creator names.")
         .def("use_module", &Factory::use_module, py::arg("module_name"),
-             "Import a Python module by name to trigger registration side effects.");
+             "Import a Python module by name to trigger registration side effects.")
+        .def("register_lazy", &Factory::register_lazy,
+             py::arg("name"),
+             py::arg("target"),
+             py::kw_only(),
+             py::arg("override") = false,
+             R"pbdoc(
+                 register_lazy(name, target, *, override=False)
+
+                 Register `name` to the callable at `target` ("package.module:attr"),
+                 imported on the first create() or lookup instead of now. If the
+                 import registers `name` itself (e.g. via @factory.register), that
+                 fills the entry rather than raising. A failed import raises and
+                 leaves the entry lazy.
+             )pbdoc")
+        .def("use_entry_points", &Factory::use_entry_points,
+             py::arg("group"),
+             py::kw_only(),
+             py::arg("override") = false,
+             "Register every entry point in `group` lazily (name -> module:attr) and return the names.")
+        .def("manifest", &Factory::manifest,
+             "Return {name: \"module:attr\"} for lazy entries and importable creators.\n\n"
+             "Lambdas, nested functions and creators defined in __main__ are left out.")
+        .def("save_manifest", &Factory::save_manifest, py::arg("path"),
+             "Write manifest() to `path` as JSON.")
+        .def("load_manifest", &Factory::load_manifest,
+             py::arg("source"),
+             py::kw_only(),
+             py::arg("override") = false,
+             "Register lazy entries from a {name: target} mapping or a JSON file path; return the names.")
+        .def("is_pending", &Factory::is_pending, py::arg("name"),
+             "True while `name` is a lazy entry whose target has not been imported.");
+
+    py::class_<Lease>(m, "Lease",
+        "Context manager from Factory.acquire(): borrows a pooled product on enter\n"
+        "and returns it on exit (reset and kept, or dropped if the block raised).")
+        .def("__enter__", &Lease::enter)
+        .def("__exit__", [](Lease& lease, const py::object& exc_type, const py::args&) { lease.exit(exc_type); })
+        .def("__repr__", &Lease::repr);
 }
 
 } // namespace pygim
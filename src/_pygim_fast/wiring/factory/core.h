@@ -1,11 +1,15 @@
 #pragma once
 
+#include <memory>
+#include <optional>
 #include <stdexcept>
 #include <string>
+#include <string_view>
 #include <utility>
 #include <vector>
 
 #include "../registry/core.h"
+#include "pool.h"
 
 namespace pygim::core {
 
@@ -35,6 +39,52 @@ struct NoValidation {
     }
 };
 
+/*
+ * ValidationMode selects how often a validator checks products:
+ * - Always: every product
+ * - First: the first product of each concrete type; validators that cannot
+ *   tell types apart treat it as Always
+ * - Never: validation is skipped
+ */
+enum class ValidationMode { Always, First, Never };
+
+[[nodiscard]] constexpr ValidationMode parse_validation_mode(std::string_view mode) {
+    if (mode == "first") {
+        return ValidationMode::First;
+    }
+    if (mode == "always") {
+        return ValidationMode::Always;
+    }
+    if (mode == "never") {
+        return ValidationMode::Never;
+    }
+    throw std::invalid_argument("validate must be 'first', 'always' or 'never'");
+}
+
+[[nodiscard]] constexpr std::string_view validation_mode_to_string(ValidationMode mode) noexcept {
+    switch (mode) {
+        case ValidationMode::Always: return "always";
+        case ValidationMode::First:  return "first";
+        case ValidationMode::Never:  return "never";
+    }
+    return "?";
+}
+
+static_assert(parse_validation_mode("first") == ValidationMode::First);
+static_assert(parse_validation_mode("never") == ValidationMode::Never);
+static_assert(validation_mode_to_string(ValidationMode::Always) == "always");
+
+/*
+ * NoLoader is the default lazy-target loader policy: factories built with
+ * it cannot hold lazy entries.
+ */
+template<class Creator>
+struct NoLoader {
+    [[noreturn]] Creator operator()(const std::string& target) const {
+        throw std::runtime_error("No loader configured for lazy creator target: " + target);
+    }
+};
+
 /*
  * FactoryCore is a pybind-free creator registry + construction engine.
  *
@@ -42,6 +92,11 @@ struct NoValidation {
  * - Product: created object type
  * - Creator: callable type stored in registry
  * - Validator: policy invoked on produced Product
+ * - Loader: policy turning a lazy entry's target string into its Creator,
+ *   invoked on first use (then the creator is kept)
+ *
+ * Entries registered with PoolOptions also own an ObjectPool: acquire()
+ * reuses their idle products and only creates (and validates) on a miss.
  *
  * Usage example:
  *   using Core = FactoryCore<std::string, Product, CreatorFn>;
@@ -49,9 +104,26 @@ struct NoValidation {
  *   core.register_creator("item", creator, false);
  *   auto value = core.create("item", [&](CreatorFn& c){ return c(); });
  */
-template<class Key, class Product, class Creator, class Validator = NoValidation<Product>>
+template<class Key, class Product, class Creator, class Validator = NoValidation<Product>,
+         class Loader = NoLoader<Creator>>
 class FactoryCore {
 public:
+    using PoolType = ObjectPool<Product>;
+
+    // A registered name: a creator, a lazy target, or both once loaded.
+    struct Slot {
+        std::optional<Creator> creator;
+        std::string target;               //!< non-empty for lazily registered entries
+        std::shared_ptr<PoolType> pool;   //!< set for pooled entries
+    };
+
+    // A product on loan from a pool; hand it back with `pool->release()`.
+    // Holding the pool keeps returns working across re-registration.
+    struct Pooled {
+        Product product;
+        std::shared_ptr<PoolType> pool;
+    };
+
     struct CreatorHash {
         std::size_t operator()(const Key& key) const noexcept {
             return std::hash<Key>{}(key);
@@ -64,40 +136,122 @@ public:
         }
     };
 
-    using RegistryType = RegistryCore<Key, Creator, CreatorHash, CreatorEq, NoHooks<Key, Creator, Product>, Product>;
+    using RegistryType = RegistryCore<Key, Slot, CreatorHash, CreatorEq, NoHooks<Key, Slot, Product>, Product>;
 
     /**
-     * \brief Create a factory core with a validation policy.
+     * \brief Create a factory core with validation and loader policies.
      * \param[in] validator Validation policy object stored by value.
+     * \param[in] loader Lazy-target loader policy object stored by value.
      * \note Exists to keep construction/validation rules in core, independent from adapter layer.
      */
-    explicit FactoryCore(Validator validator = Validator{})
-        : m_validator(std::move(validator)) {}
+    explicit FactoryCore(Validator validator = Validator{}, Loader loader = Loader{})
+        : m_validator(std::move(validator)), m_loader(std::move(loader)) {}
 
     /**
      * \brief Register or override a creator function in the internal registry.
      * \param[in] name Lookup key for the creator.
      * \param[in] creator Callable object used to create a product.
      * \param[in] override_existing When `false`, duplicate keys throw; when `true`, missing keys throw.
+     * \param[in] pool Pooling options; a non-zero capacity makes the entry usable with acquire().
      * \throws std::runtime_error On invalid override state.
      * \note Exists to centralize creator lifecycle and preserve strict override semantics.
+     *       Overriding a pooled entry closes its pool, so old products are not reused.
+     */
+    void register_creator(const Key& name, Creator creator, bool override_existing = false,
+                          PoolOptions<Product> pool = {}) {
+        auto new_pool = pool.capacity > 0 ? std::make_shared<PoolType>(std::move(pool)) : nullptr;
+        auto* slot = m_registry.try_get(name);
+        // Loading a lazy target usually imports the module that registers the
+        // real creator under the same name: that fulfils the entry.
+        if (!override_existing && slot && !slot->creator && !slot->target.empty()) {
+            slot->creator = std::move(creator);
+            slot->pool = std::move(new_pool);
+            return;
+        }
+        auto replaced = override_existing && slot ? slot->pool : nullptr;
+        m_registry.register_or_override(name, Slot{std::move(creator), {}, std::move(new_pool)}, override_existing);
+        if (replaced) {
+            replaced->close();  // instances of the old creator are not reused
+        }
+    }
+
+    /**
+     * \brief Register a lazy entry, loaded through the Loader policy on first use.
+     * \param[in] name Lookup key for the creator.
+     * \param[in] target Loader-specific target (e.g. `"package.module:attr"`).
+     * \param[in] override_existing Same strict semantics as register_creator().
+     * \throws std::runtime_error On invalid override state.
+     * \note Exists so creators can be advertised without loading their code.
+     *       Overriding a pooled entry closes its pool, as register_creator() does.
      */
-    void register_creator(const Key& name, Creator creator, bool override_existing = false) {
-        m_registry.register_or_override(name, std::move(creator), override_existing);
+    void register_target(const Key& name, std::string target, bool override_existing = false) {
+        const auto* slot = m_registry.try_get_const(name);
+        auto replaced = override_existing && slot ? slot->pool : nullptr;
+        m_registry.register_or_override(name, Slot{std::nullopt, std::move(target), nullptr}, override_existing);
+        if (replaced) {
+            replaced->close();  // instances of the old creator are not reused
+        }
     }
 
     /**
-     * \brief Retrieve a previously registered creator by key.
+     * \brief Retrieve a registered creator by key, loading a lazy entry first.
      * \param[in] name Creator key.
      * \return Stored creator callable.
      * \throws std::runtime_error If key is unknown.
      * \note Exists so call sites can separate "lookup" from "invoke" where needed.
+     *       A failed load leaves the entry lazy, so a later call retries.
+     */
+    [[nodiscard]] Creator get_creator(const Key& name) {
+        auto* slot = m_registry.try_get(name);
+        if (!slot) {
+            throw std::runtime_error("Unknown creator: " + name);
+        }
+        if (slot->creator) {
+            return *slot->creator;
+        }
+        // Loading may re-enter the factory (an imported module registering
+        // its creators), so look the entry up again afterwards.
+        const std::string target = slot->target;
+        Creator loaded = m_loader(target);
+        if (auto* loaded_slot = m_registry.try_get(name); loaded_slot && loaded_slot->target == target) {
+            loaded_slot->creator = loaded;
+        }
+        return loaded;
+    }
+
+    /**
+     * \brief Return lazy targets by key.
+     * \return `(key, target)` for every entry registered lazily (loaded or not).
+     * \note Exists to export a manifest that repopulates a factory without loading code.
      */
-    [[nodiscard]] Creator get_creator(const Key& name) const {
-        if (auto* creator = m_registry.try_get_const(name)) {
-            return *creator;
+    [[nodiscard]] std::vector<std::pair<Key, std::string>> targets() const {
+        std::vector<std::pair<Key, std::string>> result;
+        for (const auto& name : m_registry.keys()) {
+            if (const auto* slot = m_registry.try_get_const(name); !slot->target.empty()) {
+                result.emplace_back(name, slot->target);
+            }
         }
-        throw std::runtime_error("Unknown creator: " + name);
+        return result;
+    }
+
+    /**
+     * \brief Whether a key is registered lazily and not loaded yet.
+     * \param[in] name Creator key.
+     * \return `true` for a pending lazy entry, `false` otherwise (also when unknown).
+     */
+    [[nodiscard]] bool pending(const Key& name) const {
+        const auto* slot = m_registry.try_get_const(name);
+        return slot && !slot->creator;
+    }
+
+    /**
+     * \brief Retrieve an already-available creator without loading.
+     * \param[in] name Creator key.
+     * \return Pointer to the creator, or `nullptr` when unknown or still lazy.
+     */
+    [[nodiscard]] const Creator* find_creator(const Key& name) const {
+        const auto* slot = m_registry.try_get_const(name);
+        return slot && slot->creator ? &*slot->creator : nullptr;
     }
 
     /**
@@ -110,13 +264,78 @@ public:
      * \note Exists to keep invocation policy decoupled from storage and validation policy.
      */
     template<class InvokeFn>
-    [[nodiscard]] Product create(const Key& name, InvokeFn&& invoke) const {
+    [[nodiscard]] Product create(const Key& name, InvokeFn&& invoke) {
         Creator creator = get_creator(name);
-        Product product = std::forward<InvokeFn>(invoke)(creator);
-        if (!m_validator(product)) {
-            throw std::runtime_error("Created object does not implement required interface/protocol");
+        return build(creator, std::forward<InvokeFn>(invoke));
+    }
+
+    /**
+     * \brief Borrow a product from a pooled entry, creating it on a pool miss.
+     * \tparam InvokeFn Invoker type: callable that accepts `Creator&` and returns `Product`.
+     * \param[in] name Creator key of an entry registered with PoolOptions.
+     * \param[in] invoke Invocation strategy, used only on a miss.
+     * \return The product plus the pool it must be released to.
+     * \throws std::runtime_error If key is unknown, not pooled, or a new product fails validation.
+     * \note Reused products were validated when created and are not validated again.
+     */
+    template<class InvokeFn>
+    [[nodiscard]] Pooled acquire(const Key& name, InvokeFn&& invoke) {
+        Creator creator = get_creator(name);
+        auto pool = m_registry.try_get(name)->pool;
+        if (!pool) {
+            throw std::runtime_error("Creator is not pooled (register it with a pool size): " + name);
         }
-        return product;
+        Product product = pool->acquire([&] { return build(creator, invoke); });
+        return Pooled{std::move(product), std::move(pool)};
+    }
+
+    /**
+     * \brief Pool counters of a pooled entry.
+     * \param[in] name Creator key.
+     * \return Stats, or `std::nullopt` when unknown or not pooled.
+     */
+    [[nodiscard]] std::optional<PoolStats> pool_stats(const Key& name) const {
+        const auto* slot = m_registry.try_get_const(name);
+        if (!slot || !slot->pool) {
+            return std::nullopt;
+        }
+        return slot->pool->stats();
+    }
+
+    /**
+     * \brief Evict timed-out idle products from every pool.
+     * \return Number of products evicted.
+     * \note Exists for periodic cleanup; pools otherwise only evict when used.
+     */
+    std::size_t evict_idle() {
+        std::size_t evicted = 0;
+        for (const auto& name : m_registry.keys()) {
+            if (const auto* slot = m_registry.try_get_const(name); slot->pool) {
+                evicted += slot->pool->evict_idle();
+            }
+        }
+        return evicted;
+    }
+
+    /**
+     * \brief Build `count` products with one creator lookup, validating each.
+     * \tparam InvokeFn Invoker type: callable that accepts `(Creator&, std::size_t index)` and returns `Product`.
+     * \param[in] name Creator key.
+     * \param[in] count Number of products to build.
+     * \param[in] invoke Invocation strategy, called once per index in order.
+     * \return Created and validated products, in index order.
+     * \throws std::runtime_error If key is unknown or any product fails validation.
+     * \note Exists for batch construction: lookup and result storage are amortised.
+     */
+    template<class InvokeFn>
+    [[nodiscard]] std::vector<Product> create_many(const Key& name, std::size_t count, InvokeFn&& invoke) {
+        Creator creator = get_creator(name);
+        std::vector<Product> products;
+        products.reserve(count);
+        for (std::size_t index = 0; index < count; ++index) {
+            products.push_back(build(creator, [&](Creator& c) { return invoke(c, index); }));
+        }
+        return products;
     }
 
     /**
@@ -128,9 +347,27 @@ public:
         return m_registry.keys();
     }
 
+    /**
+     * \brief Access the validation policy object.
+     * \return Mutable reference to the stored validator.
+     * \note Exists so adapters can reconfigure or inspect stateful validators.
+     */
+    [[nodiscard]] Validator& validator() noexcept { return m_validator; }
+    [[nodiscard]] const Validator& validator() const noexcept { return m_validator; }
+
 private:
+    template<class InvokeFn>
+    Product build(Creator& creator, InvokeFn&& invoke) {
+        Product product = std::forward<InvokeFn>(invoke)(creator);
+        if (!m_validator(product)) {
+            throw std::runtime_error("Created object does not implement required interface/protocol");
+        }
+        return product;
+    }
+
     RegistryType m_registry;
     Validator m_validator;
+    Loader m_loader;
 };
 
 } // namespace pygim::core
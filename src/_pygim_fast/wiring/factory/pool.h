@@ -0,0 +1,183 @@
+#pragma once
+
+#include <chrono>
+#include <cstddef>
+#include <deque>
+#include <functional>
+#include <mutex>
+#include <optional>
+#include <utility>
+#include <vector>
+
+namespace pygim::core {
+
+/*
+ * PoolOptions configures an ObjectPool.
+ *
+ * - capacity: most idle instances kept for reuse (0 disables pooling)
+ * - idle_timeout: idle instances older than this are evicted
+ * - reset: called on every returned instance before it is kept
+ */
+template<class Product>
+struct PoolOptions {
+    std::size_t capacity{0};
+    std::optional<std::chrono::duration<double>> idle_timeout;
+    std::function<void(Product&)> reset;
+};
+
+struct PoolStats {
+    std::size_t capacity{0};
+    std::size_t idle{0};
+    std::size_t in_use{0};
+    std::size_t hits{0};       //!< acquires served from the idle set
+    std::size_t misses{0};     //!< acquires that had to create
+    std::size_t evictions{0};  //!< idle instances dropped by idle_timeout
+    std::size_t discarded{0};  //!< returns dropped (pool full/closed, failed reset, unusable)
+};
+
+/*
+ * ObjectPool keeps up to `capacity` idle products for reuse.
+ *
+ * Thread-safe. The mutex only guards the bookkeeping: creating, resetting
+ * and destroying products always happens outside it, so those may call
+ * back into the owner (or, for Python products, run arbitrary code).
+ * Idle instances are reused newest first; the oldest are the ones that
+ * time out.
+ *
+ * Usage example:
+ *   ObjectPool<Buffer> pool({4, std::chrono::seconds(30), [](Buffer& b){ b.clear(); }});
+ *   Buffer buffer = pool.acquire([]{ return Buffer(1 << 20); });
+ *   pool.release(std::move(buffer));
+ */
+template<class Product>
+class ObjectPool {
+public:
+    using clock = std::chrono::steady_clock;
+
+    explicit ObjectPool(PoolOptions<Product> options)
+        : m_options(std::move(options)) {}
+
+    /**
+     * \brief Take an idle product, or build one with `make` when none is left.
+     * \param[in] make Callable returning a new Product; runs without the lock.
+     * \return A product owned by the caller until release().
+     */
+    template<class MakeFn>
+    [[nodiscard]] Product acquire(MakeFn&& make) {
+        std::vector<Product> expired;
+        {
+            std::lock_guard lock(m_mutex);
+            collect_expired(expired);
+            if (!m_idle.empty()) {
+                Product product = std::move(m_idle.back().product);
+                m_idle.pop_back();
+                ++m_stats.hits;
+                ++m_stats.in_use;
+                return product;
+            }
+            ++m_stats.misses;
+            ++m_stats.in_use;
+        }
+        try {
+            return std::forward<MakeFn>(make)();
+        } catch (...) {
+            std::lock_guard lock(m_mutex);
+            --m_stats.in_use;
+            throw;
+        }
+    }
+
+    /**
+     * \brief Hand a product back after use.
+     * \param[in] product Product obtained from acquire().
+     * \param[in] reusable `false` drops it (e.g. the caller's work failed).
+     * \throws Whatever `reset` throws; the product is dropped first.
+     */
+    void release(Product product, bool reusable = true) {
+        if (reusable && m_options.reset) {
+            try {
+                m_options.reset(product);
+            } catch (...) {
+                finish(std::nullopt);
+                throw;
+            }
+        }
+        finish(reusable ? std::optional<Product>(std::move(product)) : std::nullopt);
+    }
+
+    /**
+     * \brief Drop idle products that exceeded idle_timeout.
+     * \return Number of products evicted.
+     */
+    std::size_t evict_idle() {
+        std::vector<Product> expired;
+        std::lock_guard lock(m_mutex);
+        collect_expired(expired);
+        return expired.size();
+    }
+
+    /**
+     * \brief Drop every idle product; later returns are dropped too.
+     * \note Used when the owning registration is replaced.
+     */
+    void close() {
+        std::deque<Idle> idle;
+        std::lock_guard lock(m_mutex);
+        m_closed = true;
+        idle.swap(m_idle);
+    }
+
+    [[nodiscard]] PoolStats stats() const {
+        std::lock_guard lock(m_mutex);
+        PoolStats stats = m_stats;
+        stats.capacity = m_options.capacity;
+        stats.idle = m_idle.size();
+        return stats;
+    }
+
+private:
+    struct Idle {
+        Product product;
+        clock::time_point since;
+    };
+
+    // Return slot bookkeeping; a product that is not kept is destroyed
+    // after the lock is released (declared before the guard).
+    void finish(std::optional<Product> product) {
+        std::vector<Product> expired;
+        std::lock_guard lock(m_mutex);
+        --m_stats.in_use;
+        collect_expired(expired);
+        if (product && !m_closed && m_idle.size() < m_options.capacity) {
+            m_idle.push_back(Idle{std::move(*product), clock::now()});
+            product.reset();
+            return;
+        }
+        ++m_stats.discarded;
+        if (product) {
+            expired.push_back(std::move(*product));
+        }
+    }
+
+    // Caller holds the lock; the expired products are destroyed by the caller
+    // once it is released.
+    void collect_expired(std::vector<Product>& expired) {
+        if (!m_options.idle_timeout) {
+            return;
+        }
+        const auto deadline = clock::now() - std::chrono::duration_cast<clock::duration>(*m_options.idle_timeout);
+        while (!m_idle.empty() && m_idle.front().since <= deadline) {
+            expired.push_back(std::move(m_idle.front().product));
+            m_idle.pop_front();
+            ++m_stats.evictions;
+        }
+    }
+
+    PoolOptions<Product> m_options;
+    mutable std::mutex m_mutex;
+    std::deque<Idle> m_idle;
+    PoolStats m_stats;
+    bool m_closed{false};
+};
+
+} // namespace pygim::core
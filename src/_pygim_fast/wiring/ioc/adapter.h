@@ -1,10 +1,19 @@
 #pragma once
 
+#include <algorithm>
+#include <chrono>
+#include <cmath>
+#include <atomic>
+#include <map>
 #include <memory>
+#include <mutex>
+#include <numeric>
 #include <optional>
 #include <stdexcept>
 #include <string>
 #include <string_view>
+#include <thread>
+#include <unordered_map>
 #include <utility>
 #include <vector>
 
@@ -13,6 +22,7 @@
 
 #include "../common/adapter_validation.h"
 #include "core.h"
+#include "profiling.h"
 
 namespace pygim {
 
@@ -82,6 +92,136 @@ inline core::ParamKind classify_param_kind(std::string_view kind) {
     return core::ParamKind::PositionalOrKeyword;
 }
 
+// Waiting for another thread's singleton construction must not hold the
+// GIL (or, on free-threaded builds, an attached thread state): the builder
+// needs it to finish.
+struct ReleaseGilWhileBlocked {
+    template<class Fn>
+    static void block(Fn&& fn) {
+        if (PyGILState_Check()) {
+            py::gil_scoped_release release;
+            std::forward<Fn>(fn)();
+        } else {
+            std::forward<Fn>(fn)();
+        }
+    }
+};
+
+// Process-wide cache of introspected constructors, shared by every
+// Container (and by re-registrations), keyed by class. An entry is dropped
+// when its class is collected (weakref callback) and re-parsed when the
+// class's __init__ is no longer the object it was parsed from.
+//
+// No Python code runs under m_mutex: callbacks may fire from any
+// allocation, and dropping an entry can trigger them.
+class SignatureCache {
+public:
+    using Specs = std::shared_ptr<const std::vector<core::ParamSpec<py::object>>>;
+
+    struct Stats {
+        std::size_t hits;
+        std::size_t misses;
+        std::size_t size;
+    };
+
+    static SignatureCache& instance() {
+        // Leaked on purpose: entries hold Python objects, which must not be
+        // released after the interpreter is finalized.
+        static auto* cache = new SignatureCache();
+        return *cache;
+    }
+
+    template<class Parse>
+    [[nodiscard]] Specs get(const py::object& cls, Parse&& parse) {
+        py::object init = py::getattr(cls, "__init__");
+        py::object marker;
+        Specs specs;
+        {
+            std::lock_guard lock(m_mutex);
+            if (auto it = m_entries.find(cls.ptr()); it != m_entries.end()) {
+                marker = it->second.init;
+                specs = it->second.specs;
+            }
+        }
+        if (specs && marks(marker, init)) {
+            m_hits.fetch_add(1, std::memory_order_relaxed);
+            return specs;
+        }
+
+        specs = parse(cls);
+        m_misses.fetch_add(1, std::memory_order_relaxed);
+        Entry entry{watch(cls), mark(init), specs};
+        {
+            std::lock_guard lock(m_mutex);
+            std::swap(m_entries[cls.ptr()], entry);
+        }
+        return specs;  // `entry` (any replaced one) is released unlocked
+    }
+
+    [[nodiscard]] Stats stats() const {
+        std::lock_guard lock(m_mutex);
+        return {m_hits.load(), m_misses.load(), m_entries.size()};
+    }
+
+    void clear() {
+        std::unordered_map<PyObject*, Entry> dropped;
+        {
+            std::lock_guard lock(m_mutex);
+            dropped.swap(m_entries);
+            m_hits = 0;
+            m_misses = 0;
+        }
+    }
+
+private:
+    struct Entry {
+        py::object watcher;  //!< weakref to the class; its callback drops the entry
+        py::object init;     //!< weakref to the parsed __init__ (or the object itself)
+        Specs specs;
+    };
+
+    static py::object watch(const py::object& cls) {
+        PyObject* key = cls.ptr();
+        return py::weakref(cls, py::cpp_function([key](py::handle) {
+            instance().forget(key);
+        }));
+    }
+
+    // Slot wrappers (a class without its own __init__) are not weakref-able;
+    // they live as long as their builtin type, so a strong reference is fine.
+    static py::object mark(const py::object& init) {
+        PyObject* ref = PyWeakref_NewRef(init.ptr(), nullptr);
+        if (ref == nullptr) {
+            PyErr_Clear();
+            return init;
+        }
+        return py::reinterpret_steal<py::object>(ref);
+    }
+
+    static bool marks(const py::object& marker, const py::object& init) {
+        if (marker.is(init)) {
+            return true;
+        }
+        return PyWeakref_CheckRef(marker.ptr()) && marker().is(init);
+    }
+
+    void forget(PyObject* key) {
+        std::optional<Entry> dropped;
+        {
+            std::lock_guard lock(m_mutex);
+            if (auto it = m_entries.find(key); it != m_entries.end()) {
+                dropped.emplace(std::move(it->second));
+                m_entries.erase(it);
+            }
+        }
+    }
+
+    mutable std::mutex m_mutex;
+    std::unordered_map<PyObject*, Entry> m_entries;
+    std::atomic<std::size_t> m_hits{0};
+    std::atomic<std::size_t> m_misses{0};
+};
+
 } // namespace detail
 
 class Container {
@@ -92,11 +232,20 @@ public:
         DescriptorType,
         py::object,
         InterfaceKeyPolicy::Hash,
-        InterfaceKeyPolicy::Eq>;
+        InterfaceKeyPolicy::Eq,
+        detail::ReleaseGilWhileBlocked>;
     using ParamSpecs = std::vector<core::ParamSpec<py::object>>;
 
+    using ScopeSlots = core::ScopeSlots<py::object>;
+    using Profiler = core::ResolutionProfiler<InterfaceKeyPolicy::key_type>;
+
     explicit Container(std::size_t capacity = 0)
-        : m_core(capacity) {}
+        : m_core(capacity),
+          m_scope_var(py::reinterpret_steal<py::object>(PyContextVar_New("pygim.ioc.scope", nullptr))) {
+        if (!m_scope_var) {
+            throw py::error_already_set();
+        }
+    }
 
     void register_service(
         const py::object& interface,
@@ -143,7 +292,7 @@ public:
         return m_core.contains(make_key(key));
     }
 
-    [[nodiscard]] std::size_t size() const noexcept {
+    [[nodiscard]] std::size_t size() const {
         return m_core.size();
     }
 
@@ -157,8 +306,8 @@ public:
 
     [[nodiscard]] DescriptorType describe(const py::object& key) const {
         auto resolved_key = make_key(key);
-        if (const auto* descriptor = m_core.try_descriptor(resolved_key)) {
-            return *descriptor;
+        if (auto descriptor = m_core.find_descriptor(resolved_key)) {
+            return std::move(*descriptor);
         }
         throw std::runtime_error("No provider for key" + key_suffix(resolved_key));
     }
@@ -167,18 +316,458 @@ public:
         return "Container(size=" + std::to_string(size()) + ")";
     }
 
+    // Freeze registration and precompute a flat construction plan per key
+    // (see ContainerCore::compile). Autowired constructors are introspected
+    // and planned here, once; broken registrations fail now, not at resolve.
+    void compile() {
+        try {
+            m_core.compile([this](std::size_t index, const DescriptorType& descriptor) {
+                return plan_dependencies(index, descriptor);
+            });
+        } catch (const core::DependencyChainError<InterfaceKeyPolicy::key_type>& error) {
+            throw std::runtime_error(chain_message(error));
+        }
+    }
+
+    // Construct the unbuilt singletons reachable from `keys` (all of them
+    // for None) before traffic arrives: a thread pool builds each one as
+    // soon as the singletons it depends on are built, so independent ones
+    // overlap. Returns {key: seconds} for the singletons built here.
+    [[nodiscard]] py::dict warm_up(const py::object& keys, std::size_t workers) {
+        std::vector<InterfaceKeyPolicy::key_type> roots;
+        if (!keys.is_none()) {
+            for (py::handle key : keys) {
+                roots.push_back(make_key(py::reinterpret_borrow<py::object>(key)));
+                if (!m_core.contains(roots.back())) {
+                    throw std::runtime_error("No provider for key" + key_suffix(roots.back()));
+                }
+            }
+        }
+        CoreType::WarmUpPlan plan;
+        try {
+            plan = m_core.warm_up_plan(roots, [this](std::size_t, const DescriptorType& descriptor) {
+                std::vector<InterfaceKeyPolicy::key_type> dependencies;
+                if (descriptor.autowire) {
+                    for (const auto& injection : planned_injections(descriptor)) {
+                        dependencies.push_back(
+                            InterfaceKeyPolicy::make_from_python(injection.annotation, std::nullopt));
+                    }
+                }
+                return dependencies;
+            });
+        } catch (const core::CircularDependency<InterfaceKeyPolicy::key_type>& error) {
+            throw std::runtime_error(chain_message(error));
+        }
+
+        const std::size_t n = plan.keys.size();
+        std::vector<double> seconds(n, -1.0);
+        std::vector<py::object> errors(n);
+        core::WarmUpSchedule schedule(plan.needs);
+
+        // Workers wait in the schedule without the GIL and take it per build.
+        auto work = [&] {
+            while (auto node = schedule.next()) {
+                bool succeeded = false;
+                {
+                    py::gil_scoped_acquire gil;
+                    const auto started = std::chrono::steady_clock::now();
+                    try {
+                        (void)resolve_key(plan.keys[*node]);
+                        seconds[*node] = std::chrono::duration<double>(
+                            std::chrono::steady_clock::now() - started).count();
+                        succeeded = true;
+                    } catch (py::error_already_set& error) {
+                        errors[*node] = error.value();
+                    } catch (const std::exception& error) {
+                        errors[*node] = py::module_::import("builtins").attr("RuntimeError")(error.what());
+                    }
+                }
+                schedule.finish(*node, succeeded);
+            }
+        };
+        if (n > 0) {
+            if (workers == 0) {
+                workers = std::min<std::size_t>(32, std::max(1u, std::thread::hardware_concurrency()) + 4);
+            }
+            py::gil_scoped_release release;
+            std::vector<std::jthread> pool;
+            for (std::size_t t = 0; t < std::min(workers, n); ++t) {
+                pool.emplace_back(work);
+            }
+        }
+
+        py::dict timings;
+        py::list failed;
+        for (std::size_t node = 0; node < n; ++node) {
+            if (errors[node]) {
+                failed.append(errors[node]);
+            } else if (seconds[node] >= 0.0) {
+                timings[detail::to_py_tuple(plan.keys[node])] = seconds[node];
+            }
+        }
+        if (!failed.empty()) {
+            std::string message = std::to_string(failed.size()) + " of " + std::to_string(n)
+                + " singletons failed to warm up";
+            if (std::size_t skipped = schedule.skipped()) {
+                message += " (" + std::to_string(skipped) + " dependents skipped)";
+            }
+            py::object error = py::module_::import("_pygim._core._exceptions")
+                                   .attr("WarmUpError")(message, failed);
+            PyErr_SetObject(reinterpret_cast<PyObject*>(Py_TYPE(error.ptr())), error.ptr());
+            throw py::error_already_set();
+        }
+        return timings;
+    }
+
+    [[nodiscard]] bool compiled() const noexcept {
+        return m_core.compiled();
+    }
+
+    //! Awaitable resolve: coroutine providers are awaited, the injected
+    //! dependencies of a registration resolve concurrently, and each async
+    //! singleton (or scoped instance) is built once however many tasks await
+    //! it. The orchestration lives in _pygim/_core/_aioc.py; it calls back
+    //! into async_plan()/async_complete() for the core-owned parts.
+    [[nodiscard]] py::object aresolve(const py::object& self, const py::object& key) {
+        // `self` rides along so the container outlives the coroutine; the
+        // state's callbacks only hold `this`.
+        return async_helpers().attr("aresolve")(self, async_state(), key);
+    }
+
+    //! ContextVar holding this container's active Scope. Per container, so
+    //! scopes of different containers never see each other.
+    [[nodiscard]] const py::object& scope_var() const noexcept {
+        return m_scope_var;
+    }
+
+    // -- Profiling -------------------------------------------------------
+    // While on, every top-level resolve() records its tree of resolutions:
+    // per key the inclusive time, the phase split, and whether the provider
+    // ran or a cached instance came back. aresolve() is not recorded.
+
+    [[nodiscard]] bool profiling_enabled() const noexcept {
+        return profiling();
+    }
+
+    void set_profiling(bool enabled) noexcept {
+        m_profiling.store(enabled, std::memory_order_relaxed);
+    }
+
+    void clear_profile() {
+        m_profiler.clear();
+    }
+
+    //! One nested dict per recorded top-level resolve, oldest first.
+    [[nodiscard]] py::list profile_report() const {
+        py::list report;
+        for (const auto& trace : m_profiler.traces()) {
+            report.append(trace_to_dict(trace));
+        }
+        return report;
+    }
+
+    [[nodiscard]] py::dict profile_stats() const {
+        std::size_t resolves = 0, constructed = 0, cached = 0, introspected = 0;
+        double seconds = 0.0;
+        for (const auto& trace : m_profiler.traces()) {
+            seconds += trace.front().seconds;
+            for (const auto& node : trace) {
+                ++resolves;
+                (node.constructed ? constructed : cached) += 1;
+                introspected += node.introspected ? 1 : 0;
+            }
+        }
+        py::dict stats;
+        stats["resolves"] = resolves;
+        stats["constructed"] = constructed;
+        stats["cached"] = cached;
+        stats["introspected"] = introspected;
+        stats["seconds"] = seconds;
+        return stats;
+    }
+
+    //! Folded stacks ("Root;Dep;Leaf <self µs>" per line), the input format
+    //! of flamegraph.pl, speedscope and inferno. Identical stacks merge.
+    [[nodiscard]] std::string flame_graph() const {
+        std::map<std::string, double> folded;
+        for (const auto& trace : m_profiler.traces()) {
+            std::vector<std::string> stacks;
+            std::vector<double> self;
+            stacks.reserve(trace.size());
+            self.reserve(trace.size());
+            for (const auto& node : trace) {
+                const bool root = node.parent == Profiler::npos;
+                stacks.push_back(root ? frame_label(node.key)
+                                      : stacks[node.parent] + ";" + frame_label(node.key));
+                self.push_back(node.seconds);
+                if (!root) {
+                    self[node.parent] -= node.seconds;
+                }
+            }
+            for (std::size_t i = 0; i < trace.size(); ++i) {
+                folded[stacks[i]] += std::max(0.0, self[i]);
+            }
+        }
+        std::string out;
+        for (const auto& [stack, seconds] : folded) {
+            const auto micros = static_cast<long long>(std::llround(seconds * 1e6));
+            if (micros > 0) {
+                out += stack + " " + std::to_string(micros) + "\n";
+            }
+        }
+        return out;
+    }
+
+    //! The registrations as a graph: a node per key (lifecycle, provider,
+    //! autowire, decorator count) and an edge per autowired parameter.
+    //! `format` is "json" (a JSON document) or "dot" (Graphviz).
+    [[nodiscard]] std::string dependency_graph(const std::string& format) const {
+        if (format != "json" && format != "dot") {
+            throw std::invalid_argument("format must be 'json' or 'dot', got '" + format + "'");
+        }
+        auto keys = m_core.keys();
+        std::vector<std::string> labels;
+        for (const auto& key : keys) {
+            labels.push_back(key_label(key));
+        }
+        std::vector<std::size_t> order(keys.size());
+        std::iota(order.begin(), order.end(), std::size_t{0});
+        std::sort(order.begin(), order.end(), [&](std::size_t a, std::size_t b) {
+            return labels[a] < labels[b];
+        });
+
+        std::unordered_map<InterfaceKeyPolicy::key_type, std::size_t,
+                           InterfaceKeyPolicy::Hash, InterfaceKeyPolicy::Eq> ids;
+        py::list nodes, edges;
+        for (std::size_t i : order) {
+            auto descriptor = m_core.find_descriptor(keys[i]);
+            py::dict entry;
+            entry["id"] = ids.size();
+            entry["key"] = labels[i];
+            entry["lifecycle"] = std::string(core::lifecycle_to_string(descriptor->lifecycle));
+            entry["provider"] = provider_label(descriptor->provider);
+            entry["autowire"] = descriptor->autowire;
+            entry["decorators"] = descriptor->decorators.size();
+            ids.emplace(keys[i], ids.size());
+            nodes.append(std::move(entry));
+        }
+        for (std::size_t i : order) {
+            auto descriptor = m_core.find_descriptor(keys[i]);
+            if (!descriptor->autowire) {
+                continue;
+            }
+            // Planning fails for a missing dependency: the node carries the
+            // error (drawn red in DOT) instead of failing the export.
+            std::vector<core::PlannedInjection<py::object>> injections;
+            try {
+                injections = autowire_injections(*descriptor);
+            } catch (const std::exception& error) {
+                nodes[ids.at(keys[i])]["error"] = std::string(error.what());
+                continue;
+            }
+            for (const auto& injection : injections) {
+                py::dict edge;
+                edge["source"] = ids.at(keys[i]);
+                edge["target"] = ids.at(
+                    InterfaceKeyPolicy::make_from_python(injection.annotation, std::nullopt));
+                edge["parameter"] = injection.name;
+                edges.append(std::move(edge));
+            }
+        }
+
+        if (format == "json") {
+            py::dict graph;
+            graph["nodes"] = nodes;
+            graph["edges"] = edges;
+            return py::module_::import("json").attr("dumps")(graph, py::arg("indent") = 2).cast<std::string>();
+        }
+        // Labels keep DOT's "\n" line breaks; only quotes need escaping.
+        auto quoted = [](const std::string& text) {
+            std::string out = "\"";
+            for (char c : text) {
+                if (c == '"') {
+                    out += '\\';
+                }
+                out += c;
+            }
+            return out + "\"";
+        };
+        std::string dot = "digraph pygim_ioc {\n    node [shape=box];\n";
+        for (py::handle node : nodes) {
+            auto entry = py::reinterpret_borrow<py::dict>(node);
+            const std::string label =
+                entry["key"].cast<std::string>() + "\\n" + entry["lifecycle"].cast<std::string>();
+            dot += "    n" + py::str(entry["id"]).cast<std::string>() + " [label=" + quoted(label)
+                + (entry.contains("error") ? ", color=red" : "") + "];\n";
+        }
+        for (py::handle edge : edges) {
+            auto entry = py::reinterpret_borrow<py::dict>(edge);
+            dot += "    n" + py::str(entry["source"]).cast<std::string>() + " -> n"
+                + py::str(entry["target"]).cast<std::string>()
+                + " [label=" + quoted(entry["parameter"].cast<std::string>()) + "];\n";
+        }
+        return dot + "}\n";
+    }
+
 private:
+    // Append `key` to core errors; Python exceptions pass through untouched.
+    template<class Fn>
+    static auto with_key_context(const InterfaceKeyPolicy::key_type& key, Fn&& fn) {
+        try {
+            return std::forward<Fn>(fn)();
+        } catch (const py::error_already_set&) {
+            throw;
+        } catch (const py::builtin_exception&) {
+            throw;
+        } catch (const std::runtime_error& error) {
+            throw std::runtime_error(std::string(error.what()) + key_suffix(key));
+        }
+    }
+
+    [[nodiscard]] bool profiling() const noexcept {
+        return m_profiling.load(std::memory_order_relaxed);
+    }
+
+    void profile_phase(core::ResolvePhase phase) const {
+        if (profiling()) {
+            m_profiler.phase(phase);
+        }
+    }
+
+    // Folded-stack frame name: ';' separates frames in that format.
+    [[nodiscard]] static std::string frame_label(const InterfaceKeyPolicy::key_type& key) {
+        std::string label = key_label(key);
+        std::replace(label.begin(), label.end(), ';', ':');
+        return label;
+    }
+
+    [[nodiscard]] static py::dict trace_to_dict(const core::ResolutionTrace<InterfaceKeyPolicy::key_type>& trace) {
+        std::vector<py::dict> nodes;
+        nodes.reserve(trace.size());
+        for (const auto& node : trace) {
+            py::dict phases;
+            for (std::size_t phase = 0; phase < core::kResolvePhases; ++phase) {
+                phases[py::str(std::string(core::phase_name(static_cast<core::ResolvePhase>(phase))))] =
+                    node.phases[phase];
+            }
+            py::dict entry;
+            entry["key"] = detail::to_py_tuple(node.key);
+            entry["seconds"] = node.seconds;
+            entry["phases"] = std::move(phases);
+            entry["constructed"] = node.constructed;
+            entry["introspected"] = node.introspected;
+            entry["children"] = py::list();
+            if (node.parent != Profiler::npos) {
+                nodes[node.parent]["children"].cast<py::list>().append(entry);
+            }
+            nodes.push_back(std::move(entry));
+        }
+        return nodes.front();
+    }
+
+    // Defined after Scope. Only reached for `scoped` registrations.
+    [[nodiscard]] std::shared_ptr<ScopeSlots> current_scope() const;
+
+    [[nodiscard]] py::object current_scope_object() const {
+        PyObject* value = nullptr;
+        if (PyContextVar_Get(m_scope_var.ptr(), nullptr, &value) < 0) {
+            throw py::error_already_set();
+        }
+        return value ? py::reinterpret_steal<py::object>(value) : py::none();
+    }
+
+    static py::module_ async_helpers() {
+        return py::module_::import("_pygim._core._aioc");
+    }
+
+    // The container's _aioc.AsyncState, created by the first aresolve().
+    // Racing first calls (the module runs without the GIL) each build one
+    // outside the lock, since that runs Python code; the first published wins.
+    [[nodiscard]] py::object async_state() {
+        {
+            std::lock_guard lock(m_async_mutex);
+            if (m_async_state) {
+                return m_async_state;
+            }
+        }
+        py::object fresh = async_helpers().attr("AsyncState")(
+            py::cpp_function([this](const py::object& k) { return async_plan(k); }),
+            py::cpp_function([this](const py::object& k, py::object instance) {
+                return async_complete(k, std::move(instance));
+            }));
+        std::lock_guard lock(m_async_mutex);
+        if (!m_async_state) {
+            m_async_state = std::move(fresh);
+        }
+        return m_async_state;
+    }
+
+    // (True, instance) when `key` needs no construction, otherwise
+    // (False, key, provider, [(param, dependency)], lifecycle, scope|None).
+    [[nodiscard]] py::tuple async_plan(const py::object& key_obj) {
+        auto key = make_key(key_obj);
+        return with_key_context(key, [&]() -> py::tuple {
+            if (auto instance = m_core.find_instance(key, [this] { return current_scope(); })) {
+                return py::make_tuple(true, std::move(*instance));
+            }
+            auto descriptor = m_core.find_descriptor(key);
+            if (!descriptor) {
+                throw std::runtime_error("No provider for key");
+            }
+            py::list injections;
+            if (descriptor->autowire) {
+                for (const auto& injection : autowire_injections(*descriptor)) {
+                    injections.append(py::make_tuple(py::str(injection.name), injection.annotation));
+                }
+            }
+            const bool scoped = descriptor->lifecycle == core::Lifecycle::Scoped;
+            return py::make_tuple(
+                false,
+                detail::to_py_tuple(key),
+                descriptor->provider,
+                std::move(injections),
+                std::string(core::lifecycle_to_string(descriptor->lifecycle)),
+                scoped ? current_scope_object() : py::none());
+        });
+    }
+
+    [[nodiscard]] py::object async_complete(const py::object& key_obj, py::object instance) {
+        auto key = make_key(key_obj);
+        return with_key_context(key, [&] {
+            return m_core.complete(
+                key,
+                std::move(instance),
+                [](const py::object& decorator, py::object value) {
+                    return decorator(std::move(value));
+                },
+                [](const py::object& value, const py::object& interface) {
+                    wiring::detail::ensure_instance_matches_interface(value, interface);
+                },
+                [this] { return current_scope(); });
+        });
+    }
+
     [[nodiscard]] py::object resolve_key(const InterfaceKeyPolicy::key_type& key) {
+        std::optional<Profiler::Frame> frame;
+        if (profiling()) {
+            frame.emplace(m_profiler.enter(key));
+        }
+        if (m_core.compiled()) {
+            return resolve_compiled(key);
+        }
         try {
             return m_core.resolve(
                 key,
                 [this](const DescriptorType& descriptor) { return invoke_provider(descriptor); },
-                [](const py::object& decorator, py::object instance) {
+                [this](const py::object& decorator, py::object instance) {
+                    profile_phase(core::ResolvePhase::Decorators);
                     return decorator(std::move(instance));
                 },
-                [](const py::object& instance, const py::object& interface) {
+                [this](const py::object& instance, const py::object& interface) {
+                    profile_phase(core::ResolvePhase::Validation);
                     wiring::detail::ensure_instance_matches_interface(instance, interface);
-                });
+                },
+                [this] { return current_scope(); });
         } catch (const py::error_already_set&) {
             throw;  // live Python exceptions pass through untouched
         } catch (const py::builtin_exception&) {
@@ -190,29 +779,107 @@ private:
         }
     }
 
-    [[nodiscard]] py::object invoke_provider(const DescriptorType& descriptor) {
+    [[nodiscard]] py::object resolve_compiled(const InterfaceKeyPolicy::key_type& key) {
+        // Profiling: a plan runs flat, so each constructed step becomes a
+        // child of the resolve's node (the key's own step uses that node).
+        std::optional<Profiler::Frame> step;
+        return with_key_context(key, [&] {
+            return m_core.resolve_compiled(
+                key,
+                [this, &key, &step](std::size_t index, const DescriptorType& descriptor,
+                                    const std::vector<py::object>& args) {
+                    if (profiling()) {
+                        step.reset();
+                        auto step_key = InterfaceKeyPolicy::make_from_python(descriptor.interface, descriptor.name);
+                        if (!InterfaceKeyPolicy::Eq{}(step_key, key)) {
+                            step.emplace(m_profiler.enter(step_key));
+                        }
+                        m_profiler.mark_constructed();
+                        m_profiler.phase(core::ResolvePhase::Provider);
+                    }
+                    return invoke_step(index, descriptor, args);
+                },
+                [this](const py::object& decorator, py::object instance) {
+                    profile_phase(core::ResolvePhase::Decorators);
+                    return decorator(std::move(instance));
+                },
+                [this](const py::object& instance, const py::object& interface) {
+                    profile_phase(core::ResolvePhase::Validation);
+                    wiring::detail::ensure_instance_matches_interface(instance, interface);
+                },
+                [this] { return current_scope(); });
+        });
+    }
+
+    // Compile-time half of autowiring: the keys to inject, in order, and
+    // the matching keyword names kept as a vectorcall kwnames tuple.
+    [[nodiscard]] std::vector<InterfaceKeyPolicy::key_type> plan_dependencies(
+            std::size_t index, const DescriptorType& descriptor) {
+        std::vector<InterfaceKeyPolicy::key_type> keys;
         if (!descriptor.autowire) {
+            return keys;
+        }
+        auto injections = planned_injections(descriptor);
+
+        py::tuple names(injections.size());
+        for (std::size_t i = 0; i < injections.size(); ++i) {
+            names[i] = py::str(injections[i].name);
+            keys.push_back(InterfaceKeyPolicy::make_from_python(injections[i].annotation, std::nullopt));
+        }
+        if (m_arg_names.size() <= index) {
+            m_arg_names.resize(index + 1);
+        }
+        m_arg_names[index] = std::move(names);
+        return keys;
+    }
+
+    // Injections for an autowired registration, errors naming its key.
+    [[nodiscard]] std::vector<core::PlannedInjection<py::object>> planned_injections(
+            const DescriptorType& descriptor) const {
+        try {
+            return autowire_injections(descriptor);
+        } catch (const std::runtime_error& error) {
+            throw std::runtime_error(std::string(error.what()) + key_suffix(
+                InterfaceKeyPolicy::make_from_python(descriptor.interface, descriptor.name)));
+        }
+    }
+
+    // Run one compiled step: injected arguments go by keyword, straight
+    // from the plan's slots, without building a kwargs dict.
+    [[nodiscard]] py::object invoke_step(std::size_t index, const DescriptorType& descriptor,
+                                         const std::vector<py::object>& args) const {
+        if (args.empty()) {
             return descriptor.provider();
         }
-        return invoke_autowired(descriptor);
+        std::vector<PyObject*> argv(args.size() + 1);  // slot 0: vectorcall offset
+        for (std::size_t i = 0; i < args.size(); ++i) {
+            argv[i + 1] = args[i].ptr();
+        }
+        PyObject* result = PyObject_Vectorcall(
+            descriptor.provider.ptr(), argv.data() + 1, PY_VECTORCALL_ARGUMENTS_OFFSET,
+            m_arg_names[index].ptr());
+        if (result == nullptr) {
+            throw py::error_already_set();
+        }
+        return py::reinterpret_steal<py::object>(result);
     }
 
-    [[nodiscard]] py::object invoke_autowired(const DescriptorType& descriptor) {
-        std::shared_ptr<const ParamSpecs> specs;
-        if (descriptor.autowire_slot) {
-            specs = descriptor.autowire_slot->params;
+    [[nodiscard]] py::object invoke_provider(const DescriptorType& descriptor) {
+        if (profiling()) {
+            m_profiler.mark_constructed();
         }
-        if (!specs) {
-            specs = introspect_constructor(descriptor.provider);
-            if (descriptor.autowire_slot) {
-                descriptor.autowire_slot->params = specs;
-            }
+        if (!descriptor.autowire) {
+            profile_phase(core::ResolvePhase::Provider);
+            return descriptor.provider();
         }
+        return invoke_autowired(descriptor);
+    }
 
-        auto injections = core::plan_autowiring(*specs, [this](const py::object& annotation) {
-            return m_core.contains(InterfaceKeyPolicy::make_from_python(annotation, std::nullopt));
-        });
+    [[nodiscard]] py::object invoke_autowired(const DescriptorType& descriptor) {
+        profile_phase(core::ResolvePhase::Dependencies);
+        auto injections = autowire_injections(descriptor);
         if (injections.empty()) {
+            profile_phase(core::ResolvePhase::Provider);
             return descriptor.provider();
         }
 
@@ -221,9 +888,36 @@ private:
             kwargs[py::str(injection.name)] =
                 resolve_key(InterfaceKeyPolicy::make_from_python(injection.annotation, std::nullopt));
         }
+        profile_phase(core::ResolvePhase::Provider);
         return descriptor.provider(**kwargs);
     }
 
+    [[nodiscard]] std::vector<core::PlannedInjection<py::object>> autowire_injections(
+            const DescriptorType& descriptor) const {
+        return core::plan_autowiring(*autowire_specs(descriptor), [this](const py::object& annotation) {
+            return m_core.contains(InterfaceKeyPolicy::make_from_python(annotation, std::nullopt));
+        });
+    }
+
+    [[nodiscard]] std::shared_ptr<const ParamSpecs> autowire_specs(const DescriptorType& descriptor) const {
+        std::shared_ptr<const ParamSpecs> specs;
+        if (descriptor.autowire_slot) {
+            specs = descriptor.autowire_slot->load();
+        }
+        if (!specs) {
+            specs = detail::SignatureCache::instance().get(descriptor.provider, [this](const py::object& cls) {
+                if (profiling()) {
+                    m_profiler.mark_introspected();
+                }
+                return introspect_constructor(cls);
+            });
+            if (descriptor.autowire_slot) {
+                descriptor.autowire_slot->store(specs);
+            }
+        }
+        return specs;
+    }
+
     // Reduce a class provider's constructor to neutral ParamSpec records.
     // All Python reflection lives here; the wiring decisions live in
     // core::plan_autowiring.
@@ -297,7 +991,25 @@ private:
         return InterfaceKeyPolicy::make_from_python(interface, normalize_name(name));
     }
 
+    [[nodiscard]] static std::string chain_message(
+            const core::DependencyChainError<InterfaceKeyPolicy::key_type>& error) {
+        std::string chain;
+        for (const auto& key : error.chain()) {
+            chain += (chain.empty() ? "" : " -> ") + key_label(key);
+        }
+        return std::string(error.what()) + ": " + chain;
+    }
+
     [[nodiscard]] static std::string key_suffix(const InterfaceKeyPolicy::key_type& key) {
+        return " [key: " + key_label(key) + "]";
+    }
+
+    [[nodiscard]] static std::string provider_label(const py::object& provider) {
+        py::object name = py::getattr(provider, "__qualname__", py::none());
+        return name.is_none() ? py::repr(provider).cast<std::string>() : py::str(name).cast<std::string>();
+    }
+
+    [[nodiscard]] static std::string key_label(const InterfaceKeyPolicy::key_type& key) {
         std::string label;
         try {
             py::handle interface(key.ptr);
@@ -312,10 +1024,133 @@ private:
         if (key.name) {
             label += ", name='" + *key.name + "'";
         }
-        return " [key: " + label + "]";
+        return label;
     }
 
     CoreType m_core;
+    std::vector<py::object> m_arg_names;  //!< kwnames tuple per registry index (compiled)
+    py::object m_scope_var;
+    std::mutex m_async_mutex;  //!< guards m_async_state
+    py::object m_async_state;  //!< _aioc.AsyncState, created by the first aresolve()
+    std::atomic<bool> m_profiling{false};
+    mutable Profiler m_profiler;  //!< also fed from const introspection paths
+};
+
+// One unit of work (request, task, ...) for `scoped` registrations: each
+// scoped key is built at most once per scope, and closing the scope hands
+// the instances back newest first for close()/aclose(). Entering binds the
+// scope to the container's ContextVar, so asyncio tasks spawned inside
+// inherit it while concurrent tasks keep their own.
+class Scope {
+public:
+    Scope(py::object container, py::object scope_var)
+        : m_container(std::move(container)),
+          m_var(std::move(scope_var)),
+          m_slots(std::make_shared<Container::ScopeSlots>()) {}
+
+    py::object enter(const py::object& self) {
+        if (m_token) {
+            throw std::runtime_error("Scope is already active");
+        }
+        if (m_slots->closed()) {
+            throw std::runtime_error("Scope is closed");
+        }
+        m_token = activate(self);
+        return self;
+    }
+
+    void exit() {
+        deactivate();
+        close();
+    }
+
+    py::object aenter(const py::object& self) {
+        return helpers().attr("resolved")(enter(self));
+    }
+
+    py::object aexit() {
+        deactivate();
+        return helpers().attr("adispose")(release());
+    }
+
+    //! Resolve `key` with this scope active, without entering it.
+    [[nodiscard]] py::object resolve(const py::object& self, const py::object& key) {
+        struct Reset {
+            const py::object& var;
+            py::object token;
+            ~Reset() {
+                if (PyContextVar_Reset(var.ptr(), token.ptr()) < 0) {
+                    PyErr_WriteUnraisable(var.ptr());
+                }
+            }
+        } reset{m_var, activate(self)};
+        return m_container.cast<Container&>().resolve(key);
+    }
+
+    //! Dispose the instances created so far (newest first) and close.
+    void close() {
+        helpers().attr("dispose")(release());
+    }
+
+    [[nodiscard]] std::size_t size() const {
+        return m_slots->size();
+    }
+
+    [[nodiscard]] bool closed() const {
+        return m_slots->closed();
+    }
+
+    [[nodiscard]] std::string repr() const {
+        return "Scope(size=" + std::to_string(size()) + (closed() ? ", closed" : "") + ")";
+    }
+
+    [[nodiscard]] const std::shared_ptr<Container::ScopeSlots>& slots() const noexcept {
+        return m_slots;
+    }
+
+private:
+    static py::module_ helpers() {
+        return py::module_::import("_pygim._core._scope");
+    }
+
+    [[nodiscard]] py::object activate(const py::object& self) const {
+        PyObject* token = PyContextVar_Set(m_var.ptr(), self.ptr());
+        if (token == nullptr) {
+            throw py::error_already_set();
+        }
+        return py::reinterpret_steal<py::object>(token);
+    }
+
+    void deactivate() {
+        if (!m_token) {
+            return;
+        }
+        py::object token = std::move(m_token);
+        if (PyContextVar_Reset(m_var.ptr(), token.ptr()) < 0) {
+            throw py::error_already_set();
+        }
+    }
+
+    [[nodiscard]] py::list release() {
+        py::list instances;
+        for (auto& instance : m_slots->release()) {
+            instances.append(std::move(instance));
+        }
+        return instances;
+    }
+
+    py::object m_container;
+    py::object m_var;
+    std::shared_ptr<Container::ScopeSlots> m_slots;
+    py::object m_token;  //!< set while entered via with / async with
 };
 
+inline std::shared_ptr<Container::ScopeSlots> Container::current_scope() const {
+    py::object scope = current_scope_object();
+    if (scope.is_none()) {
+        return nullptr;
+    }
+    return scope.cast<const Scope&>().slots();
+}
+
 } // namespace pygim
@@ -4,11 +4,26 @@
 
 namespace py = pybind11;
 
-PYBIND11_MODULE(ioc, m) {
+PYBIND11_MODULE(ioc, m, py::mod_gil_not_used()) {
     using Descriptor = pygim::Container::DescriptorType;
 
     m.doc() = "IoC container for provider registration and resolution.";
 
+    m.def("signature_cache_info",
+          [] {
+              auto stats = pygim::detail::SignatureCache::instance().stats();
+              py::dict info;
+              info["hits"] = stats.hits;
+              info["misses"] = stats.misses;
+              info["size"] = stats.size;
+              return info;
+          },
+          "Counters of the process-wide autowire signature cache: {hits, misses, size}.\n\n"
+          "Every Container shares the cache; a miss is one constructor introspection.");
+    m.def("signature_cache_clear",
+          [] { pygim::detail::SignatureCache::instance().clear(); },
+          "Drop every cached constructor signature and reset the counters.");
+
     py::class_<Descriptor>(m, "ServiceDescriptor",
         "Read-only snapshot of a registration; mutating it does not affect the container.")
         .def(py::init([](py::object interface,
@@ -44,10 +59,12 @@ PYBIND11_MODULE(ioc, m) {
 
     py::class_<pygim::Container>(m, "Container",
         "IoC container mapping interfaces to providers.\n\n"
-        "Thread safety: consistency relies on the GIL. If a provider releases\n"
-        "the GIL (e.g. blocking I/O in __init__), two threads racing on the\n"
-        "same not-yet-cached singleton can each construct an instance; guard\n"
-        "concurrent first-resolves externally when providers may block.")
+        "Thread safety: resolve() may be called from any number of threads\n"
+        "(also on free-threaded builds). Each singleton is constructed exactly\n"
+        "once: concurrent first-resolves of the same key wait for the builder\n"
+        "with the GIL released, while different keys build in parallel. Cycle\n"
+        "detection is per thread, and a cycle split across two threads raises\n"
+        "instead of deadlocking. Registration may run concurrently too.")
         .def(py::init<std::size_t>(), py::arg("capacity") = 0)
         .def("register",
              [](py::object self,
@@ -90,8 +107,63 @@ PYBIND11_MODULE(ioc, m) {
              py::arg("autowire") = false,
              py::arg("override") = false,
              "Register a provider directly or use as a decorator.\n\n"
-             "Supports optional name, transient/singleton lifecycle, decorator call chain, opt-in class autowiring, and strict override semantics.")
+             "Supports optional name, transient/singleton/scoped lifecycle, decorator call chain, opt-in class autowiring, and strict override semantics.")
         .def("resolve", &pygim::Container::resolve, py::arg("key"))
+        .def("aresolve",
+             [](py::object self, const py::object& key) {
+                 return self.cast<pygim::Container&>().aresolve(self, key);
+             },
+             py::arg("key"),
+             "Resolve `key` asynchronously: `await container.aresolve(key)`.\n\n"
+             "Coroutine providers are awaited, injected dependencies are resolved\n"
+             "concurrently (asyncio.gather), and a singleton is built once even\n"
+             "when many tasks await it at the same time.")
+        .def("compile", &pygim::Container::compile,
+             "Freeze registration and precompute a flat construction plan per key.\n\n"
+             "Autowired constructors are introspected once, dependency cycles and\n"
+             "missing providers are reported here, and resolve() then runs the plan\n"
+             "straight through. Further register() calls raise RuntimeError.")
+        .def_property_readonly("compiled", &pygim::Container::compiled)
+        .def("warm_up", &pygim::Container::warm_up,
+             py::arg("keys") = py::none(),
+             py::kw_only(),
+             py::arg("workers") = 0,
+             "Build singletons ahead of traffic, independent ones in parallel.\n\n"
+             "Covers every unbuilt singleton, or those reachable from `keys`. Each is\n"
+             "built once the singletons it depends on exist, on up to `workers`\n"
+             "threads (0 = auto). Returns {key: seconds} for the singletons built;\n"
+             "failures are raised together as WarmUpError after the rest finish.")
+        .def("scope",
+             [](py::object self) {
+                 const auto& var = self.cast<const pygim::Container&>().scope_var();
+                 return pygim::Scope(self, var);
+             },
+             "Open a Scope for lifecycle='scoped' registrations.\n\n"
+             "Use as `with container.scope():` or `async with container.scope():`.\n"
+             "Scoped keys resolve to one instance per scope; on exit the instances\n"
+             "are closed (close() / aclose()) in reverse creation order.")
+        .def_property("profiling",
+                      &pygim::Container::profiling_enabled,
+                      &pygim::Container::set_profiling,
+                      "Record a resolution tree for every top-level resolve() while True.")
+        .def("profile_report", &pygim::Container::profile_report,
+             "Recorded resolves, oldest first, as nested dicts.\n\n"
+             "Each node has key, seconds (inclusive), phases (dependencies, provider,\n"
+             "decorators, validation), constructed (False for a cached instance),\n"
+             "introspected (constructor signature parsed) and children.")
+        .def("profile_stats", &pygim::Container::profile_stats,
+             "Totals over the recorded resolves: resolves, constructed, cached,\n"
+             "introspected and seconds (top-level wall time).")
+        .def("flame_graph", &pygim::Container::flame_graph,
+             "Recorded resolves as folded stacks (`A;B;C <self microseconds>` per line),\n"
+             "ready for flamegraph.pl, speedscope or inferno.")
+        .def("clear_profile", &pygim::Container::clear_profile)
+        .def("dependency_graph", &pygim::Container::dependency_graph,
+             py::arg("format") = "json",
+             "Export the registrations and their autowired dependencies.\n\n"
+             "`format` is \"json\" ({nodes, edges}) or \"dot\" (Graphviz). A node\n"
+             "whose constructor cannot be planned (e.g. a dependency nobody\n"
+             "registered) carries the message under \"error\".")
         .def("describe", &pygim::Container::describe, py::arg("key"),
              "Return a read-only ServiceDescriptor snapshot of the registration for `key`.")
         .def("registered_keys", &pygim::Container::registered_keys)
@@ -99,4 +171,25 @@ PYBIND11_MODULE(ioc, m) {
         .def("__contains__", &pygim::Container::contains)
         .def("__len__", &pygim::Container::size)
         .def("__repr__", &pygim::Container::repr);
+
+    py::class_<pygim::Scope>(m, "Scope",
+        "Instances of lifecycle='scoped' registrations for one unit of work.\n\n"
+        "Active inside `with` / `async with` (a ContextVar, so asyncio tasks\n"
+        "started inside inherit it). Resolving a scoped key with no active\n"
+        "scope raises RuntimeError; transient and singleton keys are unaffected.")
+        .def("__enter__", [](py::object self) { return self.cast<pygim::Scope&>().enter(self); })
+        .def("__exit__", [](pygim::Scope& scope, const py::args&) { scope.exit(); })
+        .def("__aenter__", [](py::object self) { return self.cast<pygim::Scope&>().aenter(self); })
+        .def("__aexit__", [](pygim::Scope& scope, const py::args&) { return scope.aexit(); })
+        .def("resolve",
+             [](py::object self, const py::object& key) {
+                 return self.cast<pygim::Scope&>().resolve(self, key);
+             },
+             py::arg("key"),
+             "Resolve `key` with this scope active, without entering it.")
+        .def("close", &pygim::Scope::close,
+             "Close the instances created so far, newest first, and close the scope.")
+        .def_property_readonly("closed", &pygim::Scope::closed)
+        .def("__len__", &pygim::Scope::size)
+        .def("__repr__", &pygim::Scope::repr);
 }
@@ -1,23 +1,34 @@
 #pragma once
 
 #include <algorithm>
+#include <atomic>
+#include <condition_variable>
 #include <cstddef>
-#include <cstdint>
+#include <deque>
+#include <iterator>
 #include <memory>
+#include <mutex>
 #include <optional>
+#include <shared_mutex>
 #include <stdexcept>
 #include <string>
 #include <string_view>
+#include <thread>
 #include <unordered_map>
 #include <utility>
 #include <vector>
 
 namespace pygim::core {
 
-enum class Lifecycle { Transient = 0, Singleton = 1 };
+enum class Lifecycle { Transient = 0, Singleton = 1, Scoped = 2 };
 
 [[nodiscard]] constexpr std::string_view lifecycle_to_string(Lifecycle lifecycle) noexcept {
-    return lifecycle == Lifecycle::Singleton ? "singleton" : "transient";
+    switch (lifecycle) {
+        case Lifecycle::Singleton: return "singleton";
+        case Lifecycle::Scoped:    return "scoped";
+        case Lifecycle::Transient: break;
+    }
+    return "transient";
 }
 
 [[nodiscard]] constexpr Lifecycle parse_lifecycle(std::string_view lifecycle) {
@@ -27,13 +38,18 @@ enum class Lifecycle { Transient = 0, Singleton = 1 };
     if (lifecycle == "singleton") {
         return Lifecycle::Singleton;
     }
-    throw std::runtime_error("lifecycle must be 'transient' or 'singleton'");
+    if (lifecycle == "scoped") {
+        return Lifecycle::Scoped;
+    }
+    throw std::runtime_error("lifecycle must be 'transient', 'singleton' or 'scoped'");
 }
 
 static_assert(parse_lifecycle("transient") == Lifecycle::Transient);
 static_assert(parse_lifecycle("singleton") == Lifecycle::Singleton);
 static_assert(lifecycle_to_string(Lifecycle::Transient) == "transient");
 static_assert(lifecycle_to_string(Lifecycle::Singleton) == "singleton");
+static_assert(parse_lifecycle("scoped") == Lifecycle::Scoped);
+static_assert(lifecycle_to_string(Lifecycle::Scoped) == "scoped");
 
 // ---------------------------------------------------------------------------
 // Autowiring policy
@@ -127,9 +143,25 @@ static_assert(skips_variadics_and_untyped_defaults());
 // Lazily-filled constructor introspection shared between descriptor copies.
 // resolve() works on a descriptor copy for re-entrancy safety; the shared
 // slot lets a fill made through the copy persist on the stored descriptor.
+// Concurrent resolves may both introspect; the last fill wins, harmlessly.
 template<class Key>
-struct AutowireSlot {
-    std::shared_ptr<const std::vector<ParamSpec<Key>>> params;
+class AutowireSlot {
+public:
+    using params_type = std::shared_ptr<const std::vector<ParamSpec<Key>>>;
+
+    [[nodiscard]] params_type load() const {
+        std::lock_guard lock(m_mutex);
+        return m_params;
+    }
+
+    void store(params_type params) {
+        std::lock_guard lock(m_mutex);
+        m_params = std::move(params);
+    }
+
+private:
+    mutable std::mutex m_mutex;
+    params_type m_params;
 };
 
 template<class Interface, class Provider, class Decorator>
@@ -160,7 +192,275 @@ struct ServiceDescriptor {
           autowire_slot(autowire_ ? std::make_shared<AutowireSlot<Interface>>() : nullptr) {}
 };
 
-template<class Key, class Descriptor, class Instance, class Hash, class Eq>
+// Instances of `scoped` registrations owned by one scope: a slot array
+// indexed by registry index (grown on demand), plus the creation order so
+// release() can hand them back newest first for disposal.
+template<class Instance>
+class ScopeSlots {
+public:
+    [[nodiscard]] std::optional<Instance> get(std::size_t index) const {
+        std::lock_guard lock(m_mutex);
+        ensure_open();
+        if (index < m_slots.size() && m_slots[index]) {
+            return m_slots[index];
+        }
+        return std::nullopt;
+    }
+
+    //! Store a freshly built instance; if a racing resolve stored one first,
+    //! keep and return that one so the scope hands out a single instance.
+    [[nodiscard]] Instance put(std::size_t index, Instance instance) {
+        std::lock_guard lock(m_mutex);
+        ensure_open();
+        if (index >= m_slots.size()) {
+            m_slots.resize(index + 1);
+        }
+        if (m_slots[index]) {
+            return *m_slots[index];
+        }
+        m_slots[index].emplace(instance);
+        m_order.push_back(index);
+        return instance;
+    }
+
+    //! Close the scope and take its instances, in reverse creation order.
+    [[nodiscard]] std::vector<Instance> release() {
+        std::lock_guard lock(m_mutex);
+        m_closed = true;
+        std::vector<Instance> instances;
+        instances.reserve(m_order.size());
+        for (auto it = m_order.rbegin(); it != m_order.rend(); ++it) {
+            instances.push_back(std::move(*m_slots[*it]));
+        }
+        m_slots.clear();
+        m_order.clear();
+        return instances;
+    }
+
+    [[nodiscard]] std::size_t size() const {
+        std::lock_guard lock(m_mutex);
+        return m_order.size();
+    }
+
+    [[nodiscard]] bool closed() const {
+        std::lock_guard lock(m_mutex);
+        return m_closed;
+    }
+
+private:
+    void ensure_open() const {
+        if (m_closed) {
+            throw std::runtime_error("Scope is closed");
+        }
+    }
+
+    mutable std::mutex m_mutex;
+    std::vector<std::optional<Instance>> m_slots;
+    std::vector<std::size_t> m_order;
+    bool m_closed{false};
+};
+
+// Dependency-ordered work queue for warm_up(): node `i` becomes ready once
+// every node in needs[i] has finished. A failed node skips its dependents
+// (transitively); next() returns nullopt once every node is finished or
+// skipped. Thread-safe; workers block in next() while nothing is ready.
+class WarmUpSchedule {
+public:
+    explicit WarmUpSchedule(const std::vector<std::vector<std::size_t>>& needs)
+        : m_waiting(needs.size(), 0), m_dependents(needs.size()), m_skipped(needs.size(), 0),
+          m_remaining(needs.size()) {
+        for (std::size_t node = 0; node < needs.size(); ++node) {
+            m_waiting[node] = needs[node].size();
+            for (std::size_t need : needs[node]) {
+                m_dependents[need].push_back(node);
+            }
+            if (needs[node].empty()) {
+                m_ready.push_back(node);
+            }
+        }
+    }
+
+    [[nodiscard]] std::optional<std::size_t> next() {
+        std::unique_lock lock(m_mutex);
+        m_changed.wait(lock, [this] { return !m_ready.empty() || m_remaining == 0; });
+        if (m_ready.empty()) {
+            return std::nullopt;
+        }
+        std::size_t node = m_ready.front();
+        m_ready.pop_front();
+        return node;
+    }
+
+    void finish(std::size_t node, bool succeeded) {
+        {
+            std::lock_guard lock(m_mutex);
+            --m_remaining;
+            if (succeeded) {
+                for (std::size_t dependent : m_dependents[node]) {
+                    if (--m_waiting[dependent] == 0 && !m_skipped[dependent]) {
+                        m_ready.push_back(dependent);
+                    }
+                }
+            } else {
+                skip_dependents(node);
+            }
+        }
+        m_changed.notify_all();
+    }
+
+    [[nodiscard]] std::size_t skipped() const {
+        std::lock_guard lock(m_mutex);
+        return static_cast<std::size_t>(std::count(m_skipped.begin(), m_skipped.end(), 1));
+    }
+
+private:
+    void skip_dependents(std::size_t node) {
+        for (std::size_t dependent : m_dependents[node]) {
+            if (!m_skipped[dependent]) {
+                m_skipped[dependent] = 1;
+                --m_remaining;
+                skip_dependents(dependent);
+            }
+        }
+    }
+
+    mutable std::mutex m_mutex;
+    std::condition_variable m_changed;
+    std::vector<std::size_t> m_waiting;                 // unfinished needs per node
+    std::vector<std::vector<std::size_t>> m_dependents;
+    std::vector<char> m_skipped;
+    std::deque<std::size_t> m_ready;
+    std::size_t m_remaining;
+};
+
+// Blocking policy for ContainerCore: how to wait for another thread that is
+// building the same singleton. The adapter swaps in one that releases the
+// GIL, since the builder needs it to finish.
+struct InlineBlocking {
+    template<class Fn>
+    static void block(Fn&& fn) { std::forward<Fn>(fn)(); }
+};
+
+// A broken dependency path found by compile(), with the keys along it.
+template<class Key>
+class DependencyChainError : public std::runtime_error {
+public:
+    DependencyChainError(const char* what, std::vector<Key> chain)
+        : std::runtime_error(what), m_chain(std::move(chain)) {}
+
+    [[nodiscard]] const std::vector<Key>& chain() const noexcept { return m_chain; }
+
+private:
+    std::vector<Key> m_chain;
+};
+
+// The keys along the cycle, first key repeated last.
+template<class Key>
+class CircularDependency : public DependencyChainError<Key> {
+public:
+    explicit CircularDependency(std::vector<Key> chain)
+        : DependencyChainError<Key>("Circular dependency detected", std::move(chain)) {}
+};
+
+// A singleton that would capture a scoped instance and keep it past its
+// scope: the keys from the singleton down to the scoped key.
+template<class Key>
+class CaptiveDependency : public DependencyChainError<Key> {
+public:
+    explicit CaptiveDependency(std::vector<Key> chain)
+        : DependencyChainError<Key>(message, std::move(chain)) {}
+
+    static constexpr const char* message = "Singleton depends on a scoped service (captive dependency)";
+};
+
+namespace detail {
+
+// Per-thread resolution stack, shared by all containers (frames carry the
+// container), so cycle detection never sees another thread's in-flight keys.
+struct ResolutionFrame {
+    const void* container;
+    std::size_t index;
+};
+
+inline std::vector<ResolutionFrame>& resolution_stack() {
+    thread_local std::vector<ResolutionFrame> stack;
+    return stack;
+}
+
+// Hazard slots for lock-free readers of a published snapshot: one slot per
+// thread, written only by its thread, naming the snapshot it is reading.
+// A writer that unpublished a snapshot frees it once no slot names it.
+class HazardSlots {
+public:
+    [[nodiscard]] static HazardSlots& instance() {
+        static auto* slots = new HazardSlots;  // leaked: threads may outlive statics
+        return *slots;
+    }
+
+    //! The calling thread's slot.
+    [[nodiscard]] std::atomic<const void*>& local() {
+        thread_local Registration registration{*this};
+        return registration.slot->value;
+    }
+
+    //! Every pointer some thread is reading right now.
+    [[nodiscard]] std::vector<const void*> protected_pointers() {
+        std::lock_guard lock(m_mutex);
+        std::vector<const void*> pointers;
+        for (const auto& slot : m_slots) {
+            if (const void* ptr = slot->value.load()) {
+                pointers.push_back(ptr);
+            }
+        }
+        return pointers;
+    }
+
+private:
+    struct alignas(64) Slot {  // own cache line: readers never share a write
+        std::atomic<const void*> value{nullptr};
+    };
+
+    struct Registration {
+        HazardSlots& owner;
+        Slot* slot;
+        explicit Registration(HazardSlots& owner_) : owner(owner_), slot(owner_.acquire()) {}
+        ~Registration() { owner.release(slot); }
+    };
+
+    Slot* acquire() {
+        std::lock_guard lock(m_mutex);
+        if (!m_free.empty()) {
+            Slot* slot = m_free.back();
+            m_free.pop_back();
+            return slot;
+        }
+        return m_slots.emplace_back(std::make_unique<Slot>()).get();
+    }
+
+    void release(Slot* slot) {
+        slot->value.store(nullptr);
+        std::lock_guard lock(m_mutex);
+        m_free.push_back(slot);
+    }
+
+    std::mutex m_mutex;
+    std::vector<std::unique_ptr<Slot>> m_slots;
+    std::vector<Slot*> m_free;
+};
+
+} // namespace detail
+
+// Concurrency: the registry sits behind a shared_mutex held only for lookups
+// and copies (never while provider code runs). Each singleton registration
+// owns a cell: a built instance is published with a release store, and
+// construction is serialised per key by the cell's own mutex, so unrelated
+// singletons build in parallel and a singleton is built once. Built
+// singletons are found without m_mutex: the key -> cell map is also published
+// as an immutable snapshot, read under a hazard slot (detail::HazardSlots).
+// A registration unpublishes it (the next locked resolve publishes a fresh
+// one) and frees it once no reader holds it.
+template<class Key, class Descriptor, class Instance, class Hash, class Eq,
+         class Blocking = InlineBlocking>
 class ContainerCore {
 public:
     using key_type = Key;
@@ -171,99 +471,508 @@ public:
         reserve(capacity);
     }
 
+    ~ContainerCore() {
+        delete m_snapshot.load();
+    }
+
+    ContainerCore(const ContainerCore&) = delete;
+    ContainerCore& operator=(const ContainerCore&) = delete;
+
     void reserve(std::size_t capacity) {
+        std::unique_lock lock(m_mutex);
         m_registry.reserve(capacity);
-        m_generations.reserve(capacity);
+        m_cells.reserve(capacity);
         m_index_map.reserve(capacity);
     }
 
     void register_or_override(const key_type& key, descriptor_type descriptor, bool override_existing = false) {
+        auto cell = descriptor.lifecycle == Lifecycle::Singleton
+            ? std::make_shared<SingletonCell>() : nullptr;
+        // Replaced state is released after unlocking: dropping instances can
+        // run arbitrary destructor code.
+        descriptor_type replaced;
+        std::shared_ptr<SingletonCell> replaced_cell;
+        std::vector<std::unique_ptr<const Snapshot>> unread;
+
+        std::unique_lock lock(m_mutex);
+        if (m_frozen) {
+            throw std::runtime_error("Container is compiled; registration is frozen");
+        }
         auto it = m_index_map.find(key);
         bool exists = it != m_index_map.end();
+        if (exists != override_existing) {
+            throw std::runtime_error(exists ? "Duplicate service registration (use override=True)"
+                                            : "override=True requires existing service");
+        }
+        unread = unpublish_snapshot();
         if (exists) {
-            if (!override_existing) {
-                throw std::runtime_error("Duplicate service registration (use override=True)");
-            }
-            m_registry[it->second] = std::move(descriptor);
-            m_singletons.erase(it->second);
-            ++m_generations[it->second];
+            // A resolve still building into the old cell finishes there; the
+            // new registration starts with a fresh cell.
+            replaced = std::exchange(m_registry[it->second], std::move(descriptor));
+            replaced_cell = std::exchange(m_cells[it->second], std::move(cell));
+            lock.unlock();
             return;
         }
 
-        if (override_existing) {
-            throw std::runtime_error("override=True requires existing service");
-        }
-
         std::size_t index = m_registry.size();
         m_registry.emplace_back(std::move(descriptor));
-        m_generations.push_back(0);
+        m_cells.push_back(std::move(cell));
         m_index_map.emplace(key, index);
     }
 
     [[nodiscard]] bool contains(const key_type& key) const {
+        std::shared_lock lock(m_mutex);
         return m_index_map.find(key) != m_index_map.end();
     }
 
-    [[nodiscard]] const descriptor_type* try_descriptor(const key_type& key) const {
+    //! Copy of the registration for `key` (a pointer could dangle under a
+    //! concurrent registration).
+    [[nodiscard]] std::optional<descriptor_type> find_descriptor(const key_type& key) const {
+        std::shared_lock lock(m_mutex);
         auto it = m_index_map.find(key);
         if (it == m_index_map.end()) {
-            return nullptr;
+            return std::nullopt;
         }
-        return &m_registry[it->second];
+        return m_registry[it->second];
     }
 
-    template<class ProviderInvoker, class DecoratorApplier, class InstanceValidator>
+    //! `current_scope()` returns the active scope's ScopeSlots (or null);
+    //! it is only called for keys registered as `scoped`.
+    template<class ProviderInvoker, class DecoratorApplier, class InstanceValidator, class ScopeLookup>
     [[nodiscard]] instance_type resolve(
             const key_type& key,
             ProviderInvoker&& invoke_provider,
             DecoratorApplier&& apply_decorator,
-            InstanceValidator&& validate_instance) {
-        auto it = m_index_map.find(key);
-        if (it == m_index_map.end()) {
-            throw std::runtime_error("No provider for key");
+            InstanceValidator&& validate_instance,
+            ScopeLookup&& current_scope) {
+        if (auto built = find_built(key)) {
+            return std::move(*built);  // hot path: no lock taken
+        }
+
+        std::size_t index;
+        std::shared_ptr<SingletonCell> cell;
+        bool scoped = false;
+        {
+            std::shared_lock lock(m_mutex);
+            publish_snapshot();
+            auto it = m_index_map.find(key);
+            if (it == m_index_map.end()) {
+                throw std::runtime_error("No provider for key");
+            }
+            index = it->second;
+            if (const auto& slot = m_cells[index]) {
+                if (slot->ready.load(std::memory_order_acquire)) {
+                    return *slot->value;
+                }
+                cell = slot;
+            }
+            scoped = m_registry[index].lifecycle == Lifecycle::Scoped;
+            if (scoped) {
+                ensure_not_captive(detail::resolution_stack());
+            }
+        }
+
+        std::shared_ptr<scope_type> scope;
+        if (scoped) {
+            scope = active_scope(current_scope);
+            if (auto cached = scope->get(index)) {
+                return std::move(*cached);
+            }
+        }
+
+        auto& stack = detail::resolution_stack();
+        ensure_not_resolving(stack, index);
+        stack.push_back({this, index});
+        ResolutionGuard guard{stack};
+
+        auto build = [&] {
+            // Work on a copy: the provider and decorators run arbitrary code
+            // that may re-enter register_or_override() and reallocate
+            // m_registry, which would invalidate any reference held across
+            // those calls.
+            descriptor_type descriptor;
+            {
+                std::shared_lock lock(m_mutex);
+                descriptor = m_registry[index];
+            }
+            instance_type instance = invoke_provider(descriptor);
+            for (const auto& decorator : descriptor.decorators) {
+                instance = apply_decorator(decorator, std::move(instance));
+            }
+            validate_instance(instance, descriptor.interface);
+            return instance;
+        };
+
+        if (scope) {
+            return scope->put(index, build());
         }
-        const std::size_t index = it->second;
+        if (!cell) {
+            return build();
+        }
+        // Skipped implicitly when the registration was overridden
+        // mid-resolve: this cell is no longer reachable from the registry.
+        return build_once(*cell, build);
+    }
 
-        if (m_registry[index].lifecycle == Lifecycle::Singleton) {
-            auto singleton = m_singletons.find(index);
-            if (singleton != m_singletons.end()) {
-                return singleton->second;
+    // -----------------------------------------------------------------
+    // Warm-up
+    // -----------------------------------------------------------------
+
+    //! Unbuilt singletons to construct ahead of traffic. `needs[i]` lists
+    //! the positions (in `keys`) of the singletons keys[i] depends on,
+    //! directly or through transient/scoped registrations.
+    struct WarmUpPlan {
+        std::vector<key_type> keys;
+        std::vector<std::vector<std::size_t>> needs;
+    };
+
+    //! Plan a warm-up of the singletons reachable from `roots` (every
+    //! singleton when empty). `dependencies_of` is compile()'s planner; it
+    //! runs on a registry snapshot with no lock held. Cycles raise
+    //! CircularDependency before anything is built.
+    template<class Planner>
+    [[nodiscard]] WarmUpPlan warm_up_plan(const std::vector<key_type>& roots, Planner&& dependencies_of) const {
+        std::vector<descriptor_type> registry;
+        std::unordered_map<key_type, std::size_t, Hash, Eq> index_map;
+        std::vector<char> pending;  // 1 = singleton not built yet
+        {
+            std::shared_lock lock(m_mutex);
+            registry = m_registry;
+            index_map = m_index_map;
+            pending.resize(m_cells.size());
+            for (std::size_t index = 0; index < m_cells.size(); ++index) {
+                pending[index] = m_cells[index] && !m_cells[index]->ready.load(std::memory_order_acquire);
             }
         }
+        auto key_of = [&index_map](std::size_t index) -> const key_type& {
+            for (const auto& [key, at] : index_map) {
+                if (at == index) {
+                    return key;
+                }
+            }
+            throw std::logic_error("registry index without key");
+        };
 
-        if (std::find(m_resolution_stack.begin(), m_resolution_stack.end(), index)
-                != m_resolution_stack.end()) {
-            throw std::runtime_error("Circular dependency detected");
+        const std::size_t count = registry.size();
+        std::vector<std::optional<std::vector<std::size_t>>> deps(count);
+        auto deps_of = [&](std::size_t index) -> const std::vector<std::size_t>& {
+            if (!deps[index]) {
+                std::vector<std::size_t> resolved;
+                for (const key_type& key : dependencies_of(index, registry[index])) {
+                    auto it = index_map.find(key);
+                    if (it == index_map.end()) {
+                        throw std::runtime_error("No provider for key");
+                    }
+                    resolved.push_back(it->second);
+                }
+                deps[index] = std::move(resolved);
+            }
+            return *deps[index];
+        };
+
+        WarmUpPlan plan;
+        std::vector<std::size_t> position(count, npos);      // index -> node
+        std::vector<std::optional<std::vector<std::size_t>>> nearest(count);  // singletons below
+        std::vector<std::size_t> path;
+
+        // Nearest unbuilt singletons below `index`, looking through
+        // transient/scoped registrations; visiting a singleton plans it.
+        auto visit = [&](auto& self, std::size_t index) -> const std::vector<std::size_t>& {
+            if (nearest[index]) {
+                return *nearest[index];
+            }
+            if (auto cycle = std::find(path.begin(), path.end(), index); cycle != path.end()) {
+                std::vector<key_type> chain;
+                for (auto at = cycle; at != path.end(); ++at) {
+                    chain.push_back(key_of(*at));
+                }
+                chain.push_back(key_of(index));
+                throw CircularDependency<key_type>(std::move(chain));
+            }
+            path.push_back(index);
+            std::vector<std::size_t> below;
+            for (std::size_t dep : deps_of(index)) {
+                if (pending[dep]) {
+                    self(self, dep);
+                    below.push_back(dep);
+                } else if (registry[dep].lifecycle != Lifecycle::Singleton) {
+                    const auto& through = self(self, dep);
+                    below.insert(below.end(), through.begin(), through.end());
+                }
+            }
+            path.pop_back();
+            std::sort(below.begin(), below.end());
+            below.erase(std::unique(below.begin(), below.end()), below.end());
+            if (pending[index]) {
+                position[index] = plan.keys.size();
+                plan.keys.push_back(key_of(index));
+                plan.needs.emplace_back();
+                for (std::size_t dep : below) {
+                    plan.needs[position[index]].push_back(position[dep]);
+                }
+            }
+            nearest[index] = std::move(below);
+            return *nearest[index];
+        };
+
+        if (roots.empty()) {
+            for (std::size_t index = 0; index < count; ++index) {
+                if (pending[index]) {
+                    visit(visit, index);
+                }
+            }
         }
-        m_resolution_stack.push_back(index);
-        ResolutionGuard guard{m_resolution_stack};
+        for (const key_type& key : roots) {
+            auto it = index_map.find(key);
+            if (it == index_map.end()) {
+                throw std::runtime_error("No provider for key");
+            }
+            visit(visit, it->second);
+        }
+        return plan;
+    }
 
-        // Work on a copy: the provider and decorators run arbitrary code that
-        // may re-enter register_or_override() and reallocate m_registry,
-        // which would invalidate any reference held across those calls.
-        const std::uint64_t generation = m_generations[index];
-        descriptor_type descriptor = m_registry[index];
+    // -----------------------------------------------------------------
+    // Split resolution (async providers)
+    // -----------------------------------------------------------------
 
-        instance_type instance = std::forward<ProviderInvoker>(invoke_provider)(descriptor);
+    //! The instance `key` resolves to without construction: a built
+    //! singleton or what the active scope holds. Throws like resolve() for
+    //! unknown keys and for scoped keys outside a scope.
+    template<class ScopeLookup>
+    [[nodiscard]] std::optional<instance_type> find_instance(const key_type& key, ScopeLookup&& current_scope) const {
+        std::size_t index;
+        {
+            std::shared_lock lock(m_mutex);
+            auto it = m_index_map.find(key);
+            if (it == m_index_map.end()) {
+                throw std::runtime_error("No provider for key");
+            }
+            index = it->second;
+            if (const auto& cell = m_cells[index]) {
+                if (cell->ready.load(std::memory_order_acquire)) {
+                    return *cell->value;
+                }
+                return std::nullopt;
+            }
+            if (m_registry[index].lifecycle != Lifecycle::Scoped) {
+                return std::nullopt;
+            }
+        }
+        return active_scope(current_scope)->get(index);
+    }
+
+    //! Second half of a resolve whose provider ran elsewhere (e.g. awaited
+    //! by the caller): apply decorators, validate, and cache per lifecycle.
+    //! If a singleton or scope instance was stored meanwhile, that one wins.
+    template<class DecoratorApplier, class InstanceValidator, class ScopeLookup>
+    [[nodiscard]] instance_type complete(
+            const key_type& key,
+            instance_type instance,
+            DecoratorApplier&& apply_decorator,
+            InstanceValidator&& validate_instance,
+            ScopeLookup&& current_scope) {
+        std::size_t index;
+        descriptor_type descriptor;
+        std::shared_ptr<SingletonCell> cell;
+        {
+            std::shared_lock lock(m_mutex);
+            auto it = m_index_map.find(key);
+            if (it == m_index_map.end()) {
+                throw std::runtime_error("No provider for key");
+            }
+            index = it->second;
+            descriptor = m_registry[index];
+            cell = m_cells[index];
+        }
+        std::shared_ptr<scope_type> scope;
+        if (descriptor.lifecycle == Lifecycle::Scoped) {
+            scope = active_scope(current_scope);
+        }
         for (const auto& decorator : descriptor.decorators) {
             instance = apply_decorator(decorator, std::move(instance));
         }
         validate_instance(instance, descriptor.interface);
+        if (scope) {
+            return scope->put(index, std::move(instance));
+        }
+        if (cell) {
+            return build_once(*cell, [&instance] { return instance; });
+        }
+        return instance;
+    }
 
-        // Skip caching when the registration was overridden mid-resolve;
-        // the instance belongs to the descriptor generation we started from.
-        if (descriptor.lifecycle == Lifecycle::Singleton && m_generations[index] == generation) {
-            m_singletons.insert_or_assign(index, instance);
+    // -----------------------------------------------------------------
+    // Compiled resolution
+    // -----------------------------------------------------------------
+
+    //! Freeze registration and flatten every key into a ResolutionPlan.
+    //! `dependencies_of(index, descriptor)` returns the keys injected into
+    //! that registration's provider, in argument order (and may run Python:
+    //! no lock is held while it does). Cycles and unknown keys are reported
+    //! here, once; on failure the container stays unfrozen.
+    template<class Planner>
+    void compile(Planner&& dependencies_of) {
+        {
+            std::unique_lock lock(m_mutex);
+            if (m_frozen) {
+                throw std::runtime_error("Container is already compiled");
+            }
+            m_frozen = true;  // from here on the registry is immutable
         }
+        try {
+            const std::size_t count = m_registry.size();
+            std::vector<std::vector<std::size_t>> deps(count);
+            for (std::size_t index = 0; index < count; ++index) {
+                for (const key_type& key : dependencies_of(index, m_registry[index])) {
+                    auto it = m_index_map.find(key);
+                    if (it == m_index_map.end()) {
+                        throw std::runtime_error("No provider for key");
+                    }
+                    deps[index].push_back(it->second);
+                }
+            }
 
-        return instance;
+            std::vector<ResolutionPlan> plans(count);
+            std::vector<std::size_t> path;
+            std::vector<std::size_t> shared_step(count, npos);
+            for (std::size_t index = 0; index < count; ++index) {
+                expand(index, deps, plans[index], path, shared_step);
+                for (const PlanStep& step : plans[index].steps) {
+                    shared_step[step.index] = npos;
+                }
+            }
+            m_plans = std::move(plans);
+        } catch (...) {
+            std::unique_lock lock(m_mutex);
+            m_frozen = false;
+            throw;
+        }
+        m_compiled.store(true, std::memory_order_release);
     }
 
-    [[nodiscard]] std::size_t size() const noexcept {
+    [[nodiscard]] bool compiled() const noexcept {
+        return m_compiled.load(std::memory_order_acquire);
+    }
+
+    //! Execute the compiled plan for `key`: one pass over flat steps, no
+    //! descriptor copies, autowiring or cycle scans per dependency.
+    //! `invoke_step(index, descriptor, args)` calls the provider with the
+    //! already-built injected arguments (in the planner's order).
+    template<class StepInvoker, class DecoratorApplier, class InstanceValidator, class ScopeLookup>
+    [[nodiscard]] instance_type resolve_compiled(
+            const key_type& key,
+            StepInvoker&& invoke_step,
+            DecoratorApplier&& apply_decorator,
+            InstanceValidator&& validate_instance,
+            ScopeLookup&& current_scope) {
+        auto it = m_index_map.find(key);  // immutable once compiled
+        if (it == m_index_map.end()) {
+            throw std::runtime_error("No provider for key");
+        }
+        const std::size_t root = it->second;
+        if (const auto& cell = m_cells[root]; cell && cell->ready.load(std::memory_order_acquire)) {
+            return *cell->value;
+        }
+
+        // Providers may still re-enter resolve(), which is the only way a
+        // cycle or a captive scoped dependency can appear now. The root's
+        // frame stays pushed for the whole plan and each step's while it
+        // builds, so a provider re-entering through the root or through any
+        // step in flight is caught, as on the dynamic path.
+        auto& stack = detail::resolution_stack();
+        ensure_not_resolving(stack, root);
+        if (m_plans[root].scoped) {
+            ensure_not_captive(stack);
+        }
+        stack.push_back({this, root});
+        ResolutionGuard root_guard{stack};
+
+        const auto& steps = m_plans[root].steps;
+        const std::size_t n = steps.size();
+        std::vector<std::optional<instance_type>> values(n);
+
+        // The active scope is looked up once, and only if the plan has a
+        // scoped step: plans without one never touch the context.
+        std::shared_ptr<scope_type> scope;
+        auto scope_of = [&](std::size_t index) -> scope_type* {
+            if (m_registry[index].lifecycle != Lifecycle::Scoped) {
+                return nullptr;
+            }
+            if (!scope) {
+                scope = active_scope(current_scope);
+            }
+            return scope.get();
+        };
+
+        // Backward pass: a built singleton (or an instance the scope already
+        // holds) short-circuits its subtree, so its transient dependencies
+        // are not constructed for nothing.
+        std::vector<char> needed(n, 0);
+        needed[n - 1] = 1;
+        for (std::size_t i = n; i-- > 0;) {
+            if (!needed[i]) {
+                continue;
+            }
+            const auto& cell = m_cells[steps[i].index];
+            if (cell && cell->ready.load(std::memory_order_acquire)) {
+                values[i].emplace(*cell->value);
+                continue;
+            }
+            if (auto* slots = scope_of(steps[i].index)) {
+                if (auto cached = slots->get(steps[i].index)) {
+                    values[i].emplace(std::move(*cached));
+                    continue;
+                }
+            }
+            for (std::size_t arg : steps[i].args) {
+                needed[arg] = 1;
+            }
+        }
+
+        std::vector<instance_type> args;
+        for (std::size_t i = 0; i < n; ++i) {
+            if (!needed[i] || values[i]) {
+                continue;
+            }
+            const PlanStep& step = steps[i];
+            std::optional<ResolutionGuard> guard;
+            if (i + 1 < n) {  // the root's frame is already pushed
+                ensure_not_resolving(stack, step.index);
+                stack.push_back({this, step.index});
+                guard.emplace(stack);
+            }
+
+            auto build = [&] {
+                const descriptor_type& descriptor = m_registry[step.index];
+                args.clear();
+                for (std::size_t arg : step.args) {
+                    args.push_back(*values[arg]);
+                }
+                instance_type instance = invoke_step(step.index, descriptor, args);
+                for (const auto& decorator : descriptor.decorators) {
+                    instance = apply_decorator(decorator, std::move(instance));
+                }
+                validate_instance(instance, descriptor.interface);
+                return instance;
+            };
+            const auto& cell = m_cells[step.index];
+            if (auto* slots = scope_of(step.index)) {
+                values[i].emplace(slots->put(step.index, build()));
+            } else {
+                values[i].emplace(cell ? build_once(*cell, build) : build());
+            }
+        }
+        return std::move(*values[n - 1]);
+    }
+
+    [[nodiscard]] std::size_t size() const {
+        std::shared_lock lock(m_mutex);
         return m_registry.size();
     }
 
     [[nodiscard]] std::vector<key_type> keys() const {
+        std::shared_lock lock(m_mutex);
         std::vector<key_type> result;
         result.reserve(m_index_map.size());
         for (const auto& [key, _] : m_index_map) {
@@ -273,16 +982,254 @@ public:
     }
 
 private:
+    struct SingletonCell {
+        std::atomic<bool> ready{false};
+        std::optional<instance_type> value;      // written once, before `ready`
+        std::mutex build;                        // held by the constructing thread
+        std::atomic<std::thread::id> builder{};  // that thread, for deadlock checks
+    };
+
+    using scope_type = ScopeSlots<instance_type>;
+
+    // Singleton cells by key, immutable once published (see the class note).
+    struct Snapshot {
+        std::unordered_map<key_type, std::shared_ptr<SingletonCell>, Hash, Eq> cells;
+    };
+
+    //! A built singleton for `key` from the published snapshot, if any.
+    [[nodiscard]] std::optional<instance_type> find_built(const key_type& key) const {
+        auto& hazard = detail::HazardSlots::instance().local();
+        const Snapshot* snapshot = m_snapshot.load();
+        while (snapshot) {
+            hazard.store(snapshot);
+            const Snapshot* current = m_snapshot.load();  // still published: safe to read
+            if (current == snapshot) {
+                break;
+            }
+            snapshot = current;
+        }
+        struct ClearHazard {
+            std::atomic<const void*>& hazard;
+            ~ClearHazard() { hazard.store(nullptr, std::memory_order_release); }
+        } clear{hazard};
+
+        if (!snapshot) {
+            return std::nullopt;
+        }
+        auto it = snapshot->cells.find(key);
+        if (it == snapshot->cells.end() || !it->second->ready.load(std::memory_order_acquire)) {
+            return std::nullopt;
+        }
+        return *it->second->value;
+    }
+
+    //! Publish a snapshot of the registry if none is. Call with m_mutex
+    //! held (shared is enough: registrations, which unpublish, are excluded).
+    void publish_snapshot() const {
+        if (m_snapshot.load(std::memory_order_acquire)) {
+            return;
+        }
+        auto snapshot = std::make_unique<Snapshot>();
+        for (const auto& [key, index] : m_index_map) {
+            if (m_cells[index]) {
+                snapshot->cells.emplace(key, m_cells[index]);
+            }
+        }
+        const Snapshot* expected = nullptr;
+        if (m_snapshot.compare_exchange_strong(expected, snapshot.get())) {
+            snapshot.release();  // a racing resolve may have published first
+        }
+    }
+
+    //! Take the published snapshot down (m_mutex held exclusively) and hand
+    //! back the retired snapshots no reader holds any more, to be dropped
+    //! after unlocking.
+    [[nodiscard]] std::vector<std::unique_ptr<const Snapshot>> unpublish_snapshot() {
+        if (const Snapshot* published = m_snapshot.exchange(nullptr)) {
+            m_retired.emplace_back(published);
+        }
+        std::vector<std::unique_ptr<const Snapshot>> unread;
+        if (m_retired.empty()) {
+            return unread;
+        }
+        const auto held = detail::HazardSlots::instance().protected_pointers();
+        auto still_read = std::partition(m_retired.begin(), m_retired.end(), [&held](const auto& snapshot) {
+            return std::find(held.begin(), held.end(), snapshot.get()) != held.end();
+        });
+        std::move(still_read, m_retired.end(), std::back_inserter(unread));
+        m_retired.erase(still_read, m_retired.end());
+        return unread;
+    }
+
+    static constexpr std::size_t npos = static_cast<std::size_t>(-1);
+
+    template<class ScopeLookup>
+    [[nodiscard]] static std::shared_ptr<scope_type> active_scope(ScopeLookup& current_scope) {
+        std::shared_ptr<scope_type> scope = current_scope();
+        if (!scope) {
+            throw std::runtime_error("No active scope for scoped service");
+        }
+        return scope;
+    }
+
+    // One construction in a plan; `args` are positions of earlier steps.
+    struct PlanStep {
+        std::size_t index;
+        std::vector<std::size_t> args;
+    };
+
+    // Flattened recipe for one key, in construction order, the key last.
+    // Transients appear once per injection (each gets a fresh instance, as
+    // in dynamic resolution); a singleton or scoped key appears once per plan.
+    struct ResolutionPlan {
+        std::vector<PlanStep> steps;
+        bool scoped{false};  // some step is a scoped key
+    };
+
+    //! Throw if this thread is already resolving `index` of this container.
+    void ensure_not_resolving(const std::vector<detail::ResolutionFrame>& stack, std::size_t index) const {
+        for (const auto& frame : stack) {
+            if (frame.container == this && frame.index == index) {
+                throw std::runtime_error("Circular dependency detected");
+            }
+        }
+    }
+
+    //! Refuse a scoped instance while a singleton of this container is being
+    //! built on this thread (m_mutex held, or compiled): the singleton would
+    //! keep the instance after its scope closed and disposed of it.
+    void ensure_not_captive(const std::vector<detail::ResolutionFrame>& stack) const {
+        for (const auto& frame : stack) {
+            if (frame.container == this && m_cells[frame.index]) {
+                throw std::runtime_error(CaptiveDependency<key_type>::message);
+            }
+        }
+    }
+
+    std::size_t expand(std::size_t index, const std::vector<std::vector<std::size_t>>& deps,
+                       ResolutionPlan& plan, std::vector<std::size_t>& path,
+                       std::vector<std::size_t>& shared_step) const {
+        const bool scoped = m_registry[index].lifecycle == Lifecycle::Scoped;
+        const bool shared = scoped || m_cells[index] != nullptr;
+        if (scoped) {
+            plan.scoped = true;
+            auto captor = std::find_if(path.begin(), path.end(), [this](std::size_t at) { return m_cells[at] != nullptr; });
+            if (captor != path.end()) {
+                std::vector<key_type> chain;
+                for (auto at = captor; at != path.end(); ++at) {
+                    chain.push_back(key_at(*at));
+                }
+                chain.push_back(key_at(index));
+                throw CaptiveDependency<key_type>(std::move(chain));
+            }
+        }
+        if (shared && shared_step[index] != npos) {
+            return shared_step[index];
+        }
+        if (auto cycle = std::find(path.begin(), path.end(), index); cycle != path.end()) {
+            std::vector<key_type> chain;
+            for (auto at = cycle; at != path.end(); ++at) {
+                chain.push_back(key_at(*at));
+            }
+            chain.push_back(key_at(index));
+            throw CircularDependency<key_type>(std::move(chain));
+        }
+        path.push_back(index);
+        PlanStep step{index, {}};
+        for (std::size_t dep : deps[index]) {
+            step.args.push_back(expand(dep, deps, plan, path, shared_step));
+        }
+        path.pop_back();
+        plan.steps.push_back(std::move(step));
+        const std::size_t position = plan.steps.size() - 1;
+        if (shared) {
+            shared_step[index] = position;
+        }
+        return position;
+    }
+
+    [[nodiscard]] const key_type& key_at(std::size_t index) const {
+        for (const auto& [key, at] : m_index_map) {
+            if (at == index) {
+                return key;
+            }
+        }
+        throw std::logic_error("registry index without key");
+    }
+
+    // Construct `cell`'s instance once: the first thread builds, racing
+    // threads wait (see wait_for_builder) and take its result.
+    template<class Build>
+    instance_type build_once(SingletonCell& cell, Build&& build) {
+        std::unique_lock build_lock(cell.build, std::try_to_lock);
+        if (!build_lock.owns_lock()) {
+            wait_for_builder(cell, build_lock);
+        }
+        if (cell.ready.load(std::memory_order_acquire)) {
+            return *cell.value;  // another thread built it while we waited
+        }
+
+        cell.builder.store(std::this_thread::get_id());
+        BuilderGuard builder{cell};
+        instance_type instance = build();
+        cell.value.emplace(instance);
+        cell.ready.store(true, std::memory_order_release);
+        return instance;
+    }
+
     struct ResolutionGuard {
-        std::vector<std::size_t>& stack;
+        std::vector<detail::ResolutionFrame>& stack;
         ~ResolutionGuard() { stack.pop_back(); }
     };
 
+    struct BuilderGuard {
+        SingletonCell& cell;
+        ~BuilderGuard() { cell.builder.store(std::thread::id{}); }
+    };
+
+    // Block until the cell's builder finishes. Before blocking, follow the
+    // waits-for chain (builder -> cell it waits on -> its builder ...): if it
+    // leads back here, two threads are building each other's dependencies,
+    // which is a cycle that would otherwise deadlock.
+    void wait_for_builder(SingletonCell& cell, std::unique_lock<std::mutex>& build_lock) {
+        const auto self = std::this_thread::get_id();
+        {
+            std::lock_guard lock(m_wait_mutex);
+            for (auto owner = cell.builder.load(); owner != std::thread::id{};) {
+                if (owner == self) {
+                    throw std::runtime_error("Circular dependency detected");
+                }
+                auto waiting = m_waiting.find(owner);
+                if (waiting == m_waiting.end()) {
+                    break;
+                }
+                owner = waiting->second->builder.load();
+            }
+            m_waiting[self] = &cell;
+        }
+        struct WaitGuard {
+            ContainerCore& core;
+            std::thread::id self;
+            ~WaitGuard() {
+                std::lock_guard lock(core.m_wait_mutex);
+                core.m_waiting.erase(self);
+            }
+        } waiting{*this, self};
+
+        Blocking::block([&build_lock] { build_lock.lock(); });
+    }
+
+    mutable std::shared_mutex m_mutex;  // registry, cells and index map
     std::vector<descriptor_type> m_registry;
-    std::vector<std::uint64_t> m_generations;
+    std::vector<std::shared_ptr<SingletonCell>> m_cells;  // null for non-singletons
     std::unordered_map<key_type, std::size_t, Hash, Eq> m_index_map;
-    std::unordered_map<std::size_t, instance_type> m_singletons;
-    std::vector<std::size_t> m_resolution_stack;
+    std::mutex m_wait_mutex;  // contended path only
+    std::unordered_map<std::thread::id, const SingletonCell*> m_waiting;
+    bool m_frozen{false};                  // guarded by m_mutex
+    std::atomic<bool> m_compiled{false};   // m_plans published
+    std::vector<ResolutionPlan> m_plans;   // by registry index
+    mutable std::atomic<const Snapshot*> m_snapshot{nullptr};  // owned; null after a registration
+    std::vector<std::unique_ptr<const Snapshot>> m_retired;     // unpublished, maybe still read; m_mutex
 };
 
 } // namespace pygim::core
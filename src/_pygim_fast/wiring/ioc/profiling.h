@@ -0,0 +1,185 @@
+#pragma once
+
+#include <array>
+#include <cstddef>
+#include <mutex>
+#include <optional>
+#include <string_view>
+#include <utility>
+#include <vector>
+
+#include "../../utils/quick_timer.h"
+
+namespace pygim::core {
+
+// Where a construction spends its time. Dependencies covers autowiring
+// (planning plus resolving the injected keys, i.e. the children's time).
+enum class ResolvePhase : std::size_t { Dependencies, Provider, Decorators, Validation, COUNT };
+
+inline constexpr std::size_t kResolvePhases = static_cast<std::size_t>(ResolvePhase::COUNT);
+
+// Found by QuickTimerT through ADL.
+[[nodiscard]] constexpr std::string_view phase_name(ResolvePhase phase) noexcept {
+    switch (phase) {
+        case ResolvePhase::Dependencies: return "dependencies";
+        case ResolvePhase::Provider:     return "provider";
+        case ResolvePhase::Decorators:   return "decorators";
+        case ResolvePhase::Validation:   return "validation";
+        case ResolvePhase::COUNT:        break;
+    }
+    return "?";
+}
+
+static_assert(phase_name(ResolvePhase::Provider) == "provider");
+
+template<class Key>
+struct TraceNode {
+    Key key;
+    std::size_t parent;                          //!< index in the trace; npos for the root
+    double seconds{0.0};                         //!< inclusive of children
+    std::array<double, kResolvePhases> phases{};
+    bool constructed{false};                     //!< provider ran (else a cached instance)
+    bool introspected{false};                    //!< constructor signature parsed meanwhile
+};
+
+//! One top-level resolve: nodes in pre-order, the root first.
+template<class Key>
+using ResolutionTrace = std::vector<TraceNode<Key>>;
+
+// Records resolution trees while profiling is on. Each thread builds its
+// current tree privately (frames nest as resolves nest); a finished tree is
+// appended under the lock. Every node is timed by a QuickTimerT whose
+// sub-timers are the ResolvePhases.
+template<class Key>
+class ResolutionProfiler {
+public:
+    static constexpr std::size_t npos = static_cast<std::size_t>(-1);
+
+    // Open node for as long as it lives; closes (and times) on destruction.
+    class Frame {
+    public:
+        Frame(Frame&& other) noexcept : m_owner(std::exchange(other.m_owner, nullptr)) {}
+        Frame(const Frame&) = delete;
+        Frame& operator=(const Frame&) = delete;
+        Frame& operator=(Frame&&) = delete;
+        ~Frame() {
+            if (m_owner) {
+                m_owner->close();
+            }
+        }
+
+    private:
+        friend class ResolutionProfiler;
+        explicit Frame(ResolutionProfiler* owner) : m_owner(owner) {}
+        ResolutionProfiler* m_owner;
+    };
+
+    [[nodiscard]] Frame enter(const Key& key) {
+        Active& active = active_or_new();
+        const std::size_t parent = active.open.empty() ? npos : active.open.back().first;
+        active.trace.push_back(TraceNode<Key>{key, parent});
+        active.open.emplace_back(active.trace.size() - 1, Timer("resolve", nullptr, false, false));
+        return Frame(this);
+    }
+
+    // The helpers below act on this thread's innermost open node and do
+    // nothing without one (e.g. profiling was switched on mid-resolve).
+    void phase(ResolvePhase phase) {
+        if (auto* open = innermost()) {
+            open->second.start_sub_timer(phase, false);
+        }
+    }
+
+    void mark_constructed() {
+        if (auto* node = innermost_node()) {
+            node->constructed = true;
+        }
+    }
+
+    void mark_introspected() {
+        if (auto* node = innermost_node()) {
+            node->introspected = true;
+        }
+    }
+
+    [[nodiscard]] std::vector<ResolutionTrace<Key>> traces() const {
+        std::lock_guard lock(m_mutex);
+        return m_traces;
+    }
+
+    void clear() {
+        std::lock_guard lock(m_mutex);
+        m_traces.clear();
+    }
+
+private:
+    using Timer = QuickTimerT<ResolvePhase>;
+
+    struct Active {
+        const ResolutionProfiler* owner;
+        ResolutionTrace<Key> trace;
+        std::vector<std::pair<std::size_t, Timer>> open;  // node index, its timer
+    };
+
+    // Per thread, per profiler: a provider may resolve from another
+    // profiled container while this one's tree is still open.
+    static std::vector<Active>& actives() {
+        thread_local std::vector<Active> state;
+        return state;
+    }
+
+    Active* find_active() {
+        auto& state = actives();
+        for (auto it = state.rbegin(); it != state.rend(); ++it) {
+            if (it->owner == this) {
+                return &*it;
+            }
+        }
+        return nullptr;
+    }
+
+    Active& active_or_new() {
+        if (Active* active = find_active()) {
+            return *active;
+        }
+        return actives().emplace_back(Active{this, {}, {}});
+    }
+
+    std::pair<std::size_t, Timer>* innermost() {
+        Active* active = find_active();
+        return active && !active->open.empty() ? &active->open.back() : nullptr;
+    }
+
+    TraceNode<Key>* innermost_node() {
+        Active* active = find_active();
+        return active && !active->open.empty() ? &active->trace[active->open.back().first] : nullptr;
+    }
+
+    void close() {
+        auto& state = actives();
+        auto it = state.end();
+        while (it != state.begin() && (--it)->owner != this) {}
+        Active& active = *it;
+
+        auto& [index, timer] = active.open.back();
+        const auto snapshot = timer.snapshot();
+        TraceNode<Key>& node = active.trace[index];
+        node.seconds = snapshot.total_seconds;
+        for (std::size_t phase = 0; phase < kResolvePhases; ++phase) {
+            node.phases[phase] = snapshot.sub_timer_seconds(static_cast<ResolvePhase>(phase));
+        }
+        active.open.pop_back();
+
+        if (active.open.empty()) {
+            ResolutionTrace<Key> finished = std::move(active.trace);
+            state.erase(it);
+            std::lock_guard lock(m_mutex);
+            m_traces.push_back(std::move(finished));
+        }
+    }
+
+    mutable std::mutex m_mutex;
+    std::vector<ResolutionTrace<Key>> m_traces;
+};
+
+} // namespace pygim::core
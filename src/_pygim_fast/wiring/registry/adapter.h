@@ -3,8 +3,13 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 
+#include <chrono>
+#include <cstdint>
+#include <functional>
 #include <string>
 #include <type_traits>
+#include <unordered_map>
+#include <utility>
 #include <variant>
 
 #include "core.h"
@@ -107,7 +112,8 @@ using RegistryT = core::RegistryCore<
     typename KeyPolicy::Eq,
     std::conditional_t<
         EnableHooks,
-        core::HooksBundle<typename KeyPolicy::key_type, Value, py::object>,
+        core::HooksBundle<typename KeyPolicy::key_type, Value, py::object,
+                          typename KeyPolicy::Hash, typename KeyPolicy::Eq>,
         core::NoHooks<typename KeyPolicy::key_type, Value, py::object>>,
     py::object>;
 
@@ -144,6 +150,85 @@ class Registry {
     std::variant<R_QN_No, R_QN_Yes, R_ID_No, R_ID_Yes> m_var;
     KeyPolicyKind m_policy;
     bool m_hooks;
+    // While frozen: bare-object key -> core slot, so repeat lookups skip key
+    // construction (the qualname string build) entirely. Like m_dispatch's,
+    // the watcher is a weakref that drops the entry when its object dies, so
+    // the cache pins nothing (e.g. throwaway classes sharing a qualname) and
+    // no entry outlives its address. Objects without weakref support are not
+    // cached.
+    struct SlotEntry {
+        py::object watcher;
+        std::size_t slot;
+    };
+    std::unordered_map<PyObject*, SlotEntry> m_slot_cache;
+
+    // dispatch(): concrete type -> entry of its most specific registered
+    // base (a null key caches "no base registered"). The watcher is a
+    // weakref whose callback drops the entry, so the cache does not keep
+    // dynamically created classes alive; it dies with the cache, so no
+    // callback can outlive this Registry. Cleared on every registration.
+    struct DispatchEntry {
+        py::object watcher;
+        const void* key;  //!< `R::key_type*` of the active variant alternative
+        Value* value;
+    };
+    std::unordered_map<PyObject*, DispatchEntry> m_dispatch;
+
+    /**
+     * \brief Find the most specific registered base of `cls` (MRO order).
+     * \tparam R Concrete registry instantiation selected by variant.
+     * \param[in,out] reg Registry core.
+     * \param[in] cls Python type whose `__mro__` is walked.
+     * \return Cache entry; `key` is null when neither `cls` nor a base is registered.
+     */
+    template<class R>
+    DispatchEntry resolve_dispatch(R& reg, py::handle cls) {
+        PyObject* mro = reinterpret_cast<PyTypeObject*>(cls.ptr())->tp_mro;
+        DispatchEntry entry{watch(cls, m_dispatch), nullptr, nullptr};
+        for (Py_ssize_t i = 0; mro && i < PyTuple_GET_SIZE(mro); ++i) {
+            auto base = py::reinterpret_borrow<py::object>(PyTuple_GET_ITEM(mro, i));
+            auto [key, value] = reg.find_entry(make_key<R>(base));
+            if (key) {
+                entry.key = key;
+                entry.value = value;
+                break;
+            }
+        }
+        return entry;
+    }
+
+    // A weakref to `obj` whose callback erases its entry from `cache`.
+    template<class Cache>
+    static py::object watch(py::handle obj, Cache& cache) {
+        PyObject* ptr = obj.ptr();
+        return py::weakref(obj, py::cpp_function([&cache, ptr](py::handle) { cache.erase(ptr); }));
+    }
+
+    /**
+     * \brief Frozen-path lookup through the per-object slot cache.
+     * \tparam R Concrete registry instantiation selected by variant.
+     * \param[in,out] reg Frozen registry core.
+     * \param[in] key Python key in any accepted form.
+     * \return Pointer to value (pre hooks already run), or `nullptr` if absent.
+     * \note Only bare, weak-referenceable objects are cached; other keys probe the frozen index.
+     */
+    template<class R>
+    typename R::value_type* find_frozen(R& reg, const py::object& key) {
+        const bool bare = !PyTuple_Check(key.ptr()) && !PyUnicode_Check(key.ptr());
+        if (bare) {
+            if (auto it = m_slot_cache.find(key.ptr()); it != m_slot_cache.end()) {
+                return reg.try_get_slot(it->second.slot);
+            }
+        }
+        auto slot = reg.find_slot(make_key<R>(key));
+        if (!slot) {
+            return nullptr;
+        }
+        if (bare && PyType_SUPPORTS_WEAKREFS(Py_TYPE(key.ptr()))) {
+            m_slot_cache.emplace(key.ptr(), SlotEntry{watch(key, m_slot_cache), *slot});
+        }
+        return reg.try_get_slot(*slot);
+    }
 
     /**
      * \brief Normalize Python-facing key input to policy key type.
@@ -192,6 +277,60 @@ class Registry {
         }
     }
 
+    /**
+     * \brief Call `fn(key, value)` for each item of a mapping or `(key, value)` iterable.
+     * \param[in] entries Mapping or iterable of pairs.
+     * \param[in] api Method name for the error message.
+     * \param[in] fn Callback receiving the raw Python key and value.
+     * \throws py::type_error When an item is not a `(key, value)` pair.
+     */
+    template<class Fn>
+    static void for_each_pair(const py::object& entries, const char* api, Fn&& fn) {
+        py::object items = py::isinstance<py::dict>(entries) ? entries.attr("items")() : entries;
+        for (py::handle item : items) {
+            if ((!py::isinstance<py::tuple>(item) && !py::isinstance<py::list>(item)) || py::len(item) != 2) {
+                throw py::type_error(std::string(api) + "() expects a mapping or (key, value) pairs");
+            }
+            auto pair = py::reinterpret_borrow<py::sequence>(item);
+            fn(pair[0], pair[1]);
+        }
+    }
+
+    /**
+     * \brief Build the native key filter for a hook subscription.
+     * \tparam R Concrete registry instantiation selected by variant.
+     * \param[in] key Exact key (any accepted form), or None.
+     * \param[in] prefix Qualname id prefix, or None.
+     * \return Filter predicate; empty when both are None (hook sees every key).
+     * \throws py::type_error On both given, a non-str prefix, or a prefix under the identity policy.
+     */
+    template<class R>
+    static std::function<bool(const typename R::key_type&)> make_filter(const py::object& key, const py::object& prefix) {
+        using key_type = typename R::key_type;
+        if (!key.is_none() && !prefix.is_none()) {
+            throw py::type_error("Pass either key or prefix, not both");
+        }
+        if (!key.is_none()) {
+            // `key` rides along so an identity key's object outlives the filter.
+            return [wanted = make_key<R>(key), owner = key](const key_type& other) {
+                return typename R::key_equal{}(wanted, other);
+            };
+        }
+        if (!prefix.is_none()) {
+            if (!py::isinstance<py::str>(prefix)) {
+                throw py::type_error("prefix must be str or None");
+            }
+            if constexpr (std::is_same_v<key_type, QualnameKeyPolicy::key_type>) {
+                return [wanted = prefix.cast<std::string>()](const key_type& other) {
+                    return other.id.starts_with(wanted);
+                };
+            } else {
+                throw py::type_error("prefix filters require the qualname policy");
+            }
+        }
+        return {};
+    }
+
 public:
     /**
      * \brief Construct registry adapter over selected policy/hook mode.
@@ -215,6 +354,7 @@ public:
     }
 
     void register_or_override(py::object key, py::object value, bool override_existing) {
+        m_dispatch.clear();
         std::visit(
             [&](auto& reg) {
                 using R = std::decay_t<decltype(reg)>;
@@ -227,7 +367,8 @@ public:
         return std::visit(
             [&](auto& reg) -> py::object {
                 using R = std::decay_t<decltype(reg)>;
-                if (auto* found = reg.try_get(make_key<R>(key))) {
+                auto* found = reg.frozen() ? find_frozen(reg, key) : reg.try_get(make_key<R>(key));
+                if (found) {
                     return *found;
                 }
                 throw std::runtime_error("Unknown registry key");
@@ -235,11 +376,103 @@ public:
             m_var);
     }
 
+    /**
+     * \brief Register many entries with one crossing.
+     * \param[in] entries Mapping, or iterable of `(key, value)` pairs; keys in any accepted form.
+     * \param[in] override_existing Same strict rule as register(), applied to every entry.
+     * \return void.
+     * \throws std::runtime_error On a duplicate/missing key; the registry is left unchanged.
+     * \throws py::type_error When an item is not a `(key, value)` pair.
+     */
+    void update(const py::object& entries, bool override_existing) {
+        m_dispatch.clear();
+        std::visit(
+            [&](auto& reg) {
+                using R = std::decay_t<decltype(reg)>;
+                std::vector<std::pair<typename R::key_type, Value>> batch;
+                batch.reserve(py::len_hint(entries));
+                for_each_pair(entries, "update", [&](py::object key, py::object value) {
+                    batch.emplace_back(make_key<R>(std::move(key)), std::move(value));
+                });
+                reg.register_many(std::move(batch), override_existing);
+            },
+            m_var);
+    }
+
+    /**
+     * \brief Look up many keys with one crossing.
+     * \param[in] keys Iterable of keys in any accepted form.
+     * \return List of values, in input order.
+     * \throws std::runtime_error On the first unknown key.
+     * \note Repeated key objects are resolved once per call (pre hooks still run
+     *       per lookup), so a column of a few distinct handlers builds each key once.
+     */
+    [[nodiscard]] py::list get_many(const py::iterable& keys) {
+        return std::visit(
+            [&](auto& reg) {
+                using R = std::decay_t<decltype(reg)>;
+                using Handle = std::pair<const typename R::key_type*, Value*>;
+                // The key object is held so its address stays unique for the call.
+                std::unordered_map<PyObject*, std::pair<py::object, Handle>> seen;
+                py::list values;
+                for (py::handle key : keys) {
+                    auto it = seen.find(key.ptr());
+                    if (it == seen.end()) {
+                        auto owned = py::reinterpret_borrow<py::object>(key);
+                        Handle handle = reg.find_entry(make_key<R>(owned));
+                        if (!handle.first) {
+                            throw std::runtime_error("Unknown registry key");
+                        }
+                        it = seen.emplace(key.ptr(), std::pair{std::move(owned), handle}).first;
+                    }
+                    const auto& [entry_key, value] = it->second.second;
+                    values.append(reg.access_entry(*entry_key, *value));
+                }
+                return values;
+            },
+            m_var);
+    }
+
+    /**
+     * \brief Look up the value registered for the most specific base of a type.
+     * \param[in] obj_or_type A type, or an instance whose type is used.
+     * \return Value registered (with the default variant) for the first class in
+     *         the type's `__mro__` that has one.
+     * \throws std::runtime_error When neither the type nor any base is registered.
+     * \note `functools.singledispatch`-style: after the first call per concrete type
+     *       the answer is memoised, so a dispatch is one pointer-keyed probe.
+     *       Virtual subclasses (`ABC.register`) are not consulted.
+     */
+    [[nodiscard]] py::object dispatch(const py::object& obj_or_type) {
+        py::handle cls = PyType_Check(obj_or_type.ptr())
+            ? py::handle(obj_or_type)
+            : py::handle(reinterpret_cast<PyObject*>(Py_TYPE(obj_or_type.ptr())));
+        return std::visit(
+            [&](auto& reg) -> py::object {
+                using R = std::decay_t<decltype(reg)>;
+                auto it = m_dispatch.find(cls.ptr());
+                if (it == m_dispatch.end()) {
+                    it = m_dispatch.emplace(cls.ptr(), resolve_dispatch(reg, cls)).first;
+                }
+                if (!it->second.key) {
+                    throw std::runtime_error(
+                        "No registry entry for type '" + py::str(cls.attr("__qualname__")).cast<std::string>()
+                        + "' or any of its bases");
+                }
+                return reg.access_entry(
+                    *static_cast<const typename R::key_type*>(it->second.key), *it->second.value);
+            },
+            m_var);
+    }
+
     [[nodiscard]] std::size_t size() const noexcept {
         return std::visit([](const auto& reg) { return reg.size(); }, m_var);
     }
 
     [[nodiscard]] bool contains(py::object key) const {
+        if (auto it = m_slot_cache.find(key.ptr()); it != m_slot_cache.end()) {
+            return true;
+        }
         return std::visit(
             [&](const auto& reg) {
                 using R = std::decay_t<decltype(reg)>;
@@ -248,6 +481,27 @@ public:
             m_var);
     }
 
+    /**
+     * \brief Freeze the registry for lookup-heavy steady state.
+     * \return void.
+     * \note Builds a perfect-hash index in core; afterwards a repeat lookup by
+     *       the same object is one pointer-keyed probe with no allocation.
+     *       Registration raises until unfreeze().
+     */
+    void freeze() {
+        std::visit([](auto& reg) { reg.freeze(); }, m_var);
+        m_slot_cache.clear();
+    }
+
+    void unfreeze() {
+        std::visit([](auto& reg) { reg.unfreeze(); }, m_var);
+        m_slot_cache.clear();
+    }
+
+    [[nodiscard]] bool frozen() const noexcept {
+        return std::visit([](const auto& reg) { return reg.frozen(); }, m_var);
+    }
+
     void post(py::object key, py::object value) {
         std::visit(
             [&](auto& reg) {
@@ -257,32 +511,126 @@ public:
             m_var);
     }
 
-    void on_register(std::function<void(py::object, py::object)> fn) {
+    /**
+     * \brief Invoke post hooks for many keys with one crossing.
+     * \param[in] entries Mapping or iterable of `(key, payload)` pairs.
+     * \return void.
+     * \note No-op (beyond key parsing) if hooks are disabled.
+     */
+    void post_many(const py::object& entries) {
         std::visit(
             [&](auto& reg) {
+                using R = std::decay_t<decltype(reg)>;
+                for_each_pair(entries, "post_many", [&](py::object key, const py::object& payload) {
+                    reg.post(make_key<R>(std::move(key)), payload);
+                });
+            },
+            m_var);
+    }
+
+    // Hook subscriptions: `key` / `prefix` filters are checked natively, so
+    // the (id, name) tuple and the Python call only happen for matching keys.
+    void on_register(std::function<void(py::object, py::object)> fn, py::object key, py::object prefix) {
+        std::visit(
+            [&](auto& reg) {
+                using R = std::decay_t<decltype(reg)>;
                 reg.add_on_register([fn = std::move(fn)](const auto& key, const auto& value) {
                     fn(detail::to_py_tuple(key), value);
-                });
+                }, make_filter<R>(key, prefix));
             },
             m_var);
     }
 
-    void on_pre(std::function<void(py::object, py::object)> fn) {
+    void on_pre(std::function<void(py::object, py::object)> fn, py::object key, py::object prefix) {
         std::visit(
             [&](auto& reg) {
+                using R = std::decay_t<decltype(reg)>;
                 reg.add_on_pre([fn = std::move(fn)](const auto& key, auto& value) {
                     fn(detail::to_py_tuple(key), value);
-                });
+                }, make_filter<R>(key, prefix));
             },
             m_var);
     }
 
-    void on_post(std::function<void(py::object, py::object)> fn) {
+    void on_post(std::function<void(py::object, py::object)> fn, py::object key, py::object prefix) {
         std::visit(
             [&](auto& reg) {
+                using R = std::decay_t<decltype(reg)>;
                 reg.add_on_post([fn = std::move(fn)](const auto& key, const py::object& payload) {
                     fn(detail::to_py_tuple(key), payload);
-                });
+                }, make_filter<R>(key, prefix));
+            },
+            m_var);
+    }
+
+    /**
+     * \brief Start native hook instrumentation, replacing any previous stats.
+     * \param[in] timing Also time the subscribed Python callbacks per event kind.
+     * \return void.
+     * \throws std::runtime_error If the registry was created with hooks=False.
+     * \note Counting happens in C++: no Python call per event.
+     */
+    void enable_stats(bool timing) {
+        std::visit(
+            [&](auto& reg) {
+                if constexpr (std::decay_t<decltype(reg.hooks())>::enabled) {
+                    reg.hooks().enable_stats(timing);
+                } else {
+                    throw std::runtime_error("Hook stats require hooks=True");
+                }
+            },
+            m_var);
+    }
+
+    void disable_stats() {
+        std::visit(
+            [](auto& reg) {
+                if constexpr (std::decay_t<decltype(reg.hooks())>::enabled) {
+                    reg.hooks().disable_stats();
+                }
+            },
+            m_var);
+    }
+
+    /**
+     * \brief Snapshot native hook stats.
+     * \return `None` when disabled, else `{"totals": {event: n}, "per_key": {key: {event: n}},
+     *         "callback_seconds": {event: s} | None}`.
+     * \note Posts for unregistered keys only count towards the totals.
+     */
+    [[nodiscard]] py::object stats() const {
+        return std::visit(
+            [](const auto& reg) -> py::object {
+                if constexpr (std::decay_t<decltype(reg.hooks())>::enabled) {
+                    const auto& stats = reg.hooks().stats;
+                    if (!stats) {
+                        return py::none();
+                    }
+                    auto by_event = [](const auto& values, auto&& convert) {
+                        py::dict out;
+                        for (std::size_t event = 0; event < core::kHookEvents; ++event) {
+                            out[py::str(std::string(core::hook_event_name(static_cast<core::HookEvent>(event))))] =
+                                convert(values[event]);
+                        }
+                        return out;
+                    };
+                    auto as_int = [](std::uint64_t n) { return py::int_(n); };
+                    py::dict per_key;
+                    for (const auto& [key, counts] : stats->per_key) {
+                        per_key[detail::to_py_tuple(key)] = by_event(counts, as_int);
+                    }
+                    py::dict result;
+                    result["totals"] = by_event(stats->totals, as_int);
+                    result["per_key"] = std::move(per_key);
+                    result["callback_seconds"] = stats->timing
+                        ? py::object(by_event(stats->callback_time, [](std::chrono::nanoseconds ns) {
+                              return py::float_(std::chrono::duration<double>(ns).count());
+                          }))
+                        : py::none();
+                    return result;
+                } else {
+                    return py::none();
+                }
             },
             m_var);
     }
@@ -339,7 +687,7 @@ public:
     [[nodiscard]] std::string repr() const {
         return "Registry(policy=" + std::string(m_policy == KeyPolicyKind::Qualname ? "qualname" : "identity") +
                ", hooks=" + std::string(m_hooks ? "True" : "False") +
-               ", size=" + std::to_string(size()) + ")";
+               ", size=" + std::to_string(size()) + (frozen() ? ", frozen=True" : "") + ")";
     }
 };
 
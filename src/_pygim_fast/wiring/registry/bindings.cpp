@@ -50,15 +50,63 @@ PYBIND11_MODULE(registry, m) {
              "Returns a wrapper that registers the decorated object then returns it.\n"
              "Enforces same override rules as direct call.")
         .def("get", &pygim::Registry::get, py::arg("key"))
+        .def("update", &pygim::Registry::update,
+             py::arg("entries"),
+             py::kw_only(),
+             py::arg("override") = false,
+             "Register many entries at once from a mapping or (key, value) pairs.\n\n"
+             "Same override rules as register(), checked for the whole batch before\n"
+             "anything is stored (duplicates within the batch count too). Capacity is\n"
+             "reserved once and register hooks run in a single pass.")
+        .def("get_many", &pygim::Registry::get_many, py::arg("keys"),
+             "Return the values for an iterable of keys, in order.\n\n"
+             "Raises RuntimeError on the first unknown key. Repeated key objects are\n"
+             "resolved once per call.")
         .def("post",
              &pygim::Registry::post,
              py::arg("key"),
              py::arg("value"),
              "Invoke post hooks for a key with an arbitrary Python object.\n\n"
              "No-op if hooks are disabled.")
-        .def("on_register", &pygim::Registry::on_register)
-        .def("on_pre", &pygim::Registry::on_pre)
-        .def("on_post", &pygim::Registry::on_post)
+        .def("post_many",
+             &pygim::Registry::post_many,
+             py::arg("entries"),
+             "Invoke post hooks for a mapping or iterable of (key, payload) pairs.\n\n"
+             "No-op if hooks are disabled.")
+        .def("on_register", &pygim::Registry::on_register,
+             py::arg("fn"), py::kw_only(), py::arg("key") = py::none(), py::arg("prefix") = py::none(),
+             "Subscribe fn(key, value) to registrations.\n\n"
+             "`key` limits the hook to one key; `prefix` (qualname policy) to ids\n"
+             "starting with it. Filters are checked natively before any Python call.")
+        .def("on_pre", &pygim::Registry::on_pre,
+             py::arg("fn"), py::kw_only(), py::arg("key") = py::none(), py::arg("prefix") = py::none(),
+             "Subscribe fn(key, value) to lookups; same filters as on_register.")
+        .def("on_post", &pygim::Registry::on_post,
+             py::arg("fn"), py::kw_only(), py::arg("key") = py::none(), py::arg("prefix") = py::none(),
+             "Subscribe fn(key, payload) to post(); same filters as on_register.")
+        .def("enable_stats", &pygim::Registry::enable_stats,
+             py::kw_only(), py::arg("timing") = false,
+             "Count register/pre/post events natively, in total and per key.\n\n"
+             "Posts for keys that are not registered only count towards the totals.\n"
+             "With timing=True also accumulate the time spent in subscribed callbacks.\n"
+             "Requires hooks=True; calling again resets the counters.")
+        .def("disable_stats", &pygim::Registry::disable_stats)
+        .def("stats", &pygim::Registry::stats,
+             "Return native hook stats ({totals, per_key, callback_seconds}) or None.")
+        .def("dispatch", &pygim::Registry::dispatch, py::arg("obj_or_type"),
+             "Return the value registered for the most specific base of a type.\n\n"
+             "Accepts a type or an instance (its type is used) and walks the MRO,\n"
+             "like functools.singledispatch. The result is memoised per concrete\n"
+             "type until the next registration. Raises RuntimeError when no base\n"
+             "is registered; register `object` for a fallback.")
+        .def("freeze", &pygim::Registry::freeze,
+             "Freeze the key set for fast lookups.\n\n"
+             "Builds a perfect-hash index over the current keys; repeat lookups by\n"
+             "the same object then skip key construction. register() and item\n"
+             "assignment raise RuntimeError until unfreeze().")
+        .def("unfreeze", &pygim::Registry::unfreeze,
+             "Drop the frozen index and allow registration again.")
+        .def_property_readonly("frozen", &pygim::Registry::frozen)
         .def("registered_keys", &pygim::Registry::registered_keys,
              "Return list of (id_or_object, name) for all registered entries.")
         .def("find_id", &pygim::Registry::find_id, py::arg("id"), py::arg("name") = py::none(),
@@ -1,9 +1,17 @@
 #pragma once
 
+#include <algorithm>
+#include <array>
+#include <chrono>
+#include <cstdint>
 #include <functional>
+#include <numeric>
+#include <optional>
 #include <ranges>
 #include <stdexcept>
+#include <string_view>
 #include <unordered_map>
+#include <unordered_set>
 #include <utility>
 #include <vector>
 
@@ -13,22 +21,80 @@ namespace pygim::core {
  * HooksBundle and NoHooks are policy types consumed by RegistryCore.
  *
  * - HooksBundle stores user-provided callbacks and executes them on lifecycle events.
+ *   A callback may carry a key filter; it is checked in C++ before the callback
+ *   runs, so subscribers to a few keys cost nothing on the others.
+ * - HooksBundle can also keep native HookStats (event counts per key, optionally
+ *   time spent in the callbacks) without calling out of C++.
  * - NoHooks provides the same API surface but compiles to no-ops.
  *
  * Usage example:
- *   using Hooks = HooksBundle<MyKey, MyValue, MyPostPayload>;
+ *   using Hooks = HooksBundle<MyKey, MyValue, MyPostPayload, MyHash, MyEq>;
  *   Hooks hooks;
  *   hooks.add_on_register([](const MyKey&, const MyValue&) {});
+ *   hooks.add_on_pre([](const MyKey&, MyValue&) {}, [](const MyKey& k) { return is_hot(k); });
+ *   hooks.enable_stats(true);
  */
-template<class K, class V, class PostArg>
+enum class HookEvent : std::size_t { Register, Pre, Post, COUNT };
+
+inline constexpr std::size_t kHookEvents = static_cast<std::size_t>(HookEvent::COUNT);
+
+[[nodiscard]] constexpr std::string_view hook_event_name(HookEvent event) noexcept {
+    switch (event) {
+        case HookEvent::Register: return "register";
+        case HookEvent::Pre:      return "pre";
+        case HookEvent::Post:     return "post";
+        case HookEvent::COUNT:    break;
+    }
+    return "?";
+}
+
+static_assert(hook_event_name(HookEvent::Pre) == "pre");
+
+/*
+ * HookStats holds native hook instrumentation: how often each event fired
+ * (in total and per registered key) and, with timing on, how long the
+ * subscribed callbacks took per event kind. Posts for keys that are not
+ * registered only count towards the totals, so `per_key` never outgrows the
+ * registry (or refers to a key object the registry does not know about).
+ */
+template<class K, class Hash, class Eq>
+struct HookStats {
+    using Counts = std::array<std::uint64_t, kHookEvents>;
+
+    std::unordered_map<K, Counts, Hash, Eq> per_key;
+    Counts totals{};
+    std::array<std::chrono::nanoseconds, kHookEvents> callback_time{};
+    bool timing{false};
+
+    void count(HookEvent event, const K* key) {
+        const auto index = static_cast<std::size_t>(event);
+        ++totals[index];
+        if (key) {
+            ++per_key[*key][index];
+        }
+    }
+};
+
+template<class K, class V, class PostArg, class Hash = std::hash<K>, class Eq = std::equal_to<K>>
 struct HooksBundle {
+    static constexpr bool enabled = true;
+
     using OnRegister = std::function<void(const K&, const V&)>;
     using OnPre = std::function<void(const K&, V&)>;
     using OnPost = std::function<void(const K&, const PostArg&)>;
+    using KeyFilter = std::function<bool(const K&)>;  //!< empty: every key
+    using Stats = HookStats<K, Hash, Eq>;
+
+    template<class Fn>
+    struct Subscription {
+        Fn fn;
+        KeyFilter filter;
+    };
 
-    std::vector<OnRegister> on_register;
-    std::vector<OnPre> on_pre;
-    std::vector<OnPost> on_post;
+    std::vector<Subscription<OnRegister>> on_register;
+    std::vector<Subscription<OnPre>> on_pre;
+    std::vector<Subscription<OnPost>> on_post;
+    std::optional<Stats> stats;
 
     /**
      * \brief Execute all register hooks for key/value.
@@ -37,7 +103,7 @@ struct HooksBundle {
      * \return void.
      * \note Exists to centralize lifecycle notification behavior.
      */
-    void run_register(const K& key, const V& value) { for (auto& hook : on_register) hook(key, value); }
+    void run_register(const K& key, const V& value) { run(HookEvent::Register, on_register, key, value); }
     /**
      * \brief Execute pre-access hooks before mutable reads.
      * \param[in] key Lookup key.
@@ -45,38 +111,85 @@ struct HooksBundle {
      * \return void.
      * \note Exists to support instrumentation or lazy refresh paths.
      */
-    void run_pre(const K& key, V& value) { for (auto& hook : on_pre) hook(key, value); }
+    void run_pre(const K& key, V& value) { run(HookEvent::Pre, on_pre, key, value); }
     /**
      * \brief Execute post hooks with user payload.
      * \param[in] key Target key.
      * \param[in] payload Post-event payload.
+     * \param[in] registered Whether `key` is stored; only then is it counted per key.
      * \return void.
      * \note Exists for out-of-band notifications after core operations.
      */
-    void run_post(const K& key, const PostArg& payload) { for (auto& hook : on_post) hook(key, payload); }
+    void run_post(const K& key, const PostArg& payload, bool registered) {
+        run(HookEvent::Post, on_post, key, payload, registered);
+    }
 
     /**
      * \brief Add register-phase callback.
      * \param[in] hook Callback accepting `(key, value)`.
+     * \param[in] filter Optional key predicate; the hook only runs where it holds.
      * \return void.
      */
-    void add_on_register(OnRegister hook) { on_register.push_back(std::move(hook)); }
+    void add_on_register(OnRegister hook, KeyFilter filter = {}) {
+        on_register.push_back({std::move(hook), std::move(filter)});
+    }
     /**
      * \brief Add pre-access callback.
      * \param[in] hook Callback accepting `(key, value&)`.
+     * \param[in] filter Optional key predicate; the hook only runs where it holds.
      * \return void.
      */
-    void add_on_pre(OnPre hook) { on_pre.push_back(std::move(hook)); }
+    void add_on_pre(OnPre hook, KeyFilter filter = {}) {
+        on_pre.push_back({std::move(hook), std::move(filter)});
+    }
     /**
      * \brief Add post callback.
      * \param[in] hook Callback accepting `(key, payload)`.
+     * \param[in] filter Optional key predicate; the hook only runs where it holds.
+     * \return void.
+     */
+    void add_on_post(OnPost hook, KeyFilter filter = {}) {
+        on_post.push_back({std::move(hook), std::move(filter)});
+    }
+
+    /**
+     * \brief Start (or restart) native event counting.
+     * \param[in] timing Also accumulate the time spent in subscribed callbacks.
      * \return void.
+     * \note Exists for instrumentation that must not call back into the host language.
      */
-    void add_on_post(OnPost hook) { on_post.push_back(std::move(hook)); }
+    void enable_stats(bool timing) { stats.emplace().timing = timing; }
+
+    void disable_stats() noexcept { stats.reset(); }
+
+private:
+    // Counts after the callbacks, so an event whose hook throws (e.g. a
+    // register that is then not stored) is not counted; `stats` is re-checked
+    // since a callback may disable or restart it.
+    template<class Subscriptions, class Value>
+    void run(HookEvent event, Subscriptions& subscriptions, const K& key, Value& value, bool keyed = true) {
+        const bool timed = stats && stats->timing && !subscriptions.empty();
+        const auto started = timed ? std::chrono::steady_clock::now() : std::chrono::steady_clock::time_point{};
+        for (auto& hook : subscriptions) {
+            if (!hook.filter || hook.filter(key)) {
+                hook.fn(key, value);
+            }
+        }
+        if (!stats) {
+            return;
+        }
+        if (timed && stats->timing) {
+            stats->callback_time[static_cast<std::size_t>(event)] += std::chrono::duration_cast<std::chrono::nanoseconds>(
+                std::chrono::steady_clock::now() - started);
+        }
+        stats->count(event, keyed ? &key : nullptr);
+    }
 };
 
 template<class K, class V, class PostArg>
 struct NoHooks {
+    static constexpr bool enabled = false;
+
     template<class... Args>
     void run_register(Args&&...) {}
 
@@ -86,14 +199,135 @@ struct NoHooks {
     template<class... Args>
     void run_post(Args&&...) {}
 
-    template<class F>
-    void add_on_register(F&&) {}
+    template<class... F>
+    void add_on_register(F&&...) {}
 
-    template<class F>
-    void add_on_pre(F&&) {}
+    template<class... F>
+    void add_on_pre(F&&...) {}
 
-    template<class F>
-    void add_on_post(F&&) {}
+    template<class... F>
+    void add_on_post(F&&...) {}
+};
+
+/*
+ * PerfectHashIndex is an immutable key -> entry index with no collisions
+ * (hash-and-displace). Keys are grouped into buckets by one mix of their
+ * hash, then each bucket, largest first, gets the first seed that places
+ * all of its keys in free slots. A lookup is one key hash, two mixes and a
+ * single key comparison: no probing and no allocation.
+ *
+ * Entries keep their construction order, so `find()` returns a stable
+ * entry index the caller can cache.
+ *
+ * Usage example:
+ *   PerfectHashIndex<MyKey, MyValue*, MyHash, MyEq> index(std::move(entries));
+ *   if (auto at = index.find(key)) use(index.entry(*at).second);
+ */
+template<class Key, class Mapped, class Hash, class Eq>
+class PerfectHashIndex {
+public:
+    using entry_type = std::pair<Key, Mapped>;
+
+    PerfectHashIndex() = default;
+
+    /**
+     * \brief Build the index over a fixed set of distinct keys.
+     * \param[in] entries Key/mapped pairs; keys must be unique under `Eq`.
+     * \throws std::runtime_error When two keys share a full hash value (no seed can split them).
+     */
+    explicit PerfectHashIndex(std::vector<entry_type> entries) : m_entries(std::move(entries)) {
+        const std::size_t n = m_entries.size();
+        if (n == 0) {
+            return;
+        }
+        // 0.8 load keeps the seed search short even for the last buckets.
+        m_slots.assign(n + n / 4 + 1, kEmpty);
+        m_seeds.assign(n / 2 + 1, 0);
+
+        std::vector<std::size_t> hashes(n);
+        std::vector<std::vector<std::size_t>> buckets(m_seeds.size());
+        for (std::size_t i = 0; i < n; ++i) {
+            hashes[i] = Hash{}(m_entries[i].first);
+            buckets[mix(hashes[i]) % buckets.size()].push_back(i);
+        }
+        std::vector<std::size_t> order(buckets.size());
+        std::iota(order.begin(), order.end(), std::size_t{0});
+        std::stable_sort(order.begin(), order.end(), [&](std::size_t a, std::size_t b) {
+            return buckets[a].size() > buckets[b].size();
+        });
+
+        std::vector<std::size_t> placed;
+        for (std::size_t bucket : order) {
+            const auto& members = buckets[bucket];
+            if (members.empty()) {
+                break;
+            }
+            for (std::uint64_t seed = 1;; ++seed) {
+                if (seed > kMaxSeed) {
+                    throw std::runtime_error("Cannot build perfect hash index: keys with identical hashes");
+                }
+                placed.clear();
+                for (std::size_t i : members) {
+                    const std::size_t slot = slot_of(hashes[i], seed);
+                    if (m_slots[slot] != kEmpty
+                        || std::find(placed.begin(), placed.end(), slot) != placed.end()) {
+                        break;
+                    }
+                    placed.push_back(slot);
+                }
+                if (placed.size() == members.size()) {
+                    for (std::size_t k = 0; k < members.size(); ++k) {
+                        m_slots[placed[k]] = members[k];
+                    }
+                    m_seeds[bucket] = seed;
+                    break;
+                }
+            }
+        }
+    }
+
+    /**
+     * \brief Find the entry index of `key`.
+     * \param[in] key Lookup key.
+     * \return Entry index, or `std::nullopt` when the key is not indexed.
+     */
+    [[nodiscard]] std::optional<std::size_t> find(const Key& key) const {
+        if (m_entries.empty()) {
+            return std::nullopt;
+        }
+        const std::size_t hash = Hash{}(key);
+        const std::size_t at = m_slots[slot_of(hash, m_seeds[mix(hash) % m_seeds.size()])];
+        if (at == kEmpty || !Eq{}(m_entries[at].first, key)) {
+            return std::nullopt;
+        }
+        return at;
+    }
+
+    [[nodiscard]] const entry_type& entry(std::size_t index) const { return m_entries[index]; }
+
+    [[nodiscard]] std::size_t size() const noexcept { return m_entries.size(); }
+
+private:
+    static constexpr std::size_t kEmpty = static_cast<std::size_t>(-1);
+    static constexpr std::uint64_t kMaxSeed = 1u << 20;
+
+    // splitmix64 finalizer: spreads std::hash values (identity for ints and
+    // pointers on common standard libraries) over all bits.
+    static constexpr std::uint64_t mix(std::uint64_t x) noexcept {
+        x ^= x >> 30;
+        x *= 0xbf58476d1ce4e5b9ULL;
+        x ^= x >> 27;
+        x *= 0x94d049bb133111ebULL;
+        return x ^ (x >> 31);
+    }
+
+    [[nodiscard]] std::size_t slot_of(std::size_t hash, std::uint64_t seed) const noexcept {
+        return static_cast<std::size_t>(mix(hash ^ (seed * 0x9e3779b97f4a7c15ULL)) % m_slots.size());
+    }
+
+    std::vector<entry_type> m_entries;
+    std::vector<std::size_t> m_slots;   // slot -> entry index (kEmpty when free)
+    std::vector<std::uint64_t> m_seeds; // bucket -> displacement seed
 };
 
 /*
@@ -104,6 +338,9 @@ struct NoHooks {
  * - register_or_override(key, value, true): replace only, missing -> error.
  * - try_get(key): mutable lookup, runs pre-hook policy.
  * - try_get_const(key): const lookup without pre-hook mutation path.
+ * - freeze(): build a PerfectHashIndex over the current entries; until
+ *   unfreeze(), every mutation throws and find_slot()/try_get_slot() serve
+ *   lookups by stable slot number.
  *
  * Usage example:
  *   using Core = RegistryCore<MyKey, MyValue, MyHash, MyEq,
@@ -117,6 +354,8 @@ class RegistryCore {
 public:
     using key_type = Key;
     using value_type = Value;
+    using hasher = Hash;
+    using key_equal = Eq;
 
     /**
      * \brief Pre-reserve storage to reduce rehashing during bulk inserts.
@@ -134,6 +373,7 @@ public:
      * \note Exists for raw insert behavior when caller controls duplicate policy externally.
      */
     void register_value(const key_type& key, value_type value) {
+        ensure_mutable();
         m_hooks.run_register(key, value);
         m_map.emplace(key, std::move(value));
     }
@@ -146,6 +386,7 @@ public:
      * \note Exists for explicit replace behavior independent of strict override checks.
      */
     void upsert_value(const key_type& key, value_type value) {
+        ensure_mutable();
         m_hooks.run_register(key, value);
         m_map.insert_or_assign(key, std::move(value));
     }
@@ -160,6 +401,7 @@ public:
      * \note Exists to enforce deterministic override behavior used by Python API contracts.
      */
     void register_or_override(const key_type& key, value_type value, bool override_existing) {
+        ensure_mutable();
         auto it = m_map.find(key);
         bool exists = (it != m_map.end());
         if (exists) {
@@ -178,6 +420,44 @@ public:
         register_value(key, std::move(value));
     }
 
+    /**
+     * \brief Insert-or-override a batch with strict semantics, validated up front.
+     * \param[in] entries Key/value pairs to store, in order.
+     * \param[in] override_existing `false` forbids duplicates (including within the
+     *            batch), `true` requires every key to exist (the last value wins).
+     * \return void.
+     * \throws std::runtime_error On the first invalid entry; nothing is stored then.
+     *         A register hook that throws also leaves the registry unchanged.
+     * \note Exists to amortise bulk registration: one capacity reservation, one
+     *       validation pass, the register hooks for every entry, then the stores
+     *       (so hooks see the registry as it was before the batch).
+     */
+    void register_many(std::vector<std::pair<key_type, value_type>> entries, bool override_existing) {
+        ensure_mutable();
+        if (override_existing) {
+            for (const auto& [key, value] : entries) {
+                if (!contains(key)) {
+                    throw std::runtime_error("override=True requires existing key");
+                }
+            }
+        } else {
+            std::unordered_set<key_type, Hash, Eq> batch;
+            batch.reserve(entries.size());
+            for (const auto& [key, value] : entries) {
+                if (contains(key) || !batch.insert(key).second) {
+                    throw std::runtime_error("Duplicate key registration (use override=True)");
+                }
+            }
+            m_map.reserve(m_map.size() + entries.size());
+        }
+        for (auto& [key, value] : entries) {
+            m_hooks.run_register(key, value);
+        }
+        for (auto& [key, value] : entries) {
+            m_map.insert_or_assign(std::move(key), std::move(value));
+        }
+    }
+
     /**
      * \brief Check key existence.
      * \param[in] key Key to test.
@@ -217,6 +497,78 @@ public:
         return &it->second;
     }
 
+    /**
+     * \brief Lookup a stable handle to the stored entry, without hooks.
+     * \param[in] key Key to find.
+     * \return `{key, value}` pointers into storage, or `{nullptr, nullptr}` if absent.
+     * \note Entries are never erased, map nodes never move and an override
+     *       assigns in place, so a handle stays valid for the registry's lifetime.
+     *       Exists for adapter-side memoisation (e.g. type dispatch).
+     */
+    [[nodiscard]] std::pair<const key_type*, value_type*> find_entry(const key_type& key) {
+        auto it = m_map.find(key);
+        if (it == m_map.end()) {
+            return {nullptr, nullptr};
+        }
+        return {&it->first, &it->second};
+    }
+
+    /**
+     * \brief Read an entry handle through the pre hooks.
+     * \param[in] key Key pointer from find_entry().
+     * \param[in,out] value Value pointer from find_entry().
+     * \return Reference to the (possibly hook-updated) value.
+     */
+    value_type& access_entry(const key_type& key, value_type& value) {
+        m_hooks.run_pre(key, value);
+        return value;
+    }
+
+    /**
+     * \brief Freeze the key set and build the perfect-hash slot index.
+     * \return void.
+     * \note Exists for read-mostly registries: slots stay valid (values live in
+     *       map nodes, which never move) until unfreeze(), so callers may cache them.
+     */
+    void freeze() {
+        std::vector<typename FrozenIndex::entry_type> entries;
+        entries.reserve(m_map.size());
+        for (auto& [key, value] : m_map) {
+            entries.emplace_back(key, &value);
+        }
+        m_frozen.emplace(std::move(entries));
+    }
+
+    /**
+     * \brief Drop the frozen index and allow mutation again.
+     * \return void.
+     * \note Invalidates every slot returned by find_slot().
+     */
+    void unfreeze() noexcept { m_frozen.reset(); }
+
+    [[nodiscard]] bool frozen() const noexcept { return m_frozen.has_value(); }
+
+    /**
+     * \brief Lookup slot number of key in the frozen index.
+     * \param[in] key Key to find.
+     * \return Slot, or `std::nullopt` if absent or the registry is not frozen.
+     */
+    [[nodiscard]] std::optional<std::size_t> find_slot(const key_type& key) const {
+        return m_frozen ? m_frozen->find(key) : std::nullopt;
+    }
+
+    /**
+     * \brief Lookup mutable value by frozen slot and trigger pre hooks.
+     * \param[in] slot Slot returned by find_slot() since the last freeze().
+     * \return Pointer to mutable value.
+     * \note Exists so adapters can cache slots per native key and skip key construction.
+     */
+    [[nodiscard]] value_type* try_get_slot(std::size_t slot) {
+        const auto& [key, value] = m_frozen->entry(slot);
+        m_hooks.run_pre(key, *value);
+        return value;
+    }
+
     /**
      * \brief Trigger post-phase hooks.
      * \param[in] key Target key.
@@ -225,7 +577,9 @@ public:
      * \note Exists so callers can emit post events independently of get/register APIs.
      */
     void post(const key_type& key, const PostArg& payload) {
-        m_hooks.run_post(key, payload);
+        if constexpr (HooksPolicy::enabled) {
+            m_hooks.run_post(key, payload, contains(key));
+        }
     }
 
     /**
@@ -249,32 +603,55 @@ public:
     /**
      * \brief Register callback for register lifecycle event.
      * \param[in] hook Callback `(key, value)`.
+     * \param[in] filter Optional key predicate limiting which keys fire the hook.
      * \return void.
      */
-    void add_on_register(std::function<void(const key_type&, const value_type&)> hook) {
-        m_hooks.add_on_register(std::move(hook));
+    void add_on_register(std::function<void(const key_type&, const value_type&)> hook,
+                         std::function<bool(const key_type&)> filter = {}) {
+        m_hooks.add_on_register(std::move(hook), std::move(filter));
     }
 
     /**
      * \brief Register callback for pre-access lifecycle event.
      * \param[in] hook Callback `(key, value&)`.
+     * \param[in] filter Optional key predicate limiting which keys fire the hook.
      * \return void.
      */
-    void add_on_pre(std::function<void(const key_type&, value_type&)> hook) {
-        m_hooks.add_on_pre(std::move(hook));
+    void add_on_pre(std::function<void(const key_type&, value_type&)> hook,
+                    std::function<bool(const key_type&)> filter = {}) {
+        m_hooks.add_on_pre(std::move(hook), std::move(filter));
     }
 
     /**
      * \brief Register callback for post lifecycle event.
      * \param[in] hook Callback `(key, payload)`.
+     * \param[in] filter Optional key predicate limiting which keys fire the hook.
      * \return void.
      */
-    void add_on_post(std::function<void(const key_type&, const PostArg&)> hook) {
-        m_hooks.add_on_post(std::move(hook));
+    void add_on_post(std::function<void(const key_type&, const PostArg&)> hook,
+                     std::function<bool(const key_type&)> filter = {}) {
+        m_hooks.add_on_post(std::move(hook), std::move(filter));
     }
 
+    /**
+     * \brief Access the hooks policy (e.g. its native HookStats).
+     * \return Hooks policy instance.
+     * \note `HooksPolicy::enabled` tells callers at compile time whether hooks exist.
+     */
+    [[nodiscard]] HooksPolicy& hooks() noexcept { return m_hooks; }
+    [[nodiscard]] const HooksPolicy& hooks() const noexcept { return m_hooks; }
+
 private:
+    using FrozenIndex = PerfectHashIndex<key_type, value_type*, Hash, Eq>;
+
+    void ensure_mutable() const {
+        if (m_frozen) {
+            throw std::runtime_error("Registry is frozen (call unfreeze() to modify)");
+        }
+    }
+
     std::unordered_map<key_type, value_type, Hash, Eq> m_map;
+    std::optional<FrozenIndex> m_frozen;
     [[no_unique_address]] HooksPolicy m_hooks;
 };
 
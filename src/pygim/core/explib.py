@@ -8,6 +8,8 @@ from _pygim._core._exceptions import (
     DispatchError,
     UnrecognizedTypeError,
     GimOptionError,
+    BroadcastError,
+    WarmUpError,
 )
 
 from _pygim._core._error_msgs import (
@@ -25,6 +27,8 @@ __all__ = [
     "EntangledMethodError",
     "ShaSumTargetNotFoundError",
     "UnrecognizedTypeError",
+    "BroadcastError",
+    "WarmUpError",
     "file_error_msg",
     "type_error_msg",
 ]
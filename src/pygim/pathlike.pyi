@@ -79,6 +79,8 @@ class file(os.PathLike[str]):
     def is_dir(self) -> bool: ...
     def is_symlink(self) -> bool: ...
     def size(self) -> int: ...
+    def disk_usage(self, *, workers: int = 0) -> tuple[int, int]:
+        """(bytes, files) of this file, or summed over the tree under this directory."""
 
     # -- directory traversal (results inherit the engine pin) --------------------
     def iterdir(self) -> list[file]: ...
@@ -174,6 +174,230 @@ def test_each_broadcast_over_builtin_iterables():
     assert each(range(3)).bit_length() == [0, 1, 2]
 
 
+class Slotted:
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def multiply(self, factor=2):
+        return self.value * factor
+
+
+class Delegating:
+    def __init__(self, value):
+        self.value = value
+
+    def __getattr__(self, name):
+        if name == "multiply":
+            return lambda factor=2: -self.value * factor
+        raise AttributeError(name)
+
+
+def test_type_cached_resolution_keeps_per_element_semantics():
+    """Per-type resolution still honours whatever each element would do.
+
+    Mixed types each resolve their own method; an instance attribute that
+    shadows a class method is called instead of the method; __getattr__ is
+    consulted for names the type lacks; keyword arguments reach unbound
+    calls on slotted types.
+    """
+    shadowed = Dummy(5)
+    shadowed.multiply = lambda factor=2: "shadowed"
+    mixed = [Dummy(1), Slotted(2), Delegating(3), shadowed, Slotted(4)]
+
+    assert each(mixed).multiply(factor=10) == [10, 20, -30, "shadowed", 40]
+    assert each(mixed).value == [1, 2, 3, 5, 4]
+    assert each(mixed, workers=2).multiply(3) == [3, 6, -9, "shadowed", 12]
+
+    with pytest.raises(AttributeError, match="'missing'"):
+        each([Slotted(1), Dummy(2)]).missing
+
+
+def test_eager_broadcast_over_generator_keeps_first_element():
+    """A generator probed by getattr must not lose the probed element.
+
+    Method mode used to consume the first element while deciding, then call
+    the method on the remaining ones only.
+    """
+    assert each(Dummy(i) for i in range(4)).multiply() == [0, 2, 4, 6]
+    assert each(Dummy(i) for i in range(3)).value == [0, 1, 2]
+
+
+def test_lazy_broadcast_streams_single_pass():
+    """lazy=True pulls the source as results are consumed, never twice.
+
+    The first element decides the mode; an endless generator works because
+    nothing is materialised, and chunk=N yields lists of up to N results.
+    """
+    import itertools
+
+    pulled = []
+
+    def source():
+        for i in itertools.count():
+            pulled.append(i)
+            yield Dummy(i)
+
+    results = each(source(), lazy=True).multiply(3)
+    assert pulled == [0]  # only the probed element so far
+    assert list(itertools.islice(results, 3)) == [0, 3, 6]
+    assert pulled == [0, 1, 2]
+
+    stream = (Dummy(i) for i in range(5))
+    assert list(each(stream, lazy=True, chunk=2).value) == [[0, 1], [2, 3], [4]]
+    assert list(each([], lazy=True).value) == []
+    assert list(each([], lazy=True).multiply(2)) == []
+
+    values = each([Dummy(1), object()], lazy=True).value
+    assert next(values) == 1
+    with pytest.raises(AttributeError, match="'value'"):
+        next(values)  # errors surface when the offending element is reached
+
+
+def test_lazy_broadcast_runs_chunks_in_parallel():
+    """With chunk=N, workers fan each chunk out; options are validated."""
+    import threading
+
+    barrier = threading.Barrier(3)
+    clients = (Client(i, barrier) for i in range(6))
+
+    assert list(each(clients, lazy=True, chunk=3, workers=3).fetch()) == [[0, 1, 2], [3, 4, 5]]
+
+    with pytest.raises(ValueError):
+        each([], chunk=2)
+    with pytest.raises(ValueError):
+        each([], lazy=True, workers=2)
+
+
+def test_gather_harvests_typed_columns_in_one_pass():
+    """gather() writes attributes straight into typed buffer columns.
+
+    One name gives one array, several give a tuple in name order; a
+    generator works because gather traverses its input once. Values that
+    do not fit the dtype raise instead of being truncated.
+    """
+    import array
+
+    from pygim.each import gather
+
+    dummies = [Dummy(i) for i in range(4)]
+
+    values = gather(dummies, "value")
+    assert isinstance(values, array.array) and values.typecode == "d"
+    assert values.tolist() == [0.0, 1.0, 2.0, 3.0]
+
+    as_int, again = gather((d for d in dummies), "value", "value", dtype=int)
+    assert as_int.tolist() == again.tolist() == [0, 1, 2, 3]
+    assert as_int.itemsize == 8
+    assert gather(dummies, "value", dtype=bool).tolist() == [0, 1, 1, 1]
+    assert gather([], "value", dtype="int32").tolist() == []
+    assert memoryview(gather(dummies, "value", dtype="float32")).format == "f"
+
+    with pytest.raises(AttributeError, match="'missing'"):
+        gather(dummies, "missing")
+    with pytest.raises(TypeError):
+        gather(dummies, "text")
+    with pytest.raises(OverflowError):
+        gather([Dummy(2**40)], "value", dtype="int32")
+    with pytest.raises(ValueError, match="unsupported dtype"):
+        gather(dummies, "value", dtype="complex64")
+
+
+class Client:
+    def __init__(self, ident, barrier=None):
+        self.ident = ident
+        self.barrier = barrier
+
+    def fetch(self):
+        if self.barrier is not None:
+            self.barrier.wait(timeout=5)
+        return self.ident
+
+    def flaky(self):
+        if self.ident % 2:
+            raise ValueError(self.ident)
+        return self.ident
+
+    async def afetch(self):
+        import asyncio
+
+        await asyncio.sleep(0)
+        return self.ident * 10
+
+
+def test_parallel_broadcast_overlaps_calls_and_keeps_order():
+    """workers=N runs element calls concurrently, results in input order.
+
+    Every call blocks on a barrier that only opens once all of them are
+    in flight, so a sequential fan-out would time out instead of passing.
+    """
+    import threading
+
+    barrier = threading.Barrier(4)
+    clients = [Client(i, barrier) for i in range(4)]
+
+    assert each(clients, workers=4).fetch() == [0, 1, 2, 3]
+    assert each([Client(i) for i in range(10)], workers=0).fetch() == list(range(10))
+    assert each([], workers=4).fetch is None
+
+
+def test_parallel_broadcast_over_many_element_types():
+    """Slots resolved for one type stay valid while later types are added."""
+
+    def make(tag):
+        class Item:
+            __slots__ = ("value",)
+
+            def __init__(self, value):
+                self.value = value
+
+            def m(self):
+                return (tag, self.value)
+
+        return Item
+
+    types = [make(tag) for tag in range(40)]
+    items = [cls(i) for i in range(50) for cls in types]
+    expected = [item.m() for item in items]
+
+    assert each(items, workers=4).m() == expected
+    chunks = each(iter(items), workers=4, lazy=True, chunk=300).m()
+    assert [result for chunk in chunks for result in chunk] == expected
+
+
+def test_parallel_broadcast_aggregates_every_failure():
+    """All element calls run; every failure is raised in one BroadcastError."""
+    from pygim.core.explib import BroadcastError
+
+    with pytest.raises(BroadcastError) as info:
+        each([Client(i) for i in range(6)], workers=3).flaky()
+
+    assert [str(e) for e in info.value.exceptions] == ["1", "3", "5"]
+    assert all(isinstance(e, ValueError) for e in info.value.exceptions)
+
+
+def test_parallel_broadcast_gathers_coroutines():
+    """Async element methods are gathered; the broadcast returns an awaitable."""
+    import asyncio
+
+    awaitable = each([Client(i) for i in range(3)], workers=0).afetch()
+
+    assert asyncio.run(awaitable) == [0, 10, 20]
+
+
+def test_sequential_broadcast_returns_coroutines_unawaited():
+    """workers=1 never gathers: the caller gets the coroutines to await."""
+    import asyncio
+
+    async def main():
+        coroutines = each([Client(i) for i in range(3)]).afetch()
+        assert isinstance(coroutines, list) and all(asyncio.iscoroutine(c) for c in coroutines)
+        return await asyncio.gather(*coroutines)
+
+    assert asyncio.run(main()) == [0, 10, 20]
+
+
 if __name__ == "__main__":
     from pygim.core.testing import run_tests
 
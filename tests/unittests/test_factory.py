@@ -128,6 +128,410 @@ def test_use_module_failure(factory):
         factory.use_module("definitely_not_a_module_123")
 
 
+
+def test_create_many(dummy_interface, dummy_impl):
+    """create_many() calls the creator once per kwargs mapping and validates each product."""
+    import types
+
+    factory = Factory(dummy_interface)
+    factory.register("impl", dummy_impl)
+    factory.register("bad", lambda x: x)
+
+    products = factory.create_many("impl", [{"x": 1}, types.MappingProxyType({"x": 2})])
+    assert [p.x for p in products] == [1, 2]
+    assert factory.create_many("impl", iter([])) == []
+
+    with pytest.raises(RuntimeError, match="interface"):
+        factory.create_many("bad", [{"x": 1}])
+    with pytest.raises(RuntimeError, match="Unknown creator"):
+        factory.create_many("missing", [{}])
+    with pytest.raises(TypeError, match="keyword-argument mappings"):
+        factory.create_many("impl", [[("x", 1)]])
+    with pytest.raises(TypeError):
+        factory.create_many("impl", [{"y": 1}])  # the creator's own error propagates
+
+
+@pytest.fixture
+def plugin_module(tmp_path, monkeypatch):
+    """A throwaway importable module, removed from sys.modules afterwards."""
+    import sys
+
+    name = "pygim_test_lazy_plugin"
+    (tmp_path / f"{name}.py").write_text(
+        "class Shapes:\n"
+        "    @staticmethod\n"
+        "    def circle(radius=1):\n"
+        "        return ('circle', radius)\n"
+        "\n"
+        "def square(side=1):\n"
+        "    return ('square', side)\n"
+        "\n"
+        "class Builder:\n"
+        "    def make(self):\n"
+        "        return 'made'\n"
+        "\n"
+        "    @classmethod\n"
+        "    def build(cls):\n"
+        "        return cls.__name__\n"
+        "\n"
+        "NOT_CALLABLE = 42\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, name, raising=False)
+    yield name
+    sys.modules.pop(name, None)
+
+
+def test_register_lazy_defers_import(factory, plugin_module):
+    """A lazy entry imports its module on first use and then keeps the creator."""
+    import sys
+
+    factory.register_lazy("square", f"{plugin_module}:square")
+    factory.register_lazy("circle", f"{plugin_module}:Shapes.circle")
+    assert plugin_module not in sys.modules
+    assert factory.is_pending("square")
+    assert set(factory.registered_callables()) == {"square", "circle"}
+
+    assert factory.create("square", side=3) == ("square", 3)
+    assert plugin_module in sys.modules
+    assert not factory.is_pending("square")
+    assert factory["circle"]() == ("circle", 1)
+
+    with pytest.raises(RuntimeError, match="Duplicate"):
+        factory.register_lazy("square", f"{plugin_module}:square")
+
+
+def test_register_lazy_errors(factory, plugin_module):
+    with pytest.raises(ValueError, match="module:attr"):
+        factory.register_lazy("bad", "no_colon_here")
+
+    factory.register_lazy("value", f"{plugin_module}:NOT_CALLABLE")
+    with pytest.raises(TypeError, match="not callable"):
+        factory.create("value")
+
+    factory.register_lazy("missing", "definitely_not_a_module_123:make")
+    with pytest.raises(ModuleNotFoundError):
+        factory.create("missing")
+    assert factory.is_pending("missing")  # a failed import leaves the entry lazy
+
+
+def test_lazy_entry_filled_by_module_registration(factory, tmp_path, monkeypatch):
+    """Importing a plugin that registers its own name fulfils the lazy entry."""
+    import builtins
+    import sys
+
+    name = "pygim_test_self_registering"
+    (tmp_path / f"{name}.py").write_text(
+        "import builtins\n"
+        "factory = builtins._pygim_test_factory\n"
+        "\n"
+        "@factory.register('widget')\n"
+        "def widget():\n"
+        "    return 'widget'\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(builtins, "_pygim_test_factory", factory, raising=False)
+    factory.register_lazy("widget", f"{name}:widget")
+    try:
+        assert factory.create("widget") == "widget"
+    finally:
+        sys.modules.pop(name, None)
+
+
+def test_manifest_round_trip(factory, plugin_module, tmp_path):
+    import json
+    import sys
+
+    factory.register_lazy("square", f"{plugin_module}:square")
+    factory.register("dumps", json.dumps)
+    factory.register("anonymous", lambda: None)
+
+    manifest = factory.manifest()
+    assert manifest == {"square": f"{plugin_module}:square", "dumps": "json:dumps"}
+
+    path = tmp_path / "plugins.json"
+    factory.save_manifest(path)
+    assert json.loads(path.read_text()) == manifest
+
+    restored = Factory()
+    assert sorted(restored.load_manifest(str(path))) == ["dumps", "square"]
+    assert restored.is_pending("square") and plugin_module not in sys.modules
+    assert restored.create("dumps", [1]) == "[1]"
+
+    other = Factory()
+    other.load_manifest({"square": f"{plugin_module}:square"})
+    assert other.create("square", side=2) == ("square", 2)
+
+
+def test_manifest_leaves_out_creators_its_target_would_not_find(factory, plugin_module):
+    import importlib
+
+    plugin = importlib.import_module(plugin_module)
+    factory.register("bound", plugin.Builder().make)  # needs its instance
+    factory.register("classmethod", plugin.Builder.build)
+    factory.register("renamed", plugin.square)
+    plugin.square = lambda side=1: None  # the module attribute now points elsewhere
+
+    manifest = factory.manifest()
+    assert manifest == {"classmethod": f"{plugin_module}:Builder.build"}
+    restored = Factory()
+    restored.load_manifest(manifest)
+    assert restored.create("classmethod") == "Builder"
+
+
+def test_use_entry_points(factory, monkeypatch):
+    import importlib.metadata
+
+    class _EntryPoint:
+        def __init__(self, name, value):
+            self.name, self.value = name, value
+
+    def entry_points(*, group):
+        assert group == "pygim.test"
+        return [_EntryPoint("dumps", "json:dumps"), _EntryPoint("loads", "json:loads")]
+
+    monkeypatch.setattr(importlib.metadata, "entry_points", entry_points)
+    assert factory.use_entry_points("pygim.test") == ["dumps", "loads"]
+    assert factory.is_pending("dumps")
+    assert factory.create("loads", "[2]") == [2]
+
+
+class _Buffer:
+    def __init__(self, size=4):
+        self.data = bytearray(size)
+        self.dirty = False
+
+
+def test_pooled_acquire_reuses_and_resets():
+    """A returned product is reset and handed out again instead of re-created."""
+    factory = Factory(_Buffer)
+    factory.register("buffer", _Buffer, pool=2, reset=lambda buf: setattr(buf, "dirty", False))
+
+    with factory.acquire("buffer", size=8) as first:
+        first.dirty = True
+    with factory.acquire("buffer", size=99) as second:  # kwargs only matter on a miss
+        assert second is first
+        assert not second.dirty and len(second.data) == 8
+
+    stats = factory.pool_stats("buffer")
+    assert stats == {
+        "capacity": 2, "idle": 1, "in_use": 0,
+        "hits": 1, "misses": 1, "evictions": 0, "discarded": 0,
+    }
+    assert factory.pool_stats("missing") is None
+
+
+def test_pool_is_bounded_and_drops_failed_work():
+    factory = Factory()
+    factory.register("buffer", _Buffer, pool=1)
+
+    with factory.acquire("buffer") as a, factory.acquire("buffer") as b:
+        assert a is not b
+        assert factory.pool_stats("buffer")["in_use"] == 2
+    stats = factory.pool_stats("buffer")
+    assert (stats["idle"], stats["discarded"]) == (1, 1)  # only one is kept
+
+    with pytest.raises(KeyError):
+        with factory.acquire("buffer") as c:
+            raise KeyError("work failed")
+    assert factory.pool_stats("buffer")["idle"] == 0  # not reused after a failure
+
+    with factory.acquire("buffer") as d:
+        assert d is not c
+
+
+def test_pool_idle_timeout_eviction():
+    import time
+
+    factory = Factory()
+    factory.register("buffer", _Buffer, pool=4, idle_timeout=0.01)
+    with factory.acquire("buffer") as first:
+        pass
+    time.sleep(0.03)
+    assert factory.evict_idle() == 1
+    with factory.acquire("buffer") as second:
+        assert second is not first
+    assert factory.pool_stats("buffer")["evictions"] == 1
+
+
+def test_pool_validation_and_errors():
+    factory = Factory(_Buffer)
+    factory.register("wrong", lambda: object(), pool=2)
+    factory.register("plain", _Buffer)
+
+    with pytest.raises(RuntimeError, match="interface"):
+        with factory.acquire("wrong"):
+            pass
+    assert factory.pool_stats("wrong")["in_use"] == 0
+
+    with pytest.raises(RuntimeError, match="not pooled"):
+        with factory.acquire("plain"):
+            pass
+    with pytest.raises(ValueError, match="pool > 0"):
+        factory.register("other", _Buffer, reset=lambda buf: None)
+    with pytest.raises(ValueError, match="non-negative"):
+        factory.register("other", _Buffer, pool=1, idle_timeout=-1)
+
+    def failing_reset(buf):
+        raise OSError("cannot reset")
+
+    factory.register("fragile", _Buffer, pool=2, reset=failing_reset)
+    with pytest.raises(OSError):
+        with factory.acquire("fragile"):
+            pass
+    assert factory.pool_stats("fragile")["idle"] == 0
+
+
+def test_pool_override_closes_old_pool():
+    factory = Factory()
+
+    @factory.register("buffer", pool=2)
+    def make():
+        return _Buffer()
+
+    lease = factory.acquire("buffer")
+    borrowed = lease.__enter__()
+    factory.register("buffer", _Buffer, override=True, pool=2)
+    lease.__exit__(None, None, None)  # goes back to the closed pool and is dropped
+
+    with factory.acquire("buffer") as fresh:
+        assert fresh is not borrowed
+    assert factory.pool_stats("buffer")["misses"] == 1
+
+
+def test_lazy_override_closes_old_pool(plugin_module):
+    import gc
+    import weakref
+
+    factory = Factory()
+    factory.register("buffer", _Buffer, pool=2)
+    first, second = factory.acquire("buffer"), factory.acquire("buffer")
+    returned = weakref.ref(first.__enter__())
+    second.__enter__()
+
+    factory.register_lazy("buffer", f"{plugin_module}:square", override=True)
+    first.__exit__(None, None, None)
+    gc.collect()
+    assert returned() is None  # dropped by the closed pool, not kept idle
+    second.__exit__(None, None, None)
+    assert factory.create("buffer", side=2) == ("square", 2)
+
+
+def test_pool_threaded_acquire():
+    import threading
+
+    factory = Factory()
+    factory.register("buffer", _Buffer, pool=4)
+    errors = []
+
+    def work():
+        try:
+            for _ in range(500):
+                with factory.acquire("buffer") as buf:
+                    assert not buf.dirty
+                    buf.dirty = True
+                    buf.dirty = False
+        except Exception as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = factory.pool_stats("buffer")
+    assert not errors
+    assert stats["in_use"] == 0 and stats["hits"] + stats["misses"] == 4000
+    assert stats["idle"] <= 4
+
+
+def test_validate_first_caches_per_type(dummy_interface, dummy_impl):
+    factory = Factory(dummy_interface)
+    assert factory.validate == "first"
+    factory.register("impl", dummy_impl)
+    factory.register("bad", lambda x: x)
+
+    for x in range(3):
+        factory.create("impl", x)
+    assert factory.validation_cache_info() == {"hits": 2, "misses": 1, "size": 1}
+
+    # Failures are never cached.
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="interface"):
+            factory.create("bad", 1)
+    assert factory.validation_cache_info()["misses"] == 3
+
+    factory.validation_cache_clear()
+    assert factory.validation_cache_info() == {"hits": 0, "misses": 0, "size": 0}
+
+
+def test_validate_first_rechecks_modified_class():
+    class Meta(type):
+        def __instancecheck__(cls, obj):
+            return getattr(type(obj), "compliant", False)
+
+    class Interface(metaclass=Meta):
+        pass
+
+    class Product:
+        compliant = True
+
+    factory = Factory(Interface)
+    factory.register("product", Product)
+    factory.create("product")
+    factory.create("product")
+
+    Product.compliant = False
+    with pytest.raises(RuntimeError, match="interface"):
+        factory.create("product")
+
+    Product.compliant = True
+    factory.create("product")
+    misses = factory.validation_cache_info()["misses"]
+    Interface.marker = 1  # modifying the interface drops every verdict
+    factory.create("product")
+    assert factory.validation_cache_info()["misses"] == misses + 1
+
+
+def test_validate_modes(dummy_interface, dummy_impl):
+    always = Factory(dummy_interface, validate="always")
+    always.register("impl", dummy_impl)
+    always.create("impl", 1)
+    always.create("impl", 2)
+    assert always.validation_cache_info()["size"] == 0
+
+    never = Factory(dummy_interface, validate="never")
+    never.register("bad", lambda: object())
+    never.create("bad")
+    never.validate = "always"
+    with pytest.raises(RuntimeError, match="interface"):
+        never.create("bad")
+
+    with pytest.raises(ValueError, match="validate must be"):
+        Factory(dummy_interface, validate="sometimes")
+    with pytest.raises(ValueError, match="validate must be"):
+        never.validate = "sometimes"
+    assert Factory(None).create is not None  # None means no interface
+
+
+def test_validate_cache_releases_collected_types(dummy_interface):
+    import gc
+
+    factory = Factory(dummy_interface)
+
+    def make():
+        class Local(dummy_interface):
+            pass
+
+        return Local()
+
+    factory.register("local", make)
+    factory.create("local")
+    gc.collect()
+    assert factory.validation_cache_info()["size"] == 0
+
+
 if __name__ == "__main__":
     from pygim.core.testing import run_tests
 
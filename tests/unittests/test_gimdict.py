@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import random
+import statistics
+import sys
 from collections.abc import MutableMapping
+from functools import reduce
 
 import pytest
 
@@ -27,6 +31,7 @@ def test_gimdict_default_per_type_rules():
     d3 = d1 | d2
     assert d3["a"] == 3
     assert d3["b"] == "y"
+    assert d1.to_dict() == {"a": 1, "b": "x"}  # the operands are left alone
 
 
 def test_gimdict_per_key_strategy_overrides_type_strategy():
@@ -92,3 +97,277 @@ def test_gimdict_conflict_error_for_invalid_sum_operation():
     right = utils.gimdict({"k": 1})
     with pytest.raises(TypeError):
         _ = left | right
+
+
+def test_gimdict_typed_mode_stores_native_numbers():
+    d = utils.gimdict({"a": 1, "b": 2}, dtype="int64")
+    assert d.dtype == "int64"
+    assert utils.gimdict().dtype is None
+    d["c"] = True  # ints and bools convert
+    assert d.to_dict() == {"a": 1, "b": 2, "c": 1}
+    assert list(d) == ["a", "b", "c"]  # first-insertion order
+    d.merge_in("a", 5)
+    assert d["a"] == 6
+    del d["b"]
+    assert "b" not in d and len(d) == 2
+    with pytest.raises(KeyError):
+        del d["b"]
+    with pytest.raises(TypeError):
+        d["x"] = "not a number"
+    with pytest.raises(TypeError):
+        d["x"] = 1.5
+
+    f = utils.gimdict({"x": 1}, dtype="float64")
+    f["x"] = 2  # ints convert to float
+    assert isinstance(f["x"], float) and f.get("y", 0.5) == 0.5
+
+    with pytest.raises(ValueError, match="dtype"):
+        utils.gimdict(dtype="int32")
+
+
+def test_gimdict_typed_mode_strategies():
+    d = utils.gimdict({"a": 1, "b": 1}, dtype="int64", int=max)
+    d.set_strategy("b", "sum")
+    d.merge_in("a", 5)
+    d.merge_in("a", 3)
+    d.merge_in("b", 5)
+    assert d.to_dict() == {"a": 5, "b": 6}
+
+    d.set_default_strategy("min")
+    right = utils.gimdict({"a": 0, "c": 9}, dtype="int64")
+    assert (d | right).to_dict() == {"a": 0, "b": 6, "c": 9}
+    assert d["a"] == 5  # merged() leaves operands alone
+
+    with pytest.raises(OverflowError):
+        utils.gimdict({"a": 2**62}, dtype="int64") | utils.gimdict({"a": 2**62}, dtype="int64")
+
+
+def test_gimdict_merge_all():
+    shards = [{"a": 1, "b": 2}, {"b": 3, "c": 4}, utils.gimdict({"a": 10}), {}]
+    merged = utils.gimdict.merge_all(shards)
+    assert merged.dtype == "int64"
+    assert merged.to_dict() == {"a": 11, "b": 5, "c": 4}
+
+    floats = utils.gimdict.merge_all(iter([{"x": 0.5}, {"x": 2}]))
+    assert floats.dtype == "float64" and floats["x"] == 2.5
+
+    peaks = utils.gimdict.merge_all([{"x": 3}, {"x": 7}, {"x": 5}], strategy="max")
+    assert peaks["x"] == 7
+    assert utils.gimdict.merge_all([]).to_dict() == {}
+    assert utils.gimdict.merge_all([{"x": 1}], dtype="float64")["x"] == 1.0
+
+
+def test_gimdict_merge_all_typed_shards_and_errors():
+    base = utils.gimdict.merge_all([{"k": 1}, {"j": 2}])
+    again = utils.gimdict.merge_all([base, base, {"k": 1}])
+    assert again.to_dict() == {"k": 3, "j": 4}
+
+    other = utils.gimdict({"j": 1.5}, dtype="float64")
+    assert utils.gimdict.merge_all([base, other], dtype="float64").to_dict() == {"k": 1.0, "j": 3.5}
+
+    with pytest.raises(TypeError, match="dtype"):
+        utils.gimdict.merge_all([{"a": "text"}])
+    with pytest.raises(TypeError):
+        utils.gimdict.merge_all([{"a": 1}, {"a": 1.5}])  # int64 inferred from the first value
+    with pytest.raises(TypeError, match="mappings"):
+        utils.gimdict.merge_all([[("a", 1)]])
+
+
+def test_gimdict_typed_mode_order_strategies_and_size():
+    keys = [f"k{i}" for i in range(200)]
+    d = utils.gimdict(dtype="int64")
+    for i, key in enumerate(keys):
+        d.merge_in(key, i)
+    assert list(d.to_dict()) == keys  # first-seen order, as for a dict
+
+    d.set_strategy("k7", "max")
+    del d["k7"]
+    assert "k7" not in d and len(d) == 199
+    d.merge_in("k7", 3)
+    d.merge_in("k7", 1)
+    assert d["k7"] == 3  # the strategy outlives the value
+
+    merged = utils.gimdict.merge_all([{"z": 1}, d.to_dict(), {"a": 2}])
+    assert list(merged.to_dict())[:3] == ["z", "k0", "k1"]
+
+    small = utils.gimdict({"a": 1}, dtype="int64")
+    assert sys.getsizeof(d) > sys.getsizeof(small) > 0
+    assert sys.getsizeof(utils.gimdict({"a": 1})) > 0
+
+
+@pytest.mark.parametrize("workers", [0, 1, 2, 3, 8])
+def test_gimdict_merge_reduce_matches_merge_all(workers):
+    shards = [{f"k{(i * 7 + j) % 50}": i + j for j in range(20)} for i in range(64)]
+    expected = utils.gimdict.merge_all(shards)
+    assert utils.gimdict.merge_reduce(shards, workers=workers).to_dict() == expected.to_dict()
+
+    # typed shards sharing the result's keys are read in place
+    shared = [utils.gimdict.merge_all([expected, shard]) for shard in shards[:10]]
+    mixed = [*shared, *shards[10:20], utils.gimdict({"extra": 1}, dtype="int64")]
+    assert (utils.gimdict.merge_reduce(mixed, workers=workers).to_dict()
+            == utils.gimdict.merge_all(mixed).to_dict())
+
+    peaks = utils.gimdict.merge_reduce(shards, workers=workers, strategy="max")
+    assert peaks.to_dict() == utils.gimdict.merge_all(shards, strategy="max").to_dict()
+    floats = utils.gimdict.merge_reduce(shards[:5], workers=workers, dtype="float64")
+    ints = utils.gimdict.merge_all(shards[:5]).to_dict()
+    assert floats.to_dict() == {key: float(value) for key, value in ints.items()}
+
+
+def test_gimdict_merge_reduce_edge_cases_and_errors():
+    assert utils.gimdict.merge_reduce([]).to_dict() == {}
+    assert utils.gimdict.merge_reduce([{"x": 1}], workers=4).to_dict() == {"x": 1}
+
+    big = utils.gimdict({"x": 2**62}, dtype="int64")
+    with pytest.raises(OverflowError):
+        utils.gimdict.merge_reduce([big, big, big, big], workers=2)
+    big["x"] = 1  # the merge's read lock is released on error
+    assert big["x"] == 1
+
+    with pytest.raises(TypeError, match=r"merge_reduce\(\) expects an iterable of mappings"):
+        utils.gimdict.merge_reduce([[("a", 1)]])
+
+
+@pytest.mark.parametrize("dtype", ["int64", None])
+def test_gimdict_merge_all_and_reduce_honour_shard_key_strategies(dtype):
+    a = utils.gimdict({"k": 5, "n": 1}, dtype=dtype)
+    a.set_strategy("k", "max")
+    b = utils.gimdict({"k": 3, "n": 2}, dtype=dtype)
+    c = {"k": 4, "n": 3}
+    assert (a | b).to_dict() == {"k": 5, "n": 3}
+    assert utils.gimdict.merge_all([a, b, c]).to_dict() == {"k": 5, "n": 6}
+    assert utils.gimdict.merge_reduce([b, c, a], workers=2).to_dict() == {"k": 5, "n": 6}
+
+    b.set_strategy("k", "max")  # the same strategy twice is fine
+    assert utils.gimdict.merge_all([a, b]).to_dict() == {"k": 5, "n": 3}
+    b.set_strategy("k", "min")
+    with pytest.raises(ValueError, match=r"merge_reduce\(\) shards set different strategies for key 'k'"):
+        utils.gimdict.merge_reduce([a, b], workers=2)
+
+
+def test_gimdict_sketch_strategies_summarise_observations():
+    values = [4.0, 1.0, 9.0, 16.0, 25.0, 2.5]
+    d = utils.gimdict(dtype="float64")
+    d.set_strategy("mean", "mean")
+    d.set_strategy("count", "count")
+    d.set_strategy("top", ("top_k", 3))
+    d.set_strategy("hist", ("histogram", [0, 5, 10]))
+    for value in values:
+        for key in ("mean", "count", "top", "hist", "plain"):
+            d.merge_in(key, value)
+
+    summary = d["mean"]
+    assert summary["count"] == len(values)
+    assert summary["mean"] == pytest.approx(statistics.mean(values))
+    assert summary["variance"] == pytest.approx(statistics.pvariance(values))
+    assert d["count"] == len(values)
+    assert d["top"] == [25.0, 16.0, 9.0]
+    assert d["hist"] == [0, 3, 1, 2]  # (-inf, 0), [0, 5), [5, 10), [10, inf)
+    assert d["plain"] == sum(values)
+    assert list(d) == ["mean", "count", "top", "hist", "plain"]
+    assert len(d) == 5 and "top" in d
+
+    d["count"] = 7  # restarts the sketch from one observation
+    assert d["count"] == 1
+    del d["top"]
+    assert "top" not in d
+
+
+def test_gimdict_sketches_reject_nan_observations():
+    nan = float("nan")
+    d = utils.gimdict(dtype="float64")
+    for key, strategy in [("top", ("top_k", 3)), ("hist", ("histogram", [0, 5])), ("mean", "mean")]:
+        d.set_strategy(key, strategy)
+        for value in [1, 3, 2, 5]:
+            d.merge_in(key, value)
+        with pytest.raises(ValueError, match="NaN"):
+            d.merge_in(key, nan)
+        with pytest.raises(ValueError, match="NaN"):
+            d[key] = nan
+    assert d["top"] == [5.0, 3.0, 2.0]
+    assert d["hist"] == [0, 3, 1]
+    assert d["mean"]["mean"] == pytest.approx(2.75)
+
+    d.set_strategy("fresh", "count")
+    with pytest.raises(ValueError, match="NaN"):
+        d.merge_in("fresh", nan)
+    assert "fresh" not in d  # no empty sketch is left behind
+
+    plain = utils.gimdict({"x": nan, "y": 1.0}, dtype="float64")
+    with pytest.raises(ValueError, match="NaN"):
+        plain.set_strategy("x", "mean")
+    with pytest.raises(ValueError, match="NaN"):
+        plain.set_default_strategy("mean")
+    plain.merge_in("y", 2.0)  # nothing changed: still plain sums
+    assert plain["y"] == 3.0 and plain.default_strategy() == "type-default"
+    with pytest.raises(ValueError, match="NaN"):
+        utils.gimdict.merge_all([d, {"mean": nan}])
+
+
+def test_gimdict_sketches_merge_across_shards():
+    rng = random.Random(50)
+    observations = [rng.gauss(10, 3) for _ in range(1_000)]
+    shards = [observations[i::7] for i in range(7)]
+    for spec in ("mean", "count", ("top_k", 5), ("histogram", [5, 10, 15])):
+        whole = utils.gimdict(dtype="float64", float=spec)
+        for value in observations:
+            whole.merge_in("x", value)
+        parts = []
+        for shard in shards:
+            part = utils.gimdict(dtype="float64", float=spec)
+            for value in shard:
+                part.merge_in("x", value)
+            parts.append(part)
+
+        merged = reduce(lambda a, b: a | b, parts)
+        for combined in (merged, utils.gimdict.merge_all(parts), utils.gimdict.merge_reduce(parts, workers=3)):
+            if spec == "mean":
+                assert combined["x"]["count"] == whole["x"]["count"]
+                assert combined["x"]["mean"] == pytest.approx(whole["x"]["mean"])
+                assert combined["x"]["variance"] == pytest.approx(whole["x"]["variance"])
+            else:
+                assert combined["x"] == whole["x"]
+
+    # Plain dict shards hold one observation per key and shard.
+    means = utils.gimdict.merge_all([{"a": 1, "b": 5}, {"a": 3}], strategy="mean", dtype="float64")
+    assert means.to_dict() == {"a": {"count": 2, "mean": 2.0, "variance": 1.0},
+                               "b": {"count": 1, "mean": 5.0, "variance": 0.0}}
+    top = utils.gimdict.merge_all([{"a": 3}, {"a": 9}, {"a": 7}], strategy=("top_k", 2))
+    assert top["a"] == [9, 7]  # int64: the values stay ints
+
+
+def test_gimdict_sketch_strategy_selection_and_errors():
+    d = utils.gimdict({"a": 2.0, "b": 4.0}, dtype="float64")
+    d.set_strategy("b", "max")
+    d.set_default_strategy("mean")  # keys following the default become sketches
+    assert d["a"] == {"count": 1, "mean": 2.0, "variance": 0.0}
+    assert d["b"] == 4.0
+    d.merge_in("b", 1.0)
+    assert d["b"] == 4.0
+    assert d.default_strategy() == "mean"
+    with pytest.raises(ValueError, match="sketches under its default"):
+        d.set_default_strategy("sum")
+    assert d.default_strategy() == "mean"  # unchanged on error
+    with pytest.raises(ValueError, match="holds a mean sketch"):
+        d.set_strategy("a", "sum")
+
+    typed = utils.gimdict(dtype="int64", int=("top_k", 2))
+    assert typed.type_strategy("int") == "top_k"
+
+    with pytest.raises(ValueError, match="needs a typed gimdict"):
+        utils.gimdict(float="mean")
+    with pytest.raises(ValueError, match="needs a typed gimdict"):
+        utils.gimdict().set_strategy("x", "count")
+    with pytest.raises(ValueError, match=r"\('top_k', k\)"):
+        utils.gimdict(dtype="float64").set_strategy("x", "top_k")
+    with pytest.raises(ValueError, match="ascending"):
+        utils.gimdict(dtype="float64").set_strategy("x", ("histogram", [3, 1]))
+    with pytest.raises(ValueError, match="k >= 1"):
+        utils.gimdict(dtype="float64").set_strategy("x", ("top_k", 0))
+
+    left = utils.gimdict(dtype="float64", float="mean")
+    right = utils.gimdict(dtype="float64", float=("top_k", 2))
+    left.merge_in("x", 1.0)
+    right.merge_in("x", 2.0)
+    with pytest.raises(ValueError, match="different kinds"):
+        left | right
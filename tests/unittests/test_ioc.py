@@ -201,7 +201,7 @@ def test_invalid_inputs_raise(container):
         container.register(IService, lambda: object(), autowire=True)
 
     with pytest.raises(RuntimeError):
-        container.register(IService, lambda: object(), lifecycle="scoped")
+        container.register(IService, lambda: object(), lifecycle="request")
 
 
 def test_autowire_requires_annotations_when_no_default(container):
@@ -618,6 +618,625 @@ def test_autowire_uninspectable_class_raises(container):
         container.resolve(super)
 
 
+# Module level: get_type_hints resolves the forward reference against module
+# globals, so the mutually dependent pair cannot live inside the test.
+class _Ping:
+    def __init__(self, pong: "_Pong"):
+        self.pong = pong
+
+
+class _Pong:
+    def __init__(self, ping: _Ping):
+        self.ping = ping
+
+
+class _CompiledD:
+    pass
+
+
+class _CompiledB:
+    def __init__(self, d: _CompiledD):
+        self.d = d
+
+
+class _CompiledC:
+    def __init__(self, d: _CompiledD):
+        self.d = d
+
+
+class _CompiledA:
+    def __init__(self, b: _CompiledB, c: _CompiledC):
+        self.b, self.c = b, c
+
+
+@pytest.mark.parametrize("lifecycle", ["transient", "singleton"])
+def test_compiled_plan_matches_dynamic_resolution(container, lifecycle):
+    """compile() changes how a graph is built, never what is built.
+
+    On a diamond, a transient leaf is still fresh per injection while a
+    singleton leaf is shared, exactly as in dynamic resolution; decorators
+    and the resolved types carry over unchanged.
+    """
+    container.register(_CompiledD, _CompiledD, lifecycle=lifecycle)
+    container.register(_CompiledB, _CompiledB, autowire=True, decorators=[lambda b: setattr(b, "seen", True) or b])
+    container.register(_CompiledC, _CompiledC, autowire=True)
+    container.register(_CompiledA, _CompiledA, autowire=True)
+    dynamic = container.resolve(_CompiledA)
+
+    assert not container.compiled
+    container.compile()
+    compiled = container.resolve(_CompiledA)
+
+    assert container.compiled
+    assert compiled.b.seen and isinstance(compiled.c.d, _CompiledD)
+    assert (compiled.b.d is compiled.c.d) == (dynamic.b.d is dynamic.c.d) == (lifecycle == "singleton")
+    assert compiled is not container.resolve(_CompiledA)
+
+
+def test_compile_reports_cycles_and_freezes_registration(container):
+    """Cycles surface at compile() with the key chain; success freezes the registry."""
+
+    class Leaf:
+        pass
+
+    container.register(_Ping, _Ping, autowire=True)
+    container.register(_Pong, _Pong, autowire=True)
+
+    with pytest.raises(RuntimeError, match="Circular dependency detected: _Ping -> _Pong -> _Ping"):
+        container.compile()
+    assert not container.compiled  # a failed compile leaves the container open
+
+    container.register(_Pong, Leaf, override=True)
+    container.register(Leaf, Leaf)
+    container.compile()
+
+    with pytest.raises(RuntimeError, match="registration is frozen"):
+        container.register(_CompiledD, _CompiledD)
+    with pytest.raises(RuntimeError, match="already compiled"):
+        container.compile()
+
+
+@pytest.mark.parametrize("compiled", [False, True], ids=["dynamic", "compiled"])
+@pytest.mark.parametrize("target", [_CompiledA, _CompiledB], ids=["root", "inner"])
+def test_provider_reentering_an_ancestor_is_a_cycle(container, compiled, target):
+    """A leaf provider resolving a key above it fails the same way compiled or not.
+
+    The re-entry goes through the plan's root or through an inner step; both
+    are ancestors of the leaf in flight, so both are cycles.
+    """
+    container.register(_CompiledD, lambda: container.resolve(target))
+    container.register(_CompiledB, _CompiledB, autowire=True)
+    container.register(_CompiledC, _CompiledC, autowire=True)
+    container.register(_CompiledA, _CompiledA, autowire=True)
+    if compiled:
+        container.compile()
+
+    with pytest.raises(RuntimeError, match="Circular dependency detected"):
+        container.resolve(_CompiledA)
+
+
+def test_compiled_singleton_skips_its_dependencies_once_built(container):
+    """A built singleton short-circuits its subtree in the compiled plan."""
+    built = []
+
+    class Connection:
+        def __init__(self):
+            built.append(self)
+
+    class Pool:
+        def __init__(self, connection: Connection):
+            self.connection = connection
+
+    class Handler:
+        def __init__(self, pool: Pool):
+            self.pool = pool
+
+    container.register(Connection, Connection)
+    container.register(Pool, Pool, autowire=True, lifecycle="singleton")
+    container.register(Handler, Handler, autowire=True)
+    container.compile()
+
+    first, second = container.resolve(Handler), container.resolve(Handler)
+
+    assert first.pool is second.pool
+    assert len(built) == 1  # the transient Connection only fed the first Pool
+
+
+class _Resource:
+    def __init__(self, log, label):
+        self.log, self.label = log, label
+        log.append(f"open {label}")
+
+    def close(self):
+        self.log.append(f"close {self.label}")
+
+
+def test_scoped_instances_are_cached_per_scope_and_closed_in_reverse(container):
+    """A scoped key is built once per scope; exit closes newest first.
+
+    Resolving a scoped key with no active scope is an error, while
+    transient and singleton keys are unaffected by scopes.
+    """
+    log = []
+
+    class Session(_Resource):
+        pass
+
+    class Unit(_Resource):
+        def __init__(self, session: Session):
+            super().__init__(log, "unit")
+            self.session = session
+
+    container.register(Session, lambda: Session(log, "session"), lifecycle="scoped")
+    container.register(Unit, Unit, lifecycle="scoped", autowire=True)
+    container.register(list, list)
+
+    with container.scope() as scope:
+        unit = container.resolve(Unit)
+        assert container.resolve(Unit) is unit
+        assert container.resolve(Session) is unit.session
+        assert container.resolve(list) is not container.resolve(list)
+        assert len(scope) == 2
+
+    assert log == ["open session", "open unit", "close unit", "close session"]
+    assert scope.closed
+
+    with container.scope():
+        assert container.resolve(Unit) is not unit  # a new scope, new instances
+
+    with pytest.raises(RuntimeError, match="No active scope for scoped service"):
+        container.resolve(Session)
+    with pytest.raises(RuntimeError, match="Scope is closed"):
+        scope.resolve(Session)
+
+
+def test_scope_is_inherited_by_asyncio_tasks():
+    """async with binds the scope to the task's context.
+
+    Child tasks see the parent's scope; concurrent requests keep their own,
+    and aclose() is awaited when the scope exits.
+    """
+    import asyncio
+
+    closed = []
+
+    class Session:
+        async def aclose(self):
+            await asyncio.sleep(0)
+            closed.append(self)
+
+    container = Container()
+    container.register(Session, Session, lifecycle="scoped")
+
+    async def request():
+        async with container.scope():
+            session = container.resolve(Session)
+
+            async def child():
+                return container.resolve(Session)
+
+            assert await asyncio.create_task(child()) is session
+            await asyncio.sleep(0)
+            return session
+
+    async def main():
+        return await asyncio.gather(request(), request())
+
+    first, second = asyncio.run(main())
+
+    assert first is not second
+    assert sorted(map(id, closed)) == sorted([id(first), id(second)])
+
+
+def test_scope_disposal_attempts_every_instance(container):
+    """A failing close() does not stop the remaining instances from closing."""
+    log = []
+
+    class Broken(_Resource):
+        def close(self):
+            raise ValueError("boom")
+
+    container.register(_Resource, lambda: _Resource(log, "ok"), lifecycle="scoped")
+    container.register(Broken, lambda: Broken(log, "broken"), lifecycle="scoped")
+
+    scope = container.scope()
+    scope.resolve(_Resource)
+    scope.resolve(Broken)
+
+    with pytest.raises(ValueError, match="boom"):
+        scope.close()
+    assert log == ["open ok", "open broken", "close ok"]
+
+
+class _CaptiveSession:
+    pass
+
+
+class _CaptiveRepository:
+    def __init__(self, session: _CaptiveSession):
+        self.session = session
+
+
+class _CaptiveService:
+    def __init__(self, repository: _CaptiveRepository):
+        self.repository = repository
+
+
+@pytest.mark.parametrize("compiled", [False, True], ids=["dynamic", "compiled"])
+def test_singleton_cannot_capture_scoped_instance(compiled):
+    """A singleton must not keep a scoped instance past its scope.
+
+    The scoped key is reached through a transient, and also straight from a
+    singleton provider that resolves it by hand; both are refused, while
+    transients may still take the scoped instance.
+    """
+    container = Container()
+    container.register(_CaptiveSession, _CaptiveSession, lifecycle="scoped")
+    container.register(_CaptiveRepository, _CaptiveRepository, autowire=True)
+    container.register(_CaptiveService, _CaptiveService, lifecycle="singleton", autowire=True)
+    container.register(dict, lambda: {"session": container.resolve(_CaptiveSession)}, lifecycle="singleton")
+
+    if compiled:
+        with pytest.raises(RuntimeError, match=r"captive dependency.*_CaptiveService -> .*_CaptiveRepository"):
+            container.compile()
+        container.register(_CaptiveService, _CaptiveService, autowire=True, override=True)
+        container.compile()
+
+    with container.scope():
+        if not compiled:
+            with pytest.raises(RuntimeError, match="captive dependency"):
+                container.resolve(_CaptiveService)
+        with pytest.raises(RuntimeError, match="captive dependency"):
+            container.resolve(dict)
+        repository = container.resolve(_CaptiveRepository)
+        assert repository.session is container.resolve(_CaptiveSession)
+
+
+def test_compiled_plan_shares_scoped_instances(container):
+    """Compiled plans build a scoped key once per scope, like dynamic resolve."""
+    container.register(_CompiledD, _CompiledD, lifecycle="scoped")
+    container.register(_CompiledB, _CompiledB, autowire=True)
+    container.register(_CompiledC, _CompiledC, autowire=True)
+    container.register(_CompiledA, _CompiledA, autowire=True)
+    container.compile()
+
+    with container.scope():
+        first = container.resolve(_CompiledA)
+        second = container.resolve(_CompiledA)
+
+    assert first.b.d is first.c.d is second.b.d
+    with container.scope():
+        assert container.resolve(_CompiledA).b.d is not first.b.d
+
+
+class _AsyncClient:
+    pass
+
+
+class _AsyncCache:
+    pass
+
+
+class _AsyncService:
+    def __init__(self, client: _AsyncClient, cache: _AsyncCache):
+        self.client, self.cache = client, cache
+
+
+def test_aresolve_awaits_providers_and_gathers_dependencies(container):
+    """Independent dependencies are awaited concurrently, not one by one.
+
+    Both providers wait on the same event, which is only set once both are
+    in flight, so sequential resolution would time out. Decorators and
+    interface validation still apply to awaited results.
+    """
+    import asyncio
+
+    in_flight = []
+
+    async def gate(cls):
+        in_flight.append(cls)
+        if len(in_flight) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=5)
+        return cls()
+
+    both_started = None
+
+    container.register(_AsyncClient, lambda: gate(_AsyncClient))
+    container.register(_AsyncCache, lambda: gate(_AsyncCache), decorators=[lambda c: setattr(c, "seen", True) or c])
+    container.register(_AsyncService, _AsyncService, autowire=True)
+    container.register(int, lambda: asyncio.sleep(0, result="not an int"))
+
+    async def main():
+        nonlocal both_started
+        both_started = asyncio.Event()  # bound to the running loop
+        return await container.aresolve(_AsyncService)
+
+    service = asyncio.run(main())
+
+    assert isinstance(service.client, _AsyncClient) and service.cache.seen
+    with pytest.raises(RuntimeError, match="does not implement"):
+        asyncio.run(container.aresolve(int))
+    with pytest.raises(RuntimeError, match=r"No provider for key \[key: str\]"):
+        asyncio.run(container.aresolve(str))
+
+
+def test_aresolve_builds_async_singleton_once(container):
+    """Concurrent awaiters share one in-flight build; sync resolve sees it."""
+    import asyncio
+
+    built = []
+
+    async def connect():
+        await asyncio.sleep(0.01)
+        built.append(_AsyncClient())
+        return built[-1]
+
+    container.register(_AsyncClient, connect, lifecycle="singleton")
+    container.register(_AsyncCache, _AsyncCache, lifecycle="scoped")
+
+    async def main():
+        clients = await asyncio.gather(*(container.aresolve(_AsyncClient) for _ in range(10)))
+        async with container.scope():
+            caches = await asyncio.gather(*(container.aresolve(_AsyncCache) for _ in range(3)))
+        return clients, caches
+
+    clients, caches = asyncio.run(main())
+
+    assert len(built) == 1 and all(c is built[0] for c in clients)
+    assert container.resolve(_AsyncClient) is built[0]
+    assert caches[0] is caches[1] is caches[2]
+
+
+def test_aresolve_reports_cycles_across_tasks(container):
+    """A cycle raises whether one task walks it or two tasks meet inside it."""
+    import asyncio
+
+    container.register(_Ping, _Ping, autowire=True, lifecycle="singleton")
+    container.register(_Pong, _Pong, autowire=True, lifecycle="singleton")
+
+    with pytest.raises(RuntimeError, match="Circular dependency detected: _Ping -> _Pong -> _Ping"):
+        asyncio.run(container.aresolve(_Ping))
+
+    async def both():
+        return await asyncio.gather(
+            container.aresolve(_Ping), container.aresolve(_Pong), return_exceptions=True)
+
+    results = asyncio.wait_for(both(), timeout=5)
+    assert all(isinstance(r, RuntimeError) for r in asyncio.run(results))
+
+
+def test_warm_up_builds_independent_singletons_in_parallel(container):
+    """warm_up() overlaps independent singletons and respects dependencies.
+
+    The three leaf providers meet at a barrier that only opens once all
+    three run at the same time; the dependent singleton is built after
+    them, through a transient in between. Timings cover what was built.
+    """
+    import threading
+
+    barrier = threading.Barrier(3)
+    built = []
+
+    def leaf(cls):
+        def provide():
+            barrier.wait(timeout=5)
+            built.append(cls)
+            return cls()
+        return provide
+
+    class Db:
+        pass
+
+    class Cache:
+        pass
+
+    class Queue:
+        pass
+
+    class Repo:
+        def __init__(self, db: Db, cache: Cache):
+            self.db = db
+
+    class Service:
+        def __init__(self, repo: Repo, queue: Queue):
+            self.repo = repo
+            built.append(Service)
+
+    for cls in (Db, Cache, Queue):
+        container.register(cls, leaf(cls), lifecycle="singleton")
+    container.register(Repo, Repo, autowire=True)
+    container.register(Service, Service, autowire=True, lifecycle="singleton")
+
+    timings = container.warm_up(workers=3)
+
+    assert set(timings) == {(Db, None), (Cache, None), (Queue, None), (Service, None)}
+    assert all(seconds >= 0 for seconds in timings.values())
+    assert built[-1] is Service and len(built) == 4
+    assert container.resolve(Service).repo.db is container.resolve(Db)
+    assert container.warm_up() == {}  # nothing left to build
+
+
+def test_warm_up_reports_failures_and_cycles(container):
+    """Failures are raised together after the rest finished; cycles up front."""
+    from pygim.core.explib import WarmUpError
+
+    class Broken:
+        pass
+
+    class NeedsBroken:
+        def __init__(self, broken: Broken):
+            pass
+
+    container.register(Broken, lambda: 1 / 0, lifecycle="singleton")
+    container.register(NeedsBroken, NeedsBroken, autowire=True, lifecycle="singleton")
+    container.register(_CompiledD, _CompiledD, lifecycle="singleton")
+
+    with pytest.raises(WarmUpError, match="1 of 3 singletons failed") as info:
+        container.warm_up()
+    assert [type(e) for e in info.value.exceptions] == [ZeroDivisionError]
+    assert isinstance(container.resolve(_CompiledD), _CompiledD)
+
+    container.register(_Ping, _Ping, autowire=True, lifecycle="singleton")
+    container.register(_Pong, _Pong, autowire=True)
+    with pytest.raises(RuntimeError, match="Circular dependency detected: _Ping -> _Pong -> _Ping"):
+        container.warm_up([_Ping])
+    with pytest.raises(RuntimeError, match="No provider for key"):
+        container.warm_up([str])
+
+
+def test_signature_cache_is_shared_across_containers_and_overrides():
+    """Constructor introspection runs once per class for the whole process.
+
+    New containers and override=True re-registrations hit the shared cache;
+    replacing __init__ forces a re-parse, and a collected class leaves the
+    cache.
+    """
+    import gc
+
+    from pygim.ioc import signature_cache_info
+
+    class Dep:
+        pass
+
+    class Service:
+        def __init__(self, dep: Dep):
+            self.dep = dep
+
+    def build():
+        container = Container()
+        container.register(Dep, Dep)
+        container.register(Service, Service, autowire=True)
+        return container
+
+    before = signature_cache_info()
+    first = build()
+    first.resolve(Service)
+    build().resolve(Service)
+    first.register(Service, Service, autowire=True, override=True)
+    first.resolve(Service)
+
+    after = signature_cache_info()
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 2
+
+    def replacement(self, dep: Dep):
+        self.dep = ("replaced", dep)
+
+    Service.__init__ = replacement
+    assert build().resolve(Service).dep[0] == "replaced"
+    assert signature_cache_info()["misses"] - before["misses"] == 2
+
+    cached = signature_cache_info()["size"]
+    del first, Service, replacement
+    gc.collect()
+    assert signature_cache_info()["size"] < cached
+
+
+def _tree(node):
+    return (node["key"][0].__name__, node["constructed"], [_tree(child) for child in node["children"]])
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_profiling_records_resolution_trees(container, compiled):
+    """Each top-level resolve records a tree: who built what, and who was cached.
+
+    Dynamic resolution nests dependencies as they are resolved; a compiled
+    plan runs flat, so its constructed steps hang directly off the root.
+    """
+    container.register(_CompiledD, _CompiledD, lifecycle="singleton")
+    container.register(_CompiledB, _CompiledB, autowire=True, decorators=[lambda b: b])
+    container.register(_CompiledC, _CompiledC, autowire=True)
+    container.register(_CompiledA, _CompiledA, autowire=True)
+    if compiled:
+        container.compile()
+
+    container.resolve(_CompiledA)  # not recorded: profiling is off
+    assert not container.profiling and container.profile_report() == []
+    container.profiling = True
+    container.resolve(_CompiledA)
+    container.profiling = False
+
+    (report,) = container.profile_report()
+    if compiled:
+        # D is a built singleton, so the plan skips it altogether.
+        assert _tree(report) == ("_CompiledA", True, [("_CompiledB", True, []), ("_CompiledC", True, [])])
+    else:
+        assert _tree(report) == ("_CompiledA", True, [
+            ("_CompiledB", True, [("_CompiledD", False, [])]),
+            ("_CompiledC", True, [("_CompiledD", False, [])]),
+        ])
+    assert set(report["phases"]) == {"dependencies", "provider", "decorators", "validation"}
+    assert report["seconds"] >= max(child["seconds"] for child in report["children"])
+    assert report["children"][0]["phases"]["provider"] > 0
+
+    stats = container.profile_stats()
+    assert stats["resolves"] == (3 if compiled else 5)
+    assert stats["constructed"] == 3 and stats["cached"] == stats["resolves"] - 3
+    assert stats["seconds"] == pytest.approx(report["seconds"])
+
+    container.clear_profile()
+    assert container.profile_report() == [] and container.profile_stats()["resolves"] == 0
+
+
+def test_profiling_flame_graph_folds_stacks(container):
+    """flame_graph() emits `parent;child <self microseconds>` lines, merged per stack."""
+    import time
+
+    class Slow:
+        def __init__(self):
+            time.sleep(0.01)
+
+    class Root:
+        def __init__(self, slow: Slow):
+            self.slow = slow
+
+    container.register(Slow, Slow)
+    container.register(Root, Root, autowire=True)
+    container.profiling = True
+    container.resolve(Root)
+    container.resolve(Root)
+
+    lines = {}
+    for line in container.flame_graph().splitlines():
+        stack, micros = line.rsplit(" ", 1)
+        lines[";".join(frame.rsplit(".", 1)[-1] for frame in stack.split(";"))] = micros
+    assert "Root" in lines and int(lines["Root;Slow"]) >= 20_000  # two 10 ms builds
+    assert int(lines["Root"]) < int(lines["Root;Slow"])  # self time excludes the child
+
+
+def test_dependency_graph_exports_json_and_dot(container):
+    """The registry exports as JSON nodes/edges or Graphviz DOT; unplannable nodes carry an error."""
+    import json
+
+    class Missing:
+        pass
+
+    class Broken:
+        def __init__(self, missing: Missing):
+            pass
+
+    container.register(_CompiledD, _CompiledD, lifecycle="singleton")
+    container.register(_CompiledB, _CompiledB, autowire=True, decorators=[lambda b: b])
+    container.register(Broken, Broken, autowire=True)
+
+    graph = json.loads(container.dependency_graph())
+    nodes = {node["key"].rsplit(".", 1)[-1]: node for node in graph["nodes"]}
+    assert set(nodes) == {"Broken", "_CompiledB", "_CompiledD"}
+    assert nodes["_CompiledB"]["decorators"] == 1 and nodes["_CompiledB"]["autowire"]
+    assert nodes["_CompiledD"]["lifecycle"] == "singleton"
+    assert "'missing'" in nodes["Broken"]["error"]
+    assert graph["edges"] == [
+        {"source": nodes["_CompiledB"]["id"], "target": nodes["_CompiledD"]["id"], "parameter": "d"},
+    ]
+
+    dot = container.dependency_graph(format="dot")
+    assert dot.startswith("digraph pygim_ioc {")
+    assert '[label="d"]' in dot and "_CompiledD\\nsingleton" in dot
+    with pytest.raises(ValueError, match="format must be"):
+        container.dependency_graph(format="svg")
+
+
 if __name__ == "__main__":
     from pygim.core.testing import run_tests
 
@@ -597,6 +597,245 @@ def test_diamond_dependency_shares_singleton_without_false_cycle(container):
     assert a.b.d is a.c.d
 
 
+# ---------------------------------------------------------------------------
+# Concurrency
+# ---------------------------------------------------------------------------
+
+
+def _run_threads(targets, timeout=10):
+    """Run callables on their own threads; return (results, errors) by index.
+
+    A join timeout fails the test instead of hanging the suite when a
+    regression deadlocks.
+    """
+    import threading
+
+    results, errors = [None] * len(targets), [None] * len(targets)
+
+    def runner(i, target):
+        try:
+            results[i] = target()
+        except BaseException as error:  # noqa: BLE001 - reported to the test
+            errors[i] = error
+
+    threads = [threading.Thread(target=runner, args=(i, t), daemon=True) for i, t in enumerate(targets)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout)
+        assert not thread.is_alive(), "resolution deadlocked"
+    return results, errors
+
+
+def test_concurrent_first_resolve_builds_singleton_once(container):
+    """Racing first-resolves of one singleton construct it exactly once.
+
+    The provider sleeps (releasing the GIL) while it builds, which is the
+    window in which every other thread arrives; they must wait for the
+    builder and all receive its instance.
+    """
+    import time
+
+    class Pool:
+        built = 0
+
+        def __init__(self):
+            time.sleep(0.05)
+            Pool.built += 1
+
+    container.register(Pool, Pool, lifecycle="singleton")
+
+    results, errors = _run_threads([lambda: container.resolve(Pool)] * 16)
+
+    assert errors == [None] * 16
+    assert Pool.built == 1
+    assert all(r is results[0] for r in results)
+
+
+def test_concurrent_resolves_of_same_key_are_not_cycles(container):
+    """Two threads resolving the same transient key at once is not a cycle.
+
+    Resolution stacks are per thread; a shared stack would see the other
+    thread's in-flight key and report a false circular dependency.
+    """
+    import threading
+
+    barrier = threading.Barrier(2)
+
+    class Slow:
+        def __init__(self):
+            barrier.wait(timeout=5)  # both threads are mid-resolve here
+
+    container.register(Slow, Slow)
+
+    results, errors = _run_threads([lambda: container.resolve(Slow)] * 2)
+
+    assert errors == [None, None]
+    assert results[0] is not results[1]
+
+
+def test_distinct_singletons_build_in_parallel(container):
+    """Different singletons never serialise on a shared lock while building.
+
+    Each provider blocks until the other is also mid-construction, so a
+    container-wide construction lock would time out the barrier.
+    """
+    import threading
+
+    barrier = threading.Barrier(2)
+
+    class First:
+        def __init__(self):
+            barrier.wait(timeout=5)
+
+    class Second:
+        def __init__(self):
+            barrier.wait(timeout=5)
+
+    container.register(First, First, lifecycle="singleton")
+    container.register(Second, Second, lifecycle="singleton")
+
+    results, errors = _run_threads([lambda: container.resolve(First), lambda: container.resolve(Second)])
+
+    assert errors == [None, None]
+    assert container.resolve(First) is results[0]
+    assert container.resolve(Second) is results[1]
+
+
+def test_concurrent_first_aresolve_shares_one_async_state(container):
+    """Racing first aresolve() calls from many threads all succeed.
+
+    The container's async state is created lazily by the first call; racing
+    threads must publish one of them, not overwrite each other's.
+    """
+    import asyncio
+
+    class Service:
+        pass
+
+    async def make():
+        await asyncio.sleep(0)
+        return Service()
+
+    container.register(Service, make)
+
+    results, errors = _run_threads([lambda: asyncio.run(container.aresolve(Service))] * 16)
+
+    assert errors == [None] * 16
+    assert all(isinstance(result, Service) for result in results)
+
+
+def test_cycle_split_across_threads_raises_instead_of_deadlocking(container):
+    """A -> B -> A started from both ends at once fails fast on both threads.
+
+    Each thread holds one singleton's construction and then needs the
+    other's; the waits-for check must spot the loop and raise the usual
+    circular-dependency error rather than block forever.
+    """
+    import threading
+
+    barrier = threading.Barrier(2)
+    started = set()
+
+    class A:
+        pass
+
+    class B:
+        pass
+
+    def meet(name):
+        # Only the first build of each key meets the other thread; the
+        # survivor's retry of the failed key must not wait on a barrier.
+        if name not in started:
+            started.add(name)
+            barrier.wait(timeout=5)
+
+    def make_a():
+        meet("a")
+        return container.resolve(B) and A()
+
+    def make_b():
+        meet("b")
+        return container.resolve(A) and B()
+
+    container.register(A, make_a, lifecycle="singleton")
+    container.register(B, make_b, lifecycle="singleton")
+
+    _, errors = _run_threads([lambda: container.resolve(A), lambda: container.resolve(B)])
+
+    assert all(isinstance(e, RuntimeError) and "Circular dependency" in str(e) for e in errors)
+
+
+def test_resolve_and_register_hammered_from_many_threads(container):
+    """Mixed resolves and registrations from 8 threads stay consistent.
+
+    Singletons keep one identity per key across all threads, transients
+    stay fresh, and keys registered concurrently are immediately
+    resolvable by the thread that registered them.
+    """
+    class Shared:
+        pass
+
+    class Fresh:
+        def __init__(self, shared: Shared):
+            self.shared = shared
+
+    container.register(Shared, Shared, lifecycle="singleton")
+    container.register(Fresh, Fresh, autowire=True)
+
+    def worker():
+        seen = set()
+        for i in range(200):
+            fresh = container.resolve(Fresh)
+            seen.add(id(fresh.shared))
+            if i % 50 == 0:
+                cls = type(f"Late{i}", (), {})
+                container.register(cls, cls, lifecycle="singleton")
+                assert container.resolve(cls) is container.resolve(cls)
+        return seen
+
+    results, errors = _run_threads([worker] * 8)
+
+    assert errors == [None] * 8
+    assert set().union(*results) == {id(container.resolve(Shared))}
+    assert len(container) == 2 + 8 * 4
+
+
+def test_built_singleton_reads_follow_concurrent_overrides(container):
+    """Lock-free reads of built singletons never serve an overridden one.
+
+    Readers spin on a built singleton while writers override it and add new
+    keys, so snapshots are unpublished and freed under the readers; each
+    writer must see a replacement straight after its override.
+    """
+    class Config:
+        pass
+
+    container.register(Config, Config, lifecycle="singleton")
+    container.resolve(Config)
+
+    def reader():
+        return all(isinstance(container.resolve(Config), Config) for _ in range(2000))
+
+    def writer(tag):
+        def run():
+            for i in range(50):
+                replacement = type(f"Config{tag}_{i}", (Config,), {})
+                container.register(Config, replacement, lifecycle="singleton", override=True)
+                assert type(container.resolve(Config)) is not Config
+                late = type(f"Late{tag}_{i}", (), {})
+                container.register(late, late, lifecycle="singleton")
+                assert container.resolve(late) is container.resolve(late)
+            return True
+        return run
+
+    results, errors = _run_threads([reader] * 4 + [writer(t) for t in range(2)])
+
+    assert errors == [None] * 6 and all(results)
+    assert container.resolve(Config) is container.resolve(Config)
+    assert len(container) == 1 + 2 * 50
+
+
 # ---------------------------------------------------------------------------
 # Scale
 # ---------------------------------------------------------------------------
@@ -220,6 +220,15 @@ def test_status_and_size(temp_dir):
     assert pygim.path(temp_dir).is_dir()
 
 
+def test_disk_usage_of_file_and_tree(temp_dir):
+    _write(temp_dir, "a.yaml", "k: v\n")
+    (temp_dir / "sub").mkdir()
+    _write(temp_dir / "sub", "b.json", "{}")
+    assert pygim.path(temp_dir / "a.yaml").disk_usage() == (5, 1)
+    assert pygim.path(temp_dir).disk_usage(workers=2) == (7, 2)
+    assert pygim.path(temp_dir / "missing").disk_usage() == (0, 0)
+
+
 def test_file_is_hashable():
     assert len({pygim.path("a"), pygim.path("a"), pygim.path("b")}) == 2
 
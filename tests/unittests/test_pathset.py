@@ -142,6 +142,204 @@ def test_filter_on_empty_pathset():
     assert len((PathSet([]) & ext(".txt")).eval()) == 0
 
 
+@pytest.mark.parametrize(
+    "pattern, name, expected",
+    [
+        ("", "", False),
+        ("*", "", True),
+        ("*.*", "readme", False),
+        ("*.*", "readme.txt", True),
+        ("readme.txt", "readme.txt", True),
+        ("readme.txt", "readme.rst", False),
+        ("read*", "readme.txt", True),
+        ("*.rst", "AUTHORS.rst", True),
+        ("*.rst", ".rst", True),
+        ("read*.txt", "readme.txt", True),
+        ("read*.txt", "read.txt", True),
+        ("ab*ba", "aba", False),  # literal ends must not overlap
+        ("read??.txt", "readme.txt", True),
+        ("r*d?e*.t?t", "readme.txt", True),
+        ("r*d?e*.t?t", "readme.rst", False),
+        ("a*", "a*b", True),  # a literal '*' in the name cannot eat the wildcard
+    ],
+)
+def test_matcher_agrees_with_match_pattern(pattern, name, expected):
+    """A compiled Matcher gives exactly the verdict of match_pattern.
+
+    Matcher routes common pattern shapes (literal, prefix/suffix, single
+    star) around the backtracking loop, so each shape is covered here
+    against the one-shot function it must stay consistent with.
+    """
+    from pygim.pathset import Matcher, match_pattern
+
+    assert match_pattern(pattern, name) is expected
+    assert Matcher(pattern).match(name) is expected
+    assert Matcher(pattern)(name) is expected
+
+
+def test_matcher_match_many_returns_mask_in_input_order():
+    """match_many() filters a whole batch in one call, preserving order.
+
+    Generators are accepted (single pass), and a non-str item raises
+    TypeError instead of being silently coerced.
+    """
+    from pygim.pathset import Matcher
+
+    matcher = Matcher("*.rst")
+    names = ["readme.txt", "readme.rst", "AUTHORS.rst", "logo.png"]
+
+    assert matcher.match_many(names) == [False, True, True, False]
+    assert matcher.match_many(n for n in names) == [False, True, True, False]
+    assert matcher.match_many([]) == []
+    assert matcher.pattern == "*.rst"
+    assert repr(matcher) == 'Matcher("*.rst")'
+
+    with pytest.raises(TypeError):
+        matcher.match_many(["readme.rst", 42])
+
+
+def test_copy_to_preserves_tree_and_collects_errors(temp_dir, temp_files):
+    """copy_to() mirrors the layout under the shared root and never fails fast.
+
+    A second copy without overwrite must report every file as an error
+    (in set order) rather than raising, and the progress counters must
+    account for each item exactly once.
+    """
+    from pygim.pathset import BulkProgress
+
+    (temp_dir / "sub").mkdir()
+    (temp_dir / "sub" / "nested.txt").write_text("nested")
+    temp_files[0].write_text("hello")
+    source = PathSet([*temp_files, temp_dir / "sub" / "nested.txt"])
+    dest = temp_dir / "out"
+
+    progress = BulkProgress()
+    result = source.copy_to(dest, workers=2, progress=progress)
+
+    assert result.ok and result.succeeded == 4
+    assert result.bytes == len("hello") + len("nested")
+    assert (dest / "sub" / "nested.txt").read_text() == "nested"
+    assert (dest / "readme.txt").read_text() == "hello"
+    assert len(result.paths) == 4 and (dest / "AUTHORS.rst") in result.paths
+    assert (progress.total, progress.done, progress.failed) == (4, 4, 0)
+
+    again = source.copy_to(dest, progress=progress)
+    assert again.failed == 4 and not again.ok
+    assert [path for path, _ in again.errors] == list(source)
+    assert (progress.done, progress.failed) == (0, 4)
+
+    assert source.copy_to(dest, overwrite=True).ok
+
+
+def test_move_to_flat_and_unlink(temp_dir, temp_files):
+    """move_to() relocates files by name; unlink() removes and reports misses."""
+    dest = temp_dir / "flat"
+
+    moved = PathSet(temp_files).move_to(dest, preserve_tree=False)
+
+    assert moved.succeeded == 3
+    assert not any(f.exists() for f in temp_files)
+    assert sorted(p.name for p in dest.iterdir()) == ["AUTHORS.rst", "readme.rst", "readme.txt"]
+
+    removed = moved.paths.unlink(workers=2)
+    assert removed.succeeded == 3 and list(dest.iterdir()) == []
+
+    missing = PathSet(temp_files[:1]).unlink()
+    assert missing.failed == 1
+    assert missing.errors[0][0] == temp_files[0]
+
+
+def test_transfers_count_moved_bytes_and_never_clobber(temp_dir):
+    """Renamed files report their size; existing destinations stay intact.
+
+    Copies land under a temporary name and are renamed into place, so no
+    temporary or partial file is ever left in the destination.
+    """
+    src = temp_dir / "src"
+    (src / "tree").mkdir(parents=True)
+    (src / "a.txt").write_text("12345")
+    (src / "tree" / "b.txt").write_text("123")
+    dest = temp_dir / "dest"
+    dest.mkdir()
+    (dest / "a.txt").write_text("keep")
+
+    copied = PathSet([src / "a.txt"]).copy_to(dest, overwrite=False)
+    assert copied.failed == 1 and (dest / "a.txt").read_text() == "keep"
+    moved = PathSet([src / "a.txt"]).move_to(dest, overwrite=False)
+    assert moved.failed == 1 and (src / "a.txt").exists()
+
+    assert PathSet([src / "a.txt"]).copy_to(dest, overwrite=True).bytes == 5
+    assert (dest / "a.txt").read_text() == "12345"
+    moved = PathSet([src / "a.txt", src / "tree"]).move_to(dest, preserve_tree=False, overwrite=True)
+    assert moved.ok and moved.bytes == 5 + 3
+    assert (dest / "tree" / "b.txt").read_text() == "123"
+    assert sorted(p.name for p in dest.iterdir()) == ["a.txt", "tree"]
+
+
+def test_flat_transfer_fails_items_sharing_a_destination(temp_dir):
+    """Two sources with one file name must not race on dest/name."""
+    for sub in ("a", "b"):
+        (temp_dir / sub).mkdir()
+        (temp_dir / sub / "same.txt").write_text(sub * 1000)
+    (temp_dir / "a" / "other.txt").write_text("other")
+    source = PathSet([temp_dir / "a" / "same.txt", temp_dir / "b" / "same.txt", temp_dir / "a" / "other.txt"])
+    dest = temp_dir / "flat"
+
+    result = source.copy_to(dest, workers=2, preserve_tree=False, overwrite=True)
+
+    assert result.succeeded == 1 and result.failed == 2
+    assert sorted(path.parent.name for path, _ in result.errors) == ["a", "b"]
+    assert all("preserve_tree=True" in message for _, message in result.errors)
+    assert [path.name for path in dest.iterdir()] == ["other.txt"]
+    assert source.copy_to(temp_dir / "tree", workers=2, overwrite=True).ok
+
+
+def test_disk_usage_groups(temp_dir):
+    """disk_usage() aggregates natively per parent, entry, depth or total.
+
+    Every grouping must account for the same files and bytes; symlinks are
+    not followed, so a link to a counted file adds nothing.
+    """
+    (temp_dir / "a" / "b").mkdir(parents=True)
+    (temp_dir / "c").mkdir()
+    (temp_dir / "a" / "x").write_bytes(b"12345")
+    (temp_dir / "a" / "b" / "y").write_bytes(b"123")
+    (temp_dir / "c" / "z").write_bytes(b"1234567")
+    try:
+        (temp_dir / "a" / "link").symlink_to(temp_dir / "c" / "z")
+    except OSError:  # pragma: no cover - no symlink privilege (Windows)
+        pass
+    root = temp_dir.resolve()
+    entries = PathSet([root / "a", root / "c"])
+
+    assert entries.disk_usage() == {
+        root / "a": (5, 1),
+        root / "a" / "b": (3, 1),
+        root / "c": (7, 1),
+    }
+    assert entries.disk_usage("entry", workers=1) == {root / "a": (8, 2), root / "c": (7, 1)}
+    assert entries.disk_usage(depth=0) == {root / "a": (8, 2), root / "c": (7, 1)}
+    assert entries.disk_usage("total") == {root: (15, 3)}
+
+    # depth counts levels below each path in the set, as du --max-depth does
+    assert PathSet(root).disk_usage(depth=0) == {root: (15, 3)}
+    assert PathSet(root).disk_usage(depth=1) == {root / "a": (8, 2), root / "c": (7, 1)}
+    assert PathSet(root).disk_usage(depth=5) == entries.disk_usage()
+    assert PathSet([root / "a", root / "c" / "z"]).disk_usage(depth=1) == {
+        root / "a": (5, 1),
+        root / "a" / "b": (3, 1),
+        root / "c" / "z": (7, 1),  # a file entry is its own group
+    }
+
+    with pytest.raises(ValueError):
+        entries.disk_usage("bogus")
+    with pytest.raises(ValueError):
+        entries.disk_usage("entry", depth=1)
+    with pytest.raises(ValueError, match="either group_by or depth"):
+        entries.disk_usage("parent", depth=1)
+    assert entries.disk_usage(None) == entries.disk_usage("parent")
+
+
 def test_modification_after_cloning(temp_dir, temp_files):
     temp_files = PathSet(temp_files)
     cloned = temp_files.clone()
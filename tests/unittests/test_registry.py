@@ -300,6 +300,270 @@ def test_hooks_disabled_noop_callbacks():
     assert counters == {"reg": 0, "pre": 0, "post": 0}
 
 
+def test_freeze_serves_lookups_and_blocks_mutation(registry):
+    """A frozen registry answers every key form and refuses registration until unfrozen."""
+
+    class Handler:
+        pass
+
+    registry.register(Handler, "by type")
+    registry.register(("plain.id", "variant"), "by tuple")
+    for i in range(200):  # enough keys to exercise several index buckets
+        registry.register(f"id.{i}", i)
+
+    registry.freeze()
+    assert registry.frozen and "frozen=True" in repr(registry)
+    for _ in range(2):  # second round is served by the per-object slot cache
+        assert registry[Handler] == "by type" and Handler in registry
+    assert registry[("plain.id", "variant")] == "by tuple"
+    assert all(registry[f"id.{i}"] == i for i in range(200))
+    assert "id.200" not in registry
+    with pytest.raises(RuntimeError, match="Unknown registry key"):
+        registry["id.200"]
+
+    with pytest.raises(RuntimeError, match="frozen"):
+        registry.register("late", 1)
+    with pytest.raises(RuntimeError, match="frozen"):
+        registry.register(Handler, "replaced", override=True)
+
+    registry.unfreeze()
+    registry.register(Handler, "replaced", override=True)
+    assert not registry.frozen and registry[Handler] == "replaced"
+    registry.freeze()
+    assert registry[Handler] == "replaced"  # the slot cache was rebuilt
+
+
+def test_frozen_slot_cache_does_not_pin_keys(registry):
+    """Throwaway classes looked up while frozen are still collected."""
+    import gc
+    import weakref
+
+    def make():
+        class Handler:
+            pass
+
+        return Handler
+
+    registry.register(make(), "shared")
+    registry.freeze()
+    classes = [make() for _ in range(50)]
+    assert all(registry[cls] == "shared" for cls in classes)
+    refs = [weakref.ref(cls) for cls in classes]
+    del classes
+    gc.collect()
+
+    assert all(ref() is None for ref in refs)
+    assert all(registry[make()] == "shared" for _ in range(50))
+
+
+def test_identity_freeze(identity_registry):
+    token = object()
+    identity_registry.register(token, "found")
+    identity_registry.register((token, "alt"), "variant")
+    identity_registry.freeze()
+    assert identity_registry[token] == "found" and identity_registry[(token, "alt")] == "variant"
+    assert object() not in identity_registry
+    with pytest.raises(RuntimeError, match="frozen"):
+        identity_registry.register(object(), "late")
+
+def test_frozen_lookups_still_run_pre_hooks():
+    r = Registry(hooks=True)
+    seen = []
+    r.on_pre(lambda key, value: seen.append(key[0]))
+
+    class Handler:
+        pass
+
+    r.register(Handler, 1)
+    r.freeze()
+    assert r[Handler] == 1 and r[Handler] == 1
+    assert seen == [f"{Handler.__module__}.{Handler.__qualname__}"] * 2
+
+
+
+class _Shape:
+    pass
+
+
+class _Polygon(_Shape):
+    pass
+
+
+class _Square(_Polygon):
+    pass
+
+
+@pytest.fixture(params=["qualname", "identity"])
+def any_policy_registry(request, registry, identity_registry):
+    return registry if request.param == "qualname" else identity_registry
+
+
+def test_dispatch_resolves_most_specific_base(any_policy_registry):
+    """dispatch() walks the MRO of a type (or of an instance's type) like singledispatch."""
+    r = any_policy_registry
+    r.register(_Shape, "shape")
+
+    assert r.dispatch(_Square) == "shape"
+    assert r.dispatch(_Square()) == "shape"
+    with pytest.raises(RuntimeError, match="'int' or any of its bases"):
+        r.dispatch(3)
+
+    # Registering a closer base (or a fallback) invalidates memoised answers.
+    r.register(_Polygon, "polygon")
+    r.register(object, "anything")
+    assert r.dispatch(_Square()) == "polygon"
+    assert r.dispatch(_Shape) == "shape"
+    assert r.dispatch(3) == "anything"
+
+    r.register(_Polygon, "polygon v2", override=True)
+    assert r.dispatch(_Square) == "polygon v2"
+
+
+def test_dispatch_cache_does_not_keep_classes_alive(registry):
+    import gc
+    import weakref
+
+    registry.register(_Shape, "shape")
+
+    class Temporary(_Shape):
+        pass
+
+    assert registry.dispatch(Temporary) == "shape"
+    ref = weakref.ref(Temporary)
+    del Temporary
+    gc.collect()
+    assert ref() is None
+
+
+def test_dispatch_runs_pre_hooks():
+    r = Registry(hooks=True)
+    seen = []
+    r.on_pre(lambda key, value: seen.append(key[0]))
+    r.register(_Shape, "shape")
+
+    assert r.dispatch(_Square()) == "shape" and r.dispatch(_Square()) == "shape"
+    assert seen == [f"{_Shape.__module__}.{_Shape.__qualname__}"] * 2
+
+
+def test_update_registers_batch_atomically(any_policy_registry):
+    """update() accepts a mapping or pairs and validates the whole batch before storing."""
+    r = any_policy_registry
+    r.update({_Shape: "shape"})
+    r.update([(_Polygon, "polygon"), ((_Square, "alt"), "square alt")])
+    assert r.get_many([_Shape, _Polygon, (_Square, "alt")]) == ["shape", "polygon", "square alt"]
+
+    with pytest.raises(RuntimeError, match="Duplicate"):
+        r.update([(_Square, 1), (_Square, 2)])  # duplicate within the batch
+    with pytest.raises(RuntimeError, match="Duplicate"):
+        r.update([(_Square, 1), (_Shape, 2)])  # clashes with an existing key
+    assert _Square not in r and len(r) == 3  # nothing stored
+
+    with pytest.raises(RuntimeError, match="requires existing key"):
+        r.update({_Shape: 1, _Square: 2}, override=True)
+    r.update({_Shape: "shape v2"}, override=True)
+    assert r.dispatch(_Square) == "polygon" and r[_Shape] == "shape v2"
+
+    with pytest.raises(TypeError, match="pairs"):
+        r.update([_Square])
+
+
+def test_update_leaves_registry_unchanged_when_a_register_hook_raises():
+    r = Registry(hooks=True)
+
+    def veto(key, value):
+        if value == "bad":
+            raise ValueError("vetoed")
+
+    r.on_register(veto)
+    with pytest.raises(ValueError, match="vetoed"):
+        r.update([("a", 1), ("b", "bad"), ("c", 3)])
+    assert len(r) == 0
+    r.update([("a", 1), ("c", 3)])
+    assert r.get_many(["a", "c"]) == [1, 3]
+
+
+def test_get_many_and_batch_hooks():
+    r = Registry(hooks=True)
+    registered, accessed = [], []
+    r.on_register(lambda key, value: registered.append(value))
+    r.on_pre(lambda key, value: accessed.append(value))
+
+    r.update((f"id.{i}", i) for i in range(5))
+    assert registered == [0, 1, 2, 3, 4]
+    rows = ["id.1", "id.3", "id.1"]
+    assert r.get_many(rows) == [1, 3, 1]
+    assert accessed == [1, 3, 1]  # pre hooks run per lookup, repeats included
+    with pytest.raises(RuntimeError, match="Unknown registry key"):
+        r.get_many(["id.1", "missing"])
+
+
+def test_filtered_hooks_fire_only_for_matching_keys():
+    """key= and prefix= subscriptions are filtered natively, per hook point."""
+    r = Registry(hooks=True)
+    seen = {"key": [], "prefix": [], "all": [], "post": []}
+    r.on_pre(lambda key, value: seen["key"].append(value), key="plugins.audit")
+    r.on_register(lambda key, value: seen["prefix"].append(key[0]), prefix="plugins.")
+    r.on_pre(lambda key, value: seen["all"].append(value))
+    r.on_post(lambda key, payload: seen["post"].append(payload), key=("core.db", "replica"))
+
+    r.update({"plugins.audit": "audit", "plugins.cache": "cache", "core.db": "db", ("core.db", "replica"): "ro"})
+    r.get_many(["plugins.audit", "plugins.cache", "plugins.audit"])
+    r.post_many([("core.db", "ignored"), (("core.db", "replica"), "done")])
+
+    assert seen["key"] == ["audit", "audit"]
+    assert sorted(seen["prefix"]) == ["plugins.audit", "plugins.cache"]
+    assert seen["all"] == ["audit", "cache", "audit"]
+    assert seen["post"] == ["done"]
+
+    with pytest.raises(TypeError, match="either key or prefix"):
+        r.on_pre(print, key="a", prefix="b")
+    with pytest.raises(TypeError, match="qualname policy"):
+        Registry(hooks=True, policy=KeyPolicyKind.identity).on_pre(print, prefix="a")
+
+
+def test_native_stats_count_events_without_python_hooks():
+    r = Registry(hooks=True)
+    assert r.stats() is None
+    r.enable_stats()
+    r.update({"a": 1, "b": 2})
+    r.get_many(["a", "a", "b"])
+    r.post("a", None)
+
+    stats = r.stats()
+    assert stats["totals"] == {"register": 2, "pre": 3, "post": 1}
+    assert stats["per_key"][("a", "")] == {"register": 1, "pre": 2, "post": 1}
+    assert stats["callback_seconds"] is None
+
+    r.on_pre(lambda key, value: None)
+    r.enable_stats(timing=True)  # restarts the counters
+    r["a"]
+    stats = r.stats()
+    assert stats["totals"]["pre"] == 1 and stats["callback_seconds"]["pre"] > 0
+
+    r.disable_stats()
+    assert r.stats() is None
+    with pytest.raises(RuntimeError, match="hooks=True"):
+        Registry().enable_stats()
+
+
+def test_native_stats_count_unregistered_posts_in_totals_only():
+    import gc
+
+    class Service:
+        pass
+
+    r = Registry(hooks=True, policy=KeyPolicyKind.identity)
+    r.register(Service, "svc")
+    r.enable_stats()
+    for i in range(100):
+        r.post([i] * 3, "x")  # temporary keys, freed right after the call
+    r.post(Service, "y")
+    gc.collect()
+
+    stats = r.stats()
+    assert stats["totals"]["post"] == 101
+    assert stats["per_key"] == {(Service, ""): {"register": 0, "pre": 0, "post": 1}}
+
 if __name__ == "__main__":
     from pygim.core.testing import run_tests
 